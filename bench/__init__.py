@@ -0,0 +1,13 @@
+"""Benchmark suite for the bot's cog methods.
+
+Builds a synthetic league of any size through the real init_db schema, drives the
+cogs with a fake discord.Interaction and reports p50/p95 latency and SQL
+statement counts per operation:
+
+    python -m bench --teams 18 --players 1000
+    python -m bench --teams 100 --players 50000 --repeat 3 --save baseline.json
+    python -m bench --compare baseline.json --only autocomplete
+
+Nothing here touches Discord or the real database - the league is built in a
+temporary file unless --db says otherwise.
+"""
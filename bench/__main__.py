@@ -0,0 +1,83 @@
+"""Run the benchmark suite: python -m bench --teams 18 --players 1000"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog="python -m bench", description="Benchmark the bot's cog methods against a synthetic league")
+    parser.add_argument("--teams", type=int, default=18)
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--seasons", type=int, default=3, help="Completed seasons before the active one")
+    parser.add_argument("--rounds", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per operation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", action="append", help="Only run operations whose name starts with this (repeatable)")
+    parser.add_argument("--save", help="Write the results to this JSON file (a baseline for --compare)")
+    parser.add_argument("--compare", help="Baseline JSON to compare against - exits 1 on a regression")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p95 slowdown against the baseline (0.25 = 25%%)")
+    parser.add_argument("--db", help="Database file to build the league in (default: a temporary file)")
+    parser.add_argument("--verbose", action="store_true", help="Show what the commands print")
+    return parser.parse_args()
+
+
+async def main(args, db_path):
+    # Imported here so config picks up DB_PATH from the environment
+    from bot import EXTENSIONS, bot
+    from bench.league import build_league
+    from bench.operations import OPERATIONS, Context
+    from bench.runner import format_report, load_baseline, run_operation, save_results, snapshot
+    from excel_io import shutdown_worker
+
+    print(f"Building league: {args.teams} teams, {args.players} players, {args.seasons} seasons of {args.rounds} rounds...")
+    league = await build_league(bot, teams=args.teams, players=args.players, seasons=args.seasons,
+                                rounds=args.rounds, seed=args.seed)
+    # After the league exists - some cogs read the database when they load
+    for name in EXTENSIONS:
+        await bot.load_extension(name)
+    snapshot_path = db_path + ".snapshot"
+    snapshot(snapshot_path)
+
+    operations = [op for op in OPERATIONS if not args.only or any(op.name.startswith(prefix) for prefix in args.only)]
+    context = Context(bot, league)
+    results = []
+    try:
+        for operation in operations:
+            print(f"  {operation.name}...")
+            results.append(await run_operation(operation, context, args.repeat, snapshot_path, quiet=not args.verbose))
+    finally:
+        shutdown_worker()
+        os.remove(snapshot_path)
+
+    baseline = load_baseline(args.compare) if args.compare else None
+    report, regressions = format_report(results, baseline, args.tolerance)
+    print()
+    print(report)
+
+    if args.save:
+        save_results(results, args.save, {'teams': args.teams, 'players': args.players,
+                                          'seasons': args.seasons, 'rounds': args.rounds})
+        print(f"\nSaved results to {args.save}")
+
+    failed = [result.name for result in results if result.errors]
+    if regressions:
+        print("\nRegressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+    if failed:
+        print(f"\nOperations with errors: {', '.join(failed)}")
+    return 1 if regressions or failed else 0
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tempdir:
+        db_path = args.db or os.path.join(tempdir, "bench.db")
+        if os.path.exists(db_path):
+            sys.exit(f"{db_path} already exists - the league is built in an empty database")
+        # Must be set before anything imports config
+        os.environ['DB_PATH'] = db_path
+        sys.exit(asyncio.run(main(args, db_path)))
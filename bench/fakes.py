@@ -0,0 +1,130 @@
+"""Stand-ins for the discord.py objects the cogs touch.
+
+Only as much as the benchmarked commands use: responses, followups and message
+edits are recorded rather than sent, and the guild has no members, roles or
+channels, so anything posted to a log or team channel is skipped exactly as it
+would be for a channel that no longer exists.
+"""
+
+import io
+
+
+class FakeObject:
+    """Attribute bag"""
+
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+class FakeMessage:
+    def __init__(self, content=None, **kwargs):
+        self.content = content
+        self.kwargs = kwargs
+        self.edits = []
+
+    async def edit(self, **kwargs):
+        self.edits.append(kwargs)
+        self.content = kwargs.get('content', self.content)
+        return self
+
+    async def delete(self):
+        pass
+
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self.done = False
+
+    def is_done(self):
+        return self.done
+
+    async def defer(self, **kwargs):
+        self.done = True
+
+    async def send_message(self, content=None, **kwargs):
+        self.done = True
+        self.interaction.sent.append(FakeMessage(content, **kwargs))
+
+    async def edit_message(self, content=None, **kwargs):
+        self.done = True
+        self.interaction.sent.append(FakeMessage(content, **kwargs))
+
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, content=None, **kwargs):
+        message = FakeMessage(content, **kwargs)
+        self.interaction.sent.append(message)
+        return message
+
+
+class FakeInteraction:
+    """
+    discord.Interaction stand-in for an admin who is also the guild owner.
+
+    Everything the command sends ends up in .sent, in order.
+    """
+
+    def __init__(self, bot, command_name=None, user_id=1):
+        self.client = bot
+        self.sent = []
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.command = FakeObject(name=command_name)
+        self.user = FakeObject(
+            id=user_id, name="bench", display_name="bench", mention=f"<@{user_id}>",
+            roles=[], guild_permissions=FakeObject(administrator=True)
+        )
+        self.guild = FakeObject(
+            id=0, owner_id=user_id, roles=[], emojis=[], members=[],
+            get_member=lambda member_id: None,
+            get_role=lambda role_id: None,
+            get_channel=lambda channel_id: None,
+        )
+        self.channel = None
+
+    async def original_response(self):
+        return self.sent[0] if self.sent else FakeMessage()
+
+    async def edit_original_response(self, **kwargs):
+        message = await self.original_response()
+        return await message.edit(**kwargs)
+
+    def last_content(self):
+        """Text of the last thing the command sent or edited"""
+        for message in reversed(self.sent):
+            for edit in reversed(message.edits):
+                if edit.get('content'):
+                    return edit['content']
+            if message.content:
+                return message.content
+        return None
+
+    def attachment_bytes(self):
+        """Contents of the last file the command sent"""
+        for message in reversed(self.sent):
+            for kwargs in [*reversed(message.edits), message.kwargs]:
+                files = kwargs.get('attachments') or kwargs.get('files') or ([kwargs['file']] if kwargs.get('file') else [])
+                if files:
+                    files[0].fp.seek(0)
+                    return files[0].fp.read()
+        return None
+
+
+class FakeAttachment:
+    """discord.Attachment stand-in for /importdata"""
+
+    def __init__(self, data, filename="league.xlsx"):
+        self.data = data
+        self.filename = filename
+        self.size = len(data)
+
+    async def read(self):
+        return self.data
+
+    def to_file(self):
+        import discord
+        return discord.File(io.BytesIO(self.data), filename=self.filename)
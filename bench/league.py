@@ -0,0 +1,300 @@
+"""Synthetic league generator for the benchmark suite.
+
+Builds a league of any size in the database at config.DB_PATH, through the same
+schema the bot uses: init_db, then /migratedb for the tables and columns only
+the migration adds. On top of that it writes several completed seasons (with
+fixtures, results, submitted lineups, ladders, drafts and free agency history),
+an active season part way through, trade history and a trade waiting for
+moderator approval, and an open free agency bidding period.
+
+Everything comes from one seeded RNG, so the same arguments always give the
+same league.
+"""
+
+import json
+import random
+
+import aiosqlite
+
+from config import DB_PATH
+from positions import VALID_POSITIONS
+import fixture_generator
+
+LINEUP_SIZE = 23
+DRAFT_ROUNDS = 4
+
+FIRST_NAMES = ["Jack", "Tom", "Sam", "Josh", "Will", "Harry", "Lachlan", "Max", "Charlie", "Ben",
+               "Riley", "Cooper", "Zac", "Darcy", "Nick", "Jordan", "Marcus", "Toby", "Liam", "Kane"]
+LAST_NAMES = ["Smith", "Jones", "Williams", "Brown", "Wilson", "Taylor", "Johnson", "White", "Martin",
+              "Anderson", "Thompson", "Walker", "Harris", "Ryan", "Kelly", "Murphy", "Clarke", "Daniher",
+              "Cripps", "Petracca", "Bontempelli", "Heeney", "Oliver", "Merrett", "Dunkley", "Butters"]
+
+
+class League:
+    """What the generator made - ids the benchmark operations need"""
+
+    def __init__(self):
+        self.team_ids = []
+        self.team_names = []
+        self.active_season_id = None
+        self.active_season_number = None
+        self.period_id = None
+        self.pending_trade_ids = []
+        self.player_count = 0
+
+
+async def build_league(bot, teams=18, players=1000, seasons=3, rounds=24, seed=0):
+    """
+    Create a synthetic league in an empty database.
+
+    Args:
+        bot: The AFFLBot (needed to run /migratedb)
+        teams: Number of teams (plus the Draft Pool init_db creates)
+        players: Total players - about three quarters on lists, the rest delisted
+        seasons: Completed seasons before the active one
+        rounds: Regular season rounds per season
+        seed: RNG seed
+
+    Returns:
+        League: Ids of the generated teams, season, free agency period and pending trades
+    """
+    from bot import init_db
+    from commands.season_commands import SeasonCommands, get_ladder
+    from bench.fakes import FakeInteraction
+
+    rng = random.Random(seed)
+    league = League()
+
+    await init_db()
+    migration = SeasonCommands(bot)
+    await migration.migrate_db.callback(migration, FakeInteraction(bot, 'migratedb'))
+
+    active_number = seasons + 1
+    league.active_season_number = active_number
+    current_round = max(1, rounds // 2)
+
+    async with aiosqlite.connect(DB_PATH) as db:
+        # Teams
+        league.team_names = [f"Team {i + 1:03d}" for i in range(teams)]
+        await db.executemany(
+            "INSERT INTO teams (team_name, role_id, emoji_id) VALUES (?, ?, ?)",
+            [(name, str(10 ** 17 + i), str(2 * 10 ** 17 + i)) for i, name in enumerate(league.team_names)]
+        )
+        cursor = await db.execute("SELECT team_id FROM teams WHERE team_name != 'Draft Pool' ORDER BY team_name")
+        league.team_ids = [row[0] for row in await cursor.fetchall()]
+
+        # Seasons: completed, active, then two future ones
+        season_rows = []
+        for number in range(1, active_number + 3):
+            if number < active_number:
+                status, round_number, round_name = 'completed', rounds + 5, 'Season Complete'
+            elif number == active_number:
+                status, round_number, round_name = 'active', current_round, f"Round {current_round}"
+            else:
+                status, round_number, round_name = 'future', 0, 'Future'
+            season_rows.append((number, round_number, rounds, rounds + 5, round_name, status))
+        await db.executemany(
+            """INSERT INTO seasons (season_number, current_round, regular_rounds, total_rounds, round_name, status)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            season_rows
+        )
+        cursor = await db.execute("SELECT season_number, season_id FROM seasons")
+        season_ids = dict(await cursor.fetchall())
+        league.active_season_id = season_ids[active_number]
+
+        # Players - most on lists, with contracts running out over the next few seasons
+        player_rows = []
+        for i in range(players):
+            team_id = rng.choice(league.team_ids) if rng.random() < 0.75 else None
+            age = rng.randint(18, 34)
+            player_rows.append((
+                f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}",
+                rng.choice(VALID_POSITIONS),
+                max(40, min(99, int(rng.gauss(72, 9)))),
+                age,
+                active_number - 30 + (30 - age),
+                team_id,
+                rng.randint(active_number, active_number + 3) if team_id else active_number - 1,
+            ))
+        await db.executemany(
+            """INSERT INTO players (name, position, overall_rating, age, birth_year, team_id, contract_expiry)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            player_rows
+        )
+        league.player_count = players
+
+        cursor = await db.execute("SELECT player_id, team_id FROM players WHERE team_id IS NOT NULL ORDER BY player_id")
+        rosters = {team_id: [] for team_id in league.team_ids}
+        for player_id, team_id in await cursor.fetchall():
+            rosters[team_id].append(player_id)
+        all_player_ids = [player_id for roster in rosters.values() for player_id in roster]
+
+        # Current and starting lineups
+        lineup_rows = []
+        starting_rows = []
+        from commands.lineup_commands import AFL_POSITIONS
+        for team_id, roster in rosters.items():
+            picked = roster[:LINEUP_SIZE]
+            lineup_rows += [(team_id, player_id, slot + 1, AFL_POSITIONS[slot]) for slot, player_id in enumerate(picked)]
+            if rng.random() < 0.5:
+                starting_rows.append((team_id, json.dumps({AFL_POSITIONS[slot]: player_id for slot, player_id in enumerate(picked)})))
+        await db.executemany(
+            "INSERT INTO lineups (team_id, player_id, slot_number, position_name) VALUES (?, ?, ?, ?)",
+            lineup_rows
+        )
+        await db.executemany("INSERT INTO starting_lineups (team_id, lineup_data) VALUES (?, ?)", starting_rows)
+
+        # Fixtures, results and submitted lineups for every season played so far
+        match_rows = []
+        submission_rows = []
+        for number in range(1, active_number + 1):
+            season_id = season_ids[number]
+            played_rounds = rounds if number < active_number else current_round - 1
+            fixtures, _ = fixture_generator.generate_fixtures(league.team_ids, rounds, seed + number)
+            for round_number, home_id, away_id in fixtures:
+                if round_number <= played_rounds:
+                    match_rows.append((season_id, round_number, home_id, away_id,
+                                       rng.randint(40, 130), rng.randint(40, 130), 1))
+                else:
+                    match_rows.append((season_id, round_number, home_id, away_id, 0, 0, 0))
+            for round_number in range(1, played_rounds + 1):
+                for team_id, roster in rosters.items():
+                    picked = rng.sample(roster, min(LINEUP_SIZE, len(roster)))
+                    submission_rows.append((team_id, season_id, round_number, json.dumps(picked)))
+        await db.executemany(
+            """INSERT INTO matches (season_id, round_number, home_team_id, away_team_id, home_score, away_score, simulated)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            match_rows
+        )
+        await db.executemany(
+            "INSERT INTO submitted_lineups (team_id, season_id, round_number, player_ids) VALUES (?, ?, ?, ?)",
+            submission_rows
+        )
+
+        # Final ladders for completed seasons (from the results above)
+        for number in range(1, active_number):
+            ladder = await get_ladder(db, season_ids[number])
+            await db.executemany(
+                "INSERT INTO ladder_positions (season_id, team_id, position) VALUES (?, ?, ?)",
+                [(season_ids[number], row[0], position) for position, row in enumerate(ladder, 1)]
+            )
+
+        # Drafts: completed for every season played, future for the next two
+        for number in range(1, active_number + 2):
+            draft_season = number + 1
+            status = 'completed' if number < active_number else 'future'
+            cursor = await db.execute(
+                "INSERT INTO drafts (draft_name, season_number, status, rounds) VALUES (?, ?, ?, ?)",
+                (f"Season {number} National Draft", draft_season, status, DRAFT_ROUNDS)
+            )
+            draft_id = cursor.lastrowid
+            order = league.team_ids[:]
+            rng.shuffle(order)
+            pick_rows = []
+            for round_number in range(1, DRAFT_ROUNDS + 1):
+                for position, team_id in enumerate(order, 1):
+                    pick_number = (round_number - 1) * teams + position if status == 'completed' else None
+                    owner = team_id if rng.random() < 0.85 else rng.choice(league.team_ids)
+                    selected = rng.choice(all_player_ids) if status == 'completed' and all_player_ids else None
+                    pick_rows.append((draft_id, f"Season {number} National Draft", draft_season, round_number,
+                                      pick_number, f"{league.team_names[league.team_ids.index(team_id)]} R{round_number}",
+                                      team_id, owner, selected))
+            await db.executemany(
+                """INSERT INTO draft_picks (draft_id, draft_name, season_number, round_number, pick_number,
+                                            pick_origin, original_team_id, current_team_id, player_selected_id)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                pick_rows
+            )
+
+        # Free agency: completed periods with results for past seasons, bidding open now
+        cursor = await db.execute(
+            "SELECT player_id, team_id FROM players WHERE contract_expiry = ? AND team_id IS NOT NULL",
+            (active_number,)
+        )
+        free_agents = await cursor.fetchall()
+        for number in range(1, active_number + 1):
+            status = 'completed' if number < active_number else 'bidding'
+            cursor = await db.execute(
+                "INSERT INTO free_agency_periods (season_number, status) VALUES (?, ?)",
+                (number, status)
+            )
+            period_id = cursor.lastrowid
+            if status == 'completed':
+                history = rng.sample(all_player_ids, min(len(all_player_ids), 3 * teams))
+                await db.executemany(
+                    """INSERT INTO free_agency_results
+                       (period_id, player_id, original_team_id, winning_team_id, winning_bid, matched, confirmed_at)
+                       VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)""",
+                    [(period_id, player_id, rng.choice(league.team_ids), rng.choice(league.team_ids),
+                      rng.randint(1, 120), rng.random() < 0.3) for player_id in history]
+                )
+            else:
+                league.period_id = period_id
+                bid_rows = []
+                for team_id in league.team_ids:
+                    targets = [fa for fa in free_agents if fa[1] != team_id]
+                    budget = 300
+                    for player_id, _ in rng.sample(targets, min(len(targets), 10)):
+                        amount = rng.randint(1, 40)
+                        if amount > budget:
+                            break
+                        budget -= amount
+                        bid_rows.append((period_id, team_id, player_id, amount))
+                await db.executemany(
+                    "INSERT INTO free_agency_bids (period_id, team_id, player_id, bid_amount) VALUES (?, ?, ?, ?)",
+                    bid_rows
+                )
+
+        # Trade history, and trades accepted by both teams waiting for a moderator
+        cursor = await db.execute(
+            """SELECT pick_id, current_team_id FROM draft_picks
+               WHERE player_selected_id IS NULL AND current_team_id IS NOT NULL"""
+        )
+        future_picks = {}
+        for pick_id, team_id in await cursor.fetchall():
+            future_picks.setdefault(team_id, []).append(pick_id)
+
+        trade_rows = []
+        for i in range(seasons * teams + 5):
+            initiating, receiving = rng.sample(league.team_ids, 2)
+            pending = i >= seasons * teams
+            give = rng.sample(rosters[initiating], min(2, len(rosters[initiating])))
+            take = rng.sample(rosters[receiving], min(1, len(rosters[receiving])))
+            picks = future_picks.get(initiating, [])[:1] if pending else []
+            trade_rows.append((initiating, receiving, json.dumps(give), json.dumps(take), json.dumps(picks),
+                               json.dumps([]), 'accepted' if pending else 'approved'))
+            if pending:
+                # Later pending trades can't reuse players already promised in earlier ones
+                for player_id in give:
+                    rosters[initiating].remove(player_id)
+                for player_id in take:
+                    rosters[receiving].remove(player_id)
+                for pick_id in picks:
+                    future_picks[initiating].remove(pick_id)
+        cursor = await db.execute("SELECT IFNULL(MAX(trade_id), 0) FROM trades")
+        first_trade_id = (await cursor.fetchone())[0] + 1
+        await db.executemany(
+            """INSERT INTO trades (initiating_team_id, receiving_team_id, initiating_players, receiving_players,
+                                   initiating_picks, receiving_picks, status)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            trade_rows
+        )
+        league.pending_trade_ids = [first_trade_id + i for i, row in enumerate(trade_rows) if row[6] == 'accepted']
+
+        # Injuries and suspensions running into the current round
+        injured = rng.sample(all_player_ids, len(all_player_ids) // 50)
+        await db.executemany(
+            """INSERT INTO injuries (player_id, injury_type, injury_round, recovery_rounds, return_round)
+               VALUES (?, 'Hamstring', ?, 3, ?)""",
+            [(player_id, current_round - 1, current_round + 2) for player_id in injured]
+        )
+        suspended = rng.sample(all_player_ids, len(all_player_ids) // 100)
+        await db.executemany(
+            """INSERT INTO suspensions (player_id, suspension_reason, suspension_round, games_missed, return_round)
+               VALUES (?, 'Rough conduct', ?, 2, ?)""",
+            [(player_id, current_round - 1, current_round + 1) for player_id in suspended]
+        )
+
+        await db.commit()
+
+    return league
@@ -0,0 +1,91 @@
+"""Measure event loop lag during /exportdata and /importdata: python -m bench.loop_lag --players 20000
+
+Builds a synthetic league, then runs an export followed by an import of that
+export (the bench suite's export_data and import_data operations) while a
+ticker task asks to wake every TICK_MS. How late each tick wakes is how long
+the loop was blocked - with the Excel work in excel_io's worker process it
+should stay in the low milliseconds however big the league is.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# How often the ticker asks to wake up
+TICK_MS = 10
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog="python -m bench.loop_lag",
+                                     description="Measure event loop lag while exporting and importing a league")
+    parser.add_argument("--teams", type=int, default=18)
+    parser.add_argument("--players", type=int, default=20000)
+    parser.add_argument("--seasons", type=int, default=1, help="Completed seasons before the active one")
+    parser.add_argument("--rounds", type=int, default=24)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-lag-ms", type=float, help="Exit 1 if any tick is later than this")
+    return parser.parse_args()
+
+
+async def ticker(lags):
+    """Sleep TICK_MS at a time, recording how late each wake-up is in ms"""
+    interval = TICK_MS / 1000
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, (time.perf_counter() - start - interval) * 1000))
+
+
+async def measure(name, operation, context):
+    """Run an operation under the ticker and print its lag distribution"""
+    lags = []
+    task = asyncio.create_task(ticker(lags))
+    start = time.perf_counter()
+    try:
+        await operation(context)
+    finally:
+        elapsed = time.perf_counter() - start
+        task.cancel()
+    lags.sort()
+    p99 = lags[max(0, round(0.99 * len(lags)) - 1)] if lags else 0.0
+    print(f"{name:<12}{elapsed * 1000:>9.0f}ms   lag p50 {statistics.median(lags) if lags else 0.0:6.1f}ms   "
+          f"p99 {p99:6.1f}ms   max {max(lags, default=0.0):7.1f}ms   ({len(lags)} ticks)")
+    return max(lags, default=0.0)
+
+
+async def main(args):
+    # Imported here so config picks up DB_PATH from the environment
+    from bot import EXTENSIONS, bot
+    from bench.league import build_league
+    from bench.operations import Context, export_data, import_data
+    from excel_io import shutdown_worker
+
+    print(f"Building league: {args.teams} teams, {args.players} players, {args.seasons} seasons of {args.rounds} rounds...")
+    league = await build_league(bot, teams=args.teams, players=args.players, seasons=args.seasons,
+                                rounds=args.rounds, seed=args.seed)
+    for name in EXTENSIONS:
+        await bot.load_extension(name)
+
+    context = Context(bot, league)
+    try:
+        worst = max([await measure("export", export_data, context),
+                     await measure("import", import_data, context)])
+    finally:
+        shutdown_worker()
+
+    if args.max_lag_ms is not None and worst > args.max_lag_ms:
+        print(f"\nLoop blocked for {worst:.0f}ms - over the {args.max_lag_ms:.0f}ms limit")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tempdir:
+        # Must be set before anything imports config
+        os.environ['DB_PATH'] = os.path.join(tempdir, "loop_lag.db")
+        sys.exit(asyncio.run(main(args)))
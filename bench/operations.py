@@ -0,0 +1,266 @@
+"""The operations the benchmark suite times.
+
+Each one drives a real cog method with a FakeInteraction, the same way discord.py
+would call it. Slash commands are called through their .callback so the
+app_commands decorators are skipped; autocompletes and view methods are plain
+coroutines and are called directly. Load tests like bid_rush raise when the
+result is wrong, so the report shows an error instead of a time.
+"""
+
+import asyncio
+import decimal
+import random
+
+import aiosqlite
+
+from bench.fakes import FakeAttachment, FakeInteraction
+from bench.runner import Operation
+from bid_intake import BidIntake, BidReceipt, BidRejected
+from config import DB_PATH
+from render_cache import render_cache
+
+# Concurrent bids in the bid_rush operation
+BID_RUSH_BIDS = 400
+# Unmatched results, each earning a compensation pick, in the end_matching_period operation
+COMPENSATION_PICKS = 20
+
+
+class Context:
+    """What the operations share: the bot, the generated league and anything an earlier operation produced"""
+
+    def __init__(self, bot, league):
+        self.bot = bot
+        self.league = league
+        self.export_bytes = None
+
+    def cog(self, name):
+        return self.bot.get_cog(name)
+
+
+async def check_sent(interaction):
+    """Raise if the command reported an error, so it shows up in the report instead of a fast time"""
+    content = interaction.last_content() or ""
+    if content.startswith("❌"):
+        raise RuntimeError(content.splitlines()[0])
+
+
+async def player_name_autocomplete(context):
+    cog = context.cog('PlayerCommands')
+    await cog.player_name_autocomplete(FakeInteraction(context.bot), "ar")
+
+
+async def free_agent_autocomplete(context):
+    cog = context.cog('FreeAgencyCommands')
+    # Drop the cached pool so every run measures a rebuild, not a lookup
+    cog.free_agent_pool = None
+    await cog.free_agent_autocomplete(FakeInteraction(context.bot), "a")
+
+
+async def free_agent_autocomplete_cached(context):
+    cog = context.cog('FreeAgencyCommands')
+    await cog.free_agent_autocomplete(FakeInteraction(context.bot), "a")
+
+
+async def team_autocomplete(context):
+    cog = context.cog('AdminCommands')
+    await cog.team_autocomplete(FakeInteraction(context.bot), "1")
+
+
+async def search_players(context):
+    cog = context.cog('PlayerCommands')
+    interaction = FakeInteraction(context.bot, 'searchplayers')
+    await cog.search_players.callback(cog, interaction, min_rating=75, position1='MID')
+    await check_sent(interaction)
+
+
+async def roster(context):
+    # Drop the kept renderings so every run measures a build, not a lookup
+    render_cache.invalidate()
+    await roster_cached(context)
+
+
+async def roster_cached(context):
+    cog = context.cog('PlayerCommands')
+    interaction = FakeInteraction(context.bot, 'roster')
+    await cog.roster.callback(cog, interaction, team_name=context.league.team_names[0])
+    await check_sent(interaction)
+
+
+async def export_data(context):
+    cog = context.cog('AdminCommands')
+    interaction = FakeInteraction(context.bot, 'exportdata')
+    await cog.export_data.callback(cog, interaction)
+    await check_sent(interaction)
+    context.export_bytes = interaction.attachment_bytes()
+
+
+async def import_data(context):
+    if context.export_bytes is None:
+        await export_data(context)
+    cog = context.cog('AdminCommands')
+    interaction = FakeInteraction(context.bot, 'importdata')
+    await cog.import_data.callback(cog, interaction, FakeAttachment(context.export_bytes))
+    await check_sent(interaction)
+
+
+async def start_matching_period(context):
+    cog = context.cog('FreeAgencyCommands')
+    interaction = FakeInteraction(context.bot, 'freeagencyperiod')
+    await cog.start_matching_period(interaction)
+    await check_sent(interaction)
+
+
+async def prepare_end_matching_period(context):
+    """
+    Put the bidding period into matching with COMPENSATION_PICKS confirmed, unmatched results.
+
+    The next future draft gets its order from the team list (apply_ladder_order),
+    and the compensation chart is replaced with one giving each result's player
+    a band, spread over all five bands.
+    """
+    from commands.draft_commands import apply_ladder_order
+
+    rng = random.Random(0)
+    league = context.league
+    async with aiosqlite.connect(DB_PATH) as db:
+        cursor = await db.execute(
+            """SELECT draft_id, draft_name, season_number, rounds FROM drafts
+               WHERE status = 'future' ORDER BY season_number LIMIT 1"""
+        )
+        draft = await cursor.fetchone()
+        cursor = await db.execute(
+            """SELECT p.player_id, p.team_id, p.overall_rating FROM players p
+               JOIN free_agency_periods fp ON p.contract_expiry = fp.season_number
+               WHERE fp.period_id = ? AND p.team_id IS NOT NULL""",
+            (league.period_id,)
+        )
+        free_agents = rng.sample(await cursor.fetchall(), COMPENSATION_PICKS)
+
+        ratings = sorted({ovr for _, _, ovr in free_agents}, reverse=True)
+        await db.execute("DELETE FROM compensation_chart")
+        await db.executemany(
+            "INSERT INTO compensation_chart (min_age, max_age, min_ovr, max_ovr, compensation_band) VALUES (0, 99, ?, ?, ?)",
+            [(ovr, ovr, 1 + rank * 5 // len(ratings)) for rank, ovr in enumerate(ratings)]
+        )
+        await db.execute("UPDATE free_agency_periods SET status = 'matching' WHERE period_id = ?", (league.period_id,))
+        await db.execute("DELETE FROM free_agency_results WHERE period_id = ?", (league.period_id,))
+        await db.executemany(
+            """INSERT INTO free_agency_results
+               (period_id, player_id, original_team_id, winning_team_id, winning_bid, matched, confirmed_at)
+               VALUES (?, ?, ?, ?, ?, 0, CURRENT_TIMESTAMP)""",
+            [(league.period_id, player_id, team_id, rng.choice([t for t in league.team_ids if t != team_id]),
+              rng.randint(1, 100)) for player_id, team_id, _ in free_agents]
+        )
+        await db.commit()
+
+    draft_id, draft_name, season_number, rounds = draft
+    team_order = [(team_id, name, position) for position, (team_id, name)
+                  in enumerate(zip(league.team_ids, league.team_names), 1)]
+    await apply_ladder_order(draft_id, draft_name, rounds, season_number, team_order)
+
+
+async def end_matching_period(context):
+    cog = context.cog('FreeAgencyCommands')
+    interaction = FakeInteraction(context.bot, 'freeagencyperiod')
+    await cog.end_matching_period(interaction)
+    await check_sent(interaction)
+
+
+async def next_round(context):
+    cog = context.cog('SeasonCommands')
+    interaction = FakeInteraction(context.bot, 'nextround')
+    await cog.next_round.callback(cog, interaction)
+    await check_sent(interaction)
+
+
+async def execute_trade(context):
+    from commands.trade_commands import ModeratorApprovalView
+
+    interaction = FakeInteraction(context.bot, 'approve_trade')
+    view = ModeratorApprovalView(context.league.pending_trade_ids[0], context.bot)
+    await view.execute_trade(interaction)
+    await check_sent(interaction)
+
+
+async def bid_rush(context):
+    """
+    BID_RUSH_BIDS concurrent bids from every team, checked for overspending afterwards.
+
+    Two bad bids ride along with the valid ones: one whose amount fails its
+    check (rejected on its own) and one whose amount can't be written, which
+    fails its whole batch and sends it down the one-bid-at-a-time retry. Every
+    other bid has to come back placed, updated or short of points.
+    """
+    rng = random.Random(0)
+    period_id = context.league.period_id
+    async with aiosqlite.connect(DB_PATH) as db:
+        cursor = await db.execute(
+            "SELECT season_number, auction_points FROM free_agency_periods WHERE period_id = ?",
+            (period_id,)
+        )
+        season_number, max_points = await cursor.fetchone()
+        cursor = await db.execute(
+            "SELECT player_id, team_id FROM players WHERE contract_expiry = ? AND team_id IS NOT NULL",
+            (season_number,)
+        )
+        free_agents = await cursor.fetchall()
+
+    bids = []
+    for _ in range(BID_RUSH_BIDS):
+        team_id = rng.choice(context.league.team_ids)
+        player_id = rng.choice([player_id for player_id, owner in free_agents if owner != team_id])
+        bids.append((period_id, team_id, player_id, rng.randint(1, max_points // 4), max_points))
+    bad = {3: None, 30: decimal.Decimal(5)}  # positions in the first and second batches
+    for index, amount in bad.items():
+        bids[index] = bids[index][:3] + (amount,) + bids[index][4:]
+
+    intake = BidIntake()
+    try:
+        outcomes = await asyncio.gather(*(intake.submit(*bid) for bid in bids), return_exceptions=True)
+    finally:
+        await intake.close()
+
+    for index, outcome in enumerate(outcomes):
+        if index in bad:
+            if isinstance(outcome, BidReceipt):
+                raise AssertionError(f"Bad bid {bids[index]} was accepted")
+        elif not (isinstance(outcome, BidReceipt)
+                  or isinstance(outcome, BidRejected) and str(outcome).startswith("❌ Insufficient points!")):
+            raise AssertionError(f"Bid {bids[index]} failed alongside a bad bid: {outcome!r}")
+
+    async with aiosqlite.connect(DB_PATH) as db:
+        cursor = await db.execute(
+            """SELECT team_id, SUM(bid_amount) FROM free_agency_bids
+               WHERE period_id = ? AND status = 'active'
+               GROUP BY team_id""",
+            (period_id,)
+        )
+        spent = dict(await cursor.fetchall())
+        cursor = await db.execute(
+            "SELECT team_id, active_points FROM team_auction_balance WHERE period_id = ?",
+            (period_id,)
+        )
+        ledger = {team_id: points for team_id, points in await cursor.fetchall() if points}
+    overspent = {team_id: points for team_id, points in spent.items() if points > max_points}
+    if overspent:
+        raise AssertionError(f"Teams over their {max_points} auction points: {overspent}")
+    if ledger != spent:
+        raise AssertionError(f"team_auction_balance drifted from the bids: {ledger} != {spent}")
+
+
+OPERATIONS = [
+    Operation('autocomplete:player_name', player_name_autocomplete, max_queries=1),
+    Operation('autocomplete:free_agent', free_agent_autocomplete, max_queries=2),
+    Operation('autocomplete:free_agent_cached', free_agent_autocomplete_cached, max_queries=0),
+    Operation('autocomplete:team', team_autocomplete, max_queries=1),
+    Operation('search_players', search_players, max_queries=1),
+    Operation('roster', roster, max_queries=2),
+    Operation('roster_cached', roster_cached, max_queries=0),
+    Operation('export_data', export_data),
+    Operation('import_data', import_data, max_queries=85),
+    Operation('start_matching_period', start_matching_period, mutates=True),
+    Operation('end_matching_period', end_matching_period, mutates=True, setup=prepare_end_matching_period),
+    Operation('next_round', next_round, mutates=True),
+    Operation('execute_trade', execute_trade, mutates=True, max_queries=15),
+    Operation('bid_rush', bid_rush, mutates=True),
+]
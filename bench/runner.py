@@ -0,0 +1,159 @@
+"""Timing, query counting and reporting for the benchmark suite."""
+
+import contextlib
+import io
+import json
+import math
+import shutil
+import time
+
+from config import DB_PATH
+import query_log
+from render_cache import render_cache
+from settings_store import settings
+
+
+class Operation:
+    """
+    One benchmarked action.
+
+    Args:
+        name: Name shown in the report
+        run: async function(context) doing the work being timed
+        mutates: Restore the league snapshot before every run
+        setup: Optional async function(context) run before each run, untimed
+        max_queries: Optional SQL statement budget (query_log.query_budget) - a run
+            over it is reported as an error. Only for operations whose count
+            doesn't grow with the league
+    """
+
+    def __init__(self, name, run, mutates=False, setup=None, max_queries=None):
+        self.name = name
+        self.run = run
+        self.mutates = mutates
+        self.setup = setup
+        self.max_queries = max_queries
+
+    def counting(self):
+        """Context manager counting a run's statements, enforcing max_queries if set"""
+        if self.max_queries is None:
+            return query_log.track(self.name)
+        return query_log.query_budget(self.max_queries, self.name)
+
+
+class Result:
+    def __init__(self, name, timings, queries, errors):
+        self.name = name
+        self.timings = timings  # seconds, one per successful run
+        self.queries = queries  # statements per successful run
+        self.errors = errors
+
+    def percentile(self, values, fraction):
+        """Nearest-rank percentile"""
+        if not values:
+            return None
+        ordered = sorted(values)
+        return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+    def summary(self):
+        return {
+            'runs': len(self.timings),
+            'errors': len(self.errors),
+            'p50_ms': round(1000 * self.percentile(self.timings, 0.5), 2) if self.timings else None,
+            'p95_ms': round(1000 * self.percentile(self.timings, 0.95), 2) if self.timings else None,
+            'max_ms': round(1000 * max(self.timings), 2) if self.timings else None,
+            'queries': self.percentile(self.queries, 0.5),
+        }
+
+
+def snapshot(path):
+    """Copy the league database so mutating operations can start from it again"""
+    shutil.copyfile(DB_PATH, path)
+
+
+def restore(path):
+    shutil.copyfile(path, DB_PATH)
+    # The copy replaced the tables under the in-memory settings and renderings
+    settings.invalidate()
+    render_cache.invalidate()
+
+
+async def run_operation(operation, context, repeat, snapshot_path, quiet=True):
+    """
+    Time an operation repeat times.
+
+    Returns:
+        Result: Timings and query counts for the successful runs
+    """
+    timings = []
+    queries = []
+    errors = []
+    for _ in range(repeat):
+        if operation.mutates:
+            restore(snapshot_path)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+            if operation.setup:
+                await operation.setup(context)
+            try:
+                # The budget is checked as the block exits, so its AssertionError lands here too
+                with operation.counting() as statements:
+                    start = time.perf_counter()
+                    try:
+                        await operation.run(context)
+                    finally:
+                        elapsed = time.perf_counter() - start
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+                continue
+        timings.append(elapsed)
+        queries.append(statements.count)
+    if operation.mutates:
+        restore(snapshot_path)
+    return Result(operation.name, timings, queries, errors)
+
+
+def format_report(results, baseline=None, tolerance=0.25):
+    """
+    Render results as a text table, flagging regressions against a baseline.
+
+    Args:
+        results: List of Result
+        baseline: Optional {name: summary} from an earlier --save
+        tolerance: Allowed p95 slowdown before an operation is flagged (0.25 = 25%)
+
+    Returns:
+        tuple: (report text, list of regression descriptions)
+    """
+    lines = [f"{'operation':<34}{'runs':>6}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'queries':>9}"]
+    regressions = []
+    for result in results:
+        summary = result.summary()
+        if not summary['runs']:
+            lines.append(f"{result.name:<34}{'failed':>6}  {result.errors[0] if result.errors else ''}")
+            continue
+        line = (f"{result.name:<34}{summary['runs']:>6}{summary['p50_ms']:>10.2f}{summary['p95_ms']:>10.2f}"
+                f"{summary['max_ms']:>10.2f}{summary['queries']:>9}")
+
+        previous = (baseline or {}).get(result.name)
+        if previous and previous.get('p95_ms'):
+            change = summary['p95_ms'] / previous['p95_ms'] - 1
+            line += f"  {change:+.0%}"
+            if change > tolerance:
+                regressions.append(f"{result.name}: p95 {previous['p95_ms']}ms -> {summary['p95_ms']}ms")
+            if previous.get('queries') is not None and summary['queries'] > previous['queries']:
+                regressions.append(f"{result.name}: queries {previous['queries']} -> {summary['queries']}")
+        if result.errors:
+            line += f"  ({len(result.errors)} errors: {result.errors[0]})"
+        lines.append(line)
+    return "\n".join(lines), regressions
+
+
+def save_results(results, path, league_size):
+    with open(path, 'w') as f:
+        json.dump({'league': league_size, 'operations': {result.name: result.summary() for result in results}}, f, indent=2)
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)['operations']
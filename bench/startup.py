@@ -0,0 +1,87 @@
+"""Time the bot's startup imports: python -m bench.startup --runs 5
+
+Imports are cached per process, so every run is a fresh interpreter that
+imports bot (everything python bot.py imports), creates the schema in an empty
+database and loads all the extensions, the way setup_hook does. It reports the
+import and extension load times, peak RSS, and whether pandas got loaded -
+excel_io keeps it out of startup, so the run exits 1 if it shows up.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Runs in each fresh interpreter, with DB_PATH already in the environment
+PROBE = """
+import asyncio, json, sys, time
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+start = time.perf_counter()
+import bot
+imported = time.perf_counter()
+
+async def load():
+    await bot.init_db()
+    loading = time.perf_counter()
+    for name in bot.EXTENSIONS:
+        await bot.bot.load_extension(name)
+    return time.perf_counter() - loading
+
+load_seconds = asyncio.run(load())
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'extensions_ms': load_seconds * 1000,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 if resource else None,
+    'pandas': 'pandas' in sys.modules,
+}))
+"""
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog="python -m bench.startup", description="Time the bot's startup imports")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time")
+    return parser.parse_args()
+
+
+def probe(db_path):
+    """One run in a fresh interpreter - returns the PROBE's measurements"""
+    env = dict(os.environ, DB_PATH=db_path)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    completed = subprocess.run([sys.executable, "-c", PROBE], cwd=root, env=env,
+                               capture_output=True, text=True, check=True)
+    # The bot prints as it loads - the measurements are the last line
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main(args):
+    runs = []
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory() as tempdir:
+            runs.append(probe(os.path.join(tempdir, "startup.db")))
+
+    for key, label in (('import_ms', "imports"), ('extensions_ms', "extensions"), ('max_rss_mb', "max RSS")):
+        values = [run[key] for run in runs if run[key] is not None]
+        if values:
+            unit = "MB" if key == 'max_rss_mb' else "ms"
+            print(f"{label:<12} median {statistics.median(values):7.1f}{unit}   "
+                  f"min {min(values):7.1f}{unit}   max {max(values):7.1f}{unit}")
+    totals = [run['import_ms'] + run['extensions_ms'] for run in runs]
+    print(f"{'total':<12} median {statistics.median(totals):7.1f}ms   min {min(totals):7.1f}ms   max {max(totals):7.1f}ms")
+
+    pandas_runs = sum(run['pandas'] for run in runs)
+    if pandas_runs:
+        print(f"\npandas was loaded at startup in {pandas_runs} of {len(runs)} runs")
+        return 1
+    print("\npandas not loaded at startup")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(parse_args()))
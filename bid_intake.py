@@ -0,0 +1,276 @@
+"""Serialized bid intake for /placebid.
+
+Every bid goes through one queue and is written by a single worker task, so two
+bids from the same team can never both pass the points check. The worker takes
+whatever has queued up since its last write (up to MAX_BATCH bids) and handles
+it as one BEGIN IMMEDIATE transaction: period statuses, team balances from the
+team_auction_balance ledger and existing bids are read once for the whole batch,
+each bid is checked against the running balance, and the accepted bids are
+written with one executemany for inserts, one for updates and a single commit.
+Under a deadline rush that turns hundreds of connections and commits into a
+handful.
+
+A bid that fails its own check is rejected on its own; if the batch's
+transaction fails as a whole, each of its bids is retried in a transaction of
+its own, so one bad write or lock timeout only fails the bids it belongs to.
+
+BEGIN IMMEDIATE takes the write lock before anything is read, so withdrawals,
+period changes, trades and player edits made on other connections can't slip in
+between the check and the write either. That is also why the player's team and
+contract are checked here rather than against the cog's FreeAgentPool.
+"""
+
+import asyncio
+import aiosqlite
+from config import DB_PATH
+
+# Most bids handled in one transaction
+MAX_BATCH = 25
+
+
+class BidRejected(Exception):
+    """A bid failed validation - the message is shown to the user as-is"""
+
+
+class BidReceipt:
+    """Outcome of an accepted bid"""
+
+    def __init__(self, action, remaining_points):
+        self.action = action  # 'Placed' or 'Updated'
+        self.remaining_points = remaining_points
+
+
+class BidIntake:
+    def __init__(self, db_path=DB_PATH, max_batch=MAX_BATCH):
+        self.db_path = db_path
+        self.max_batch = max_batch
+        self.queue = None
+        self.worker = None
+
+    async def submit(self, period_id, team_id, player_id, amount, max_points):
+        """
+        Queue a bid and wait for it to be written.
+
+        Args:
+            period_id: Bidding period the bid is for
+            team_id: Bidding team
+            player_id: Free agent being bid on
+            amount: Bid amount (already checked against 1..max_points)
+            max_points: The period's auction points
+
+        Returns:
+            BidReceipt: Whether the bid was placed or updated, and the team's points left
+
+        Raises:
+            BidRejected: The period has closed, the player isn't an opposition free agent
+                or the team can't afford the bid
+        """
+        if self.worker is None or self.worker.done():
+            self.queue = asyncio.Queue()
+            self.worker = asyncio.create_task(self.run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((period_id, team_id, player_id, amount, max_points, future))
+        return await future
+
+    async def close(self):
+        """Stop the worker and fail any bids still waiting in the queue"""
+        if self.worker is None:
+            return
+        self.worker.cancel()
+        try:
+            await self.worker
+        except asyncio.CancelledError:
+            pass
+        self.worker = None
+
+        while not self.queue.empty():
+            future = self.queue.get_nowait()[-1]
+            if not future.done():
+                future.set_exception(BidRejected("❌ The bot is restarting - please place your bid again."))
+
+    async def run(self):
+        """Worker loop - write queued bids in batches"""
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            bids = [bid[:-1] for bid in batch]
+            try:
+                outcomes = await self.process_batch(bids)
+            except Exception as e:
+                # A lock timeout or one bad write shouldn't fail everyone queued with it -
+                # give each bid its own transaction before reporting an error
+                print(f"Bid intake batch of {len(batch)} failed: {e} - retrying bids one at a time")
+                outcomes = [await self.process_alone(bid) for bid in bids]
+
+            for bid, outcome in zip(batch, outcomes):
+                future = bid[-1]
+                if future.done():
+                    continue
+                if isinstance(outcome, Exception):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+
+    async def process_alone(self, bid):
+        """
+        Write one bid in its own transaction, after the batch it came in failed.
+
+        Args:
+            bid: (period_id, team_id, player_id, amount, max_points)
+
+        Returns:
+            BidReceipt, BidRejected, or the exception the write failed with
+        """
+        try:
+            return (await self.process_batch([bid]))[0]
+        except Exception as e:
+            print(f"Bid intake failed for team {bid[1]}, player {bid[2]}: {e}")
+            return e
+
+    async def process_batch(self, bids):
+        """
+        Validate and write a batch of bids in one transaction.
+
+        Args:
+            bids: List of (period_id, team_id, player_id, amount, max_points) in arrival order
+
+        Returns:
+            list: A BidReceipt or BidRejected for each bid, in the same order
+        """
+        period_ids = sorted({bid[0] for bid in bids})
+        team_ids = sorted({bid[1] for bid in bids})
+        player_ids = sorted({bid[2] for bid in bids})
+
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                period_marks = ','.join('?' * len(period_ids))
+                team_marks = ','.join('?' * len(team_ids))
+
+                player_marks = ','.join('?' * len(player_ids))
+
+                cursor = await db.execute(
+                    f"""SELECT period_id, season_number FROM free_agency_periods
+                        WHERE status = 'bidding' AND period_id IN ({period_marks})""",
+                    period_ids
+                )
+                open_periods = dict(await cursor.fetchall())
+
+                cursor = await db.execute(
+                    f"SELECT player_id, name, team_id, contract_expiry FROM players WHERE player_id IN ({player_marks})",
+                    player_ids
+                )
+                players = {row[0]: row[1:] for row in await cursor.fetchall()}
+
+                cursor = await db.execute(
+                    f"""SELECT period_id, team_id, active_points FROM team_auction_balance
+                        WHERE period_id IN ({period_marks}) AND team_id IN ({team_marks})""",
+                    period_ids + team_ids
+                )
+                balances = {(period_id, team_id): active for period_id, team_id, active in await cursor.fetchall()}
+
+                cursor = await db.execute(
+                    f"""SELECT period_id, team_id, player_id, bid_amount, status FROM free_agency_bids
+                        WHERE period_id IN ({period_marks}) AND team_id IN ({team_marks})
+                          AND player_id IN ({player_marks})""",
+                    period_ids + team_ids + player_ids
+                )
+                existing = {(period_id, team_id, player_id): (amount, status)
+                            for period_id, team_id, player_id, amount, status in await cursor.fetchall()}
+
+                outcomes = []
+                inserts = []
+                updates = []
+                for period_id, team_id, player_id, amount, max_points in bids:
+                    key = (period_id, team_id, player_id)
+                    previous = existing.get(key)
+                    try:
+                        spent, remaining = self.check_bid(open_periods.get(period_id), team_id, players.get(player_id),
+                                                          balances.get((period_id, team_id), 0), previous, amount, max_points)
+                    except BidRejected as e:
+                        outcomes.append(e)
+                        continue
+                    except Exception as e:
+                        # Only this bid is bad - the rest of the batch goes ahead
+                        print(f"Bid intake couldn't check team {team_id}'s bid on player {player_id}: {e}")
+                        outcomes.append(BidRejected("❌ Your bid couldn't be checked - please try again."))
+                        continue
+
+                    # Track the write so later bids in this batch see it
+                    status = previous[1] if previous else 'active'
+                    if status == 'active':
+                        balances[(period_id, team_id)] = spent + amount
+                    if previous:
+                        updates.append((amount, period_id, team_id, player_id))
+                    else:
+                        inserts.append((period_id, team_id, player_id, amount))
+                    existing[key] = (amount, status)
+                    outcomes.append(BidReceipt("Updated" if previous else "Placed", remaining - amount))
+
+                # Inserts first - a later bid in the batch may update a row inserted here.
+                # (Not an upsert: its conflict handling would override the ledger triggers' INSERT OR IGNORE.)
+                await db.executemany(
+                    """INSERT INTO free_agency_bids (period_id, team_id, player_id, bid_amount)
+                       VALUES (?, ?, ?, ?)""",
+                    inserts
+                )
+                await db.executemany(
+                    """UPDATE free_agency_bids
+                       SET bid_amount = ?, updated_at = CURRENT_TIMESTAMP
+                       WHERE period_id = ? AND team_id = ? AND player_id = ?""",
+                    updates
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+        return outcomes
+
+    @staticmethod
+    def check_bid(season_number, team_id, player, spent, previous, amount, max_points):
+        """
+        Check one bid against the player as they are now and its team's running balance.
+
+        Args:
+            season_number: Season of the bid's period, or None if it isn't taking bids
+            team_id: Bidding team
+            player: (name, team_id, contract_expiry) of the player, or None if they don't exist
+            spent: Points the team has on active bids in the period
+            previous: (bid_amount, status) of the team's existing bid on the player, or None
+            amount: Bid amount
+            max_points: The period's auction points
+
+        Returns:
+            tuple: (points spent without the existing bid, points remaining before this one)
+
+        Raises:
+            BidRejected: The period has closed, the player isn't an opposition free agent
+                or the team can't afford the bid
+        """
+        if season_number is None:
+            raise BidRejected("❌ No active bidding period!")
+
+        if player is None:
+            raise BidRejected("❌ Player not found!")
+        name, player_team_id, contract_expiry = player
+        if player_team_id is None or contract_expiry != season_number:
+            raise BidRejected(f"❌ {name} is not a free agent this season!")
+        if player_team_id == team_id:
+            raise BidRejected("❌ You cannot bid on your own players! Wait for the matching period.")
+
+        if previous and previous[1] == 'active':
+            spent -= previous[0]
+
+        remaining = max_points - spent
+        if amount > remaining:
+            raise BidRejected(
+                f"❌ Insufficient points!\n\n"
+                f"**Available:** {remaining} points\n"
+                f"**Bid Amount:** {amount} points\n\n"
+                f"Use `/auctionsmenu` to view your bids."
+            )
+        return spent, remaining
@@ -1,14 +1,111 @@
 import discord
 from discord.ext import commands
 import aiosqlite
-from config import DISCORD_BOT_TOKEN, GUILD_ID, DB_PATH
+import asyncio
+import hashlib
+import json
+import time
+from config import DISCORD_BOT_TOKEN, GUILD_ID, DB_PATH, METRICS_PORT, METRICS_HOST
+from excel_io import shutdown_worker
+import metrics
+from metrics_server import MetricsServer
+from loop_monitor import LoopMonitor
+from team_emojis import team_emojis
+
+# Command modules loaded at startup
+EXTENSIONS = [
+    'commands.player_commands',
+    'commands.admin_commands',
+    'commands.lineup_commands',
+    'commands.season_commands',
+    'commands.injury_commands',
+    'commands.suspension_commands',
+    'commands.trade_commands',
+    'commands.draft_commands',
+    'commands.free_agency_commands',
+]
+
+
+class AFFLBot(commands.Bot):
+    async def setup_hook(self):
+        """Startup pipeline - runs once per process, before connecting to the gateway.
+
+        on_ready fires again on every reconnect, so nothing here may live there.
+        """
+        startup_start = time.perf_counter()
+
+        # Time every interaction and its SQL for /perfstats, logging slow statements and N+1 loops
+        metrics.install(self)
+        # Catch synchronous work blocking the event loop, with the stack that did it
+        self.loop_monitor = LoopMonitor(self)
+        self.loop_monitor.start()
+        # Team emojis by team_id, resolved once and refreshed when the guild's emojis change
+        team_emojis.install(self)
+
+        phase_start = time.perf_counter()
+        await init_db()
+        print(f"[startup] init_db: {(time.perf_counter() - phase_start) * 1000:.0f}ms")
+        await team_emojis.reload()
+
+        phase_start = time.perf_counter()
+        await reconcile_derived_tables()
+        print(f"[startup] reconcile: {(time.perf_counter() - phase_start) * 1000:.0f}ms")
+
+        # cog_load only reads (persistent views) - every startup write happens above, one
+        # transaction at a time - so the cogs can load side by side
+        phase_start = time.perf_counter()
+        results = await asyncio.gather(
+            *(self.load_extension(name) for name in EXTENSIONS),
+            return_exceptions=True
+        )
+        for name, result in zip(EXTENSIONS, results):
+            if isinstance(result, Exception):
+                print(f"Error loading extension {name}: {result}")
+        print(f"[startup] load_extensions: {(time.perf_counter() - phase_start) * 1000:.0f}ms")
+
+        if METRICS_PORT:
+            self.metrics_server = MetricsServer(self, METRICS_HOST, METRICS_PORT)
+            await self.metrics_server.start()
+            print(f"Serving metrics on http://{METRICS_HOST}:{self.metrics_server.port}/metrics")
+
+        # Syncing is a slow HTTP round trip and the commands already exist on
+        # Discord's side, so don't hold up the gateway connection for it
+        self.sync_task = asyncio.create_task(sync_command_tree(self))
+
+        print(f"[startup] setup_hook total: {(time.perf_counter() - startup_start) * 1000:.0f}ms")
+
+    async def close(self):
+        shutdown_worker()
+        if getattr(self, 'loop_monitor', None):
+            self.loop_monitor.stop()
+        if getattr(self, 'metrics_server', None):
+            await self.metrics_server.stop()
+        await super().close()
+
 
 # Bot setup
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 
-bot = commands.Bot(command_prefix='!', intents=intents)
+bot = AFFLBot(command_prefix='!', intents=intents)
+
+async def reconcile_derived_tables():
+    """Check the ledger tables against the rows they summarise, correcting any drift"""
+    from commands.free_agency_commands import reconcile_auction_balances
+    from commands.season_commands import reconcile_ladder
+
+    async with aiosqlite.connect(DB_PATH) as db:
+        drift = await reconcile_auction_balances(db)
+        await db.commit()
+        for period_id, team_id, ledger, actual in drift:
+            print(f"Auction balance corrected for period {period_id}, team {team_id}: {ledger} -> {actual}")
+
+        drift = await reconcile_ladder(db)
+        await db.commit()
+        if drift:
+            print(f"Ladder standings corrected for {len(drift)} team season(s)")
+
 
 # Initialize database
 async def init_db():
@@ -344,6 +441,159 @@ async def init_db():
             )
         ''')
 
+        # Create Team Auction Balance ledger (points committed per team per period).
+        # Kept in step with free_agency_bids by the triggers below, so balance reads
+        # don't need to SUM every bid.
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS team_auction_balance (
+                period_id INTEGER NOT NULL,
+                team_id INTEGER NOT NULL,
+                active_points INTEGER NOT NULL DEFAULT 0,
+                winning_points INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (period_id, team_id),
+                FOREIGN KEY (period_id) REFERENCES free_agency_periods(period_id),
+                FOREIGN KEY (team_id) REFERENCES teams(team_id)
+            )
+        ''')
+
+        await db.execute('''
+            CREATE TRIGGER IF NOT EXISTS team_auction_balance_bid_insert
+            AFTER INSERT ON free_agency_bids
+            BEGIN
+                INSERT OR IGNORE INTO team_auction_balance (period_id, team_id) VALUES (NEW.period_id, NEW.team_id);
+                UPDATE team_auction_balance
+                SET active_points = active_points + CASE WHEN NEW.status = 'active' THEN NEW.bid_amount ELSE 0 END,
+                    winning_points = winning_points + CASE WHEN NEW.status = 'winning' THEN NEW.bid_amount ELSE 0 END
+                WHERE period_id = NEW.period_id AND team_id = NEW.team_id;
+            END
+        ''')
+
+        await db.execute('''
+            CREATE TRIGGER IF NOT EXISTS team_auction_balance_bid_update
+            AFTER UPDATE OF period_id, team_id, bid_amount, status ON free_agency_bids
+            BEGIN
+                UPDATE team_auction_balance
+                SET active_points = active_points - CASE WHEN OLD.status = 'active' THEN OLD.bid_amount ELSE 0 END,
+                    winning_points = winning_points - CASE WHEN OLD.status = 'winning' THEN OLD.bid_amount ELSE 0 END
+                WHERE period_id = OLD.period_id AND team_id = OLD.team_id;
+                INSERT OR IGNORE INTO team_auction_balance (period_id, team_id) VALUES (NEW.period_id, NEW.team_id);
+                UPDATE team_auction_balance
+                SET active_points = active_points + CASE WHEN NEW.status = 'active' THEN NEW.bid_amount ELSE 0 END,
+                    winning_points = winning_points + CASE WHEN NEW.status = 'winning' THEN NEW.bid_amount ELSE 0 END
+                WHERE period_id = NEW.period_id AND team_id = NEW.team_id;
+            END
+        ''')
+
+        await db.execute('''
+            CREATE TRIGGER IF NOT EXISTS team_auction_balance_bid_delete
+            AFTER DELETE ON free_agency_bids
+            BEGIN
+                UPDATE team_auction_balance
+                SET active_points = active_points - CASE WHEN OLD.status = 'active' THEN OLD.bid_amount ELSE 0 END,
+                    winning_points = winning_points - CASE WHEN OLD.status = 'winning' THEN OLD.bid_amount ELSE 0 END
+                WHERE period_id = OLD.period_id AND team_id = OLD.team_id;
+            END
+        ''')
+
+        # Create Ladder Standings table (W/L/D and points for each team, kept up to date
+        # from matches by the triggers below - a match counts once it has a result)
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS ladder_standings (
+                season_id INTEGER NOT NULL,
+                team_id INTEGER NOT NULL,
+                played INTEGER NOT NULL DEFAULT 0,
+                wins INTEGER NOT NULL DEFAULT 0,
+                losses INTEGER NOT NULL DEFAULT 0,
+                draws INTEGER NOT NULL DEFAULT 0,
+                points_for INTEGER NOT NULL DEFAULT 0,
+                points_against INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (season_id, team_id),
+                FOREIGN KEY (season_id) REFERENCES seasons(season_id),
+                FOREIGN KEY (team_id) REFERENCES teams(team_id)
+            )
+        ''')
+
+        await db.execute('''
+            CREATE TRIGGER IF NOT EXISTS ladder_standings_match_insert
+            AFTER INSERT ON matches
+            BEGIN
+                INSERT OR IGNORE INTO ladder_standings (season_id, team_id)
+                VALUES (NEW.season_id, NEW.home_team_id), (NEW.season_id, NEW.away_team_id);
+                UPDATE ladder_standings
+                SET played = played + 1,
+                    wins = wins + CASE WHEN IFNULL(NEW.home_score, 0) = IFNULL(NEW.away_score, 0) THEN 0
+                                  WHEN (team_id = NEW.home_team_id) = (IFNULL(NEW.home_score, 0) > IFNULL(NEW.away_score, 0)) THEN 1
+                                  ELSE 0 END,
+                    losses = losses + CASE WHEN IFNULL(NEW.home_score, 0) = IFNULL(NEW.away_score, 0) THEN 0
+                                      WHEN (team_id = NEW.home_team_id) = (IFNULL(NEW.home_score, 0) > IFNULL(NEW.away_score, 0)) THEN 0
+                                      ELSE 1 END,
+                    draws = draws + CASE WHEN IFNULL(NEW.home_score, 0) = IFNULL(NEW.away_score, 0) THEN 1 ELSE 0 END,
+                    points_for = points_for + CASE WHEN team_id = NEW.home_team_id THEN IFNULL(NEW.home_score, 0) ELSE IFNULL(NEW.away_score, 0) END,
+                    points_against = points_against + CASE WHEN team_id = NEW.home_team_id THEN IFNULL(NEW.away_score, 0) ELSE IFNULL(NEW.home_score, 0) END
+                WHERE season_id = NEW.season_id AND team_id IN (NEW.home_team_id, NEW.away_team_id)
+                  AND NEW.home_team_id <> NEW.away_team_id
+                  AND (IFNULL(NEW.simulated, 0) = 1 OR IFNULL(NEW.home_score, 0) > 0 OR IFNULL(NEW.away_score, 0) > 0);
+            END
+        ''')
+
+        await db.execute('''
+            CREATE TRIGGER IF NOT EXISTS ladder_standings_match_update
+            AFTER UPDATE OF season_id, home_team_id, away_team_id, home_score, away_score, simulated ON matches
+            BEGIN
+                UPDATE ladder_standings
+                SET played = played - 1,
+                    wins = wins - CASE WHEN IFNULL(OLD.home_score, 0) = IFNULL(OLD.away_score, 0) THEN 0
+                                  WHEN (team_id = OLD.home_team_id) = (IFNULL(OLD.home_score, 0) > IFNULL(OLD.away_score, 0)) THEN 1
+                                  ELSE 0 END,
+                    losses = losses - CASE WHEN IFNULL(OLD.home_score, 0) = IFNULL(OLD.away_score, 0) THEN 0
+                                      WHEN (team_id = OLD.home_team_id) = (IFNULL(OLD.home_score, 0) > IFNULL(OLD.away_score, 0)) THEN 0
+                                      ELSE 1 END,
+                    draws = draws - CASE WHEN IFNULL(OLD.home_score, 0) = IFNULL(OLD.away_score, 0) THEN 1 ELSE 0 END,
+                    points_for = points_for - CASE WHEN team_id = OLD.home_team_id THEN IFNULL(OLD.home_score, 0) ELSE IFNULL(OLD.away_score, 0) END,
+                    points_against = points_against - CASE WHEN team_id = OLD.home_team_id THEN IFNULL(OLD.away_score, 0) ELSE IFNULL(OLD.home_score, 0) END
+                WHERE season_id = OLD.season_id AND team_id IN (OLD.home_team_id, OLD.away_team_id)
+                  AND OLD.home_team_id <> OLD.away_team_id
+                  AND (IFNULL(OLD.simulated, 0) = 1 OR IFNULL(OLD.home_score, 0) > 0 OR IFNULL(OLD.away_score, 0) > 0);
+                INSERT OR IGNORE INTO ladder_standings (season_id, team_id)
+                VALUES (NEW.season_id, NEW.home_team_id), (NEW.season_id, NEW.away_team_id);
+                UPDATE ladder_standings
+                SET played = played + 1,
+                    wins = wins + CASE WHEN IFNULL(NEW.home_score, 0) = IFNULL(NEW.away_score, 0) THEN 0
+                                  WHEN (team_id = NEW.home_team_id) = (IFNULL(NEW.home_score, 0) > IFNULL(NEW.away_score, 0)) THEN 1
+                                  ELSE 0 END,
+                    losses = losses + CASE WHEN IFNULL(NEW.home_score, 0) = IFNULL(NEW.away_score, 0) THEN 0
+                                      WHEN (team_id = NEW.home_team_id) = (IFNULL(NEW.home_score, 0) > IFNULL(NEW.away_score, 0)) THEN 0
+                                      ELSE 1 END,
+                    draws = draws + CASE WHEN IFNULL(NEW.home_score, 0) = IFNULL(NEW.away_score, 0) THEN 1 ELSE 0 END,
+                    points_for = points_for + CASE WHEN team_id = NEW.home_team_id THEN IFNULL(NEW.home_score, 0) ELSE IFNULL(NEW.away_score, 0) END,
+                    points_against = points_against + CASE WHEN team_id = NEW.home_team_id THEN IFNULL(NEW.away_score, 0) ELSE IFNULL(NEW.home_score, 0) END
+                WHERE season_id = NEW.season_id AND team_id IN (NEW.home_team_id, NEW.away_team_id)
+                  AND NEW.home_team_id <> NEW.away_team_id
+                  AND (IFNULL(NEW.simulated, 0) = 1 OR IFNULL(NEW.home_score, 0) > 0 OR IFNULL(NEW.away_score, 0) > 0);
+            END
+        ''')
+
+        await db.execute('''
+            CREATE TRIGGER IF NOT EXISTS ladder_standings_match_delete
+            AFTER DELETE ON matches
+            BEGIN
+                UPDATE ladder_standings
+                SET played = played - 1,
+                    wins = wins - CASE WHEN IFNULL(OLD.home_score, 0) = IFNULL(OLD.away_score, 0) THEN 0
+                                  WHEN (team_id = OLD.home_team_id) = (IFNULL(OLD.home_score, 0) > IFNULL(OLD.away_score, 0)) THEN 1
+                                  ELSE 0 END,
+                    losses = losses - CASE WHEN IFNULL(OLD.home_score, 0) = IFNULL(OLD.away_score, 0) THEN 0
+                                      WHEN (team_id = OLD.home_team_id) = (IFNULL(OLD.home_score, 0) > IFNULL(OLD.away_score, 0)) THEN 0
+                                      ELSE 1 END,
+                    draws = draws - CASE WHEN IFNULL(OLD.home_score, 0) = IFNULL(OLD.away_score, 0) THEN 1 ELSE 0 END,
+                    points_for = points_for - CASE WHEN team_id = OLD.home_team_id THEN IFNULL(OLD.home_score, 0) ELSE IFNULL(OLD.away_score, 0) END,
+                    points_against = points_against - CASE WHEN team_id = OLD.home_team_id THEN IFNULL(OLD.away_score, 0) ELSE IFNULL(OLD.home_score, 0) END
+                WHERE season_id = OLD.season_id AND team_id IN (OLD.home_team_id, OLD.away_team_id)
+                  AND OLD.home_team_id <> OLD.away_team_id
+                  AND (IFNULL(OLD.simulated, 0) = 1 OR IFNULL(OLD.home_score, 0) > 0 OR IFNULL(OLD.away_score, 0) > 0);
+            END
+        ''')
+
         # Create Draft Pool team if it doesn't exist
         cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = 'Draft Pool'")
         if not await cursor.fetchone():
@@ -365,36 +615,62 @@ async def init_db():
         await db.commit()
         print("Database initialized successfully!")
 
-@bot.event
-async def on_ready():
-    print(f'{bot.user} has connected to Discord!')
-    await init_db()
-    
-    # Load command modules
-    await bot.load_extension('commands.player_commands')
-    await bot.load_extension('commands.admin_commands')
-    await bot.load_extension('commands.lineup_commands')
-    await bot.load_extension('commands.season_commands')
-    await bot.load_extension('commands.injury_commands')
-    await bot.load_extension('commands.suspension_commands')
-    await bot.load_extension('commands.trade_commands')
-    await bot.load_extension('commands.draft_commands')
-    await bot.load_extension('commands.free_agency_commands')
-    
+def command_tree_hash(tree, guild=None):
+    """Hash the payload that tree.sync would send, so unchanged trees can skip syncing."""
+    payload = [command.to_dict(tree) for command in tree.get_commands(guild=guild)]
+    payload.sort(key=lambda command: (command.get('type', 1), command['name']))
+    encoded = json.dumps({'guild': guild.id if guild else None, 'commands': payload},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+async def sync_command_tree(bot):
+    """Sync application commands, skipping the sync when the tree hasn't changed since the last deploy"""
+    phase_start = time.perf_counter()
     try:
+        guild = None
         if GUILD_ID:
             # Sync to specific guild (faster for development)
             guild = discord.Object(id=GUILD_ID)
             bot.tree.copy_global_to(guild=guild)
+
+        tree_hash = command_tree_hash(bot.tree, guild)
+
+        async with aiosqlite.connect(DB_PATH) as db:
+            cursor = await db.execute(
+                "SELECT setting_value FROM settings WHERE setting_key = 'command_tree_hash'"
+            )
+            result = await cursor.fetchone()
+
+        if result and result[0] == tree_hash:
+            print(f"Command tree unchanged, skipping sync "
+                  f"({(time.perf_counter() - phase_start) * 1000:.0f}ms)")
+            return
+
+        if guild:
             synced = await bot.tree.sync(guild=guild)
             print(f"Synced {len(synced)} command(s) to guild {GUILD_ID}")
         else:
             # Sync globally (slower, can take up to 1 hour)
             synced = await bot.tree.sync()
             print(f"Synced {len(synced)} command(s) globally")
+
+        async with aiosqlite.connect(DB_PATH) as db:
+            await db.execute(
+                "INSERT OR REPLACE INTO settings (setting_key, setting_value) VALUES ('command_tree_hash', ?)",
+                (tree_hash,)
+            )
+            await db.commit()
+
+        print(f"[startup] tree sync: {(time.perf_counter() - phase_start) * 1000:.0f}ms")
     except Exception as e:
         print(f"Error syncing commands: {e}")
 
+@bot.event
+async def on_ready():
+    # Fires on every (re)connect - startup work lives in AFFLBot.setup_hook
+    print(f'{bot.user} has connected to Discord!')
+
 # Run the bot
 if __name__ == "__main__":
     bot.run(DISCORD_BOT_TOKEN)
\ No newline at end of file
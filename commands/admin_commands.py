@@ -2,11 +2,90 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import aiosqlite
-import pandas as pd
+import asyncio
 import io
 import json
 from config import DB_PATH, ADMIN_ROLE_ID
 from positions import validate_position, get_positions_string
+from utils import ProgressMessage
+from league_import import LeagueImport
+from settings_store import settings
+from team_emojis import team_emojis
+import metrics
+import profiler
+
+# /perfstats windows, in minutes
+PERFSTATS_WINDOWS = {'hour': 60, 'day': 24 * 60}
+
+# /profile limits - a capture stops at whichever it reaches first
+PROFILE_DEFAULT_SECONDS = 60
+PROFILE_MAX_SECONDS = 600
+PROFILE_MAX_INTERACTIONS = 500
+
+# Columns read as text on /importdata so Excel doesn't mangle Discord IDs
+IMPORT_DTYPES = {
+    'Teams': {'Role_ID': str, 'Emoji_ID': str, 'Channel_ID': str},
+    'Trades': {'Created_By_User_ID': str, 'Responded_By_User_ID': str, 'Approved_By_User_ID': str},
+    'Settings': {'Setting_Value': str},
+}
+
+# Contents of the README sheet in /exportdata workbooks
+EXPORT_INSTRUCTIONS = [
+    '--- EXCEL IMPORT/EXPORT GUIDE ---',
+    '',
+    'IMPORTANT: Before editing Teams sheet:',
+    '  - Select entire Role_ID column → Right-click → Format Cells → Text',
+    '  - This prevents Excel from corrupting Discord IDs',
+    '',
+    'To import: Use /importdata command and attach this file',
+    '  - A preview of the changes is shown before anything is saved',
+    '',
+    '--- SHEET ORGANIZATION ---',
+    '',
+    'CORE DATA (Editable):',
+    '  • Teams - Team info, Discord role/emoji IDs',
+    '  • Players - Edit EXISTING players only (has Player_ID column)',
+    '  • Add_Players - Bulk add NEW players here (no Player_ID needed)',
+    '  • Seasons - Season configuration',
+    '  • Settings - Bot settings',
+    '',
+    'RELATIONSHIPS/STATE (Editable):',
+    '  • Current_Lineups - Active team lineups (Team/Position/Player)',
+    '  • Starting_Lineups - Saved lineup templates (Team/Position/Player)',
+    '  • Injuries - Injury status (Recovery calculated automatically)',
+    '  • Suspensions - Suspension status (Games missed calculated automatically)',
+    '  • Draft_Picks - Draft pick ownership',
+    '',
+    'HISTORY (Read-only - import supported):',
+    '  • Trades - Trade history',
+    '  • Matches - Match results',
+    '  • Submitted_Lineups - Historical lineup submissions',
+    '',
+    '--- KEY FEATURES ---',
+    '',
+    '1. Players sheet includes Player_ID column',
+    '   - Only updates EXISTING players',
+    '   - Cannot add new players through this sheet',
+    '',
+    '2. Add_Players sheet for bulk adding',
+    '   - Fill in Name, Team, Age, Pos, OVR',
+    '   - Import will add all new players at once',
+    '   - Skips duplicates automatically',
+    '',
+    '3. Simplified Injuries/Suspensions',
+    '   - Just enter Injury_Round and Return_Round',
+    '   - Recovery_Rounds/Games_Missed calculated on import',
+    '',
+    '4. Consistent lineup formats',
+    '   - Current_Lineups and Starting_Lineups use identical format',
+    '   - Easy to copy/paste between sheets',
+    '',
+    '--- VALID POSITIONS ---',
+    '',
+    'Player Positions: MID, KEY FWD, RUCK, GEN DEF, etc.',
+    'Lineup Positions: FB, CHB, LW, C, RW, CHF, FF, R, RR, RO, INT1-5',
+]
+
 
 class AdminCommands(commands.Cog):
     def __init__(self, bot):
@@ -164,6 +243,7 @@ class AdminCommands(commands.Cog):
                     (team_name, str(role.id), emoji_id, channel_id)
                 )
                 await db.commit()
+                await team_emojis.reload()
 
                 # Build confirmation message
                 msg = f"✅ Team **{team_name}** created!\n"
@@ -262,6 +342,7 @@ class AdminCommands(commands.Cog):
             try:
                 await db.execute(query, values)
                 await db.commit()
+                await team_emojis.reload()
 
                 # Build response
                 response = f"✅ Updated **{current_name}**\n\n"
@@ -299,78 +380,69 @@ class AdminCommands(commands.Cog):
     ):
         # If no parameters provided, show current settings
         if all(ch is None for ch in [lineups_channel, delist_log_channel, trade_approval_channel, trade_log_channel, auctions_log_channel, bot_logs_channel, draft_channel, season_1_year]):
-            async with aiosqlite.connect(DB_PATH) as db:
-                cursor = await db.execute(
-                    """SELECT setting_key, setting_value FROM settings
-                       WHERE setting_key IN ('lineups_channel_id', 'delist_log_channel_id',
-                                             'trade_approval_channel_id', 'trade_log_channel_id',
-                                             'auctions_log_channel_id', 'bot_logs_channel_id', 'draft_channel_id', 'season_1_year')"""
-                )
-                results = await cursor.fetchall()
-
             embed = discord.Embed(title="⚙️ Bot Configuration", color=discord.Color.blue())
 
-            settings = {key: value for key, value in results}
+            values = await settings.loaded()
 
             # Lineups Channel
-            if 'lineups_channel_id' in settings and settings['lineups_channel_id']:
-                channel = interaction.guild.get_channel(int(settings['lineups_channel_id']))
-                channel_display = channel.mention if channel else f"<#{settings['lineups_channel_id']}> (channel not found)"
+            if 'lineups_channel_id' in values and values['lineups_channel_id']:
+                channel = interaction.guild.get_channel(int(values['lineups_channel_id']))
+                channel_display = channel.mention if channel else f"<#{values['lineups_channel_id']}> (channel not found)"
             else:
                 channel_display = "*Not set*"
             embed.add_field(name="Lineups Channel", value=channel_display, inline=False)
 
             # Delist Log Channel
-            if 'delist_log_channel_id' in settings and settings['delist_log_channel_id']:
-                channel = interaction.guild.get_channel(int(settings['delist_log_channel_id']))
-                channel_display = channel.mention if channel else f"<#{settings['delist_log_channel_id']}> (channel not found)"
+            if 'delist_log_channel_id' in values and values['delist_log_channel_id']:
+                channel = interaction.guild.get_channel(int(values['delist_log_channel_id']))
+                channel_display = channel.mention if channel else f"<#{values['delist_log_channel_id']}> (channel not found)"
             else:
                 channel_display = "*Not set*"
             embed.add_field(name="Delist Log Channel", value=channel_display, inline=False)
 
             # Trade Approval Channel
-            if 'trade_approval_channel_id' in settings and settings['trade_approval_channel_id']:
-                channel = interaction.guild.get_channel(int(settings['trade_approval_channel_id']))
-                channel_display = channel.mention if channel else f"<#{settings['trade_approval_channel_id']}> (channel not found)"
+            if 'trade_approval_channel_id' in values and values['trade_approval_channel_id']:
+                channel = interaction.guild.get_channel(int(values['trade_approval_channel_id']))
+                channel_display = channel.mention if channel else f"<#{values['trade_approval_channel_id']}> (channel not found)"
             else:
                 channel_display = "*Not set*"
             embed.add_field(name="Trade Approval Channel", value=channel_display, inline=False)
 
             # Trade Log Channel
-            if 'trade_log_channel_id' in settings and settings['trade_log_channel_id']:
-                channel = interaction.guild.get_channel(int(settings['trade_log_channel_id']))
-                channel_display = channel.mention if channel else f"<#{settings['trade_log_channel_id']}> (channel not found)"
+            if 'trade_log_channel_id' in values and values['trade_log_channel_id']:
+                channel = interaction.guild.get_channel(int(values['trade_log_channel_id']))
+                channel_display = channel.mention if channel else f"<#{values['trade_log_channel_id']}> (channel not found)"
             else:
                 channel_display = "*Not set*"
             embed.add_field(name="Trade Log Channel", value=channel_display, inline=False)
 
             # Auctions Log Channel
-            if 'auctions_log_channel_id' in settings and settings['auctions_log_channel_id']:
-                channel = interaction.guild.get_channel(int(settings['auctions_log_channel_id']))
-                channel_display = channel.mention if channel else f"<#{settings['auctions_log_channel_id']}> (channel not found)"
+            if 'auctions_log_channel_id' in values and values['auctions_log_channel_id']:
+                channel = interaction.guild.get_channel(int(values['auctions_log_channel_id']))
+                channel_display = channel.mention if channel else f"<#{values['auctions_log_channel_id']}> (channel not found)"
             else:
                 channel_display = "*Not set*"
             embed.add_field(name="Auctions Log Channel", value=channel_display, inline=False)
 
             # Bot Logs Channel
-            if 'bot_logs_channel_id' in settings and settings['bot_logs_channel_id']:
-                channel = interaction.guild.get_channel(int(settings['bot_logs_channel_id']))
-                channel_display = channel.mention if channel else f"<#{settings['bot_logs_channel_id']}> (channel not found)"
+            if 'bot_logs_channel_id' in values and values['bot_logs_channel_id']:
+                channel = interaction.guild.get_channel(int(values['bot_logs_channel_id']))
+                channel_display = channel.mention if channel else f"<#{values['bot_logs_channel_id']}> (channel not found)"
             else:
                 channel_display = "*Not set*"
             embed.add_field(name="Bot Logs Channel", value=channel_display, inline=False)
 
             # Draft Channel
-            if 'draft_channel_id' in settings and settings['draft_channel_id']:
-                channel = interaction.guild.get_channel(int(settings['draft_channel_id']))
-                channel_display = channel.mention if channel else f"<#{settings['draft_channel_id']}> (channel not found)"
+            if 'draft_channel_id' in values and values['draft_channel_id']:
+                channel = interaction.guild.get_channel(int(values['draft_channel_id']))
+                channel_display = channel.mention if channel else f"<#{values['draft_channel_id']}> (channel not found)"
             else:
                 channel_display = "*Not set*"
             embed.add_field(name="Draft Channel", value=channel_display, inline=False)
 
             # Season 1 Year
-            if 'season_1_year' in settings and settings['season_1_year']:
-                year_display = settings['season_1_year']
+            if 'season_1_year' in values and values['season_1_year']:
+                year_display = values['season_1_year']
             else:
                 year_display = "*Not set (defaults to 2016)*"
             embed.add_field(name="Season 1 Year", value=year_display, inline=False)
@@ -384,62 +456,38 @@ class AdminCommands(commands.Cog):
         updates = []
         async with aiosqlite.connect(DB_PATH) as db:
             if lineups_channel:
-                await db.execute(
-                    "INSERT OR REPLACE INTO settings (setting_key, setting_value) VALUES (?, ?)",
-                    ("lineups_channel_id", str(lineups_channel.id))
-                )
+                await settings.set(db, "lineups_channel_id", lineups_channel.id)
                 updates.append(f"Lineups Channel → {lineups_channel.mention}")
 
             if delist_log_channel:
-                await db.execute(
-                    "INSERT OR REPLACE INTO settings (setting_key, setting_value) VALUES (?, ?)",
-                    ("delist_log_channel_id", str(delist_log_channel.id))
-                )
+                await settings.set(db, "delist_log_channel_id", delist_log_channel.id)
                 updates.append(f"Delist Log Channel → {delist_log_channel.mention}")
 
             if trade_approval_channel:
-                await db.execute(
-                    "INSERT OR REPLACE INTO settings (setting_key, setting_value) VALUES (?, ?)",
-                    ("trade_approval_channel_id", str(trade_approval_channel.id))
-                )
+                await settings.set(db, "trade_approval_channel_id", trade_approval_channel.id)
                 updates.append(f"Trade Approval Channel → {trade_approval_channel.mention}")
 
             if trade_log_channel:
-                await db.execute(
-                    "INSERT OR REPLACE INTO settings (setting_key, setting_value) VALUES (?, ?)",
-                    ("trade_log_channel_id", str(trade_log_channel.id))
-                )
+                await settings.set(db, "trade_log_channel_id", trade_log_channel.id)
                 updates.append(f"Trade Log Channel → {trade_log_channel.mention}")
 
             if auctions_log_channel:
-                await db.execute(
-                    "INSERT OR REPLACE INTO settings (setting_key, setting_value) VALUES (?, ?)",
-                    ("auctions_log_channel_id", str(auctions_log_channel.id))
-                )
+                await settings.set(db, "auctions_log_channel_id", auctions_log_channel.id)
                 updates.append(f"Auctions Log Channel → {auctions_log_channel.mention}")
 
             if bot_logs_channel:
-                await db.execute(
-                    "INSERT OR REPLACE INTO settings (setting_key, setting_value) VALUES (?, ?)",
-                    ("bot_logs_channel_id", str(bot_logs_channel.id))
-                )
+                await settings.set(db, "bot_logs_channel_id", bot_logs_channel.id)
                 updates.append(f"Bot Logs Channel → {bot_logs_channel.mention}")
 
             if draft_channel:
-                await db.execute(
-                    "INSERT OR REPLACE INTO settings (setting_key, setting_value) VALUES (?, ?)",
-                    ("draft_channel_id", str(draft_channel.id))
-                )
+                await settings.set(db, "draft_channel_id", draft_channel.id)
                 updates.append(f"Draft Channel → {draft_channel.mention}")
 
             if season_1_year is not None:
-                await db.execute(
-                    "INSERT OR REPLACE INTO settings (setting_key, setting_value) VALUES (?, ?)",
-                    ("season_1_year", str(season_1_year))
-                )
+                await settings.set(db, "season_1_year", season_1_year)
                 updates.append(f"Season 1 Year → {season_1_year}")
 
-            await db.commit()
+            await settings.commit(db)
 
         if updates:
             await interaction.response.send_message(
@@ -476,6 +524,7 @@ class AdminCommands(commands.Cog):
             # Delete the team
             await db.execute("DELETE FROM teams WHERE team_id = ?", (team_id,))
             await db.commit()
+            await team_emojis.reload()
             
             await interaction.response.send_message(
                 f"✅ Team **{team_name}** removed and all players released to free agency!"
@@ -551,11 +600,7 @@ class AdminCommands(commands.Cog):
             season_result = await cursor.fetchone()
             current_season = season_result[0] if season_result else 1
 
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = 'season_1_year'"
-            )
-            setting_result = await cursor.fetchone()
-            season_1_year = int(setting_result[0]) if setting_result else current_season
+            season_1_year = await settings.get_int('season_1_year', current_season)
             current_year = season_1_year + (current_season - 1)
             birth_year = current_year - age
 
@@ -716,11 +761,7 @@ class AdminCommands(commands.Cog):
                 season_result = await cursor.fetchone()
                 current_season = season_result[0] if season_result else 1
 
-                cursor = await db.execute(
-                    "SELECT setting_value FROM settings WHERE setting_key = 'season_1_year'"
-                )
-                setting_result = await cursor.fetchone()
-                season_1_year = int(setting_result[0]) if setting_result else current_season
+                season_1_year = await settings.get_int('season_1_year', current_season)
                 current_year = season_1_year + (current_season - 1)
                 birth_year = current_year - age
 
@@ -836,8 +877,10 @@ class AdminCommands(commands.Cog):
     @app_commands.command(name="exportdata", description="[ADMIN] Export all teams and players to Excel")
     async def export_data(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
-        
+        progress = ProgressMessage(interaction)
+
         try:
+            await progress.update("⏳ Reading league data...")
             async with aiosqlite.connect(DB_PATH) as db:
                 # Export Teams
                 cursor = await db.execute(
@@ -845,10 +888,6 @@ class AdminCommands(commands.Cog):
                        FROM teams ORDER BY team_name"""
                 )
                 teams = await cursor.fetchall()
-                teams_df = pd.DataFrame(teams, columns=['Team_Name', 'Role_ID', 'Emoji_ID', 'Channel_ID'])
-                teams_df['Role_ID'] = teams_df['Role_ID'].fillna('')
-                teams_df['Emoji_ID'] = teams_df['Emoji_ID'].fillna('')
-                teams_df['Channel_ID'] = teams_df['Channel_ID'].fillna('')
                 
                 # Export Players (existing players only - edit but don't add new)
                 cursor = await db.execute(
@@ -861,17 +900,7 @@ class AdminCommands(commands.Cog):
                        ORDER BY p.name"""
                 )
                 players = await cursor.fetchall()
-                players_df = pd.DataFrame(players, columns=['Player_ID', 'Name', 'Team', 'Age', 'Birth_Year', 'Pos', 'OVR', 'Contract_Expiry', 'Plays_Like', 'Father_Son_Club'])
-                players_df['Team'] = players_df['Team'].fillna('')
-                players_df['Birth_Year'] = players_df['Birth_Year'].fillna('')
-                players_df['Contract_Expiry'] = players_df['Contract_Expiry'].fillna('')
-                players_df['Plays_Like'] = players_df['Plays_Like'].fillna('')
-                players_df['Father_Son_Club'] = players_df['Father_Son_Club'].fillna('')
-
-                # Create Add_Players sheet (for bulk adding new players)
-                add_players_df = pd.DataFrame(columns=['Name', 'Team', 'Age', 'Pos', 'OVR', 'Contract_Expiry', 'Plays_Like', 'Father_Son_Club'])
-                add_players_df = add_players_df.fillna('')
-                
+
                 # Export Lineups (merged Current, Starting, and Submitted into one sheet with Type column)
                 lineups_list = []
 
@@ -886,15 +915,7 @@ class AdminCommands(commands.Cog):
                 )
                 current_lineups = await cursor.fetchall()
                 for team_name, position, player_id, player_name in current_lineups:
-                    lineups_list.append({
-                        'Type': 'current',
-                        'Team_Name': team_name,
-                        'Position': position,
-                        'Player_ID': player_id,
-                        'Player_Name': player_name,
-                        'Season': '',
-                        'Round': ''
-                    })
+                    lineups_list.append(('current', team_name, position, player_id, player_name, '', ''))
 
                 # Export Starting Lineups (flatten JSON)
                 cursor = await db.execute(
@@ -912,15 +933,7 @@ class AdminCommands(commands.Cog):
                             cursor = await db.execute("SELECT name FROM players WHERE player_id = ?", (int(player_id),))
                             player = await cursor.fetchone()
                             player_name = player[0] if player else f"Unknown ({player_id})"
-                            lineups_list.append({
-                                'Type': 'starting',
-                                'Team_Name': team_name,
-                                'Position': position_name,
-                                'Player_ID': int(player_id),
-                                'Player_Name': player_name,
-                                'Season': '',
-                                'Round': ''
-                            })
+                            lineups_list.append(('starting', team_name, position_name, int(player_id), player_name, '', ''))
 
                 # Export Submitted Lineups (flatten JSON player_ids array)
                 cursor = await db.execute(
@@ -932,34 +945,20 @@ class AdminCommands(commands.Cog):
                 )
                 submitted_lineup_rows = await cursor.fetchall()
 
-                # Define position names for submitted lineups (order matters)
-                position_names = ['HB', 'HB', 'HB', 'HB', 'C', 'C', 'HF', 'HF', 'HF', 'HF',
-                                 'F', 'F', 'RUCK', 'RUCK', 'RUCK', 'BENCH', 'BENCH', 'BENCH', 'BENCH',
-                                 'BENCH', 'BENCH', 'BENCH']
+                # Submitted player_ids are in slot order - label each with its slot, and export every
+                # one of them (the import rebuilds the list from these rows, so a dropped row is lost)
+                from commands.lineup_commands import AFL_POSITIONS
 
                 for team_name, season, round_num, player_ids_json in submitted_lineup_rows:
                     if player_ids_json:
                         player_ids = json.loads(player_ids_json)
                         for idx, player_id in enumerate(player_ids):
-                            if idx < len(position_names):
-                                position_name = position_names[idx]
-                                # Get player name
-                                cursor = await db.execute("SELECT name FROM players WHERE player_id = ?", (int(player_id),))
-                                player = await cursor.fetchone()
-                                player_name = player[0] if player else f"Unknown ({player_id})"
-                                lineups_list.append({
-                                    'Type': 'submitted',
-                                    'Team_Name': team_name,
-                                    'Position': position_name,
-                                    'Player_ID': int(player_id),
-                                    'Player_Name': player_name,
-                                    'Season': season,
-                                    'Round': round_num
-                                })
-
-                lineups_df = pd.DataFrame(lineups_list)
-                if lineups_df.empty:
-                    lineups_df = pd.DataFrame(columns=['Type', 'Team_Name', 'Position', 'Player_ID', 'Player_Name', 'Season', 'Round'])
+                            position_name = AFL_POSITIONS[idx] if idx < len(AFL_POSITIONS) else f"Slot {idx + 1}"
+                            # Get player name
+                            cursor = await db.execute("SELECT name FROM players WHERE player_id = ?", (int(player_id),))
+                            player = await cursor.fetchone()
+                            player_name = player[0] if player else f"Unknown ({player_id})"
+                            lineups_list.append(('submitted', team_name, position_name, int(player_id), player_name, season, round_num))
 
                 # Export Seasons
                 cursor = await db.execute(
@@ -969,11 +968,10 @@ class AdminCommands(commands.Cog):
                        FROM seasons ORDER BY season_number"""
                 )
                 seasons = await cursor.fetchall()
-                seasons_df = pd.DataFrame(seasons, columns=['Season', 'Current_Round', 'Regular_Rounds', 'Total_Rounds', 'Round_Name', 'Status'])
 
                 # Export Injuries (removed Recovery_Rounds - redundant with Injury_Round + Return_Round)
                 cursor = await db.execute(
-                    """SELECT i.player_id as Player_ID, p.name as Player_Name, t.team_name as Team,
+                    """SELECT i.player_id as Player_ID, p.name as Player_Name, COALESCE(t.team_name, 'Delisted') as Team,
                               i.injury_type as Injury_Type, i.injury_round as Injury_Round,
                               i.return_round as Return_Round, i.status as Status
                        FROM injuries i
@@ -982,12 +980,10 @@ class AdminCommands(commands.Cog):
                        ORDER BY i.status, i.return_round"""
                 )
                 injuries = await cursor.fetchall()
-                injuries_df = pd.DataFrame(injuries, columns=['Player_ID', 'Player_Name', 'Team', 'Injury_Type', 'Injury_Round', 'Return_Round', 'Status'])
-                injuries_df['Team'] = injuries_df['Team'].fillna('Delisted')
 
                 # Export Suspensions (removed Games_Missed - redundant with Suspension_Round + Return_Round)
                 cursor = await db.execute(
-                    """SELECT s.player_id as Player_ID, p.name as Player_Name, t.team_name as Team,
+                    """SELECT s.player_id as Player_ID, p.name as Player_Name, COALESCE(t.team_name, 'Delisted') as Team,
                               s.suspension_round as Suspension_Round, s.return_round as Return_Round,
                               s.suspension_reason as Reason, s.status as Status
                        FROM suspensions s
@@ -996,8 +992,6 @@ class AdminCommands(commands.Cog):
                        ORDER BY s.status, s.return_round"""
                 )
                 suspensions = await cursor.fetchall()
-                suspensions_df = pd.DataFrame(suspensions, columns=['Player_ID', 'Player_Name', 'Team', 'Suspension_Round', 'Return_Round', 'Reason', 'Status'])
-                suspensions_df['Team'] = suspensions_df['Team'].fillna('Delisted')
 
                 # Export Trades
                 cursor = await db.execute(
@@ -1013,8 +1007,6 @@ class AdminCommands(commands.Cog):
                        ORDER BY tr.created_at DESC"""
                 )
                 trades = await cursor.fetchall()
-                trades_df = pd.DataFrame(trades, columns=['Trade_ID', 'Initiating_Team', 'Receiving_Team', 'Initiating_Players', 'Receiving_Players', 'Status', 'Created_At', 'Responded_At', 'Approved_At', 'Created_By_User_ID', 'Responded_By_User_ID', 'Approved_By_User_ID', 'Original_Trade_ID'])
-                trades_df = trades_df.fillna('')
 
                 # Export Settings
                 cursor = await db.execute(
@@ -1022,8 +1014,6 @@ class AdminCommands(commands.Cog):
                        FROM settings ORDER BY setting_key"""
                 )
                 settings = await cursor.fetchall()
-                settings_df = pd.DataFrame(settings, columns=['Setting_Key', 'Setting_Value'])
-                settings_df = settings_df.fillna('')
 
                 # Export Matches
                 cursor = await db.execute(
@@ -1038,7 +1028,6 @@ class AdminCommands(commands.Cog):
                        ORDER BY s.season_number, m.round_number, m.match_id"""
                 )
                 matches = await cursor.fetchall()
-                matches_df = pd.DataFrame(matches, columns=['Match_ID', 'Season', 'Round', 'Home_Team', 'Away_Team', 'Home_Score', 'Away_Score', 'Simulated'])
 
                 # Export Drafts (check which columns exist for backwards compatibility)
                 cursor = await db.execute("PRAGMA table_info(drafts)")
@@ -1061,8 +1050,6 @@ class AdminCommands(commands.Cog):
 
                 cursor = await db.execute(f"SELECT {draft_select} FROM drafts ORDER BY draft_id")
                 drafts = await cursor.fetchall()
-                drafts_df = pd.DataFrame(drafts, columns=draft_col_list)
-                drafts_df = drafts_df.fillna('')
 
                 # Export Draft Picks
                 cursor = await db.execute(
@@ -1077,11 +1064,6 @@ class AdminCommands(commands.Cog):
                        ORDER BY dp.draft_name, dp.round_number, dp.pick_number"""
                 )
                 draft_picks = await cursor.fetchall()
-                draft_picks_df = pd.DataFrame(draft_picks, columns=['Pick_ID', 'Draft_Name', 'Round', 'Pick', 'Pick_Origin', 'Current_Team', 'Player_ID', 'Player_Name', 'Passed', 'Picked_At'])
-                draft_picks_df['Pick_Origin'] = draft_picks_df['Pick_Origin'].fillna('')
-                draft_picks_df['Player_ID'] = draft_picks_df['Player_ID'].fillna('')
-                draft_picks_df['Player_Name'] = draft_picks_df['Player_Name'].fillna('')
-                draft_picks_df['Picked_At'] = draft_picks_df['Picked_At'].fillna('')
 
                 # Export Ladder Positions
                 cursor = await db.execute(
@@ -1093,7 +1075,6 @@ class AdminCommands(commands.Cog):
                        ORDER BY s.season_number, lp.position"""
                 )
                 ladder_positions = await cursor.fetchall()
-                ladder_positions_df = pd.DataFrame(ladder_positions, columns=['Ladder_ID', 'Season', 'Team', 'Position'])
 
                 # Export Compensation Chart as 2D table (individual ages 19-33, individual OVRs 70-99)
                 cursor = await db.execute(
@@ -1131,8 +1112,6 @@ class AdminCommands(commands.Cog):
                         row.append(band if band else '')
                     table_data.append(row)
 
-                compensation_chart_df = pd.DataFrame(table_data, columns=header)
-
                 # Export Contract Config
                 cursor = await db.execute(
                     """SELECT min_age as Min_Age, max_age as Max_Age, contract_years as Contract_Years
@@ -1140,8 +1119,6 @@ class AdminCommands(commands.Cog):
                        ORDER BY min_age"""
                 )
                 contract_config = await cursor.fetchall()
-                contract_config_df = pd.DataFrame(contract_config, columns=['Min_Age', 'Max_Age', 'Contract_Years'])
-                contract_config_df['Max_Age'] = contract_config_df['Max_Age'].fillna('')
 
                 # Export Draft Value Index
                 cursor = await db.execute(
@@ -1150,7 +1127,6 @@ class AdminCommands(commands.Cog):
                        ORDER BY pick_number"""
                 )
                 draft_value_index = await cursor.fetchall()
-                draft_value_index_df = pd.DataFrame(draft_value_index, columns=['Pick_Number', 'Points_Value'])
 
                 # Export Free Agency Periods
                 cursor = await db.execute(
@@ -1165,8 +1141,6 @@ class AdminCommands(commands.Cog):
                        ORDER BY season_number DESC"""
                 )
                 free_agency_periods = await cursor.fetchall()
-                free_agency_periods_df = pd.DataFrame(free_agency_periods, columns=['Period_ID', 'Season_Number', 'Status', 'Auction_Points', 'Started_At', 'Resign_Started_At', 'Bidding_Started_At', 'Bidding_Ended_At', 'Matching_Ended_At'])
-                free_agency_periods_df = free_agency_periods_df.fillna('')
 
                 # Export Free Agency Bids
                 cursor = await db.execute(
@@ -1180,8 +1154,6 @@ class AdminCommands(commands.Cog):
                        ORDER BY fab.period_id DESC, fab.placed_at DESC"""
                 )
                 free_agency_bids = await cursor.fetchall()
-                free_agency_bids_df = pd.DataFrame(free_agency_bids, columns=['Bid_ID', 'Period_ID', 'Team', 'Player_ID', 'Player_Name', 'Bid_Amount', 'Status', 'Placed_At'])
-                free_agency_bids_df = free_agency_bids_df.fillna('')
 
                 # Export Free Agency Re-Signs
                 cursor = await db.execute(
@@ -1195,8 +1167,6 @@ class AdminCommands(commands.Cog):
                        ORDER BY far.period_id DESC, far.confirmed_at DESC"""
                 )
                 free_agency_resigns = await cursor.fetchall()
-                free_agency_resigns_df = pd.DataFrame(free_agency_resigns, columns=['Resign_ID', 'Period_ID', 'Team', 'Player_ID', 'Player_Name', 'Confirmed', 'Confirmed_At'])
-                free_agency_resigns_df = free_agency_resigns_df.fillna('')
 
                 # Export Free Agency Results
                 cursor = await db.execute(
@@ -1212,120 +1182,61 @@ class AdminCommands(commands.Cog):
                        ORDER BY far.period_id DESC, far.result_id"""
                 )
                 free_agency_results = await cursor.fetchall()
-                free_agency_results_df = pd.DataFrame(free_agency_results, columns=['Result_ID', 'Period_ID', 'Player_ID', 'Player_Name', 'Original_Team', 'Winning_Team', 'Winning_Bid', 'Matched', 'Compensation_Band', 'Confirmed_At'])
-                free_agency_results_df = free_agency_results_df.fillna('')
 
-            # Create Excel file in memory
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
+            # Build the workbook in memory (in the Excel worker process, off the event loop)
+            from excel_io import run_in_worker, write_workbook
+            sheets = [
                 # Core data sheets (editable)
-                teams_df.to_excel(writer, sheet_name='Teams', index=False)
-                players_df.to_excel(writer, sheet_name='Players', index=False)
-                add_players_df.to_excel(writer, sheet_name='Add_Players', index=False)
-                seasons_df.to_excel(writer, sheet_name='Seasons', index=False)
-                settings_df.to_excel(writer, sheet_name='Settings', index=False)
-                compensation_chart_df.to_excel(writer, sheet_name='Compensation_Chart', index=False)
-                contract_config_df.to_excel(writer, sheet_name='Contract_Config', index=False)
-                draft_value_index_df.to_excel(writer, sheet_name='Draft_Value_Index', index=False)
+                ('Teams', ['Team_Name', 'Role_ID', 'Emoji_ID', 'Channel_ID'], teams),
+                ('Players', ['Player_ID', 'Name', 'Team', 'Age', 'Birth_Year', 'Pos', 'OVR', 'Contract_Expiry', 'Plays_Like', 'Father_Son_Club'], players),
+                # Add_Players sheet is left empty for bulk adding new players
+                ('Add_Players', ['Name', 'Team', 'Age', 'Pos', 'OVR', 'Contract_Expiry', 'Plays_Like', 'Father_Son_Club'], []),
+                ('Seasons', ['Season', 'Current_Round', 'Regular_Rounds', 'Total_Rounds', 'Round_Name', 'Status'], seasons),
+                ('Settings', ['Setting_Key', 'Setting_Value'], settings),
+                ('Compensation_Chart', header, table_data),
+                ('Contract_Config', ['Min_Age', 'Max_Age', 'Contract_Years'], contract_config),
+                ('Draft_Value_Index', ['Pick_Number', 'Points_Value'], draft_value_index),
 
                 # Relationship/State sheets (editable)
-                lineups_df.to_excel(writer, sheet_name='Lineups', index=False)
-                injuries_df.to_excel(writer, sheet_name='Injuries', index=False)
-                suspensions_df.to_excel(writer, sheet_name='Suspensions', index=False)
-                drafts_df.to_excel(writer, sheet_name='Drafts', index=False)
-                draft_picks_df.to_excel(writer, sheet_name='Draft_Picks', index=False)
-                ladder_positions_df.to_excel(writer, sheet_name='Ladder_Positions', index=False)
-                free_agency_periods_df.to_excel(writer, sheet_name='Free_Agency_Periods', index=False)
-                free_agency_bids_df.to_excel(writer, sheet_name='Free_Agency_Bids', index=False)
-                free_agency_resigns_df.to_excel(writer, sheet_name='Free_Agency_Re-Signs', index=False)
-                free_agency_results_df.to_excel(writer, sheet_name='Free_Agency_Results', index=False)
+                ('Lineups', ['Type', 'Team_Name', 'Position', 'Player_ID', 'Player_Name', 'Season', 'Round'], lineups_list),
+                ('Injuries', ['Player_ID', 'Player_Name', 'Team', 'Injury_Type', 'Injury_Round', 'Return_Round', 'Status'], injuries),
+                ('Suspensions', ['Player_ID', 'Player_Name', 'Team', 'Suspension_Round', 'Return_Round', 'Reason', 'Status'], suspensions),
+                ('Drafts', draft_col_list, drafts),
+                ('Draft_Picks', ['Pick_ID', 'Draft_Name', 'Round', 'Pick', 'Pick_Origin', 'Current_Team', 'Player_ID', 'Player_Name', 'Passed', 'Picked_At'], draft_picks),
+                ('Ladder_Positions', ['Ladder_ID', 'Season', 'Team', 'Position'], ladder_positions),
+                ('Free_Agency_Periods', ['Period_ID', 'Season_Number', 'Status', 'Auction_Points', 'Started_At', 'Resign_Started_At', 'Bidding_Started_At', 'Bidding_Ended_At', 'Matching_Ended_At'], free_agency_periods),
+                ('Free_Agency_Bids', ['Bid_ID', 'Period_ID', 'Team', 'Player_ID', 'Player_Name', 'Bid_Amount', 'Status', 'Placed_At'], free_agency_bids),
+                ('Free_Agency_Re-Signs', ['Resign_ID', 'Period_ID', 'Team', 'Player_ID', 'Player_Name', 'Confirmed', 'Confirmed_At'], free_agency_resigns),
+                ('Free_Agency_Results', ['Result_ID', 'Period_ID', 'Player_ID', 'Player_Name', 'Original_Team', 'Winning_Team', 'Winning_Bid', 'Matched', 'Compensation_Band', 'Confirmed_At'], free_agency_results),
 
                 # History/Read-only sheets
-                trades_df.to_excel(writer, sheet_name='Trades', index=False)
-                matches_df.to_excel(writer, sheet_name='Matches', index=False)
-                
+                ('Trades', ['Trade_ID', 'Initiating_Team', 'Receiving_Team', 'Initiating_Players', 'Receiving_Players', 'Status', 'Created_At', 'Responded_At', 'Approved_At', 'Created_By_User_ID', 'Responded_By_User_ID', 'Approved_By_User_ID', 'Original_Trade_ID'], trades),
+                ('Matches', ['Match_ID', 'Season', 'Round', 'Home_Team', 'Away_Team', 'Home_Score', 'Away_Score', 'Simulated'], matches),
+
                 # Add instructions sheet
-                instructions = pd.DataFrame({
-                    'IMPORTANT INSTRUCTIONS': [
-                        '--- EXCEL IMPORT/EXPORT GUIDE ---',
-                        '',
-                        'IMPORTANT: Before editing Teams sheet:',
-                        '  - Select entire Role_ID column → Right-click → Format Cells → Text',
-                        '  - This prevents Excel from corrupting Discord IDs',
-                        '',
-                        'To import: Use /importdata command and attach this file',
-                        '',
-                        '--- SHEET ORGANIZATION ---',
-                        '',
-                        'CORE DATA (Editable):',
-                        '  • Teams - Team info, Discord role/emoji IDs',
-                        '  • Players - Edit EXISTING players only (has Player_ID column)',
-                        '  • Add_Players - Bulk add NEW players here (no Player_ID needed)',
-                        '  • Seasons - Season configuration',
-                        '  • Settings - Bot settings',
-                        '',
-                        'RELATIONSHIPS/STATE (Editable):',
-                        '  • Current_Lineups - Active team lineups (Team/Position/Player)',
-                        '  • Starting_Lineups - Saved lineup templates (Team/Position/Player)',
-                        '  • Injuries - Injury status (Recovery calculated automatically)',
-                        '  • Suspensions - Suspension status (Games missed calculated automatically)',
-                        '  • Draft_Picks - Draft pick ownership',
-                        '',
-                        'HISTORY (Read-only - import supported):',
-                        '  • Trades - Trade history',
-                        '  • Matches - Match results',
-                        '  • Submitted_Lineups - Historical lineup submissions',
-                        '',
-                        '--- KEY FEATURES ---',
-                        '',
-                        '1. Players sheet includes Player_ID column',
-                        '   - Only updates EXISTING players',
-                        '   - Cannot add new players through this sheet',
-                        '',
-                        '2. Add_Players sheet for bulk adding',
-                        '   - Fill in Name, Team, Age, Pos, OVR',
-                        '   - Import will add all new players at once',
-                        '   - Skips duplicates automatically',
-                        '',
-                        '3. Simplified Injuries/Suspensions',
-                        '   - Just enter Injury_Round and Return_Round',
-                        '   - Recovery_Rounds/Games_Missed calculated on import',
-                        '',
-                        '4. Consistent lineup formats',
-                        '   - Current_Lineups and Starting_Lineups use identical format',
-                        '   - Easy to copy/paste between sheets',
-                        '',
-                        '--- VALID POSITIONS ---',
-                        '',
-                        'Player Positions: MID, KEY FWD, RUCK, GEN DEF, etc.',
-                        'Lineup Positions: FB, CHB, LW, C, RW, CHF, FF, R, RR, RO, INT1-5',
-                    ]
-                })
-                instructions.to_excel(writer, sheet_name='README', index=False)
-            output.seek(0)
-            
+                ('README', ['IMPORTANT INSTRUCTIONS'], [(line,) for line in EXPORT_INSTRUCTIONS]),
+            ]
+            await progress.update("⏳ Building workbook...")
+            output = io.BytesIO(await run_in_worker(write_workbook, sheets))
+
             # Send file
             file = discord.File(output, filename='league_data.xlsx')
             stats = [
-                f"{len(teams_df)} teams",
-                f"{len(players_df)} players",
-                f"{len(lineups_df)} lineup positions",
-                f"{len(seasons_df)} seasons",
-                f"{len(injuries_df)} injuries",
-                f"{len(suspensions_df)} suspensions",
-                f"{len(draft_picks_df)} draft picks",
-                f"{len(trades_df)} trades",
-                f"{len(matches_df)} matches",
-                f"{len(settings_df)} settings"
+                f"{len(teams)} teams",
+                f"{len(players)} players",
+                f"{len(lineups_list)} lineup positions",
+                f"{len(seasons)} seasons",
+                f"{len(injuries)} injuries",
+                f"{len(suspensions)} suspensions",
+                f"{len(draft_picks)} draft picks",
+                f"{len(trades)} trades",
+                f"{len(matches)} matches",
+                f"{len(settings)} settings"
             ]
-            await interaction.followup.send(
-                f"✅ Exported: {', '.join(stats)}",
-                file=file,
-                ephemeral=True
-            )
-            
+            await progress.update(f"✅ Exported: {', '.join(stats)}", force=True, attachments=[file])
+
         except Exception as e:
-            await interaction.followup.send(f"❌ Error exporting data: {e}", ephemeral=True)
+            await progress.update(f"❌ Error exporting data: {e}", force=True)
 
     @app_commands.command(name="importdata", description="[ADMIN] Import teams and players from Excel file")
     async def import_data(self, interaction: discord.Interaction, file: discord.Attachment):
@@ -1336,1162 +1247,37 @@ class AdminCommands(commands.Cog):
             await interaction.followup.send("❌ Please upload an Excel file (.xlsx or .xls)", ephemeral=True)
             return
         
+        progress = ProgressMessage(interaction)
+
         try:
             # Download file
+            await progress.update("⏳ Reading workbook...")
             file_data = await file.read()
-            excel_file = io.BytesIO(file_data)
-            
-            teams_added = 0
-            teams_updated = 0
-            players_added = 0
-            players_updated = 0
-            players_deleted = 0
-            errors = []
-            duplicate_warnings = []
-            
-            async with aiosqlite.connect(DB_PATH) as db:
-                # Import Teams
-                try:
-                    teams_df = pd.read_excel(excel_file, sheet_name='Teams', dtype={'Role_ID': str, 'Emoji_ID': str, 'Channel_ID': str})
-
-                    for _, row in teams_df.iterrows():
-                        try:
-                            team_name = str(row['Team_Name']).strip()
-                            role_id = str(row['Role_ID']).strip() if pd.notna(row['Role_ID']) and row['Role_ID'] else None
-                            emoji_id = str(row['Emoji_ID']).strip() if pd.notna(row['Emoji_ID']) and row['Emoji_ID'] else None
-                            channel_id = str(row['Channel_ID']).strip() if 'Channel_ID' in row and pd.notna(row['Channel_ID']) and row['Channel_ID'] else None
-
-                            cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (team_name,))
-                            existing = await cursor.fetchone()
-
-                            if existing:
-                                await db.execute("UPDATE teams SET role_id = ?, emoji_id = ?, channel_id = ? WHERE team_name = ?", (role_id, emoji_id, channel_id, team_name))
-                                teams_updated += 1
-                            else:
-                                await db.execute("INSERT INTO teams (team_name, role_id, emoji_id, channel_id) VALUES (?, ?, ?, ?)", (team_name, role_id, emoji_id, channel_id))
-                                teams_added += 1
-                        except Exception as e:
-                            errors.append(f"Team '{team_name}': {str(e)}")
-                    
-                    await db.commit()
-                except Exception as e:
-                    errors.append(f"Teams sheet error: {str(e)}")
-                
-                # Import Players (UPDATE existing players only - use Add_Players sheet to add new)
-                try:
-                    players_df = pd.read_excel(excel_file, sheet_name='Players')
-
-                    # Get team mapping
-                    cursor = await db.execute("SELECT team_id, team_name FROM teams")
-                    teams = await cursor.fetchall()
-                    team_map = {name.lower(): id for id, name in teams}
-
-                    # Collect all player IDs from the Excel file
-                    excel_player_ids = set()
-
-                    for _, row in players_df.iterrows():
-                        try:
-                            # Use Player_ID if available for more reliable matching
-                            player_id = None
-                            if 'Player_ID' in players_df.columns and pd.notna(row['Player_ID']):
-                                player_id = int(row['Player_ID'])
-
-                            name = str(row['Name']).strip()
-                            position = str(row['Pos']).strip()
-                            rating = int(row['OVR'])
-                            age = int(row['Age'])
-
-                            # Get birth_year if present, otherwise calculate from age
-                            birth_year = None
-                            if 'Birth_Year' in players_df.columns and pd.notna(row['Birth_Year']) and row['Birth_Year']:
-                                birth_year = int(row['Birth_Year'])
-                            else:
-                                # Calculate birth_year from age
-                                cursor = await db.execute(
-                                    """SELECT season_number FROM seasons
-                                       ORDER BY
-                                           CASE status
-                                               WHEN 'active' THEN 1
-                                               WHEN 'offseason' THEN 2
-                                               ELSE 3
-                                           END,
-                                           season_number DESC
-                                       LIMIT 1"""
-                                )
-                                season_result = await cursor.fetchone()
-                                current_season = season_result[0] if season_result else 1
-
-                                cursor = await db.execute(
-                                    "SELECT setting_value FROM settings WHERE setting_key = 'season_1_year'"
-                                )
-                                setting_result = await cursor.fetchone()
-                                season_1_year = int(setting_result[0]) if setting_result else current_season
-                                current_year = season_1_year + (current_season - 1)
-                                birth_year = current_year - age
-
-                            # Get contract_expiry if present
-                            contract_expiry = None
-                            if 'Contract_Expiry' in players_df.columns and pd.notna(row['Contract_Expiry']) and row['Contract_Expiry']:
-                                contract_expiry = int(row['Contract_Expiry'])
-
-                            # Validate position
-                            is_valid, normalized_pos = validate_position(position)
-                            if not is_valid:
-                                errors.append(f"Player '{name}': Invalid position '{position}'")
-                                continue
-
-                            # Get team ID
-                            team_id = None
-                            if 'Team' in players_df.columns and pd.notna(row['Team']) and row['Team']:
-                                team_name_lower = str(row['Team']).strip().lower()
-                                team_id = team_map.get(team_name_lower)
-
-                            # Get father/son club ID
-                            father_son_club_id = None
-                            if 'Father_Son_Club' in players_df.columns and pd.notna(row['Father_Son_Club']) and row['Father_Son_Club']:
-                                fs_team_name_lower = str(row['Father_Son_Club']).strip().lower()
-                                father_son_club_id = team_map.get(fs_team_name_lower)
-
-                            # Get plays_like value
-                            plays_like = None
-                            if 'Plays_Like' in players_df.columns and pd.notna(row['Plays_Like']) and row['Plays_Like']:
-                                plays_like = str(row['Plays_Like']).strip()
-
-                            # Check if player exists (by ID first, then by name)
-                            existing = None
-                            if player_id:
-                                cursor = await db.execute("SELECT player_id FROM players WHERE player_id = ?", (player_id,))
-                                existing = await cursor.fetchone()
-
-                            if not existing:
-                                cursor = await db.execute("SELECT player_id FROM players WHERE name = ?", (name,))
-                                existing = await cursor.fetchone()
-
-                            # Only UPDATE existing players (don't add new ones)
-                            if existing:
-                                excel_player_ids.add(existing[0])  # Track this player ID
-                                await db.execute(
-                                    """UPDATE players
-                                       SET name = ?, position = ?, overall_rating = ?, age = ?, birth_year = ?, team_id = ?, contract_expiry = ?, father_son_club_id = ?, plays_like = ?
-                                       WHERE player_id = ?""",
-                                    (name, normalized_pos, rating, age, birth_year, team_id, contract_expiry, father_son_club_id, plays_like, existing[0])
-                                )
-                                players_updated += 1
-                            else:
-                                errors.append(f"Player '{name}' not found - use Add_Players sheet to add new players")
-
-                        except Exception as e:
-                            errors.append(f"Player '{name}': {str(e)}")
-
-                    # Delete players that exist in database but NOT in Excel file
-                    cursor = await db.execute("SELECT player_id, name FROM players")
-                    all_db_players = await cursor.fetchall()
-                    players_deleted = 0
-                    for db_player_id, db_player_name in all_db_players:
-                        if db_player_id not in excel_player_ids:
-                            await db.execute("DELETE FROM players WHERE player_id = ?", (db_player_id,))
-                            players_deleted += 1
-                            print(f"Deleted player not in Excel: {db_player_name} (ID: {db_player_id})")
-
-                    await db.commit()
-                except Exception as e:
-                    errors.append(f"Players sheet error: {str(e)}")
-
-                # Import Add_Players (bulk add new players)
-                try:
-                    add_players_df = pd.read_excel(excel_file, sheet_name='Add_Players')
-
-                    # Get team mapping
-                    cursor = await db.execute("SELECT team_id, team_name FROM teams")
-                    teams = await cursor.fetchall()
-                    team_map = {name.lower(): id for id, name in teams}
-
-                    for _, row in add_players_df.iterrows():
-                        try:
-                            # Skip empty rows
-                            if not pd.notna(row['Name']) or not str(row['Name']).strip():
-                                continue
-
-                            name = str(row['Name']).strip()
-                            position = str(row['Pos']).strip()
-                            rating = int(row['OVR'])
-                            age = int(row['Age'])
-
-                            # Calculate birth_year from age
-                            cursor = await db.execute(
-                                """SELECT season_number FROM seasons
-                                   ORDER BY
-                                       CASE status
-                                           WHEN 'active' THEN 1
-                                           WHEN 'offseason' THEN 2
-                                           ELSE 3
-                                       END,
-                                       season_number DESC
-                                   LIMIT 1"""
-                            )
-                            season_result = await cursor.fetchone()
-                            current_season = season_result[0] if season_result else 1
-
-                            cursor = await db.execute(
-                                "SELECT setting_value FROM settings WHERE setting_key = 'season_1_year'"
-                            )
-                            setting_result = await cursor.fetchone()
-                            season_1_year = int(setting_result[0]) if setting_result else current_season
-                            current_year = season_1_year + (current_season - 1)
-                            birth_year = current_year - age
-
-                            # Get contract_expiry if present
-                            contract_expiry = None
-                            if 'Contract_Expiry' in add_players_df.columns and pd.notna(row['Contract_Expiry']) and row['Contract_Expiry']:
-                                contract_expiry = int(row['Contract_Expiry'])
-
-                            # Validate position
-                            is_valid, normalized_pos = validate_position(position)
-                            if not is_valid:
-                                errors.append(f"Add_Players - '{name}': Invalid position '{position}'")
-                                continue
-
-                            # Get team ID
-                            team_id = None
-                            if 'Team' in add_players_df.columns and pd.notna(row['Team']) and row['Team']:
-                                team_name_lower = str(row['Team']).strip().lower()
-                                team_id = team_map.get(team_name_lower)
-
-                            # Get father/son club ID
-                            father_son_club_id = None
-                            if 'Father_Son_Club' in add_players_df.columns and pd.notna(row['Father_Son_Club']) and row['Father_Son_Club']:
-                                fs_team_name_lower = str(row['Father_Son_Club']).strip().lower()
-                                father_son_club_id = team_map.get(fs_team_name_lower)
-
-                            # Get plays_like value
-                            plays_like = None
-                            if 'Plays_Like' in add_players_df.columns and pd.notna(row['Plays_Like']) and row['Plays_Like']:
-                                plays_like = str(row['Plays_Like']).strip()
-
-                            # Add player (duplicate names now allowed since we use Player_ID)
-                            await db.execute(
-                                """INSERT INTO players (name, position, overall_rating, age, birth_year, team_id, contract_expiry, father_son_club_id, plays_like)
-                                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                                (name, normalized_pos, rating, age, birth_year, team_id, contract_expiry, father_son_club_id, plays_like)
-                            )
-                            players_added += 1
-                        except Exception as e:
-                            errors.append(f"Add_Players - '{name}': {str(e)}")
-
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Add_Players' not in str(e):
-                        errors.append(f"Add_Players sheet error: {str(e)}")
-
-                # Import Lineups (merged Current, Starting, and Submitted)
-                current_lineups_imported = 0
-                starting_lineups_imported = 0
-                try:
-                    lineups_df = pd.read_excel(excel_file, sheet_name='Lineups')
-
-                    # Valid lineup positions with slot numbers (for current lineups)
-                    valid_lineup_positions = [
-                        "LBP", "FB", "RBP", "LHB", "CHB", "RHB",
-                        "LW", "C", "RW", "LHF", "CHF", "RHF",
-                        "LFP", "FF", "RFP", "R", "RR", "RO",
-                        "INT1", "INT2", "INT3", "INT4", "INT5"
-                    ]
-
-                    # Group starting lineups by team
-                    team_starting_lineups = {}
-
-                    for _, row in lineups_df.iterrows():
-                        try:
-                            lineup_type = str(row['Type']).strip().lower()
-                            team_name = str(row['Team_Name'])
-                            position = str(row['Position']).strip()
-                            player_id = int(row['Player_ID'])
-
-                            # Verify player exists
-                            cursor = await db.execute("SELECT player_id FROM players WHERE player_id = ?", (player_id,))
-                            player = await cursor.fetchone()
-                            if not player:
-                                continue
-
-                            # Get team ID
-                            cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (team_name,))
-                            team = await cursor.fetchone()
-                            if not team:
-                                continue
-
-                            if lineup_type == 'current':
-                                position_upper = position.upper()
-                                if position_upper in valid_lineup_positions:
-                                    slot_number = valid_lineup_positions.index(position_upper) + 1
-                                    await db.execute(
-                                        """INSERT OR REPLACE INTO lineups (team_id, player_id, slot_number, position_name)
-                                           VALUES (?, ?, ?, ?)""",
-                                        (team[0], player_id, slot_number, position_upper)
-                                    )
-                                    current_lineups_imported += 1
-                                else:
-                                    errors.append(f"Current lineup: Invalid position '{position}' for Player_ID {player_id}")
-
-                            elif lineup_type == 'starting':
-                                if team_name not in team_starting_lineups:
-                                    team_starting_lineups[team_name] = {}
-                                team_starting_lineups[team_name][position] = player_id
-
-                            # Note: We're not importing 'submitted' lineups since those are historical records
-                            # kept in submitted_lineups table, not for recreation from Excel
-
-                        except Exception as e:
-                            errors.append(f"Lineup row error: {str(e)}")
-
-                    # Insert/update starting lineups for each team
-                    for team_name, lineup_dict in team_starting_lineups.items():
-                        try:
-                            # Get team ID
-                            cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (team_name,))
-                            team = await cursor.fetchone()
-
-                            if team:
-                                lineup_json = json.dumps(lineup_dict)
-                                await db.execute(
-                                    """INSERT OR REPLACE INTO starting_lineups (team_id, lineup_data, last_updated)
-                                       VALUES (?, ?, CURRENT_TIMESTAMP)""",
-                                    (team[0], lineup_json)
-                                )
-                                starting_lineups_imported += 1
-                        except Exception as e:
-                            errors.append(f"Starting lineup for {team_name}: {str(e)}")
-
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Lineups' not in str(e):
-                        errors.append(f"Lineups sheet error: {str(e)}")
-
-                # Import Seasons
-                seasons_imported = 0
-                try:
-                    seasons_df = pd.read_excel(excel_file, sheet_name='Seasons')
-                    for _, row in seasons_df.iterrows():
-                        try:
-                            await db.execute(
-                                """INSERT OR REPLACE INTO seasons
-                                   (season_number, current_round, regular_rounds, total_rounds, round_name, status)
-                                   VALUES (?, ?, ?, ?, ?, ?)""",
-                                (int(row['Season']), int(row['Current_Round']), int(row['Regular_Rounds']),
-                                 int(row['Total_Rounds']), str(row['Round_Name']), str(row['Status']))
-                            )
-                            seasons_imported += 1
-                        except Exception as e:
-                            errors.append(f"Season {row['Season']}: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Seasons' not in str(e):
-                        errors.append(f"Seasons sheet error: {str(e)}")
-
-                # Import Injuries (calculate recovery_rounds from injury_round and return_round)
-                injuries_imported = 0
-                try:
-                    injuries_df = pd.read_excel(excel_file, sheet_name='Injuries')
-
-                    # Clear existing injuries before importing to avoid duplicates
-                    await db.execute("DELETE FROM injuries")
-
-                    for _, row in injuries_df.iterrows():
-                        try:
-                            # Find player by ID
-                            player_id = int(row['Player_ID'])
-                            cursor = await db.execute("SELECT player_id FROM players WHERE player_id = ?", (player_id,))
-                            player = await cursor.fetchone()
-                            if player:
-                                injury_round = int(row['Injury_Round'])
-                                return_round = int(row['Return_Round'])
-                                recovery_rounds = return_round - injury_round
-                                await db.execute(
-                                    """INSERT INTO injuries
-                                       (player_id, injury_type, injury_round, recovery_rounds, return_round, status)
-                                       VALUES (?, ?, ?, ?, ?, ?)""",
-                                    (player_id, str(row['Injury_Type']), injury_round,
-                                     recovery_rounds, return_round, str(row['Status']))
-                                )
-                                injuries_imported += 1
-                        except Exception as e:
-                            errors.append(f"Injury for Player_ID {row.get('Player_ID', 'unknown')}: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Injuries' not in str(e):
-                        errors.append(f"Injuries sheet error: {str(e)}")
-
-                # Import Suspensions (calculate games_missed from suspension_round and return_round)
-                suspensions_imported = 0
-                try:
-                    suspensions_df = pd.read_excel(excel_file, sheet_name='Suspensions')
-
-                    # Clear existing suspensions before importing to avoid duplicates
-                    await db.execute("DELETE FROM suspensions")
-
-                    for _, row in suspensions_df.iterrows():
-                        try:
-                            # Find player by ID
-                            player_id = int(row['Player_ID'])
-                            cursor = await db.execute("SELECT player_id FROM players WHERE player_id = ?", (player_id,))
-                            player = await cursor.fetchone()
-                            if player:
-                                suspension_round = int(row['Suspension_Round'])
-                                return_round = int(row['Return_Round'])
-                                games_missed = return_round - suspension_round
-                                await db.execute(
-                                    """INSERT INTO suspensions
-                                       (player_id, suspension_round, games_missed, return_round, suspension_reason, status)
-                                       VALUES (?, ?, ?, ?, ?, ?)""",
-                                    (player_id, suspension_round, games_missed,
-                                     return_round, str(row['Reason']), str(row['Status']))
-                                )
-                                suspensions_imported += 1
-                        except Exception as e:
-                            errors.append(f"Suspension for Player_ID {row.get('Player_ID', 'unknown')}: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Suspensions' not in str(e):
-                        errors.append(f"Suspensions sheet error: {str(e)}")
-
-                # Import Trades
-                trades_imported = 0
-                try:
-                    trades_df = pd.read_excel(excel_file, sheet_name='Trades', dtype={'Created_By_User_ID': str, 'Responded_By_User_ID': str, 'Approved_By_User_ID': str})
-
-                    # Clear existing trades
-                    await db.execute("DELETE FROM trades")
-                    for _, row in trades_df.iterrows():
-                        try:
-                            # Get team IDs
-                            cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (str(row['Initiating_Team']),))
-                            init_team = await cursor.fetchone()
-                            cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (str(row['Receiving_Team']),))
-                            recv_team = await cursor.fetchone()
-
-                            if init_team and recv_team:
-                                original_trade_id = int(row['Original_Trade_ID']) if pd.notna(row['Original_Trade_ID']) and row['Original_Trade_ID'] else None
-                                created_by = str(row['Created_By_User_ID']) if pd.notna(row['Created_By_User_ID']) and row['Created_By_User_ID'] else None
-                                responded_by = str(row['Responded_By_User_ID']) if pd.notna(row['Responded_By_User_ID']) and row['Responded_By_User_ID'] else None
-                                approved_by = str(row['Approved_By_User_ID']) if pd.notna(row['Approved_By_User_ID']) and row['Approved_By_User_ID'] else None
-                                created_at = str(row['Created_At']) if pd.notna(row['Created_At']) and row['Created_At'] else None
-                                responded_at = str(row['Responded_At']) if pd.notna(row['Responded_At']) and row['Responded_At'] else None
-                                approved_at = str(row['Approved_At']) if pd.notna(row['Approved_At']) and row['Approved_At'] else None
-
-                                await db.execute(
-                                    """INSERT INTO trades
-                                       (trade_id, initiating_team_id, receiving_team_id, initiating_players, receiving_players,
-                                        initiating_picks, receiving_picks, status, created_at, responded_at, approved_at,
-                                        created_by_user_id, responded_by_user_id, approved_by_user_id, original_trade_id)
-                                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                                    (int(row['Trade_ID']), init_team[0], recv_team[0], str(row['Initiating_Players']),
-                                     str(row['Receiving_Players']), str(row['Initiating_Picks']) if pd.notna(row.get('Initiating_Picks')) else '',
-                                     str(row['Receiving_Picks']) if pd.notna(row.get('Receiving_Picks')) else '',
-                                     str(row['Status']), created_at, responded_at, approved_at, created_by, responded_by, approved_by, original_trade_id)
-                                )
-                                trades_imported += 1
-                        except Exception as e:
-                            errors.append(f"Trade {row['Trade_ID']}: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Trades' not in str(e):
-                        errors.append(f"Trades sheet error: {str(e)}")
-
-                # Import Settings
-                settings_imported = 0
-                try:
-                    settings_df = pd.read_excel(excel_file, sheet_name='Settings', dtype={'Setting_Value': str})
-                    for _, row in settings_df.iterrows():
-                        try:
-                            setting_value = str(row['Setting_Value']) if pd.notna(row['Setting_Value']) and row['Setting_Value'] else None
-                            await db.execute(
-                                """INSERT OR REPLACE INTO settings (setting_key, setting_value)
-                                   VALUES (?, ?)""",
-                                (str(row['Setting_Key']), setting_value)
-                            )
-                            settings_imported += 1
-                        except Exception as e:
-                            errors.append(f"Setting {row['Setting_Key']}: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Settings' not in str(e):
-                        errors.append(f"Settings sheet error: {str(e)}")
-
-                # Import Matches
-                matches_imported = 0
-                try:
-                    matches_df = pd.read_excel(excel_file, sheet_name='Matches')
-
-                    # Clear existing matches
-                    await db.execute("DELETE FROM matches")
-
-                    for _, row in matches_df.iterrows():
-                        try:
-                            # Get season ID
-                            cursor = await db.execute("SELECT season_id FROM seasons WHERE season_number = ?", (int(row['Season']),))
-                            season = await cursor.fetchone()
-
-                            # Get home team ID
-                            cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (str(row['Home_Team']),))
-                            home_team = await cursor.fetchone()
-
-                            # Get away team ID
-                            cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (str(row['Away_Team']),))
-                            away_team = await cursor.fetchone()
-
-                            if season and home_team and away_team:
-                                await db.execute(
-                                    """INSERT INTO matches
-                                       (match_id, season_id, round_number, home_team_id, away_team_id, home_score, away_score, simulated)
-                                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                                    (int(row['Match_ID']), season[0], int(row['Round']), home_team[0], away_team[0],
-                                     int(row['Home_Score']), int(row['Away_Score']), int(row['Simulated']))
-                                )
-                                matches_imported += 1
-                        except Exception as e:
-                            errors.append(f"Match {row['Match_ID']}: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Matches' not in str(e):
-                        errors.append(f"Matches sheet error: {str(e)}")
-
-                # Import Drafts (optional sheet - new fields for live draft)
-                drafts_imported = 0
-                try:
-                    drafts_df = pd.read_excel(excel_file, sheet_name='Drafts')
-
-                    # Update existing drafts with new fields
-                    for _, row in drafts_df.iterrows():
-                        try:
-                            draft_id = int(row['Draft_ID']) if pd.notna(row['Draft_ID']) else None
-                            if not draft_id:
-                                continue
-
-                            # Get fields (handle NaN)
-                            status = str(row['Status']) if 'Status' in row and pd.notna(row['Status']) else None
-                            started_at = str(row['Started_At']) if 'Started_At' in row and pd.notna(row['Started_At']) and row['Started_At'] else None
-                            completed_at = str(row['Completed_At']) if 'Completed_At' in row and pd.notna(row['Completed_At']) and row['Completed_At'] else None
-                            current_pick_number = int(row['Current_Pick_Number']) if 'Current_Pick_Number' in row and pd.notna(row['Current_Pick_Number']) else 0
-
-                            # Update draft - use the Status from the Excel file
-                            if status:
-                                await db.execute(
-                                    """UPDATE drafts
-                                       SET started_at = ?, completed_at = ?, current_pick_number = ?, status = ?
-                                       WHERE draft_id = ?""",
-                                    (started_at, completed_at, current_pick_number, status, draft_id)
-                                )
-                            else:
-                                # No status in Excel, just update the timestamps
-                                await db.execute(
-                                    """UPDATE drafts
-                                       SET started_at = ?, completed_at = ?, current_pick_number = ?
-                                       WHERE draft_id = ?""",
-                                    (started_at, completed_at, current_pick_number, draft_id)
-                                )
-                            drafts_imported += 1
-                        except Exception as e:
-                            errors.append(f"Draft {row.get('Draft_ID', 'Unknown')}: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    # Drafts sheet is optional (for backwards compatibility)
-                    if 'Worksheet Drafts' not in str(e):
-                        errors.append(f"Drafts sheet error: {str(e)}")
-
-                # Import Draft Picks
-                draft_picks_imported = 0
-                try:
-                    draft_picks_df = pd.read_excel(excel_file, sheet_name='Draft_Picks')
-
-                    # Clear existing draft picks before importing to avoid duplicates
-                    await db.execute("DELETE FROM draft_picks")
-
-                    for _, row in draft_picks_df.iterrows():
-                        try:
-                            # Get current team ID
-                            cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (str(row['Current_Team']),))
-                            current_team = await cursor.fetchone()
-
-                            # Parse original_team_id from pick_origin
-                            original_team_id = None
-                            pick_origin = str(row['Pick_Origin']) if pd.notna(row['Pick_Origin']) and row['Pick_Origin'] else ''
-                            if pick_origin:
-                                # Parse pick_origin format: "Team Name R1" or "Team Name F/S Match"
-                                if ' R' in pick_origin:
-                                    team_name = pick_origin.split(' R')[0]
-                                elif ' F/S' in pick_origin:
-                                    team_name = pick_origin.split(' F/S')[0]
-                                else:
-                                    team_name = None
-
-                                if team_name:
-                                    cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (team_name,))
-                                    orig_team = await cursor.fetchone()
-                                    if orig_team:
-                                        original_team_id = orig_team[0]
-
-                            # Fallback to current team if pick_origin parsing failed
-                            if not original_team_id:
-                                original_team_id = current_team[0] if current_team else None
-
-                            # Get player ID if selected
-                            player_id = None
-                            if pd.notna(row['Player_ID']) and row['Player_ID']:
-                                player_id = int(row['Player_ID'])
-                                # Verify player exists
-                                cursor = await db.execute("SELECT player_id FROM players WHERE player_id = ?", (player_id,))
-                                player = await cursor.fetchone()
-                                if not player:
-                                    player_id = None
-
-                            # Handle NaN values for numeric fields
-                            pick_id = int(row['Pick_ID']) if pd.notna(row['Pick_ID']) else None
-                            round_number = int(row['Round']) if pd.notna(row['Round']) else None
-                            pick_number = int(row['Pick']) if pd.notna(row['Pick']) else None
-                            draft_name = str(row['Draft_Name']) if pd.notna(row['Draft_Name']) else ''
-
-                            # Get season_number from draft_name if possible (format: "Season X National Draft")
-                            season_number = None
-                            if 'Season' in draft_name:
-                                try:
-                                    # Extract season number from draft name (e.g., "Season 9 National Draft")
-                                    season_str = draft_name.split('Season')[1].split()[0]
-                                    # Draft is for season_number + 1 (Season 9 Draft is for Season 10)
-                                    season_number = int(season_str) + 1
-                                except:
-                                    pass
-
-                            # Get or create draft_id
-                            draft_id = None
-                            if draft_name:
-                                cursor = await db.execute(
-                                    "SELECT draft_id FROM drafts WHERE draft_name = ?",
-                                    (draft_name,)
-                                )
-                                draft_result = await cursor.fetchone()
-
-                                if draft_result:
-                                    draft_id = draft_result[0]
-                                else:
-                                    # Create draft if it doesn't exist
-                                    # Determine status based on whether pick_number is set
-                                    draft_status = 'current' if pick_number is not None else 'future'
-                                    cursor = await db.execute(
-                                        """INSERT INTO drafts (draft_name, season_number, status, rounds)
-                                           VALUES (?, ?, ?, 4)""",
-                                        (draft_name, season_number, draft_status)
-                                    )
-                                    draft_id = cursor.lastrowid
-
-                            if current_team and pick_id and draft_id:
-                                # Get passed and picked_at if they exist
-                                passed = int(row['Passed']) if 'Passed' in row and pd.notna(row['Passed']) else 0
-                                picked_at = str(row['Picked_At']) if 'Picked_At' in row and pd.notna(row['Picked_At']) and row['Picked_At'] else None
-
-                                await db.execute(
-                                    """INSERT INTO draft_picks
-                                       (pick_id, draft_id, draft_name, season_number, round_number, pick_number,
-                                        pick_origin, original_team_id, current_team_id, player_selected_id, passed, picked_at)
-                                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                                    (pick_id, draft_id, draft_name, season_number, round_number, pick_number,
-                                     pick_origin, original_team_id, current_team[0], player_id, passed, picked_at)
-                                )
-                                draft_picks_imported += 1
-                        except Exception as e:
-                            errors.append(f"Draft Pick {row['Pick_ID']}: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Draft_Picks' not in str(e):
-                        errors.append(f"Draft Picks sheet error: {str(e)}")
-
-                # Import Ladder Positions
-                ladder_positions_imported = 0
-                try:
-                    ladder_positions_df = pd.read_excel(excel_file, sheet_name='Ladder_Positions')
-
-                    # Clear existing ladder positions
-                    await db.execute("DELETE FROM ladder_positions")
-
-                    for _, row in ladder_positions_df.iterrows():
-                        try:
-                            # Get season ID
-                            cursor = await db.execute("SELECT season_id FROM seasons WHERE season_number = ?", (int(row['Season']),))
-                            season = await cursor.fetchone()
-
-                            # Get team ID
-                            cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (str(row['Team']),))
-                            team = await cursor.fetchone()
-
-                            if season and team:
-                                await db.execute(
-                                    """INSERT INTO ladder_positions
-                                       (ladder_id, season_id, team_id, position)
-                                       VALUES (?, ?, ?, ?)""",
-                                    (int(row['Ladder_ID']), season[0], team[0], int(row['Position']))
-                                )
-                                ladder_positions_imported += 1
-                        except Exception as e:
-                            errors.append(f"Ladder Position {row['Ladder_ID']}: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Ladder_Positions' not in str(e):
-                        errors.append(f"Ladder Positions sheet error: {str(e)}")
-
-                # Import Submitted Lineups (from merged Lineups sheet where Type='submitted')
-                submitted_lineups_imported = 0
-                try:
-                    # Read submitted lineups from the merged Lineups sheet
-                    submitted_rows = lineups_df[lineups_df['Type'] == 'submitted']
-
-                    if not submitted_rows.empty:
-                        # Clear existing submitted lineups
-                        await db.execute("DELETE FROM submitted_lineups")
-
-                        # Group by team, season, and round to rebuild each submission
-                        grouped = submitted_rows.groupby(['Team_Name', 'Season', 'Round'])
-
-                        submission_id = 1  # Auto-increment submission IDs
-                        for (team_name, season_num, round_num), group in grouped:
-                            try:
-                                # Get team ID
-                                cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (str(team_name),))
-                                team = await cursor.fetchone()
-                                if not team:
-                                    continue
-
-                                # Get season ID
-                                cursor = await db.execute("SELECT season_id FROM seasons WHERE season_number = ?", (int(season_num),))
-                                season = await cursor.fetchone()
-                                if not season:
-                                    continue
-
-                                # Build player_ids array from Player_ID column (in position order)
-                                player_ids = group['Player_ID'].tolist()
-                                player_ids_json = json.dumps(player_ids)
-
-                                # Use current timestamp for submitted_at (we don't track this in the merged sheet)
-                                await db.execute(
-                                    """INSERT INTO submitted_lineups
-                                       (submission_id, team_id, season_id, round_number, player_ids, submitted_at)
-                                       VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)""",
-                                    (submission_id, team[0], season[0], int(round_num), player_ids_json)
-                                )
-                                submitted_lineups_imported += 1
-                                submission_id += 1
-                            except Exception as e:
-                                errors.append(f"Submitted Lineup for {team_name} S{season_num} R{round_num}: {str(e)}")
-
-                        await db.commit()
-                except Exception as e:
-                    errors.append(f"Submitted Lineups import error: {str(e)}")
-
-                # Import Compensation Chart (2D table format with individual ages/OVRs)
-                compensation_chart_imported = 0
-                try:
-                    compensation_chart_df = pd.read_excel(excel_file, sheet_name='Compensation_Chart')
-
-                    # Clear existing compensation chart
-                    await db.execute("DELETE FROM compensation_chart")
-
-                    # Parse 2D table: first column is ages, other columns are individual OVRs
-                    age_col = compensation_chart_df.columns[0]  # Should be "Age \ OVR" or similar
-                    ovr_cols = compensation_chart_df.columns[1:]  # All other columns are OVR values
 
-                    # Build a map of (age, ovr) -> band
-                    cell_map = {}
-                    for _, row in compensation_chart_df.iterrows():
-                        age_str = str(row[age_col]).strip()
-                        if not age_str or age_str == '' or age_str == 'nan':
-                            continue
-
-                        try:
-                            age = int(float(age_str))  # Convert through float first to handle "19.0" format
-                        except:
-                            continue
-
-                        # Process each OVR column
-                        for ovr_col in ovr_cols:
-                            band_value = row[ovr_col]
-                            if pd.isna(band_value) or band_value == '':
-                                continue
-
-                            try:
-                                band = int(float(band_value))  # Convert through float first
-                                # Column name might be int or string
-                                try:
-                                    ovr = int(ovr_col)
-                                except:
-                                    ovr = int(float(str(ovr_col)))  # Handle string column names
-                                cell_map[(age, ovr)] = band
-                            except Exception as e:
-                                # Log parsing errors for debugging
-                                errors.append(f"Compensation Chart cell parsing error at age {age_str}, OVR {ovr_col}: {str(e)}")
-                                continue
-
-                    # Check if we parsed any data
-                    if not cell_map:
-                        errors.append("Compensation Chart: No valid data found in sheet. Check that cells contain numeric values for bands.")
-
-                    # Group consecutive cells with same band into ranges
-                    # Process by band number
-                    bands = set(cell_map.values())
-                    for band in sorted(bands):
-                        # Get all cells for this band
-                        band_cells = {k for k, v in cell_map.items() if v == band}
-
-                        # Group by age, then find consecutive OVR ranges
-                        age_groups = {}
-                        for age, ovr in band_cells:
-                            if age not in age_groups:
-                                age_groups[age] = []
-                            age_groups[age].append(ovr)
-
-                        # For each age, find consecutive OVR ranges
-                        for age, ovrs in age_groups.items():
-                            ovrs = sorted(ovrs)
-                            # Find consecutive ranges
-                            ranges = []
-                            start = ovrs[0]
-                            prev = ovrs[0]
-
-                            for ovr in ovrs[1:]:
-                                if ovr == prev + 1:
-                                    prev = ovr
-                                else:
-                                    ranges.append((start, prev))
-                                    start = ovr
-                                    prev = ovr
-                            ranges.append((start, prev))
-
-                            # Insert each range
-                            for min_ovr, max_ovr in ranges:
-                                await db.execute(
-                                    """INSERT INTO compensation_chart (min_age, max_age, min_ovr, max_ovr, compensation_band)
-                                       VALUES (?, ?, ?, ?, ?)""",
-                                    (age, age, min_ovr, max_ovr if max_ovr != min_ovr else None, band)
-                                )
-                                compensation_chart_imported += 1
-
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Compensation_Chart' not in str(e):
-                        errors.append(f"Compensation Chart sheet error: {str(e)}")
-
-                # Import Contract Config
-                contract_config_imported = 0
-                try:
-                    contract_config_df = pd.read_excel(excel_file, sheet_name='Contract_Config')
-
-                    # Clear existing contract config
-                    await db.execute("DELETE FROM contract_config")
-
-                    for _, row in contract_config_df.iterrows():
-                        try:
-                            # Skip empty rows
-                            if pd.isna(row['Min_Age']) or row['Min_Age'] == '':
-                                continue
-
-                            min_age = int(row['Min_Age'])
-                            max_age = int(row['Max_Age']) if pd.notna(row['Max_Age']) and row['Max_Age'] != '' else None
-                            contract_years = int(row['Contract_Years'])
-
-                            await db.execute(
-                                """INSERT INTO contract_config (min_age, max_age, contract_years)
-                                   VALUES (?, ?, ?)""",
-                                (min_age, max_age, contract_years)
-                            )
-                            contract_config_imported += 1
-                        except Exception as e:
-                            errors.append(f"Contract Config row: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Contract_Config' not in str(e):
-                        errors.append(f"Contract Config sheet error: {str(e)}")
-
-                # Import Draft Value Index
-                draft_value_index_imported = 0
-                try:
-                    draft_value_index_df = pd.read_excel(excel_file, sheet_name='Draft_Value_Index')
-
-                    # Clear existing draft value index
-                    await db.execute("DELETE FROM draft_value_index")
-
-                    for _, row in draft_value_index_df.iterrows():
-                        try:
-                            # Skip empty rows
-                            if pd.isna(row['Pick_Number']) or row['Pick_Number'] == '':
-                                continue
-
-                            pick_number = int(row['Pick_Number'])
-                            points_value = int(row['Points_Value'])
-
-                            await db.execute(
-                                """INSERT INTO draft_value_index (pick_number, points_value)
-                                   VALUES (?, ?)""",
-                                (pick_number, points_value)
-                            )
-                            draft_value_index_imported += 1
-                        except Exception as e:
-                            errors.append(f"Draft Value Index row: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Draft_Value_Index' not in str(e):
-                        errors.append(f"Draft Value Index sheet error: {str(e)}")
-
-                # Import Free Agency Periods
-                free_agency_periods_imported = 0
-                try:
-                    free_agency_periods_df = pd.read_excel(excel_file, sheet_name='Free_Agency_Periods')
-
-                    # Clear existing free agency periods
-                    await db.execute("DELETE FROM free_agency_periods")
-
-                    for _, row in free_agency_periods_df.iterrows():
-                        try:
-                            period_id = int(row['Period_ID']) if pd.notna(row['Period_ID']) and row['Period_ID'] else None
-                            season_number = int(row['Season_Number'])
-                            status = str(row['Status'])
-                            auction_points = int(row['Auction_Points']) if pd.notna(row['Auction_Points']) else 300
-                            started_at = str(row['Started_At']) if pd.notna(row['Started_At']) and row['Started_At'] else None
-                            resign_started_at = str(row['Resign_Started_At']) if pd.notna(row['Resign_Started_At']) and row['Resign_Started_At'] else None
-                            bidding_started_at = str(row['Bidding_Started_At']) if pd.notna(row['Bidding_Started_At']) and row['Bidding_Started_At'] else None
-                            bidding_ended_at = str(row['Bidding_Ended_At']) if pd.notna(row['Bidding_Ended_At']) and row['Bidding_Ended_At'] else None
-                            matching_ended_at = str(row['Matching_Ended_At']) if pd.notna(row['Matching_Ended_At']) and row['Matching_Ended_At'] else None
-
-                            if period_id:
-                                await db.execute(
-                                    """INSERT INTO free_agency_periods (period_id, season_number, status, auction_points, started_at, resign_started_at, bidding_started_at, bidding_ended_at, matching_ended_at)
-                                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                                    (period_id, season_number, status, auction_points, started_at, resign_started_at, bidding_started_at, bidding_ended_at, matching_ended_at)
-                                )
-                            else:
-                                await db.execute(
-                                    """INSERT INTO free_agency_periods (season_number, status, auction_points, started_at, resign_started_at, bidding_started_at, bidding_ended_at, matching_ended_at)
-                                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                                    (season_number, status, auction_points, started_at, resign_started_at, bidding_started_at, bidding_ended_at, matching_ended_at)
-                                )
-                            free_agency_periods_imported += 1
-                        except Exception as e:
-                            errors.append(f"Free Agency Periods row: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Free_Agency_Periods' not in str(e):
-                        errors.append(f"Free Agency Periods sheet error: {str(e)}")
-
-                # Import Free Agency Bids (optional - clears existing bids)
-                free_agency_bids_imported = 0
-                try:
-                    free_agency_bids_df = pd.read_excel(excel_file, sheet_name='Free_Agency_Bids')
-
-                    # Clear existing free agency bids
-                    await db.execute("DELETE FROM free_agency_bids")
-
-                    for _, row in free_agency_bids_df.iterrows():
-                        try:
-                            if pd.isna(row['Bid_ID']) or not row['Bid_ID']:
-                                continue
-
-                            bid_id = int(row['Bid_ID'])
-                            period_id = int(row['Period_ID'])
-                            team_name = str(row['Team'])
-                            player_id = int(row['Player_ID'])
-                            bid_amount = int(row['Bid_Amount'])
-                            status = str(row['Status'])
-                            placed_at = str(row['Placed_At']) if pd.notna(row['Placed_At']) and row['Placed_At'] else None
-
-                            # Get team_id from name and verify player_id exists
-                            cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (team_name,))
-                            team = await cursor.fetchone()
-                            if not team:
-                                errors.append(f"Free Agency Bids: Team '{team_name}' not found")
-                                continue
-                            team_id = team[0]
-
-                            cursor = await db.execute("SELECT player_id FROM players WHERE player_id = ?", (player_id,))
-                            player = await cursor.fetchone()
-                            if not player:
-                                errors.append(f"Free Agency Bids: Player_ID '{player_id}' not found")
-                                continue
-
-                            await db.execute(
-                                """INSERT INTO free_agency_bids (bid_id, period_id, team_id, player_id, bid_amount, status, placed_at)
-                                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                                (bid_id, period_id, team_id, player_id, bid_amount, status, placed_at)
-                            )
-                            free_agency_bids_imported += 1
-
-                        except Exception as e:
-                            errors.append(f"Free Agency Bids row: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Free_Agency_Bids' not in str(e):
-                        errors.append(f"Free Agency Bids sheet error: {str(e)}")
-
-                # Import Free Agency Re-Signs
-                free_agency_resigns_imported = 0
-                try:
-                    free_agency_resigns_df = pd.read_excel(excel_file, sheet_name='Free_Agency_Re-Signs')
+            # Parse in the Excel worker process so other commands keep responding
+            from excel_io import read_workbook, run_in_worker
+            sheets = await run_in_worker(read_workbook, file_data, IMPORT_DTYPES)
 
-                    # Clear existing free agency re-signs
-                    await db.execute("DELETE FROM free_agency_resigns")
-
-                    for _, row in free_agency_resigns_df.iterrows():
-                        try:
-                            if pd.isna(row['Resign_ID']) or not row['Resign_ID']:
-                                continue
-
-                            resign_id = int(row['Resign_ID'])
-                            period_id = int(row['Period_ID'])
-                            team_name = str(row['Team'])
-                            player_id = int(row['Player_ID'])
-                            confirmed = int(row['Confirmed']) if pd.notna(row['Confirmed']) else 0
-                            confirmed_at = str(row['Confirmed_At']) if pd.notna(row['Confirmed_At']) and row['Confirmed_At'] else None
-
-                            # Get team_id from name and verify player_id exists
-                            cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (team_name,))
-                            team = await cursor.fetchone()
-                            if not team:
-                                errors.append(f"Free Agency Re-Sign: Team '{team_name}' not found")
-                                continue
-                            team_id = team[0]
-
-                            cursor = await db.execute("SELECT player_id FROM players WHERE player_id = ?", (player_id,))
-                            player = await cursor.fetchone()
-                            if not player:
-                                errors.append(f"Free Agency Re-Sign: Player_ID '{player_id}' not found")
-                                continue
-
-                            await db.execute(
-                                """INSERT INTO free_agency_resigns (resign_id, period_id, team_id, player_id, confirmed, confirmed_at)
-                                   VALUES (?, ?, ?, ?, ?, ?)""",
-                                (resign_id, period_id, team_id, player_id, confirmed, confirmed_at)
-                            )
-                            free_agency_resigns_imported += 1
-
-                        except Exception as e:
-                            errors.append(f"Free Agency Re-Signs row: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Free_Agency_Re-Signs' not in str(e):
-                        errors.append(f"Free Agency Re-Signs sheet error: {str(e)}")
-
-                # Import Free Agency Results
-                free_agency_results_imported = 0
-                try:
-                    free_agency_results_df = pd.read_excel(excel_file, sheet_name='Free_Agency_Results')
+            # Dry run: diff every sheet against the database, then throw the writes away
+            async with aiosqlite.connect(DB_PATH) as db:
+                preview = LeagueImport(db, sheets)
+                await preview.run(lambda stage: progress.update(f"⏳ Checking {stage}"))
+                await db.rollback()
+
+            if not preview.changed:
+                response = "✅ **Nothing to import** - the workbook matches the current data.\n"
+                response += format_import_errors(preview.errors)
+                await progress.update(response, force=True)
+                return
 
-                    # Clear existing free agency results
-                    await db.execute("DELETE FROM free_agency_results")
+            response = "📋 **Import Preview**\n\n"
+            response += "\n".join(preview.summary_lines()) + "\n"
+            response += format_import_errors(preview.errors)
+            response += "\nApply these changes?"
+            await progress.update(response, force=True, view=ConfirmImportView(sheets))
 
-                    for _, row in free_agency_results_df.iterrows():
-                        try:
-                            if pd.isna(row['Result_ID']) or not row['Result_ID']:
-                                continue
-
-                            result_id = int(row['Result_ID'])
-                            period_id = int(row['Period_ID'])
-                            player_id = int(row['Player_ID'])
-                            original_team_name = str(row['Original_Team'])
-                            winning_team_name = str(row['Winning_Team']) if pd.notna(row['Winning_Team']) and row['Winning_Team'] else None
-                            winning_bid = int(row['Winning_Bid']) if pd.notna(row['Winning_Bid']) and row['Winning_Bid'] else None
-                            matched = int(row['Matched']) if pd.notna(row['Matched']) else 0
-                            compensation_band = int(row['Compensation_Band']) if pd.notna(row['Compensation_Band']) and row['Compensation_Band'] else None
-                            confirmed_at = str(row['Confirmed_At']) if pd.notna(row['Confirmed_At']) and row['Confirmed_At'] else None
-
-                            # Verify player_id exists and get team IDs from names
-                            cursor = await db.execute("SELECT player_id FROM players WHERE player_id = ?", (player_id,))
-                            player = await cursor.fetchone()
-                            if not player:
-                                errors.append(f"Free Agency Results: Player_ID '{player_id}' not found")
-                                continue
-
-                            cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (original_team_name,))
-                            orig_team = await cursor.fetchone()
-                            if not orig_team:
-                                errors.append(f"Free Agency Results: Original team '{original_team_name}' not found")
-                                continue
-                            original_team_id = orig_team[0]
-
-                            winning_team_id = None
-                            if winning_team_name:
-                                cursor = await db.execute("SELECT team_id FROM teams WHERE team_name = ?", (winning_team_name,))
-                                win_team = await cursor.fetchone()
-                                if win_team:
-                                    winning_team_id = win_team[0]
-
-                            await db.execute(
-                                """INSERT INTO free_agency_results
-                                   (result_id, period_id, player_id, original_team_id, winning_team_id, winning_bid, matched, compensation_band, confirmed_at)
-                                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                                (result_id, period_id, player_id, original_team_id, winning_team_id, winning_bid, matched, compensation_band, confirmed_at)
-                            )
-                            free_agency_results_imported += 1
-
-                        except Exception as e:
-                            errors.append(f"Free Agency Results row: {str(e)}")
-                    await db.commit()
-                except Exception as e:
-                    if 'Worksheet Free_Agency_Results' not in str(e):
-                        errors.append(f"Free Agency Results sheet error: {str(e)}")
-
-            # Build response
-            response = "✅ **Import Complete!**\n\n"
-            response += f"**Teams:** {teams_added} added, {teams_updated} updated\n"
-            response += f"**Players:** {players_added} added, {players_updated} updated, {players_deleted} deleted\n"
-            if current_lineups_imported > 0:
-                response += f"**Current Lineups:** {current_lineups_imported} imported\n"
-            if starting_lineups_imported > 0:
-                response += f"**Starting Lineups:** {starting_lineups_imported} teams imported\n"
-            if seasons_imported > 0:
-                response += f"**Seasons:** {seasons_imported} imported\n"
-            if injuries_imported > 0:
-                response += f"**Injuries:** {injuries_imported} imported\n"
-            if suspensions_imported > 0:
-                response += f"**Suspensions:** {suspensions_imported} imported\n"
-            if drafts_imported > 0:
-                response += f"**Drafts:** {drafts_imported} updated\n"
-            if draft_picks_imported > 0:
-                response += f"**Draft Picks:** {draft_picks_imported} imported\n"
-            if ladder_positions_imported > 0:
-                response += f"**Ladder Positions:** {ladder_positions_imported} imported\n"
-            if trades_imported > 0:
-                response += f"**Trades:** {trades_imported} imported\n"
-            if matches_imported > 0:
-                response += f"**Matches:** {matches_imported} imported\n"
-            if submitted_lineups_imported > 0:
-                response += f"**Submitted Lineups:** {submitted_lineups_imported} imported\n"
-            if settings_imported > 0:
-                response += f"**Settings:** {settings_imported} imported\n"
-            if compensation_chart_imported > 0:
-                response += f"**Compensation Chart:** {compensation_chart_imported} entries imported\n"
-            if contract_config_imported > 0:
-                response += f"**Contract Config:** {contract_config_imported} entries imported\n"
-            if draft_value_index_imported > 0:
-                response += f"**Draft Value Index:** {draft_value_index_imported} entries imported\n"
-            if free_agency_periods_imported > 0:
-                response += f"**Free Agency Periods:** {free_agency_periods_imported} imported\n"
-            if free_agency_bids_imported > 0:
-                response += f"**Free Agency Bids:** {free_agency_bids_imported} imported\n"
-            if free_agency_resigns_imported > 0:
-                response += f"**Free Agency Re-Signs:** {free_agency_resigns_imported} imported\n"
-            if free_agency_results_imported > 0:
-                response += f"**Free Agency Results:** {free_agency_results_imported} imported\n"
-
-            if duplicate_warnings:
-                response += f"\n⚠️ **{len(duplicate_warnings)} Duplicate Name Warning(s):**\n"
-                response += "\n".join(duplicate_warnings[:10])  # Show first 10 warnings
-                if len(duplicate_warnings) > 10:
-                    response += f"\n... and {len(duplicate_warnings) - 10} more"
-
-            if errors:
-                response += f"\n❌ **{len(errors)} Errors:**\n"
-                response += "\n".join(errors[:10])  # Show first 10 errors
-                if len(errors) > 10:
-                    response += f"\n... and {len(errors) - 10} more"
-
-            await interaction.followup.send(response, ephemeral=True)
-            
         except Exception as e:
-            await interaction.followup.send(f"❌ Error importing file: {e}", ephemeral=True)
+            await progress.update(f"❌ Error importing file: {e}", force=True)
 
     @app_commands.command(name="assignrookiecontracts", description="[ADMIN] Assign contract_expiry to drafted rookies")
     @app_commands.describe(
@@ -2583,6 +1369,225 @@ class AdminCommands(commands.Cog):
         except Exception as e:
             await interaction.followup.send(f"❌ Error exporting database: {e}", ephemeral=True)
 
+    @app_commands.command(name="perfstats", description="[ADMIN] Command and view latency percentiles")
+    @app_commands.describe(
+        window="How far back to look",
+        sort_by="Which interactions to list first"
+    )
+    @app_commands.choices(
+        window=[
+            app_commands.Choice(name="Last hour", value="hour"),
+            app_commands.Choice(name="Last day", value="day"),
+        ],
+        sort_by=[
+            app_commands.Choice(name="Slowest (p95)", value="p95"),
+            app_commands.Choice(name="Most total time", value="total"),
+            app_commands.Choice(name="Most used", value="count"),
+        ]
+    )
+    async def perfstats(self, interaction: discord.Interaction, window: str = "hour", sort_by: str = "p95"):
+        await interaction.response.send_message(
+            format_perfstats(PERFSTATS_WINDOWS[window], window, sort_by), ephemeral=True
+        )
+
+    @app_commands.command(name="profile", description="[ADMIN] Profile the bot for the next interactions or seconds")
+    @app_commands.describe(
+        action="Start a capture, or stop it and get the files",
+        mode="cProfile (exact call counts) or sampling (low overhead, flamegraph stacks)",
+        interactions="Stop after this many interactions",
+        seconds=f"Stop after this many seconds (default {PROFILE_DEFAULT_SECONDS} if no interaction count, max {PROFILE_MAX_SECONDS})",
+        memory="Also attach a tracemalloc diff of what was allocated"
+    )
+    @app_commands.choices(
+        action=[
+            app_commands.Choice(name="Start", value="start"),
+            app_commands.Choice(name="Stop", value="stop"),
+        ],
+        mode=[
+            app_commands.Choice(name="cProfile", value="cprofile"),
+            app_commands.Choice(name="Sampling", value="sampling"),
+        ]
+    )
+    async def profile(self, interaction: discord.Interaction, action: str, mode: str = "sampling",
+                      interactions: app_commands.Range[int, 1, PROFILE_MAX_INTERACTIONS] = None,
+                      seconds: app_commands.Range[int, 1, PROFILE_MAX_SECONDS] = None,
+                      memory: bool = False):
+        if action == "stop":
+            await interaction.response.defer(ephemeral=True)
+            result = profiler.stop()
+            if result is None:
+                await interaction.followup.send("❌ No profile is running.", ephemeral=True)
+                return
+            await send_profile_result(interaction, result)
+            return
+
+        if not interactions and not seconds:
+            seconds = PROFILE_DEFAULT_SECONDS
+
+        def on_finish(result):
+            # A limit ended the capture - deliver it on the start interaction while its token is still valid
+            async def deliver():
+                try:
+                    await send_profile_result(interaction, result)
+                    profiler.discard(result)
+                except discord.HTTPException as e:
+                    print(f"Profile finished but could not be sent ({e}) - use /profile stop to collect it")
+            asyncio.get_running_loop().create_task(deliver())
+
+        try:
+            profiler.start(mode, interactions, seconds, memory, on_finish=on_finish)
+        except RuntimeError as e:
+            await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+            return
+
+        limits = []
+        if interactions:
+            limits.append(f"{interactions} interaction(s)")
+        if seconds:
+            limits.append(f"{seconds}s")
+        await interaction.response.send_message(
+            f"🔬 Profiling ({mode}{', with memory' if memory else ''}) for {' or '.join(limits)}. "
+            f"The files will be posted here, or use `/profile stop` to end it early.",
+            ephemeral=True
+        )
+
+
+async def send_profile_result(interaction, result):
+    """Upload a finished profile as ephemeral attachments"""
+    files = [discord.File(io.BytesIO(data), filename=filename) for filename, data in result.files]
+    summary = result.summary
+    if len(summary) > 1500:
+        summary = summary[:1500] + "\n..."
+    await interaction.followup.send(
+        f"🔬 **Profile** ({result.mode}): {result.seconds:.1f}s, {result.interactions} interaction(s)\n"
+        f"```\n{summary}\n```",
+        files=files,
+        ephemeral=True
+    )
+
+
+def format_perfstats(minutes, window_name, sort_by):
+    """
+    Render the metrics for the last `minutes` minutes as a /perfstats message.
+
+    Args:
+        minutes: Window length
+        window_name: "hour" or "day", for the title
+        sort_by: "p95", "total" or "count"
+
+    Returns:
+        str: Message under Discord's 2000 character limit
+    """
+    stats = metrics.interaction_window(minutes)
+    if not stats:
+        return f"📈 No interactions recorded in the last {window_name}."
+
+    sort_keys = {
+        'p95': lambda item: item[1].latency.percentile(0.95),
+        'total': lambda item: item[1].latency.total,
+        'count': lambda item: item[1].latency.count,
+    }
+    rows = sorted(stats.items(), key=sort_keys[sort_by], reverse=True)
+
+    calls = sum(s.latency.count for s in stats.values())
+    late = sum(s.late_responses for s in stats.values())
+    errors = sum(s.errors for s in stats.values())
+    deferrals = sum(s.auto_deferrals for s in stats.values())
+    total_ms = sum(s.latency.total for s in stats.values())
+    db_ms = sum(s.db_ms for s in stats.values())
+    discord_ms = sum(s.discord_ms for s in stats.values())
+
+    response = f"📈 **Performance - last {window_name}**\n"
+    response += (f"{calls} interactions, {late} responded after {metrics.RESPONSE_DEADLINE:.0f}s, "
+                 f"{deferrals} auto-deferred, {errors} failed\n")
+    if total_ms:
+        response += (f"Time split: {db_ms / total_ms:.0%} SQL, {discord_ms / total_ms:.0%} Discord API, "
+                     f"{max(0.0, 1 - (db_ms + discord_ms) / total_ms):.0%} other\n")
+
+    cache_rates = metrics.cache_window(minutes)
+    if cache_rates:
+        response += "Cache hits: " + ", ".join(
+            f"{name} {hits / (hits + misses):.0%} ({hits}/{hits + misses})"
+            for name, (hits, misses) in sorted(cache_rates.items())
+        ) + "\n"
+
+    # ms columns; sql/api are averages per call, dfr counts automatic deferrals
+    table = [f"{'interaction':<28}{'n':>5}{'p50':>7}{'p95':>7}{'p99':>7}{'max':>7}{'sql':>6}{'api':>6}{'late':>5}{'dfr':>4}"]
+    shown = 0
+    for name, s in rows:
+        latency = s.latency
+        line = (f"{name[:27]:<28}{latency.count:>5}{latency.percentile(0.5):>7.0f}{latency.percentile(0.95):>7.0f}"
+                f"{latency.percentile(0.99):>7.0f}{latency.max:>7.0f}{s.db_ms / latency.count:>6.0f}"
+                f"{s.discord_ms / latency.count:>6.0f}{s.late_responses:>5}{s.auto_deferrals:>4}")
+        if len(response) + sum(len(l) + 1 for l in table) + len(line) + 60 > 2000:
+            break
+        table.append(line)
+        shown += 1
+
+    response += "```\n" + "\n".join(table) + "\n```"
+    if shown < len(rows):
+        response += f"... and {len(rows) - shown} more"
+    return response
+
+
+def format_import_errors(errors):
+    """Error section for import messages (first 10 errors)"""
+    if not errors:
+        return ""
+    response = f"\n❌ **{len(errors)} Errors:**\n"
+    response += "\n".join(errors[:10])
+    if len(errors) > 10:
+        response += f"\n... and {len(errors) - 10} more"
+    return response + "\n"
+
+
+class ConfirmImportView(discord.ui.View):
+    """Confirmation view for applying a previewed /importdata workbook"""
+    def __init__(self, sheets):
+        super().__init__(timeout=300)
+        self.sheets = sheets
+
+    @discord.ui.button(label="✅ Confirm", style=discord.ButtonStyle.danger)
+    async def confirm_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        # Disable all buttons while the import runs
+        for item in self.children:
+            item.disabled = True
+        await interaction.response.edit_message(content="⏳ Importing...", view=self)
+
+        try:
+            # Diff again rather than reusing the preview, in case anything changed since
+            async with aiosqlite.connect(DB_PATH) as db:
+                league_import = LeagueImport(db, self.sheets)
+                await league_import.run()
+                await db.commit()
+            # The Settings sheet may have rewritten any setting, the Teams sheet any emoji, and
+            # the other sheets anything the free agent pool and projections are built from
+            settings.invalidate()
+            await team_emojis.reload()
+            free_agency_cog = interaction.client.get_cog('FreeAgencyCommands')
+            if free_agency_cog:
+                free_agency_cog.free_agent_pool = None
+            season_cog = interaction.client.get_cog('SeasonCommands')
+            if season_cog:
+                season_cog.projections_cache.clear()
+
+            response = "✅ **Import Complete!**\n\n"
+            response += "\n".join(league_import.summary_lines() or ["No changes were needed."]) + "\n"
+            response += format_import_errors(league_import.errors)
+        except Exception as e:
+            response = f"❌ Error importing file: {e}"
+
+        await interaction.edit_original_response(content=response, view=None)
+        self.stop()
+
+    @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.secondary)
+    async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        # Disable all buttons
+        for item in self.children:
+            item.disabled = True
+        await interaction.response.edit_message(content="❌ Import cancelled - nothing was changed.", view=self)
+        self.stop()
+
 
 async def setup(bot):
     await bot.add_cog(AdminCommands(bot))
\ No newline at end of file
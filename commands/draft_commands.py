@@ -3,6 +3,11 @@ from discord.ext import commands
 from discord import app_commands
 import aiosqlite
 from config import DB_PATH, ADMIN_ROLE_ID
+from deferral import auto_defer
+from settings_store import settings
+from team_emojis import team_emojis
+from render_cache import render_cache
+from commands.season_commands import get_ladder
 
 class DraftCommands(commands.Cog):
     def __init__(self, bot):
@@ -254,8 +259,19 @@ class DraftCommands(commands.Cog):
                     await interaction.followup.send("❌ No teams found!", ephemeral=True)
                     return
 
+                # Offer the results ladder of the season this draft follows, if it has been played
+                ladder_order = None
+                ladder_season = season_number - 1 if season_number else None
+                cursor = await db.execute("SELECT season_id FROM seasons WHERE season_number = ?", (ladder_season,))
+                ladder_season_row = await cursor.fetchone()
+                if ladder_season_row:
+                    ladder = await get_ladder(db, ladder_season_row[0])
+                    if any(played for _, _, _, played, *_ in ladder):
+                        ladder_order = [(team_id, team_name, position)
+                                        for position, (team_id, team_name, *_) in enumerate(ladder, 1)]
+
                 # Send the ladder entry modal
-                view = SetLadderView(teams, draft_id, draft_name, rounds, season_number)
+                view = SetLadderView(teams, draft_id, draft_name, rounds, season_number, ladder_order, ladder_season)
 
                 message = f"📊 **Set Ladder Order: {draft_name}**\n\n"
                 message += f"**Current Status:** {status}\n"
@@ -265,6 +281,8 @@ class DraftCommands(commands.Cog):
                 message += f"\nClick the button below to enter the ladder order.\n"
                 message += f"You'll paste teams in order from 1st place to last place (one team per line).\n"
                 message += f"The draft order will be the reverse of the ladder (last place picks first)."
+                if ladder_order:
+                    message += f"\n\nOr use the Season {ladder_season} results ladder (from `/ladder`) as is."
 
                 await interaction.followup.send(message, view=view, ephemeral=True)
 
@@ -278,68 +296,82 @@ class DraftCommands(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            async with aiosqlite.connect(DB_PATH) as db:
-                # If no draft name provided, get the most recent current or in-progress draft
-                if draft_name is None:
-                    cursor = await db.execute(
-                        """SELECT draft_name
-                           FROM drafts
-                           WHERE status IN ('current', 'in_progress')
-                           ORDER BY draft_id DESC
-                           LIMIT 1"""
-                    )
-                    draft_result = await cursor.fetchone()
-                    if not draft_result:
-                        await interaction.followup.send(
-                            "❌ No current or in-progress drafts found!\n"
-                            "Use `/setdraftladder` to set the order for a future draft."
-                        )
-                        return
-                    draft_name = draft_result[0]
+            # Every viewer of a draft gets the same pages until a pick is made or moved
+            error, pages = await render_cache.get(
+                'draftorder', None, draft_name, lambda: self.build_draft_order_pages(draft_name)
+            )
+            if error:
+                await interaction.followup.send(error)
+                return
 
-                # Verify this draft is current or in progress (has ladder set)
-                cursor = await db.execute(
-                    "SELECT status FROM drafts WHERE draft_name = ?",
-                    (draft_name,)
-                )
-                draft_status = await cursor.fetchone()
-                if not draft_status or draft_status[0] not in ('current', 'in_progress'):
-                    await interaction.followup.send(
-                        f"❌ Draft '{draft_name}' is not viewable (status: {draft_status[0] if draft_status else 'unknown'})!\n"
-                        f"Only current or in-progress drafts with ladder order set can be viewed.\n"
-                        f"Use `/setdraftladder` to set the order for a future draft."
-                    )
-                    return
+            # Create paginated view
+            view = DraftOrderView(pages)
+            await interaction.followup.send(embed=view.create_embed(), view=view)
 
-                # Get draft picks with team emojis
+        except Exception as e:
+            await interaction.followup.send(f"❌ Error: {e}")
+
+    async def build_draft_order_pages(self, draft_name):
+        """
+        Render a draft's order, a page per round.
+
+        Args:
+            draft_name: Draft to show (None for the most recent current or in-progress draft)
+
+        Returns:
+            tuple: (error message, None) if the draft can't be shown, else (None, list of embeds for rounds 1 on)
+        """
+        async with aiosqlite.connect(DB_PATH) as db:
+            # If no draft name provided, get the most recent current or in-progress draft
+            if draft_name is None:
                 cursor = await db.execute(
-                    """SELECT dp.pick_number, dp.round_number,
-                              dp.pick_origin,
-                              ct.team_name as current_team, ct.emoji_id as current_emoji,
-                              p.name as player_selected
-                       FROM draft_picks dp
-                       JOIN teams ct ON dp.current_team_id = ct.team_id
-                       LEFT JOIN players p ON dp.player_selected_id = p.player_id
-                       WHERE dp.draft_name = ? AND dp.pick_number IS NOT NULL
-                       ORDER BY dp.pick_number""",
-                    (draft_name,)
+                    """SELECT draft_name
+                       FROM drafts
+                       WHERE status IN ('current', 'in_progress')
+                       ORDER BY draft_id DESC
+                       LIMIT 1"""
                 )
-                picks = await cursor.fetchall()
-
-                if not picks:
-                    await interaction.followup.send(
-                        f"❌ No draft picks found for '{draft_name}'!\n"
-                        f"This draft may not have a ladder order set yet."
-                    )
-                    return
+                draft_result = await cursor.fetchone()
+                if not draft_result:
+                    return (
+                        "❌ No current or in-progress drafts found!\n"
+                        "Use `/setdraftladder` to set the order for a future draft."
+                    ), None
+                draft_name = draft_result[0]
+
+            # Verify this draft is current or in progress (has ladder set)
+            cursor = await db.execute(
+                "SELECT status FROM drafts WHERE draft_name = ?",
+                (draft_name,)
+            )
+            draft_status = await cursor.fetchone()
+            if not draft_status or draft_status[0] not in ('current', 'in_progress'):
+                return (
+                    f"❌ Draft '{draft_name}' is not viewable (status: {draft_status[0] if draft_status else 'unknown'})!\n"
+                    f"Only current or in-progress drafts with ladder order set can be viewed.\n"
+                    f"Use `/setdraftladder` to set the order for a future draft."
+                ), None
+
+            # Get draft picks (the pages show the current team's emoji)
+            cursor = await db.execute(
+                """SELECT dp.pick_number, dp.round_number,
+                          dp.pick_origin, dp.current_team_id,
+                          p.name as player_selected
+                   FROM draft_picks dp
+                   LEFT JOIN players p ON dp.player_selected_id = p.player_id
+                   WHERE dp.draft_name = ? AND dp.pick_number IS NOT NULL
+                   ORDER BY dp.pick_number""",
+                (draft_name,)
+            )
+            picks = await cursor.fetchall()
 
-                # Create paginated view
-                view = DraftOrderView(picks, draft_name, interaction.guild)
-                embed = view.create_embed()
-                await interaction.followup.send(embed=embed, view=view)
+        if not picks:
+            return (
+                f"❌ No draft picks found for '{draft_name}'!\n"
+                f"This draft may not have a ladder order set yet."
+            ), None
 
-        except Exception as e:
-            await interaction.followup.send(f"❌ Error: {e}")
+        return None, draft_order_pages(picks, draft_name)
 
     async def all_drafts_autocomplete(
         self,
@@ -510,132 +542,93 @@ class DraftCommands(commands.Cog):
     @app_commands.command(name="drafthand", description="View a team's draft picks")
     @app_commands.describe(team="Team to view (defaults to your team)")
     @app_commands.autocomplete(team=team_autocomplete)
+    @auto_defer(ephemeral=True)
     async def draft_hand(self, interaction: discord.Interaction, team: str = None):
-        await interaction.response.defer(ephemeral=True)
-
-        async with aiosqlite.connect(DB_PATH) as db:
-            # Get team ID - default to user's team if not specified
-            if team is None:
-                # Get user's team from their role
-                cursor = await db.execute(
-                    "SELECT team_id, team_name FROM teams ORDER BY team_name"
-                )
-                teams = await cursor.fetchall()
-
-                user_team_id = None
-                user_team_name = None
-                for team_id, team_name in teams:
-                    cursor = await db.execute(
-                        "SELECT role_id FROM teams WHERE team_id = ?",
-                        (team_id,)
-                    )
-                    role_result = await cursor.fetchone()
-                    if role_result and role_result[0]:
-                        role = interaction.guild.get_role(int(role_result[0]))
-                        if role and role in interaction.user.roles:
-                            user_team_id = team_id
-                            user_team_name = team_name
-                            break
-
-                if not user_team_id:
-                    await interaction.followup.send(
-                        "❌ You don't have a team role! Please specify a team.",
-                        ephemeral=True
-                    )
-                    return
-
-                target_team_id = user_team_id
-                target_team_name = user_team_name
-            else:
-                # Look up specified team
-                cursor = await db.execute(
-                    "SELECT team_id, team_name FROM teams WHERE LOWER(team_name) = LOWER(?)",
-                    (team,)
+        # Get team - default to user's team if not specified
+        if team is None:
+            target_team = await render_cache.team_for_member(interaction.user)
+            if not target_team:
+                await interaction.response.send_message(
+                    "❌ You don't have a team role! Please specify a team.",
+                    ephemeral=True
                 )
-                team_result = await cursor.fetchone()
-                if not team_result:
-                    await interaction.followup.send(f"❌ Team '{team}' not found!", ephemeral=True)
-                    return
-
-                target_team_id, target_team_name = team_result
+                return
+        else:
+            target_team = await render_cache.team_named(team, ignore_case=True)
+            if not target_team:
+                await interaction.response.send_message(f"❌ Team '{team}' not found!", ephemeral=True)
+                return
 
-            # Get team emoji
-            cursor = await db.execute(
-                "SELECT emoji_id FROM teams WHERE team_id = ?",
-                (target_team_id,)
+        target_team_id, target_team_name = target_team
+        embed = await render_cache.get(
+            'drafthand', target_team_id, None,
+            lambda: self.build_draft_hand_embed(target_team_id, target_team_name)
+        )
+        if embed is None:
+            await interaction.response.send_message(
+                f"❌ {target_team_name} has no draft picks!",
+                ephemeral=True
             )
-            emoji_result = await cursor.fetchone()
-            team_emoji = None
-            if emoji_result and emoji_result[0]:
-                team_emoji = self.bot.get_emoji(int(emoji_result[0]))
+            return
 
-            # Get current active season
-            cursor = await db.execute(
-                "SELECT season_number FROM seasons WHERE status = 'active' LIMIT 1"
-            )
-            active_season_result = await cursor.fetchone()
-            current_season = active_season_result[0] if active_season_result else 999
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
-            # Get all picks for this team, grouped by season
+    async def build_draft_hand_embed(self, team_id, team_name):
+        """
+        Render the picks a team holds.
+
+        Returns:
+            discord.Embed: The draft hand, or None if the team holds no picks
+        """
+        async with aiosqlite.connect(DB_PATH) as db:
+            # Get all unused picks for this team, grouped by season
             cursor = await db.execute(
-                """SELECT dp.season_number, dp.pick_number, dp.round_number,
-                          dp.pick_origin, t.emoji_id, d.draft_name
-                   FROM draft_picks dp
-                   JOIN teams t ON dp.original_team_id = t.team_id
-                   LEFT JOIN drafts d ON dp.draft_id = d.draft_id
-                   WHERE dp.current_team_id = ?
-                     AND dp.player_selected_id IS NULL
-                   ORDER BY dp.season_number ASC NULLS FIRST,
-                            dp.pick_number ASC NULLS LAST,
-                            dp.round_number ASC""",
-                (target_team_id,)
+                """SELECT season_number, pick_number, round_number, pick_origin, original_team_id
+                   FROM draft_picks
+                   WHERE current_team_id = ?
+                     AND player_selected_id IS NULL
+                   ORDER BY season_number ASC NULLS FIRST,
+                            pick_number ASC NULLS LAST,
+                            round_number ASC""",
+                (team_id,)
             )
             all_picks = await cursor.fetchall()
 
-            if not all_picks:
-                await interaction.followup.send(
-                    f"❌ {target_team_name} has no draft picks!",
-                    ephemeral=True
-                )
-                return
+        if not all_picks:
+            return None
 
-            # Group picks by season
-            picks_by_season = {}
-            for season_num, pick_num, round_num, pick_origin, orig_emoji_id, draft_name in all_picks:
-                if season_num not in picks_by_season:
-                    picks_by_season[season_num] = []
-                picks_by_season[season_num].append((pick_num, round_num, pick_origin, orig_emoji_id, draft_name))
+        # Group picks by season
+        picks_by_season = {}
+        for season_num, pick_num, round_num, pick_origin, original_team_id in all_picks:
+            if season_num not in picks_by_season:
+                picks_by_season[season_num] = []
+            picks_by_season[season_num].append((pick_num, round_num, pick_origin, original_team_id))
 
-            # Build embed
-            team_emoji_str = f"{team_emoji} " if team_emoji else ""
-            embed = discord.Embed(
-                title=f"{team_emoji_str}{target_team_name} Draft Hand",
-                color=discord.Color.blue()
-            )
+        # Build embed
+        embed = discord.Embed(
+            title=f"{team_emojis.prefix(team_id)}{team_name} Draft Hand",
+            color=discord.Color.blue()
+        )
 
-            # Collect all picks in one list
-            all_pick_lines = []
-            for season_num in sorted(picks_by_season.keys(), key=lambda x: (x is None, x)):
-                picks = picks_by_season[season_num]
+        # Collect all picks in one list
+        all_pick_lines = []
+        for season_num in sorted(picks_by_season.keys(), key=lambda x: (x is None, x)):
+            picks = picks_by_season[season_num]
 
-                for pick_num, round_num, pick_origin, orig_emoji_id, draft_name in picks:
-                    if pick_num is not None:
-                        # Current pick with number
-                        all_pick_lines.append(f"Pick #{pick_num}")
-                    else:
-                        # Future pick - format as "Future 1st ([emoji] S10)"
-                        round_suffix = {1: "1st", 2: "2nd", 3: "3rd", 4: "4th"}.get(round_num, f"{round_num}th")
-                        orig_emoji = None
-                        if orig_emoji_id:
-                            orig_emoji = self.bot.get_emoji(int(orig_emoji_id))
-                        emoji_str = f"{orig_emoji} " if orig_emoji else ""
-                        # Use season_num - 1 for display (draft naming convention)
-                        all_pick_lines.append(f"Future {round_suffix} ({emoji_str}S{season_num - 1})")
-
-            # Display all picks in embed description
-            embed.description = "\n".join(all_pick_lines) if all_pick_lines else "*No picks*"
+            for pick_num, round_num, pick_origin, original_team_id in picks:
+                if pick_num is not None:
+                    # Current pick with number
+                    all_pick_lines.append(f"Pick #{pick_num}")
+                else:
+                    # Future pick - format as "Future 1st ([emoji] S10)"
+                    round_suffix = {1: "1st", 2: "2nd", 3: "3rd", 4: "4th"}.get(round_num, f"{round_num}th")
+                    emoji_str = team_emojis.prefix(original_team_id)
+                    # Use season_num - 1 for display (draft naming convention)
+                    all_pick_lines.append(f"Future {round_suffix} ({emoji_str}S{season_num - 1})")
 
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        # Display all picks in embed description
+        embed.description = "\n".join(all_pick_lines) if all_pick_lines else "*No picks*"
+        return embed
 
     @app_commands.command(name="addpick", description="[ADMIN] Insert a pick into the draft order")
     @app_commands.describe(
@@ -908,34 +901,26 @@ class DraftCommands(commands.Cog):
                 )
                 return
 
-            # Convert to format expected by view: (pick_id, pick_number, emoji_id, team_name, points_value)
+            # Convert to format expected by view: (pick_id, pick_number, team_id, points_value)
             all_picks = []
 
             if draft_result:
-                # If there's an active draft, get team info for each pick
+                # If there's an active draft, show the team holding each pick
                 draft_id, draft_name = draft_result
+                cursor = await db.execute(
+                    """SELECT pick_number, current_team_id FROM draft_picks
+                       WHERE draft_id = ? AND pick_number IS NOT NULL""",
+                    (draft_id,)
+                )
+                pick_teams = dict(await cursor.fetchall())
                 for pick_number, points_value in index_picks:
-                    # Try to get team emoji for this pick from the draft
-                    cursor = await db.execute(
-                        """SELECT t.emoji_id, t.team_name
-                           FROM draft_picks dp
-                           JOIN teams t ON dp.current_team_id = t.team_id
-                           WHERE dp.draft_id = ? AND dp.pick_number = ?""",
-                        (draft_id, pick_number)
-                    )
-                    team_result = await cursor.fetchone()
-
-                    if team_result:
-                        emoji_id, team_name = team_result
-                        all_picks.append((pick_number, pick_number, emoji_id, team_name, points_value))
-                    else:
-                        # Pick exists in index but not in draft yet
-                        all_picks.append((pick_number, pick_number, None, None, points_value))
+                    # Picks in the index but not in the draft yet have no team
+                    all_picks.append((pick_number, pick_number, pick_teams.get(pick_number), points_value))
             else:
                 # No active draft - just use pick numbers
                 draft_name = None
                 for pick_number, points_value in index_picks:
-                    all_picks.append((pick_number, pick_number, None, None, points_value))
+                    all_picks.append((pick_number, pick_number, None, points_value))
 
         # Create the calculator view
         view = DraftPointsCalculatorView(self.bot, draft_name, all_picks, interaction.guild)
@@ -1000,19 +985,14 @@ class DraftCommands(commands.Cog):
                         )
                         return
 
-                    # Get draft channel from settings
-                    cursor = await db.execute(
-                        "SELECT setting_value FROM settings WHERE setting_key = 'draft_channel_id'"
-                    )
-                    result = await cursor.fetchone()
-                    if not result or not result[0]:
+                    draft_channel_id = await settings.get_int('draft_channel_id')
+                    if not draft_channel_id:
                         await interaction.followup.send(
                             "❌ No draft channel configured! Use `/config` to set the draft channel.",
                             ephemeral=True
                         )
                         return
 
-                    draft_channel_id = int(result[0])
                     draft_channel = self.bot.get_channel(draft_channel_id)
                     if not draft_channel:
                         await interaction.followup.send(
@@ -1124,12 +1104,7 @@ class DraftCommands(commands.Cog):
 
             if players_in_pool == 0:
                 # No players left - auto-end draft
-                cursor = await db.execute(
-                    "SELECT setting_value FROM settings WHERE setting_key = 'draft_channel_id'"
-                )
-                result = await cursor.fetchone()
-                draft_channel_id = int(result[0]) if result and result[0] else None
-                draft_channel = self.bot.get_channel(draft_channel_id) if draft_channel_id else None
+                draft_channel = await settings.channel(self.bot, 'draft_channel_id')
 
                 if draft_channel:
                     await draft_channel.send("**No players left in draft pool**")
@@ -1175,12 +1150,7 @@ class DraftCommands(commands.Cog):
                     pass
 
             # Get draft channel
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = 'draft_channel_id'"
-            )
-            result = await cursor.fetchone()
-            draft_channel_id = int(result[0]) if result and result[0] else None
-            draft_channel = self.bot.get_channel(draft_channel_id) if draft_channel_id else None
+            draft_channel = await settings.channel(self.bot, 'draft_channel_id')
 
             # Post round header if this is the first pick of a new round
             if draft_channel:
@@ -1221,12 +1191,7 @@ class DraftCommands(commands.Cog):
             await db.commit()
 
             # Get draft channel
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = 'draft_channel_id'"
-            )
-            result = await cursor.fetchone()
-            draft_channel_id = int(result[0]) if result and result[0] else None
-            draft_channel = self.bot.get_channel(draft_channel_id) if draft_channel_id else None
+            draft_channel = await settings.channel(self.bot, 'draft_channel_id')
 
             if draft_channel:
                 await draft_channel.send(f"# End of Draft")
@@ -1423,21 +1388,112 @@ class LadderEntryModal(discord.ui.Modal):
             await interaction.followup.send(f"❌ Error creating draft: {e}", ephemeral=True)
 
 
+async def apply_ladder_order(draft_id, draft_name, rounds, season_number, team_order):
+    """
+    Save a ladder order for a future draft and generate its picks.
+
+    Marks the draft 'current', saves ladder_positions for the draft's season and
+    creates the picks in reverse ladder order (last place picks first).
+
+    Args:
+        team_order: List of (team_id, team_name, position) from 1st to last
+
+    Returns:
+        str: Confirmation message for the admin
+    """
+    async with aiosqlite.connect(DB_PATH) as db:
+        # Update draft status to 'current' and set ladder_set_at timestamp
+        await db.execute(
+            """UPDATE drafts SET status = 'current', ladder_set_at = CURRENT_TIMESTAMP
+               WHERE draft_id = ?""",
+            (draft_id,)
+        )
+
+        # Delete all existing picks for this draft
+        await db.execute("DELETE FROM draft_picks WHERE draft_id = ?", (draft_id,))
+
+        # Save ladder positions if this draft is linked to a season
+        if season_number is not None:
+            cursor = await db.execute("SELECT season_id FROM seasons WHERE season_number = ?", (season_number,))
+            season_data = await cursor.fetchone()
+            if season_data:
+                season_id = season_data[0]
+                # Delete existing ladder for this season
+                await db.execute("DELETE FROM ladder_positions WHERE season_id = ?", (season_id,))
+
+                # Insert new ladder positions
+                for team_id, team_name, position in team_order:
+                    await db.execute(
+                        "INSERT INTO ladder_positions (season_id, team_id, position) VALUES (?, ?, ?)",
+                        (season_id, team_id, position)
+                    )
+
+        # Generate new picks with pick_number set, in reverse order (last place picks first)
+        pick_counter = 1
+        for round_num in range(1, rounds + 1):
+            for team_id, team_name, position in reversed(team_order):
+                pick_origin = f"{team_name} R{round_num}"
+                await db.execute(
+                    """INSERT INTO draft_picks (draft_id, draft_name, season_number, round_number, pick_number,
+                                                pick_origin, original_team_id, current_team_id)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (draft_id, draft_name, season_number, round_num, pick_counter, pick_origin, team_id, team_id)
+                )
+                pick_counter += 1
+
+        await db.commit()
+
+        # Get first and last teams
+        first_place_team = team_order[0][1]
+        last_place_team = team_order[-1][1]
+
+        total_picks = len(team_order) * rounds
+        response = f"✅ **Ladder Order Set for '{draft_name}'!**\n\n"
+        response += f"**Status:** Future → Current\n"
+        response += f"**Ladder:**\n"
+        response += f"  1st: {first_place_team}\n"
+        response += f"  ...\n"
+        response += f"  {len(team_order)}th: {last_place_team}\n\n"
+        response += f"**Total Picks:** {total_picks} ({len(team_order)} teams × {rounds} rounds)\n"
+        response += f"**First pick:** {last_place_team} (last place)\n"
+        response += f"\nUse `/draftorder \"{draft_name}\"` to view the full draft order."
+
+    return response
+
+
 class SetLadderView(discord.ui.View):
     """View for setting ladder order on existing future draft"""
-    def __init__(self, teams, draft_id, draft_name, rounds, season_number):
+    def __init__(self, teams, draft_id, draft_name, rounds, season_number, ladder_order=None, ladder_season=None):
         super().__init__(timeout=300)
         self.teams = teams
         self.draft_id = draft_id
         self.draft_name = draft_name
         self.rounds = rounds
         self.season_number = season_number
+        self.ladder_order = ladder_order
+
+        # Only offer the results ladder if that season has been played
+        if ladder_order:
+            self.use_ladder_button.label = f"📊 Use Season {ladder_season} Ladder"
+        else:
+            self.remove_item(self.use_ladder_button)
 
     @discord.ui.button(label="📝 Enter Ladder Order", style=discord.ButtonStyle.primary)
     async def enter_ladder_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         modal = SetLadderModal(self.teams, self.draft_id, self.draft_name, self.rounds, self.season_number)
         await interaction.response.send_modal(modal)
 
+    @discord.ui.button(label="📊 Use Season Ladder", style=discord.ButtonStyle.success)
+    async def use_ladder_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer(ephemeral=True)
+
+        try:
+            response = await apply_ladder_order(self.draft_id, self.draft_name, self.rounds, self.season_number, self.ladder_order)
+            self.stop()
+            await interaction.followup.send(response, ephemeral=True)
+        except Exception as e:
+            await interaction.followup.send(f"❌ Error setting ladder: {e}", ephemeral=True)
+
 
 class SetLadderModal(discord.ui.Modal):
     """Modal for setting ladder order on existing future draft"""
@@ -1503,115 +1559,52 @@ class SetLadderModal(discord.ui.Modal):
                 )
                 return
 
-            # Update the draft
-            async with aiosqlite.connect(DB_PATH) as db:
-                # Update draft status to 'current' and set ladder_set_at timestamp
-                await db.execute(
-                    """UPDATE drafts SET status = 'current', ladder_set_at = CURRENT_TIMESTAMP
-                       WHERE draft_id = ?""",
-                    (self.draft_id,)
-                )
-
-                # Delete all existing picks for this draft
-                await db.execute("DELETE FROM draft_picks WHERE draft_id = ?", (self.draft_id,))
-
-                # Save ladder positions if this draft is linked to a season
-                if self.season_number is not None:
-                    cursor = await db.execute("SELECT season_id FROM seasons WHERE season_number = ?", (self.season_number,))
-                    season_data = await cursor.fetchone()
-                    if season_data:
-                        season_id = season_data[0]
-                        # Delete existing ladder for this season
-                        await db.execute("DELETE FROM ladder_positions WHERE season_id = ?", (season_id,))
-
-                        # Insert new ladder positions
-                        for team_id, team_name, position in team_order:
-                            await db.execute(
-                                "INSERT INTO ladder_positions (season_id, team_id, position) VALUES (?, ?, ?)",
-                                (season_id, team_id, position)
-                            )
-
-                # Generate new picks with pick_number set, in reverse order (last place picks first)
-                pick_counter = 1
-                for round_num in range(1, self.rounds + 1):
-                    for team_id, team_name, position in reversed(team_order):
-                        pick_origin = f"{team_name} R{round_num}"
-                        await db.execute(
-                            """INSERT INTO draft_picks (draft_id, draft_name, season_number, round_number, pick_number,
-                                                        pick_origin, original_team_id, current_team_id)
-                               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                            (self.draft_id, self.draft_name, self.season_number, round_num, pick_counter, pick_origin, team_id, team_id)
-                        )
-                        pick_counter += 1
-
-                await db.commit()
-
-                # Get first and last teams
-                first_place_team = team_order[0][1]
-                last_place_team = team_order[-1][1]
-
-                total_picks = len(self.teams) * self.rounds
-                response = f"✅ **Ladder Order Set for '{self.draft_name}'!**\n\n"
-                response += f"**Status:** Future → Current\n"
-                response += f"**Ladder:**\n"
-                response += f"  1st: {first_place_team}\n"
-                response += f"  ...\n"
-                response += f"  {len(team_order)}th: {last_place_team}\n\n"
-                response += f"**Total Picks:** {total_picks} ({len(self.teams)} teams × {self.rounds} rounds)\n"
-                response += f"**First pick:** {last_place_team} (last place)\n"
-                response += f"\nUse `/draftorder \"{self.draft_name}\"` to view the full draft order."
-
-                await interaction.followup.send(response, ephemeral=True)
+            response = await apply_ladder_order(self.draft_id, self.draft_name, self.rounds, self.season_number, team_order)
+            await interaction.followup.send(response, ephemeral=True)
 
         except Exception as e:
             await interaction.followup.send(f"❌ Error setting ladder: {e}", ephemeral=True)
 
 
-class DraftOrderView(discord.ui.View):
-    def __init__(self, picks, draft_name, guild):
-        super().__init__(timeout=180)
-        self.picks = picks
-        self.draft_name = draft_name
-        self.guild = guild
-        self.current_round = 1
+def draft_order_pages(picks, draft_name):
+    """
+    Render draft picks a page per round.
 
-        # Group picks by round
-        self.picks_by_round = {}
-        for pick in picks:
-            round_num = pick[1]
-            if round_num not in self.picks_by_round:
-                self.picks_by_round[round_num] = []
-            self.picks_by_round[round_num].append(pick)
+    Args:
+        picks: (pick_number, round_number, pick_origin, current_team_id, player_selected) in pick order
+        draft_name: For the titles
 
-        self.max_rounds = max(self.picks_by_round.keys()) if self.picks_by_round else 1
-        self.update_buttons()
+    Returns:
+        list: An embed per round, from round 1 to the last round with picks
+    """
+    # Group picks by round
+    picks_by_round = {}
+    for pick in picks:
+        round_num = pick[1]
+        if round_num not in picks_by_round:
+            picks_by_round[round_num] = []
+        picks_by_round[round_num].append(pick)
 
-    def get_emoji(self, emoji_id):
-        """Convert emoji_id to Discord emoji or return empty string"""
-        if not emoji_id:
-            return ""
-        try:
-            emoji = self.guild.get_emoji(int(emoji_id))
-            return str(emoji) + " " if emoji else ""
-        except:
-            return ""
+    max_rounds = max(picks_by_round.keys()) if picks_by_round else 1
 
-    def create_embed(self):
+    pages = []
+    for round_num in range(1, max_rounds + 1):
         embed = discord.Embed(
-            title=f"{self.draft_name} - Round {self.current_round}",
+            title=f"{draft_name} - Round {round_num}",
             color=discord.Color.blue()
         )
 
-        round_picks = self.picks_by_round.get(self.current_round, [])
+        round_picks = picks_by_round.get(round_num, [])
 
         if not round_picks:
             embed.description = "No picks in this round"
-            return embed
+            pages.append(embed)
+            continue
 
         description = ""
-        for pick_num, round_num, pick_origin, current_team, current_emoji, player_selected in round_picks:
+        for pick_num, _, pick_origin, current_team_id, player_selected in round_picks:
             # Get emoji for current team
-            current_emoji_str = self.get_emoji(current_emoji)
+            current_emoji_str = team_emojis.prefix(current_team_id)
 
             # Build pick - number, emoji, and origin
             pick_desc = f"**{pick_num}.** {current_emoji_str}"
@@ -1627,9 +1620,22 @@ class DraftOrderView(discord.ui.View):
             description += pick_desc + "\n"
 
         embed.description = description
-        embed.set_footer(text=f"Round {self.current_round} of {self.max_rounds}")
+        embed.set_footer(text=f"Round {round_num} of {max_rounds}")
+        pages.append(embed)
 
-        return embed
+    return pages
+
+
+class DraftOrderView(discord.ui.View):
+    def __init__(self, pages):
+        super().__init__(timeout=180)
+        self.pages = pages  # from draft_order_pages - shared with other viewers, so never modified
+        self.current_round = 1
+        self.max_rounds = len(pages)
+        self.update_buttons()
+
+    def create_embed(self):
+        return self.pages[self.current_round - 1]
 
     def update_buttons(self):
         # Enable/disable buttons based on current round
@@ -2015,14 +2021,7 @@ class DraftPickView(discord.ui.View):
         """Post father/son bid to draft channel"""
         try:
             # Get draft channel
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = 'draft_channel_id'"
-            )
-            result = await cursor.fetchone()
-            if not result or not result[0]:
-                return
-
-            draft_channel = self.bot.get_channel(int(result[0]))
+            draft_channel = await settings.channel(self.bot, 'draft_channel_id')
             if not draft_channel:
                 return
 
@@ -2100,51 +2099,46 @@ class DraftPickView(discord.ui.View):
 
         # Post auto-pass result to draft channel
         try:
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = 'draft_channel_id'"
-            )
-            result = await cursor.fetchone()
-            if result and result[0]:
-                draft_channel = self.bot.get_channel(int(result[0]))
-                if draft_channel:
-                    # Get emojis
-                    bidding_emoji_str = ""
-                    if bidding_emoji_id:
-                        try:
-                            emoji = self.bot.get_emoji(int(bidding_emoji_id))
-                            if emoji:
-                                bidding_emoji_str = f"{emoji} "
-                        except:
-                            pass
-
-                    fs_emoji_str = ""
-                    if fs_emoji_id:
-                        try:
-                            emoji = self.bot.get_emoji(int(fs_emoji_id))
-                            if emoji:
-                                fs_emoji_str = f"{emoji} "
-                        except:
-                            pass
-
-                    # Get plays_like info
-                    cursor = await db.execute(
-                        "SELECT plays_like FROM players WHERE player_id = ?",
-                        (player_id,)
-                    )
-                    plays_like_result = await cursor.fetchone()
-                    plays_like = plays_like_result[0] if plays_like_result and plays_like_result[0] else None
+            draft_channel = await settings.channel(self.bot, 'draft_channel_id')
+            if draft_channel:
+                # Get emojis
+                bidding_emoji_str = ""
+                if bidding_emoji_id:
+                    try:
+                        emoji = self.bot.get_emoji(int(bidding_emoji_id))
+                        if emoji:
+                            bidding_emoji_str = f"{emoji} "
+                    except:
+                        pass
+
+                fs_emoji_str = ""
+                if fs_emoji_id:
+                    try:
+                        emoji = self.bot.get_emoji(int(fs_emoji_id))
+                        if emoji:
+                            fs_emoji_str = f"{emoji} "
+                    except:
+                        pass
+
+                # Get plays_like info
+                cursor = await db.execute(
+                    "SELECT plays_like FROM players WHERE player_id = ?",
+                    (player_id,)
+                )
+                plays_like_result = await cursor.fetchone()
+                plays_like = plays_like_result[0] if plays_like_result and plays_like_result[0] else None
 
-                    # Build main message line
-                    message = f"**Pick {self.pick_number}:** {bidding_emoji_str}select **{player_name.upper()}** ({pos}, {age} yo, {ovr} OVR)"
+                # Build main message line
+                message = f"**Pick {self.pick_number}:** {bidding_emoji_str}select **{player_name.upper()}** ({pos}, {age} yo, {ovr} OVR)"
 
-                    # Add plays like on main line
-                    if plays_like:
-                        message += f" - Plays like *{plays_like}*"
+                # Add plays like on main line
+                if plays_like:
+                    message += f" - Plays like *{plays_like}*"
 
-                    # Add matching status on new line
-                    message += f"\n└ {fs_emoji_str}Unable to match"
+                # Add matching status on new line
+                message += f"\n└ {fs_emoji_str}Unable to match"
 
-                    await draft_channel.send(message)
+                await draft_channel.send(message)
         except Exception as e:
             print(f"Error posting auto-pass result to draft channel: {e}")
 
@@ -2170,14 +2164,7 @@ class DraftPickView(discord.ui.View):
         """Post pick result to draft channel"""
         try:
             # Get draft channel
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = 'draft_channel_id'"
-            )
-            result = await cursor.fetchone()
-            if not result or not result[0]:
-                return
-
-            draft_channel = self.bot.get_channel(int(result[0]))
+            draft_channel = await settings.channel(self.bot, 'draft_channel_id')
             if not draft_channel:
                 return
 
@@ -2558,14 +2545,7 @@ class FatherSonMatchView(discord.ui.View):
         """Post the match/pass result to draft channel"""
         try:
             # Get draft channel
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = 'draft_channel_id'"
-            )
-            result = await cursor.fetchone()
-            if not result or not result[0]:
-                return
-
-            draft_channel = self.bot.get_channel(int(result[0]))
+            draft_channel = await settings.channel(self.bot, 'draft_channel_id')
             if not draft_channel:
                 return
 
@@ -2659,22 +2639,12 @@ class DraftPointsCalculatorView(discord.ui.View):
         super().__init__(timeout=300)
         self.bot = bot
         self.draft_name = draft_name
-        self.all_picks = all_picks  # List of (pick_id, pick_number, emoji_id, team_name, points_value)
+        self.all_picks = all_picks  # List of (pick_id, pick_number, team_id, points_value)
         self.guild = guild
         self.selected_picks = []  # List of pick_ids
         self.current_page = 0
         self.picks_per_page = 25
 
-    def get_emoji(self, emoji_id):
-        """Convert emoji_id to Discord emoji or return empty string"""
-        if not emoji_id:
-            return ""
-        try:
-            emoji = self.guild.get_emoji(int(emoji_id))
-            return str(emoji) + " " if emoji else ""
-        except:
-            return ""
-
     def create_embed(self):
         """Create the calculator embed"""
         embed = discord.Embed(
@@ -2689,7 +2659,7 @@ class DraftPointsCalculatorView(discord.ui.View):
             for pick_id in self.selected_picks:
                 pick = next((p for p in self.all_picks if p[0] == pick_id), None)
                 if pick:
-                    total_points += pick[4]  # points_value
+                    total_points += pick[3]  # points_value
 
         # Show selected picks
         if self.selected_picks:
@@ -2697,8 +2667,8 @@ class DraftPointsCalculatorView(discord.ui.View):
             for pick_id in self.selected_picks:
                 pick = next((p for p in self.all_picks if p[0] == pick_id), None)
                 if pick:
-                    _, pick_number, emoji_id, _, points_value = pick
-                    emoji_str = self.get_emoji(emoji_id) if emoji_id else ""
+                    _, pick_number, team_id, points_value = pick
+                    emoji_str = team_emojis.prefix(team_id)
                     selected_text += f"{emoji_str}Pick #{pick_number} - **{points_value} pts**\n"
 
             embed.add_field(
@@ -2806,23 +2776,15 @@ class DraftPointsCalculatorView(discord.ui.View):
         page_picks = self.all_picks[start_idx:end_idx]
 
         options = []
-        for pick_id, pick_number, emoji_id, team_name, points_value in page_picks:
+        for pick_id, pick_number, team_id, points_value in page_picks:
             # Format: "Pick #X - Z pts"
             label = f"Pick #{pick_number} - {points_value} pts"
 
-            # Get emoji object for the SelectOption emoji parameter
-            pick_emoji = None
-            if emoji_id:
-                try:
-                    pick_emoji = self.guild.get_emoji(int(emoji_id))
-                except:
-                    pass
-
             options.append(
                 discord.SelectOption(
                     label=label,
                     value=f"pick_{pick_id}",
-                    emoji=pick_emoji,
+                    emoji=team_emojis.emoji(team_id),
                     default=(pick_id in self.selected_picks)
                 )
             )
@@ -3,17 +3,302 @@ from discord import app_commands
 from discord.ext import commands
 import aiosqlite
 from config import DB_PATH, ADMIN_ROLE_ID
+from bid_intake import BidIntake, BidRejected
+from deferral import auto_defer
+from settings_store import settings
+from team_emojis import team_emojis
+from render_cache import render_cache
 import json
+import time
 from datetime import datetime
+import metrics
+import query_log
+
+# New contract length for a player aliased "p", from the contract_config age bands (2 years if none match)
+CONTRACT_YEARS_SQL = """COALESCE((SELECT contract_years FROM contract_config
+                                  WHERE min_age <= p.age AND (max_age >= p.age OR max_age IS NULL)
+                                  LIMIT 1), 2)"""
+
+# Draft round each compensation band's pick goes in
+COMPENSATION_BAND_ROUNDS = {1: 1, 2: 1, 3: 2, 4: 2, 5: 3}
+
+
+def sort_compensation_results(comp_results):
+    """
+    Put compensation results in the order place_compensation_picks places them.
+
+    By band, then for bands 2 and 4 in reverse ladder order (the worst team's pick
+    goes first, teams without a ladder position last) and for bands 1, 3 and 5 by
+    descending team_id. Results that still tie keep result_id order.
+
+    Args:
+        comp_results: List of (result_id, team_id, compensation_band, ladder_position) -
+            ladder_position is None for a team missing from the draft's ladder
+
+    Returns:
+        list: (result_id, team_id, compensation_band) in placement order
+    """
+    def placement(row):
+        result_id, team_id, comp_band, ladder_position = row
+        tiebreak = ladder_position if comp_band in (2, 4) else team_id
+        return comp_band, tiebreak is None, -(tiebreak or 0), result_id
+
+    return [row[:3] for row in sorted(comp_results, key=placement)]
+
+
+def place_compensation_picks(draft_order, comp_results, team_names):
+    """
+    Work out where compensation picks go in a draft without touching the database.
+
+    Bands 1, 3 and 5 go straight after the team's natural pick in rounds 1, 2 and 3
+    (or at the end of the round if the team no longer has that pick). Bands 2 and 4
+    go at the end of rounds 1 and 2. Picks are placed in the order given, so
+    comp_results must already be sorted by sort_compensation_results.
+
+    Args:
+        draft_order: List of (pick_id, round_number, pick_number, pick_origin) ordered by pick_number
+        comp_results: List of (result_id, team_id, compensation_band) in placement order
+        team_names: Dict of team_id -> team_name
+
+    Returns:
+        tuple: (list of (pick_number, pick_id) for existing picks whose number changed,
+                list of (result_id, team_id, compensation_band, round_number, pick_number) for new picks)
+    """
+    # Existing picks carry their pick_id, compensation picks carry their result
+    order = [(pick_id, round_number, pick_origin, None) for pick_id, round_number, _, pick_origin in draft_order]
+
+    for result_id, team_id, comp_band in comp_results:
+        round_num = COMPENSATION_BAND_ROUNDS.get(comp_band)
+        if round_num is None:
+            continue  # Unknown band - skip
+
+        # End of the round (picks are in pick order, so rounds are contiguous)
+        index = sum(1 for _, round_number, _, _ in order if round_number is not None and round_number <= round_num)
+
+        if comp_band in (1, 3, 5):
+            if team_id not in team_names:
+                continue  # Skip if team not found
+
+            # Find the team's natural pick in this round by origin (unchanging identifier)
+            natural_pick_origin = f"{team_names[team_id]} R{round_num}"
+            for position, (pick_id, round_number, pick_origin, _) in enumerate(order):
+                if pick_id is not None and round_number == round_num and pick_origin == natural_pick_origin:
+                    index = position + 1
+                    break
+
+        order.insert(index, (None, round_num, None, (result_id, team_id, comp_band)))
+
+    # Number the new order: picks after each insertion move down one place
+    old_numbers = {pick_id: pick_number for pick_id, _, pick_number, _ in draft_order}
+    renumbered = []
+    new_picks = []
+    offset = 0
+    pick_number = 0
+    for pick_id, round_number, _, comp in order:
+        if comp:
+            offset += 1
+            pick_number += 1
+            result_id, team_id, comp_band = comp
+            new_picks.append((result_id, team_id, comp_band, round_number, pick_number))
+        else:
+            pick_number = old_numbers[pick_id] + offset
+            if offset:
+                renumbered.append((pick_number, pick_id))
+
+    return renumbered, new_picks
+
+
+async def get_team_auction_balance(db, period_id, team_id):
+    """
+    Get a team's committed auction points from the team_auction_balance ledger.
+
+    Returns:
+        tuple: (active_points, winning_points) - points in active bids and in winning bids
+    """
+    cursor = await db.execute(
+        """SELECT active_points, winning_points FROM team_auction_balance
+           WHERE period_id = ? AND team_id = ?""",
+        (period_id, team_id)
+    )
+    result = await cursor.fetchone()
+    return result if result else (0, 0)
+
+
+async def reconcile_auction_balances(db):
+    """
+    Check the team_auction_balance ledger against free_agency_bids and fix any drift.
+
+    The ledger is maintained by triggers on free_agency_bids, so this should find
+    nothing - apart from backfilling bids placed before the ledger existed.
+    The caller commits.
+
+    Returns:
+        list: (period_id, team_id, ledger balance, actual balance) for each corrected row
+    """
+    cursor = await db.execute(
+        """SELECT period_id, team_id,
+                  COALESCE(SUM(CASE WHEN status = 'active' THEN bid_amount END), 0),
+                  COALESCE(SUM(CASE WHEN status = 'winning' THEN bid_amount END), 0)
+           FROM free_agency_bids
+           GROUP BY period_id, team_id"""
+    )
+    actual = {(period_id, team_id): (active, winning) for period_id, team_id, active, winning in await cursor.fetchall()}
+
+    cursor = await db.execute("SELECT period_id, team_id, active_points, winning_points FROM team_auction_balance")
+    ledger = {(period_id, team_id): (active, winning) for period_id, team_id, active, winning in await cursor.fetchall()}
+
+    drift = []
+    for key in actual.keys() | ledger.keys():
+        expected = actual.get(key, (0, 0))
+        if ledger.get(key, (0, 0)) != expected:
+            drift.append((*key, ledger.get(key), expected))
+
+    await db.executemany(
+        """INSERT OR REPLACE INTO team_auction_balance (period_id, team_id, active_points, winning_points)
+           VALUES (?, ?, ?, ?)""",
+        [(period_id, team_id, *expected) for period_id, team_id, _, expected in drift]
+    )
+    return drift
+
+
+# The cog drops its FreeAgentPool after any commit that writes these tables
+# (trades, /editplayer, /importdata, draft picks - through query_log's commit hook)
+FREE_AGENT_POOL_TABLES = frozenset({'players', 'teams'})
+# Seconds a FreeAgentPool is trusted before it's rebuilt anyway, for writes made outside the bot
+FREE_AGENT_POOL_MAX_AGE = 60
+
+
+class FreeAgentPool:
+    """
+    The current season's free agents, loaded once and read from memory.
+
+    Built per free agency period status - the cog drops it whenever it moves the
+    period on or a commit writes players or teams, and commands that already
+    query the season check pool.key. Never trusted for whether a bid is allowed -
+    the bid intake checks that against the database.
+    Holds each player's autocomplete display string, a lowercase search index
+    in name order, and per-team groupings in overall rating order.
+    """
+
+    def __init__(self, key, auction_points, rows):
+        """
+        Args:
+            key: (season_number, period_id, period_status) - period values are None with no period
+            auction_points: The period's auction points (None with no period)
+            rows: (player_id, name, position, overall_rating, age, team_id, team_name, channel_id)
+        """
+        self.key = key
+        self.season_number, self.period_id, self.period_status = key
+        self.auction_points = auction_points
+        self.built_at = time.monotonic()
+
+        self.players = {row[0]: row for row in rows}
+
+        self.search = []
+        for player_id, name, pos, ovr, age, _, team_name, _ in sorted(rows, key=lambda row: row[1]):
+            display = f"{name} ({pos}, {age}, {ovr}) - {team_name}"
+            self.search.append((display.lower(), display, player_id))
+
+        self.by_team = {}
+        for row in sorted(rows, key=lambda row: (row[3] is None, -(row[3] or 0), row[1])):
+            self.by_team.setdefault(row[5], []).append(row)
+
+    @property
+    def stale(self):
+        return time.monotonic() - self.built_at > FREE_AGENT_POOL_MAX_AGE
+
+    def choices(self, current, limit=25):
+        """Autocomplete matches for current as (display, player_id), in name order"""
+        current = current.lower()
+        matches = []
+        for lowered, display, player_id in self.search:
+            if current in lowered:
+                matches.append((display, player_id))
+                if len(matches) == limit:
+                    break
+        return matches
+
+    def grouped(self, team_id=None):
+        """
+        Free agents grouped by team for FreeAgentsView.
+
+        Returns:
+            dict: team_name -> {'team_id', 'players': [(name, pos, age, ovr)]}, in team name order
+        """
+        team_ids = [team_id] if team_id is not None else self.by_team.keys()
+        teams = sorted((self.by_team[tid] for tid in team_ids if tid in self.by_team), key=lambda rows: rows[0][6])
+        return {
+            rows[0][6]: {
+                'team_id': rows[0][5],
+                'players': [(name, pos, age, ovr) for _, name, pos, ovr, age, _, _, _ in rows]
+            }
+            for rows in teams
+        }
+
+
+async def load_free_agent_pool_key(db):
+    """
+    Get the current season (active or offseason) and its free agency period.
+
+    Returns:
+        tuple: ((season_number, period_id, period_status), auction_points), or None with no season
+    """
+    cursor = await db.execute(
+        """SELECT s.season_number, fp.period_id, fp.status, fp.auction_points
+           FROM (SELECT season_number FROM seasons
+                 ORDER BY
+                     CASE status
+                         WHEN 'active' THEN 1
+                         WHEN 'offseason' THEN 2
+                         ELSE 3
+                     END,
+                     season_number DESC
+                 LIMIT 1) s
+           LEFT JOIN free_agency_periods fp ON fp.season_number = s.season_number"""
+    )
+    result = await cursor.fetchone()
+    if not result:
+        return None
+    return result[:3], result[3]
+
+
+async def build_free_agent_pool(db, key, auction_points):
+    """Load the free agents (players whose contract expires in key's season) into a FreeAgentPool"""
+    cursor = await db.execute(
+        """SELECT p.player_id, p.name, p.position, p.overall_rating, p.age, t.team_id, t.team_name, t.channel_id
+           FROM players p
+           JOIN teams t ON p.team_id = t.team_id
+           WHERE p.contract_expiry = ?""",
+        (key[0],)
+    )
+    return FreeAgentPool(key, auction_points, await cursor.fetchall())
+
 
 class FreeAgencyCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.bid_intake = BidIntake()
+        self.free_agent_pool = None
+        self.pool_writes = 0  # commits that dropped the pool, so a build racing one isn't kept
 
     async def cog_load(self):
-        """Called when the cog is loaded - re-register persistent views"""
+        """Called when the cog is loaded - follow player writes and re-register persistent views"""
+        query_log.install()
+        query_log.commit_hooks.append(self.tables_written)
         await self.register_persistent_views()
 
+    async def cog_unload(self):
+        """Called when the cog is unloaded - stop the bid intake worker"""
+        if self.tables_written in query_log.commit_hooks:
+            query_log.commit_hooks.remove(self.tables_written)
+        await self.bid_intake.close()
+
+    def tables_written(self, tables):
+        """query_log commit hook - drop the FreeAgentPool once a commit changes players or teams"""
+        if not FREE_AGENT_POOL_TABLES.isdisjoint(tables):
+            self.pool_writes += 1
+            self.free_agent_pool = None
+
     async def register_persistent_views(self):
         """Re-register all persistent views on bot startup"""
         try:
@@ -110,83 +395,46 @@ class FreeAgencyCommands(commands.Cog):
         interaction: discord.Interaction,
         current: str,
     ) -> list[app_commands.Choice[str]]:
-        """Autocomplete for free agents"""
+        """Autocomplete for free agents - served from the FreeAgentPool"""
         try:
-            async with aiosqlite.connect(DB_PATH) as db:
-                # Get current season (active or offseason)
-                cursor = await db.execute(
-                    """SELECT season_number FROM seasons
-                       ORDER BY
-                           CASE status
-                               WHEN 'active' THEN 1
-                               WHEN 'offseason' THEN 2
-                               ELSE 3
-                           END,
-                           season_number DESC
-                       LIMIT 1"""
-                )
-                season_result = await cursor.fetchone()
-                if not season_result:
+            pool = self.free_agent_pool
+            if pool is None or pool.stale:
+                async with aiosqlite.connect(DB_PATH) as db:
+                    pool = await self.get_free_agent_pool(db)
+                if not pool:
                     return []
-                current_season = season_result[0]
-
-                # Get players whose contracts expired (contract_expiry = current season during offseason)
-                cursor = await db.execute(
-                    """SELECT p.player_id, p.name, p.position, p.overall_rating, p.age, t.team_name
-                       FROM players p
-                       JOIN teams t ON p.team_id = t.team_id
-                       WHERE p.contract_expiry = ?
-                       ORDER BY p.name""",
-                    (current_season,)
-                )
-                free_agents = await cursor.fetchall()
-
-                choices = []
-                for player_id, name, pos, ovr, age, team in free_agents:
-                    display = f"{name} ({pos}, {age}, {ovr}) - {team}"
-                    if current.lower() in display.lower():
-                        choices.append(app_commands.Choice(name=display, value=str(player_id)))
+            else:
+                metrics.cache_lookup('free_agent_pool', True)
 
-                return choices[:25]
+            return [
+                app_commands.Choice(name=display, value=str(player_id))
+                for display, player_id in pool.choices(current)
+            ]
         except:
             return []
 
-    async def get_auctions_log_channel(self, db):
-        """Get the auctions log channel from settings"""
-        cursor = await db.execute(
-            "SELECT setting_value FROM settings WHERE setting_key = 'auctions_log_channel_id'"
-        )
-        result = await cursor.fetchone()
-        if result and result[0]:
-            try:
-                return self.bot.get_channel(int(result[0]))
-            except:
-                return None
-        return None
-
-    async def get_bot_logs_channel(self, db):
-        """Get the bot logs channel from settings"""
-        cursor = await db.execute(
-            "SELECT setting_value FROM settings WHERE setting_key = 'bot_logs_channel_id'"
-        )
-        result = await cursor.fetchone()
-        if result and result[0]:
-            try:
-                return self.bot.get_channel(int(result[0]))
-            except:
-                return None
-        return None
-
-    async def get_contract_years_for_age(self, db, age):
-        """Get contract years based on player age from contract_config table"""
-        cursor = await db.execute(
-            """SELECT contract_years FROM contract_config
-               WHERE min_age <= ? AND (max_age >= ? OR max_age IS NULL)
-               LIMIT 1""",
-            (age, age)
-        )
-        result = await cursor.fetchone()
-        return result[0] if result else 2  # Default to 2 years if not found
+    async def get_free_agent_pool(self, db):
+        """
+        Get the FreeAgentPool for the current season, rebuilding it if the season or
+        free agency period status has moved on (or it has gone stale).
+
+        Returns:
+            FreeAgentPool, or None if there is no season
+        """
+        loaded = await load_free_agent_pool_key(db)
+        if not loaded:
+            return None
+        key, auction_points = loaded
+
+        pool = self.free_agent_pool
+        hit = pool is not None and pool.key == key and not pool.stale
+        metrics.cache_lookup('free_agent_pool', hit)
+        if not hit:
+            writes = self.pool_writes
+            pool = await build_free_agent_pool(db, key, auction_points)
+            if writes == self.pool_writes:
+                self.free_agent_pool = pool
+        return pool
 
     async def get_compensation_band(self, db, age, ovr):
         """Get compensation band based on player age and OVR from compensation_chart table
@@ -202,17 +450,19 @@ class FreeAgencyCommands(commands.Cog):
         result = await cursor.fetchone()
         return result[0] if result else None  # None means no compensation
 
-    async def calculate_free_resign_allowance(self, db, team_id, current_season):
+    async def calculate_free_resign_allowance(self, db, team_id, current_season, free_agents=None):
         """Calculate how many free re-signs a team gets based on their free agents
-        Formula: 0.5 per Band 1 player + 0.25 per Band 2 player, rounded to nearest (0.5 rounds down)"""
+        Formula: 0.5 per Band 1 player + 0.25 per Band 2 player, rounded to nearest (0.5 rounds down)
+        free_agents: optional (player_id, age, overall_rating) list if the caller already has it"""
         # Get all free agents for this team
-        cursor = await db.execute(
-            """SELECT p.player_id, p.age, p.overall_rating
-               FROM players p
-               WHERE p.team_id = ? AND p.contract_expiry = ?""",
-            (team_id, current_season)
-        )
-        free_agents = await cursor.fetchall()
+        if free_agents is None:
+            cursor = await db.execute(
+                """SELECT p.player_id, p.age, p.overall_rating
+                   FROM players p
+                   WHERE p.team_id = ? AND p.contract_expiry = ?""",
+                (team_id, current_season)
+            )
+            free_agents = await cursor.fetchall()
 
         credits = 0.0
         for player_id, age, ovr in free_agents:
@@ -233,43 +483,31 @@ class FreeAgencyCommands(commands.Cog):
             return round(credits)
 
     async def process_free_resigns(self, db, period_id, current_season):
-        """Process all confirmed free re-signs and assign contracts"""
-        # Get all confirmed free re-signs
-        cursor = await db.execute(
-            """SELECT r.player_id, p.age
-               FROM free_agency_resigns r
-               JOIN players p ON r.player_id = p.player_id
-               WHERE r.period_id = ? AND r.confirmed = 1""",
-            (period_id,)
+        """Assign new contracts to all confirmed free re-signs (the caller commits)"""
+        # current_season is the season that just ended (Offseason 9 means Season 9 just ended)
+        # Adding contract_years gives us the last season they'll play under the new contract
+        await db.execute(
+            f"""WITH settled AS (
+                    SELECT r.player_id, ? + {CONTRACT_YEARS_SQL} AS new_contract_expiry
+                    FROM free_agency_resigns r
+                    JOIN players p ON r.player_id = p.player_id
+                    WHERE r.period_id = ? AND r.confirmed = 1
+                )
+                UPDATE players SET contract_expiry = settled.new_contract_expiry
+                FROM settled
+                WHERE players.player_id = settled.player_id""",
+            (current_season, period_id)
         )
-        resigns = await cursor.fetchall()
-
-        for player_id, age in resigns:
-            # Get contract length based on age
-            contract_years = await self.get_contract_years_for_age(db, age)
-
-            # Calculate new contract expiry
-            # current_season is the season that just ended (Offseason 9 means Season 9 just ended)
-            # Adding contract_years gives us the last season they'll play under the new contract
-            new_contract_expiry = current_season + contract_years
-
-            # Update player's contract
-            await db.execute(
-                "UPDATE players SET contract_expiry = ? WHERE player_id = ?",
-                (new_contract_expiry, player_id)
-            )
-
-        await db.commit()
 
     async def log_free_resign_results(self, db, period_id, current_season):
         """Log free re-sign results to auctions channel"""
-        log_channel = await self.get_auctions_log_channel(db)
+        log_channel = await settings.channel(self.bot, 'auctions_log_channel_id')
         if not log_channel:
             return
 
         # Get all confirmed free re-signs
         cursor = await db.execute(
-            """SELECT p.name, p.position, p.age, p.overall_rating, t.emoji_id, p.contract_expiry
+            """SELECT p.name, p.position, p.age, p.overall_rating, p.team_id, p.contract_expiry
                FROM free_agency_resigns r
                JOIN players p ON r.player_id = p.player_id
                JOIN teams t ON p.team_id = t.team_id
@@ -290,17 +528,8 @@ class FreeAgencyCommands(commands.Cog):
 
         # Build list of all re-signs with emoji in front of player name
         player_lines = []
-        for name, pos, age, ovr, emoji_id, contract_expiry in resigns:
-            # Get emoji
-            emoji_str = ""
-            if emoji_id:
-                try:
-                    emoji = self.bot.get_emoji(int(emoji_id))
-                    if emoji:
-                        emoji_str = f"{emoji} "
-                except:
-                    pass
-
+        for name, pos, age, ovr, team_id, contract_expiry in resigns:
+            emoji_str = team_emojis.prefix(team_id)
             contract_years = contract_expiry - current_season
             player_lines.append(f"{emoji_str}**{name}** ({pos}, {age}, {ovr}) - **{contract_years} years**")
 
@@ -331,7 +560,7 @@ class FreeAgencyCommands(commands.Cog):
     async def log_winning_bids(self, db, period_id, current_season):
         """Log winning bids to auctions channel"""
         try:
-            log_channel = await self.get_auctions_log_channel(db)
+            log_channel = await settings.channel(self.bot, 'auctions_log_channel_id')
             if not log_channel:
                 print("No auctions log channel configured")
                 return
@@ -342,13 +571,9 @@ class FreeAgencyCommands(commands.Cog):
         # Get all winning bids
         cursor = await db.execute(
             """SELECT p.name, p.position, p.age, p.overall_rating,
-                      orig_team.team_name as original_team, orig_team.emoji_id as orig_emoji,
-                      bid_team.team_name as bidding_team, bid_team.emoji_id as bid_emoji,
-                      r.winning_bid
+                      r.original_team_id, r.winning_team_id, r.winning_bid
                FROM free_agency_results r
                JOIN players p ON r.player_id = p.player_id
-               JOIN teams orig_team ON r.original_team_id = orig_team.team_id
-               LEFT JOIN teams bid_team ON r.winning_team_id = bid_team.team_id
                WHERE r.period_id = ? AND r.winning_team_id IS NOT NULL
                ORDER BY r.winning_bid DESC, p.name""",
             (period_id,)
@@ -361,57 +586,25 @@ class FreeAgencyCommands(commands.Cog):
             print("log_winning_bids: No winning bids found, returning early")
             return
 
-        # Calculate team points for match checking
+        # Calculate team points for match checking (300 - winning bids), one ledger read for every team
         cursor = await db.execute(
-            """SELECT team_id FROM teams"""
+            """SELECT t.team_id, 300 - COALESCE(b.winning_points, 0)
+               FROM teams t
+               LEFT JOIN team_auction_balance b ON b.team_id = t.team_id AND b.period_id = ?""",
+            (period_id,)
         )
-        all_teams = await cursor.fetchall()
-
-        team_points = {}
-        for (team_id,) in all_teams:
-            # Calculate spent points (winning bids on OTHER teams' players only)
-            cursor = await db.execute(
-                """SELECT COALESCE(SUM(b.bid_amount), 0)
-                   FROM free_agency_bids b
-                   JOIN players p ON b.player_id = p.player_id
-                   WHERE b.period_id = ? AND b.team_id = ? AND b.status = 'winning'
-                   AND p.team_id != ?""",
-                (period_id, team_id, team_id)
-            )
-            spent = (await cursor.fetchone())[0]
-            team_points[team_id] = 300 - spent
+        team_points = dict(await cursor.fetchall())
 
         player_lines = []
-        for name, pos, age, ovr, orig_team, orig_emoji, bid_team, bid_emoji, winning_bid in winning_bids:
-            # Get emojis
-            orig_emoji_str = ""
-            if orig_emoji:
-                try:
-                    emoji = self.bot.get_emoji(int(orig_emoji))
-                    if emoji:
-                        orig_emoji_str = f"{emoji} "
-                except:
-                    pass
-
-            bid_emoji_str = ""
-            if bid_emoji:
-                try:
-                    emoji = self.bot.get_emoji(int(bid_emoji))
-                    if emoji:
-                        bid_emoji_str = f"{emoji} "
-                except:
-                    pass
+        for name, pos, age, ovr, orig_team_id, bid_team_id, winning_bid in winning_bids:
+            orig_emoji_str = team_emojis.prefix(orig_team_id)
+            bid_emoji_str = team_emojis.prefix(bid_team_id)
 
             # Check if RFA (can match at 80%)
             is_rfa = age <= 25
             match_cost = round(winning_bid * 0.8) if is_rfa else winning_bid
 
             # Determine if team can match
-            cursor = await db.execute(
-                "SELECT team_id FROM teams WHERE team_name = ?",
-                (orig_team,)
-            )
-            orig_team_id = (await cursor.fetchone())[0]
             remaining_points = team_points.get(orig_team_id, 0)
 
             if remaining_points >= match_cost:
@@ -473,7 +666,7 @@ class FreeAgencyCommands(commands.Cog):
 
     async def log_final_movements(self, db, period_id, current_season):
         """Log final player movements and compensation picks to auctions channel"""
-        log_channel = await self.get_auctions_log_channel(db)
+        log_channel = await settings.channel(self.bot, 'auctions_log_channel_id')
         if not log_channel:
             print("No auctions log channel configured for final movements")
             return
@@ -481,13 +674,10 @@ class FreeAgencyCommands(commands.Cog):
         # Get only players who moved clubs (not matched, has new team)
         cursor = await db.execute(
             """SELECT p.name, p.position, p.age, p.overall_rating,
-                      orig_team.emoji_id as orig_emoji,
-                      new_team.emoji_id as new_emoji,
+                      r.original_team_id, r.winning_team_id,
                       r.compensation_band, r.compensation_pick_id
                FROM free_agency_results r
                JOIN players p ON r.player_id = p.player_id
-               JOIN teams orig_team ON r.original_team_id = orig_team.team_id
-               LEFT JOIN teams new_team ON r.winning_team_id = new_team.team_id
                WHERE r.period_id = ? AND r.matched = 0 AND r.winning_team_id IS NOT NULL
                ORDER BY p.name""",
             (period_id,)
@@ -506,25 +696,11 @@ class FreeAgencyCommands(commands.Cog):
 
         # Build movement lines
         movement_lines = []
-        for name, pos, age, ovr, orig_emoji, new_emoji, comp_band, comp_pick_id in transfers:
-            # Get emojis
-            orig_emoji_str = ""
-            if orig_emoji:
-                try:
-                    emoji = self.bot.get_emoji(int(orig_emoji))
-                    if emoji:
-                        orig_emoji_str = f"{emoji} "
-                except:
-                    pass
-
-            new_emoji_str = ""
-            if new_emoji:
-                try:
-                    emoji = self.bot.get_emoji(int(new_emoji))
-                    if emoji:
-                        new_emoji_str = f" → {emoji}"
-                except:
-                    pass
+        for name, pos, age, ovr, orig_team_id, new_team_id, comp_band, comp_pick_id in transfers:
+            orig_emoji_str = team_emojis.prefix(orig_team_id)
+            new_emoji_str = team_emojis.text(new_team_id)
+            if new_emoji_str:
+                new_emoji_str = " → " + new_emoji_str
 
             # Build player line (no team names)
             player_line = f"{orig_emoji_str}**{name}** ({pos}, {age}, {ovr}){new_emoji_str}"
@@ -600,24 +776,12 @@ class FreeAgencyCommands(commands.Cog):
 
         try:
             async with aiosqlite.connect(DB_PATH) as db:
-                # Get current season (active or offseason)
-                cursor = await db.execute(
-                    """SELECT season_number FROM seasons
-                       ORDER BY
-                           CASE status
-                               WHEN 'active' THEN 1
-                               WHEN 'offseason' THEN 2
-                               ELSE 3
-                           END,
-                           season_number DESC
-                       LIMIT 1"""
-                )
-                season_result = await cursor.fetchone()
-                if not season_result:
+                pool = await self.get_free_agent_pool(db)
+                if not pool:
                     await interaction.followup.send("❌ No active season found!")
                     return
 
-                current_season = season_result[0]
+                current_season = pool.season_number
 
                 # Build query based on team filter
                 if team:
@@ -631,47 +795,22 @@ class FreeAgencyCommands(commands.Cog):
                         await interaction.followup.send(f"❌ Team '{team}' not found!")
                         return
 
-                    # Get free agents for specific team
-                    cursor = await db.execute(
-                        """SELECT p.player_id, p.name, p.position, p.overall_rating, p.age, t.team_name, t.emoji_id
-                           FROM players p
-                           JOIN teams t ON p.team_id = t.team_id
-                           WHERE p.contract_expiry = ? AND LOWER(t.team_name) = LOWER(?)
-                           ORDER BY p.overall_rating DESC, p.name""",
-                        (current_season, team)
-                    )
+                    # Free agents for specific team
+                    teams_dict = pool.grouped(team_result[0])
                 else:
-                    # Get all free agents
-                    cursor = await db.execute(
-                        """SELECT p.player_id, p.name, p.position, p.overall_rating, p.age, t.team_name, t.emoji_id
-                           FROM players p
-                           JOIN teams t ON p.team_id = t.team_id
-                           WHERE p.contract_expiry = ?
-                           ORDER BY t.team_name, p.overall_rating DESC, p.name""",
-                        (current_season,)
-                    )
-
-                free_agents = await cursor.fetchall()
+                    # All free agents
+                    teams_dict = pool.grouped()
 
-                if not free_agents:
+                if not teams_dict:
                     if team:
                         await interaction.followup.send(f"No free agents found for {team} in Season {current_season}.")
                     else:
                         await interaction.followup.send(f"No free agents found for Season {current_season}.")
                     return
 
-                # Group by team
-                teams_dict = {}
-                for _, name, pos, ovr, age, team_name, emoji_id in free_agents:
-                    if team_name not in teams_dict:
-                        teams_dict[team_name] = {
-                            'emoji_id': emoji_id,
-                            'players': []
-                        }
-                    teams_dict[team_name]['players'].append((name, pos, age, ovr))
-
                 # Create paginated view
-                view = FreeAgentsView(self.bot, teams_dict, current_season, len(free_agents))
+                fa_count = sum(len(team_data['players']) for team_data in teams_dict.values())
+                view = FreeAgentsView(self.bot, teams_dict, current_season, fa_count)
                 embed = view.create_embed()
                 await interaction.followup.send(embed=embed, view=view)
 
@@ -684,181 +823,80 @@ class FreeAgencyCommands(commands.Cog):
         amount="Bid amount (1-300 points)"
     )
     @app_commands.autocomplete(player=free_agent_autocomplete)
+    @auto_defer(ephemeral=True)
     async def place_bid(self, interaction: discord.Interaction, player: str, amount: int):
-        await interaction.response.defer(ephemeral=True)
-
         try:
             async with aiosqlite.connect(DB_PATH) as db:
-                # Get current season (active or offseason)
-                cursor = await db.execute(
-                    """SELECT season_number FROM seasons
-                       ORDER BY
-                           CASE status
-                               WHEN 'active' THEN 1
-                               WHEN 'offseason' THEN 2
-                               ELSE 3
-                           END,
-                           season_number DESC
-                       LIMIT 1"""
-                )
-                season_result = await cursor.fetchone()
-                if not season_result:
-                    await interaction.followup.send("❌ No active season found!")
+                loaded = await load_free_agent_pool_key(db)
+                if not loaded:
+                    await interaction.response.send_message("❌ No active season found!", ephemeral=True)
                     return
-                current_season = season_result[0]
+                (_, period_id, period_status), max_points = loaded
 
                 # Check if there's an active bidding period
-                cursor = await db.execute(
-                    """SELECT period_id, auction_points FROM free_agency_periods
-                       WHERE season_number = ? AND status = 'bidding'""",
-                    (current_season,)
-                )
-                period_result = await cursor.fetchone()
-                if not period_result:
-                    await interaction.followup.send("❌ No active bidding period!")
+                if period_status != 'bidding':
+                    await interaction.response.send_message("❌ No active bidding period!", ephemeral=True)
                     return
 
-                period_id, max_points = period_result
-
-                # Get player details
+                # Read the player as they are now, not from the FreeAgentPool - whether they're
+                # an opposition free agent is checked again with the write, in the bid intake
                 player_id = int(player)
                 cursor = await db.execute(
-                    """SELECT p.name, p.position, p.age, p.overall_rating, p.team_id, p.contract_expiry,
-                              t.team_name, t.emoji_id
+                    """SELECT p.name, p.position, p.overall_rating, p.age, p.team_id, t.team_name
                        FROM players p
-                       JOIN teams t ON p.team_id = t.team_id
+                       LEFT JOIN teams t ON p.team_id = t.team_id
                        WHERE p.player_id = ?""",
                     (player_id,)
                 )
                 player_data = await cursor.fetchone()
                 if not player_data:
-                    await interaction.followup.send("❌ Player not found!")
+                    await interaction.response.send_message("❌ Player not found!", ephemeral=True)
                     return
 
-                player_name, pos, age, ovr, player_team_id, contract_expiry, team_name, emoji_id = player_data
+                player_name, pos, ovr, age, player_team_id, team_name = player_data
 
-                # Verify player is a free agent (contract expired = contract_expiry matches current season)
-                if contract_expiry != current_season:
-                    await interaction.followup.send(f"❌ {player_name} is not a free agent this season!")
-                    return
-
-                # Get user's team
-                user_team_id = None
-                for role in interaction.user.roles:
-                    cursor = await db.execute(
-                        "SELECT team_id FROM teams WHERE role_id = ?",
-                        (str(role.id),)
-                    )
-                    team_result = await cursor.fetchone()
-                    if team_result:
-                        user_team_id = team_result[0]
-                        break
+                # Get user's team (first of their roles that belongs to a team)
+                role_ids = [str(role.id) for role in interaction.user.roles]
+                cursor = await db.execute(
+                    f"SELECT role_id, team_id FROM teams WHERE role_id IN ({','.join('?' * len(role_ids))})",
+                    role_ids
+                )
+                role_teams = dict(await cursor.fetchall())
+                user_team_id = next((role_teams[role_id] for role_id in role_ids if role_id in role_teams), None)
 
                 if not user_team_id:
-                    await interaction.followup.send("❌ You don't have a team role!")
-                    return
-
-                # Check player is not on user's team
-                if player_team_id == user_team_id:
-                    await interaction.followup.send(f"❌ You cannot bid on your own players! Wait for the matching period.")
+                    await interaction.response.send_message("❌ You don't have a team role!", ephemeral=True)
                     return
 
                 # Validate bid amount
                 if amount < 1 or amount > max_points:
-                    await interaction.followup.send(f"❌ Bid amount must be between 1 and {max_points} points!")
+                    await interaction.response.send_message(f"❌ Bid amount must be between 1 and {max_points} points!", ephemeral=True)
                     return
 
-                # Calculate user's remaining points (excluding current player)
-                cursor = await db.execute(
-                    """SELECT COALESCE(SUM(bid_amount), 0) FROM free_agency_bids
-                       WHERE period_id = ? AND team_id = ? AND status = 'active'
-                       AND player_id != ?""",
-                    (period_id, user_team_id, player_id)
-                )
-                spent_points = (await cursor.fetchone())[0]
-
-                # Check if user already has a bid on this player (for validation)
-                cursor = await db.execute(
-                    """SELECT bid_amount FROM free_agency_bids
-                       WHERE period_id = ? AND team_id = ? AND player_id = ?""",
-                    (period_id, user_team_id, player_id)
-                )
-                existing_bid = await cursor.fetchone()
-
-                remaining_points = max_points - spent_points
-
-                if amount > remaining_points:
-                    await interaction.followup.send(
-                        f"❌ Insufficient points!\n\n"
-                        f"**Available:** {remaining_points} points\n"
-                        f"**Bid Amount:** {amount} points\n\n"
-                        f"Use `/auctionsmenu` to view your bids."
-                    )
+                # The free agent, own-player and points checks happen with the write in the bid
+                # intake queue, one batch at a time, so concurrent bids from the same team can't
+                # overspend and a trade or edit since the player was read can't slip through
+                try:
+                    receipt = await self.bid_intake.submit(period_id, user_team_id, player_id, amount, max_points)
+                except BidRejected as e:
+                    await interaction.response.send_message(str(e), ephemeral=True)
                     return
-
-                # Place or update bid
-                if existing_bid:
-                    await db.execute(
-                        """UPDATE free_agency_bids
-                           SET bid_amount = ?, updated_at = CURRENT_TIMESTAMP
-                           WHERE period_id = ? AND team_id = ? AND player_id = ?""",
-                        (amount, period_id, user_team_id, player_id)
-                    )
-                    action = "Updated"
-                else:
-                    await db.execute(
-                        """INSERT INTO free_agency_bids (period_id, team_id, player_id, bid_amount)
-                           VALUES (?, ?, ?, ?)""",
-                        (period_id, user_team_id, player_id, amount)
-                    )
-                    action = "Placed"
-
-                await db.commit()
+                action = receipt.action
 
                 # Log to bot logs channel
-                log_channel = await self.get_bot_logs_channel(db)
+                log_channel = await settings.channel(self.bot, 'bot_logs_channel_id')
                 if log_channel:
                     # Get bidding team info
-                    cursor = await db.execute("SELECT team_name, emoji_id FROM teams WHERE team_id = ?", (user_team_id,))
+                    cursor = await db.execute("SELECT team_name FROM teams WHERE team_id = ?", (user_team_id,))
                     bidding_team_data = await cursor.fetchone()
                     bidding_team_name = bidding_team_data[0] if bidding_team_data else "Unknown Team"
-                    bidding_emoji_id = bidding_team_data[1] if bidding_team_data and bidding_team_data[1] else None
-
-                    bidding_emoji_str = ""
-                    if bidding_emoji_id:
-                        try:
-                            emoji = self.bot.get_emoji(int(bidding_emoji_id))
-                            if emoji:
-                                bidding_emoji_str = f"{emoji} "
-                        except:
-                            pass
-
-                    # Get player's original team emoji
-                    original_emoji_str = ""
-                    if emoji_id:
-                        try:
-                            emoji = self.bot.get_emoji(int(emoji_id))
-                            if emoji:
-                                original_emoji_str = f"{emoji} "
-                        except:
-                            pass
+                    bidding_emoji_str = team_emojis.prefix(user_team_id)
+                    original_emoji_str = team_emojis.prefix(player_team_id)
 
-                    action_text = "updated their bid on" if existing_bid else "placed a bid on"
+                    action_text = "updated their bid on" if action == "Updated" else "placed a bid on"
                     await log_channel.send(f"💰 {bidding_emoji_str}**{bidding_team_name}** {action_text} {original_emoji_str}**{player_name}**: {amount}pts ({interaction.user.mention})")
 
-                # Get emoji
-                emoji_str = ""
-                if emoji_id:
-                    try:
-                        emoji = self.bot.get_emoji(int(emoji_id))
-                        if emoji:
-                            emoji_str = f"{emoji} "
-                    except:
-                        pass
-
-                # Calculate new remaining points after this bid
-                # spent_points already excludes the old bid if it existed
-                new_remaining = max_points - (spent_points + amount)
+                emoji_str = team_emojis.prefix(player_team_id)
 
                 embed = discord.Embed(
                     title=f"✅ Bid {action}!",
@@ -876,15 +914,15 @@ class FreeAgencyCommands(commands.Cog):
                 )
                 embed.add_field(
                     name="Remaining",
-                    value=f"{new_remaining} points",
+                    value=f"{receipt.remaining_points} points",
                     inline=True
                 )
                 embed.set_footer(text="View all bids: /auctionsmenu")
 
-                await interaction.followup.send(embed=embed)
+                await interaction.response.send_message(embed=embed, ephemeral=True)
 
         except Exception as e:
-            await interaction.followup.send(f"❌ Error: {e}")
+            await interaction.response.send_message(f"❌ Error: {e}", ephemeral=True)
 
     @app_commands.command(name="auctionsmenu", description="View your bids and remaining auction points")
     async def auctions_menu(self, interaction: discord.Interaction):
@@ -949,7 +987,7 @@ class FreeAgencyCommands(commands.Cog):
                 if period_status == 'matching':
                     cursor = await db.execute(
                         """SELECT b.bid_id, b.player_id, b.bid_amount, p.name, p.position, p.age, p.overall_rating,
-                                  t.team_name, t.emoji_id
+                                  t.team_name, t.team_id
                            FROM free_agency_bids b
                            JOIN players p ON b.player_id = p.player_id
                            JOIN teams t ON p.team_id = t.team_id
@@ -960,7 +998,7 @@ class FreeAgencyCommands(commands.Cog):
                 else:
                     cursor = await db.execute(
                         """SELECT b.bid_id, b.player_id, b.bid_amount, p.name, p.position, p.age, p.overall_rating,
-                                  t.team_name, t.emoji_id
+                                  t.team_name, t.team_id
                            FROM free_agency_bids b
                            JOIN players p ON b.player_id = p.player_id
                            JOIN teams t ON p.team_id = t.team_id
@@ -970,8 +1008,9 @@ class FreeAgencyCommands(commands.Cog):
                     )
                 bids = await cursor.fetchall()
 
-                # Calculate remaining points
-                total_spent = sum(bid[2] for bid in bids)
+                # Calculate remaining points (the bids listed above)
+                active_points, winning_points = await get_team_auction_balance(db, period_id, user_team_id)
+                total_spent = active_points + (winning_points if period_status == 'matching' else 0)
                 remaining_points = max_points - total_spent
 
                 # Create view
@@ -1302,41 +1341,19 @@ class FreeAgencyCommands(commands.Cog):
         """Start the free re-sign period for free agency"""
         try:
             async with aiosqlite.connect(DB_PATH) as db:
-                # Get current season (active or offseason)
-                cursor = await db.execute(
-                    """SELECT season_number FROM seasons
-                       ORDER BY
-                           CASE status
-                               WHEN 'active' THEN 1
-                               WHEN 'offseason' THEN 2
-                               ELSE 3
-                           END,
-                           season_number DESC
-                       LIMIT 1"""
-                )
-                season_result = await cursor.fetchone()
-                if not season_result:
+                pool = await self.get_free_agent_pool(db)
+                if not pool:
                     await interaction.followup.send("❌ No active season found!")
                     return
-                current_season = season_result[0]
+                current_season = pool.season_number
 
                 # Check if period already exists
-                cursor = await db.execute(
-                    "SELECT period_id, status FROM free_agency_periods WHERE season_number = ?",
-                    (current_season,)
-                )
-                existing = await cursor.fetchone()
-                if existing:
-                    await interaction.followup.send(f"❌ Free agency period already exists for Season {current_season} (status: {existing[1]})")
+                if pool.period_id is not None:
+                    await interaction.followup.send(f"❌ Free agency period already exists for Season {current_season} (status: {pool.period_status})")
                     return
 
-                # Get free agents (only those with a team)
-                cursor = await db.execute(
-                    """SELECT COUNT(*) FROM players
-                       WHERE contract_expiry = ? AND team_id IS NOT NULL""",
-                    (current_season,)
-                )
-                fa_count = (await cursor.fetchone())[0]
+                # Free agents (only those with a team)
+                fa_count = len(pool.players)
 
                 if fa_count == 0:
                     await interaction.followup.send(f"❌ No free agents found for Season {current_season}!")
@@ -1350,24 +1367,21 @@ class FreeAgencyCommands(commands.Cog):
                 )
                 period_id = cursor.lastrowid
                 await db.commit()
-
-                # Get all teams with free agents and calculate their allowances
-                cursor = await db.execute(
-                    """SELECT DISTINCT t.team_id, t.team_name, t.channel_id
-                       FROM teams t
-                       JOIN players p ON t.team_id = p.team_id
-                       WHERE p.contract_expiry = ?""",
-                    (current_season,)
-                )
-                teams_with_fas = await cursor.fetchall()
+                self.free_agent_pool = None
 
                 # Send notifications to eligible teams
                 notifications_sent = 0
                 debug_info = []  # For debugging
 
-                for team_id, team_name, channel_id in teams_with_fas:
+                for team_id, team_fas in sorted(pool.by_team.items()):
+                    team_name, channel_id = team_fas[0][6], team_fas[0][7]
+
                     # Calculate how many free re-signs this team gets
-                    allowance = await self.calculate_free_resign_allowance(db, team_id, current_season)
+                    free_agents = [(player_id, name, pos, age, ovr) for player_id, name, pos, ovr, age, *_ in team_fas]
+                    allowance = await self.calculate_free_resign_allowance(
+                        db, team_id, current_season,
+                        free_agents=[(player_id, age, ovr) for player_id, _, _, age, ovr in free_agents]
+                    )
                     debug_info.append(f"{team_name}: allowance={allowance}, channel_id={channel_id}")
 
                     if allowance > 0:
@@ -1375,16 +1389,6 @@ class FreeAgencyCommands(commands.Cog):
                             debug_info.append(f"  → Skipped (no channel)")
                             continue
 
-                        # Get the team's free agents
-                        cursor = await db.execute(
-                            """SELECT p.player_id, p.name, p.position, p.age, p.overall_rating
-                               FROM players p
-                               WHERE p.team_id = ? AND p.contract_expiry = ?
-                               ORDER BY p.overall_rating DESC, p.name""",
-                            (team_id, current_season)
-                        )
-                        free_agents = await cursor.fetchall()
-
                         # Build embed
                         embed = discord.Embed(
                             title="🔄 Free Re-Sign Period Started!",
@@ -1521,6 +1525,7 @@ class FreeAgencyCommands(commands.Cog):
                             (period_id,)
                         )
                         await db.commit()
+                        self.free_agent_pool = None
 
                         await interaction.followup.send(
                             f"✅ **Free Agency Bidding Period Started!**\n\n"
@@ -1555,6 +1560,7 @@ class FreeAgencyCommands(commands.Cog):
                 )
                 period_id = cursor.lastrowid
                 await db.commit()
+                self.free_agent_pool = None
 
                 await interaction.followup.send(
                     f"✅ **Free Agency Bidding Period Started!**\n\n"
@@ -1674,7 +1680,12 @@ class FreeAgencyCommands(commands.Cog):
                        WHERE period_id = ?""",
                     (period_id,)
                 )
+
+                # Make sure the balances the summaries use match the bids
+                for drift_period_id, team_id, ledger, actual in await reconcile_auction_balances(db):
+                    print(f"Auction balance corrected for period {drift_period_id}, team {team_id}: {ledger} -> {actual}")
                 await db.commit()
+                self.free_agent_pool = None
 
                 # Log winning bids
                 await self.log_winning_bids(db, period_id, current_season)
@@ -1696,7 +1707,7 @@ class FreeAgencyCommands(commands.Cog):
                         # Get this team's players with bids
                         cursor = await db.execute(
                             """SELECT r.player_id, p.name, p.position, p.age, p.overall_rating,
-                                      r.winning_team_id, t.team_name, t.emoji_id, r.winning_bid
+                                      r.winning_team_id, t.team_name, r.winning_bid
                                FROM free_agency_results r
                                JOIN players p ON r.player_id = p.player_id
                                JOIN teams t ON r.winning_team_id = t.team_id
@@ -1707,15 +1718,7 @@ class FreeAgencyCommands(commands.Cog):
 
                         if player_bids:
                             # Calculate remaining points for this team (300 - winning bids on other teams' players)
-                            cursor = await db.execute(
-                                """SELECT COALESCE(SUM(b.bid_amount), 0)
-                                   FROM free_agency_bids b
-                                   JOIN players p ON b.player_id = p.player_id
-                                   WHERE b.period_id = ? AND b.team_id = ? AND b.status = 'winning'
-                                   AND p.team_id != ?""",
-                                (period_id, team_id, team_id)
-                            )
-                            winning_bid_total = (await cursor.fetchone())[0]
+                            _, winning_bid_total = await get_team_auction_balance(db, period_id, team_id)
                             remaining_points = 300 - winning_bid_total
 
                             channel = self.bot.get_channel(int(channel_id))
@@ -1839,7 +1842,7 @@ class FreeAgencyCommands(commands.Cog):
                         # Get this team's players with bids
                         cursor = await db.execute(
                             """SELECT r.player_id, p.name, p.position, p.age, p.overall_rating,
-                                      r.winning_team_id, t.team_name, t.emoji_id, r.winning_bid
+                                      r.winning_team_id, t.team_name, r.winning_bid
                                FROM free_agency_results r
                                JOIN players p ON r.player_id = p.player_id
                                JOIN teams t ON r.winning_team_id = t.team_id
@@ -1850,15 +1853,7 @@ class FreeAgencyCommands(commands.Cog):
 
                         if player_bids:
                             # Calculate remaining points for this team (300 - winning bids on other teams' players)
-                            cursor = await db.execute(
-                                """SELECT COALESCE(SUM(b.bid_amount), 0)
-                                   FROM free_agency_bids b
-                                   JOIN players p ON b.player_id = p.player_id
-                                   WHERE b.period_id = ? AND b.team_id = ? AND b.status = 'winning'
-                                   AND p.team_id != ?""",
-                                (period_id, team_id, team_id)
-                            )
-                            winning_bid_total = (await cursor.fetchone())[0]
+                            _, winning_bid_total = await get_team_auction_balance(db, period_id, team_id)
                             remaining_points = 300 - winning_bid_total
 
                             channel = self.bot.get_channel(int(channel_id))
@@ -1884,29 +1879,21 @@ class FreeAgencyCommands(commands.Cog):
         """Send auction summary to each team's channel"""
         try:
             # Get all teams
-            cursor = await db.execute("SELECT team_id, team_name, emoji_id, channel_id FROM teams")
+            cursor = await db.execute("SELECT team_id, team_name, channel_id FROM teams")
             teams = await cursor.fetchall()
 
-            for team_id, team_name, emoji_id, channel_id in teams:
+            for team_id, team_name, channel_id in teams:
                 # Skip Draft Pool
                 if team_name == "Draft Pool":
                     continue
 
-                # Get team emoji
-                team_emoji = ""
-                if emoji_id:
-                    try:
-                        emoji = self.bot.get_emoji(int(emoji_id))
-                        team_emoji = str(emoji) + " " if emoji else ""
-                    except:
-                        pass
+                team_emoji = team_emojis.prefix(team_id)
 
                 # Get players gained (won bids)
                 cursor = await db.execute(
-                    """SELECT p.name, p.position, p.age, p.overall_rating, ot.emoji_id
+                    """SELECT p.name, p.position, p.age, p.overall_rating, r.original_team_id
                        FROM free_agency_results r
                        JOIN players p ON r.player_id = p.player_id
-                       JOIN teams ot ON r.original_team_id = ot.team_id
                        WHERE r.period_id = ? AND r.winning_team_id = ? AND r.matched = 0
                        ORDER BY p.overall_rating DESC, p.name""",
                     (period_id, team_id)
@@ -1916,11 +1903,10 @@ class FreeAgencyCommands(commands.Cog):
                 # Get players lost (original team, lost to winning bids)
                 cursor = await db.execute(
                     """SELECT p.name, p.position, p.age, p.overall_rating, r.compensation_band,
-                              dp.pick_number, r.matched, wt.emoji_id
+                              dp.pick_number, r.matched, r.winning_team_id
                        FROM free_agency_results r
                        JOIN players p ON r.player_id = p.player_id
                        LEFT JOIN draft_picks dp ON r.compensation_pick_id = dp.pick_id
-                       LEFT JOIN teams wt ON r.winning_team_id = wt.team_id
                        WHERE r.period_id = ? AND r.original_team_id = ? AND (r.winning_team_id IS NOT NULL OR r.matched = 1)
                        ORDER BY p.overall_rating DESC, p.name""",
                     (period_id, team_id)
@@ -1954,14 +1940,8 @@ class FreeAgencyCommands(commands.Cog):
                 # Players Gained
                 gained_text = ""
                 if players_gained:
-                    for player_name, pos, age, ovr, prev_emoji_id in players_gained:
-                        prev_emoji = ""
-                        if prev_emoji_id:
-                            try:
-                                emoji = self.bot.get_emoji(int(prev_emoji_id))
-                                prev_emoji = str(emoji) + " " if emoji else ""
-                            except:
-                                pass
+                    for player_name, pos, age, ovr, previous_team_id in players_gained:
+                        prev_emoji = team_emojis.prefix(previous_team_id)
                         gained_text += f"{prev_emoji}**{player_name}** ({pos}, {age}, {ovr})\n"
                 else:
                     gained_text = "*None*"
@@ -1975,7 +1955,7 @@ class FreeAgencyCommands(commands.Cog):
                 lost_text = ""
                 has_lost = False
                 if players_lost:
-                    for player_name, pos, age, ovr, comp_band, pick_num, matched, new_team_emoji_id in players_lost:
+                    for player_name, pos, age, ovr, comp_band, pick_num, matched, new_team_id in players_lost:
                         if matched:
                             # Player was matched - stayed with original team
                             continue
@@ -1983,13 +1963,9 @@ class FreeAgencyCommands(commands.Cog):
                         has_lost = True
 
                         # Get new team emoji
-                        new_team_emoji = ""
-                        if new_team_emoji_id:
-                            try:
-                                emoji = self.bot.get_emoji(int(new_team_emoji_id))
-                                new_team_emoji = " → " + str(emoji) if emoji else ""
-                            except:
-                                pass
+                        new_team_emoji = team_emojis.text(new_team_id)
+                        if new_team_emoji:
+                            new_team_emoji = " → " + new_team_emoji
 
                         lost_text += f"**{player_name}** ({pos}, {age}, {ovr}){new_team_emoji}\n"
                         if comp_band and pick_num:
@@ -2096,64 +2072,59 @@ class FreeAgencyCommands(commands.Cog):
                     )
                     return
 
-                # Get all free agency results
+                # Unmatched players with a winning bid move to the winning team,
+                # and their original team gets the best compensation band they qualify for
+                await db.execute(
+                    """WITH bands AS (
+                           SELECT r.result_id,
+                                  (SELECT compensation_band FROM compensation_chart
+                                   WHERE min_age <= p.age AND COALESCE(max_age, min_age) >= p.age
+                                   AND min_ovr <= p.overall_rating AND COALESCE(max_ovr, min_ovr) >= p.overall_rating
+                                   ORDER BY compensation_band ASC
+                                   LIMIT 1) AS compensation_band
+                           FROM free_agency_results r
+                           JOIN players p ON r.player_id = p.player_id
+                           WHERE r.period_id = ? AND r.winning_team_id IS NOT NULL AND NOT COALESCE(r.matched, 0)
+                       )
+                       UPDATE free_agency_results SET compensation_band = bands.compensation_band
+                       FROM bands
+                       WHERE free_agency_results.result_id = bands.result_id
+                       AND bands.compensation_band IS NOT NULL""",
+                    (period_id,)
+                )
+
                 cursor = await db.execute(
-                    """SELECT r.result_id, r.player_id, r.original_team_id, r.winning_team_id,
-                              r.winning_bid, r.matched, p.name, p.age, p.overall_rating
+                    """SELECT COUNT(*) FILTER (WHERE r.winning_team_id IS NOT NULL AND NOT COALESCE(r.matched, 0)),
+                              COUNT(*) FILTER (WHERE r.winning_team_id IS NOT NULL AND COALESCE(r.matched, 0)),
+                              COUNT(*) FILTER (WHERE r.winning_team_id IS NULL),
+                              COUNT(*) FILTER (WHERE r.winning_team_id IS NOT NULL AND NOT COALESCE(r.matched, 0)
+                                               AND r.compensation_band IS NOT NULL)
                        FROM free_agency_results r
                        JOIN players p ON r.player_id = p.player_id
                        WHERE r.period_id = ?""",
                     (period_id,)
                 )
-                results = await cursor.fetchall()
-
-                players_transferred = 0
-                players_matched = 0
-                players_resigned = 0
-                compensation_picks = 0
+                players_transferred, players_matched, players_resigned, compensation_picks = await cursor.fetchone()
 
-                for result_id, player_id, original_team_id, winning_team_id, winning_bid, matched, player_name, age, ovr in results:
-                    # Get new contract length based on age
-                    contract_years = await self.get_contract_years_for_age(db, age)
-                    # current_season is the season that just ended (Offseason 9 means Season 9 just ended)
-                    # Adding contract_years gives us the last season they'll play under the new contract
-                    new_contract_expiry = current_season + contract_years
-
-                    if winning_team_id is None:
-                        # No bids - auto re-sign with original team
-                        await db.execute(
-                            "UPDATE players SET contract_expiry = ? WHERE player_id = ?",
-                            (new_contract_expiry, player_id)
-                        )
-                        players_resigned += 1
-
-                    elif matched:
-                        # Original team matched - player stays, winning bidder gets refund
-                        await db.execute(
-                            "UPDATE players SET contract_expiry = ? WHERE player_id = ?",
-                            (new_contract_expiry, player_id)
-                        )
-                        players_matched += 1
-
-                        # Note: Points are already not deducted for matched bids in the matching logic
-
-                    else:
-                        # Unmatched - transfer player to winning team
-                        await db.execute(
-                            "UPDATE players SET team_id = ?, contract_expiry = ? WHERE player_id = ?",
-                            (winning_team_id, new_contract_expiry, player_id)
+                # Every player gets a new contract based on age - re-signed (no bids), matched
+                # (points are already not deducted for matched bids) or transferred.
+                # current_season is the season that just ended (Offseason 9 means Season 9 just ended)
+                # Adding contract_years gives us the last season they'll play under the new contract
+                await db.execute(
+                    f"""WITH settled AS (
+                            SELECT r.player_id,
+                                   CASE WHEN r.winning_team_id IS NOT NULL AND NOT COALESCE(r.matched, 0)
+                                        THEN r.winning_team_id ELSE p.team_id END AS team_id,
+                                   ? + {CONTRACT_YEARS_SQL} AS new_contract_expiry
+                            FROM free_agency_results r
+                            JOIN players p ON r.player_id = p.player_id
+                            WHERE r.period_id = ?
                         )
-                        players_transferred += 1
-
-                        # Calculate compensation for original team
-                        compensation_band = await self.get_compensation_band(db, age, ovr)
-                        if compensation_band:
-                            # Store compensation band for later pick insertion
-                            await db.execute(
-                                "UPDATE free_agency_results SET compensation_band = ? WHERE result_id = ?",
-                                (compensation_band, result_id)
-                            )
-                            compensation_picks += 1
+                        UPDATE players SET team_id = settled.team_id, contract_expiry = settled.new_contract_expiry
+                        FROM settled
+                        WHERE players.player_id = settled.player_id""",
+                    (current_season, period_id)
+                )
 
                 # Update period status
                 await db.execute(
@@ -2183,116 +2154,64 @@ class FreeAgencyCommands(commands.Cog):
                     if draft:
                         draft_id, draft_name, draft_season = draft
 
-                        # Get all compensation results for this period, ordered by band and ladder position
+                        # Get all compensation results for this period with each team's ladder position
                         # For bands 1,3,5: order doesn't matter as much (inserted after natural pick)
                         # For bands 2,4: MUST be in reverse ladder order (worst team = highest position number = pick first)
+                        # The draft's ladder is saved under the draft's own season (apply_ladder_order)
                         cursor = await db.execute(
-                            """SELECT r.result_id, r.original_team_id, r.compensation_band, r.player_id
+                            """SELECT r.result_id, r.original_team_id, r.compensation_band, lp.position
                                FROM free_agency_results r
                                LEFT JOIN ladder_positions lp ON r.original_team_id = lp.team_id
-                               LEFT JOIN seasons s ON lp.season_id = s.season_id AND s.season_number = ?
-                               WHERE r.period_id = ? AND r.compensation_band IS NOT NULL
-                               ORDER BY r.compensation_band,
-                                        CASE
-                                            WHEN r.compensation_band IN (2, 4) THEN lp.position
-                                            ELSE r.original_team_id
-                                        END DESC""",
-                            (current_season, period_id)
+                                   AND lp.season_id = (SELECT season_id FROM seasons WHERE season_number = ?)
+                               WHERE r.period_id = ? AND r.compensation_band IS NOT NULL""",
+                            (draft_season, period_id)
                         )
-                        comp_results = await cursor.fetchall()
-
-                        # Process compensation picks in order by band (lower bands/rounds first)
-                        # Each insertion renumbers all subsequent picks globally
-                        for result_id, team_id, comp_band, player_id in comp_results:
-                            # Get player name for pick origin description
-                            cursor = await db.execute("SELECT name FROM players WHERE player_id = ?", (player_id,))
-                            player_name = (await cursor.fetchone())[0]
-
-                            # Determine round and insertion logic based on compensation band
-                            if comp_band in [1, 3, 5]:
-                                # After team's natural pick in the round
-                                round_num = {1: 1, 3: 2, 5: 3}[comp_band]
+                        comp_results = sort_compensation_results(await cursor.fetchall())
 
-                                # Get team name to identify their natural pick by origin
-                                cursor = await db.execute("SELECT team_name FROM teams WHERE team_id = ?", (team_id,))
-                                team_name_result = await cursor.fetchone()
-                                if not team_name_result:
-                                    continue  # Skip if team not found
+                        cursor = await db.execute("SELECT team_id, team_name FROM teams")
+                        team_names = dict(await cursor.fetchall())
 
-                                team_name = team_name_result[0]
-                                natural_pick_origin = f"{team_name} R{round_num}"
-
-                                # Find the team's natural pick in this round by origin (unchanging identifier)
-                                cursor = await db.execute(
-                                    """SELECT pick_number FROM draft_picks
-                                       WHERE draft_id = ? AND round_number = ? AND pick_origin = ?
-                                       ORDER BY pick_number LIMIT 1""",
-                                    (draft_id, round_num, natural_pick_origin)
-                                )
-                                natural_pick = await cursor.fetchone()
-
-                                if natural_pick:
-                                    natural_pick_num = natural_pick[0]
-                                    new_pick_num = natural_pick_num + 1
-
-                                    # Shift all picks after this position up by 1
-                                    await db.execute(
-                                        """UPDATE draft_picks
-                                           SET pick_number = pick_number + 1
-                                           WHERE draft_id = ? AND pick_number >= ?""",
-                                        (draft_id, new_pick_num)
-                                    )
-                                else:
-                                    # Fallback: append to end of round if natural pick not found
-                                    cursor = await db.execute(
-                                        """SELECT COALESCE(MAX(pick_number), 0) FROM draft_picks
-                                           WHERE draft_id = ? AND round_number = ?""",
-                                        (draft_id, round_num)
-                                    )
-                                    new_pick_num = (await cursor.fetchone())[0] + 1
-
-                            elif comp_band in [2, 4]:
-                                # End of round, reverse ladder order
-                                round_num = {2: 1, 4: 2}[comp_band]
-
-                                # Find the last pick in this round
-                                cursor = await db.execute(
-                                    """SELECT COALESCE(MAX(pick_number), 0) FROM draft_picks
-                                       WHERE draft_id = ? AND round_number = ?""",
-                                    (draft_id, round_num)
-                                )
-                                last_pick_in_round = (await cursor.fetchone())[0]
-                                new_pick_num = last_pick_in_round + 1
-
-                                # Shift all picks in subsequent rounds up by 1
-                                await db.execute(
-                                    """UPDATE draft_picks
-                                       SET pick_number = pick_number + 1
-                                       WHERE draft_id = ? AND pick_number >= ?""",
-                                    (draft_id, new_pick_num)
-                                )
+                        # Load the draft order once and place every compensation pick in memory
+                        cursor = await db.execute(
+                            """SELECT pick_id, round_number, pick_number, pick_origin FROM draft_picks
+                               WHERE draft_id = ? AND pick_number IS NOT NULL
+                               ORDER BY pick_number""",
+                            (draft_id,)
+                        )
+                        draft_order = await cursor.fetchall()
+                        renumbered, new_picks = place_compensation_picks(draft_order, comp_results, team_names)
 
-                            else:
-                                # Unknown band - skip
-                                continue
+                        # Move existing picks to their final numbers, then add the compensation picks
+                        await db.executemany(
+                            "UPDATE draft_picks SET pick_number = ? WHERE pick_id = ?",
+                            renumbered
+                        )
+                        await db.executemany(
+                            """INSERT INTO draft_picks (draft_id, draft_name, season_number, round_number, pick_number, pick_origin, original_team_id, current_team_id)
+                               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                            [(draft_id, draft_name, draft_season, round_num, pick_number,
+                              f"Band {comp_band} Compensation", team_id, team_id)
+                             for _, team_id, comp_band, round_num, pick_number in new_picks]
+                        )
 
-                            # Insert the compensation pick with proper round and pick number
+                        # Link each result to its pick (pick numbers are unique once the order is rebuilt)
+                        if new_picks:
+                            pick_numbers = [pick_number for *_, pick_number in new_picks]
                             cursor = await db.execute(
-                                """INSERT INTO draft_picks (draft_id, draft_name, season_number, round_number, pick_number, pick_origin, original_team_id, current_team_id)
-                                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                                (draft_id, draft_name, draft_season, round_num, new_pick_num,
-                                 f"Band {comp_band} Compensation", team_id, team_id)
+                                f"""SELECT pick_number, pick_id FROM draft_picks
+                                    WHERE draft_id = ? AND pick_origin LIKE 'Band % Compensation'
+                                    AND pick_number IN ({','.join('?' * len(pick_numbers))})""",
+                                (draft_id, *pick_numbers)
                             )
-                            pick_id = cursor.lastrowid
-
-                            # Update free_agency_results with the pick_id reference
-                            await db.execute(
+                            pick_ids = dict(await cursor.fetchall())
+                            await db.executemany(
                                 "UPDATE free_agency_results SET compensation_pick_id = ? WHERE result_id = ?",
-                                (pick_id, result_id)
+                                [(pick_ids[pick_number], result_id) for result_id, *_, pick_number in new_picks]
                             )
-                            picks_inserted += 1
+                        picks_inserted = len(new_picks)
 
                 await db.commit()
+                self.free_agent_pool = None
 
                 # Log final movements and compensation
                 await self.log_final_movements(db, period_id, current_season)
@@ -2339,104 +2258,98 @@ class FreeAgencyCommands(commands.Cog):
     @app_commands.command(name="contractstatus", description="View contract expiry years for all players on a team")
     @app_commands.describe(team="The team to view contracts for (defaults to your team)")
     @app_commands.autocomplete(team=team_autocomplete)
+    @auto_defer(ephemeral=True)
     async def contract_status(self, interaction: discord.Interaction, team: str = None):
         """Display contract expiry years for all players on a team"""
-        await interaction.response.defer(ephemeral=True)
-
         try:
-            async with aiosqlite.connect(DB_PATH) as db:
-                # If no team specified, get user's team
-                if team is None:
-                    # Get user's team from roles
-                    user_team_id = None
-                    user_team_name = None
-                    for role in interaction.user.roles:
-                        cursor = await db.execute(
-                            "SELECT team_id, team_name FROM teams WHERE role_id = ?",
-                            (str(role.id),)
-                        )
-                        team_result = await cursor.fetchone()
-                        if team_result:
-                            user_team_id, user_team_name = team_result
-                            break
+            # If no team specified, get user's team
+            if team is None:
+                team_result = await render_cache.team_for_member(interaction.user)
+                if not team_result:
+                    await interaction.response.send_message("❌ You don't have a team role! Please specify a team.", ephemeral=True)
+                    return
+            else:
+                team_result = await render_cache.team_named(team)
+                if not team_result:
+                    await interaction.response.send_message(f"❌ Team '{team}' not found!", ephemeral=True)
+                    return
 
-                    if not user_team_id:
-                        await interaction.followup.send("❌ You don't have a team role! Please specify a team.")
-                        return
+            team_id, team_name = team_result
+            embed = await render_cache.get(
+                'contracts', team_id, None, lambda: self.build_contract_status_embed(team_id, team_name)
+            )
+            if embed is None:
+                await interaction.response.send_message(f"❌ No players found for {team_name}!", ephemeral=True)
+                return
 
-                    team_id, team_name = user_team_id, user_team_name
-                else:
-                    # Get specified team info
-                    cursor = await db.execute(
-                        "SELECT team_id, team_name FROM teams WHERE team_name = ?",
-                        (team,)
-                    )
-                    team_result = await cursor.fetchone()
-                    if not team_result:
-                        await interaction.followup.send(f"❌ Team '{team}' not found!")
-                        return
+            await interaction.response.send_message(embed=embed, ephemeral=True)
 
-                    team_id, team_name = team_result
+        except Exception as e:
+            await interaction.response.send_message(f"❌ Error: {e}", ephemeral=True)
 
-                # Get all players grouped by contract expiry year
-                cursor = await db.execute(
-                    """SELECT contract_expiry, name, position, age, overall_rating
-                       FROM players
-                       WHERE team_id = ?
-                       ORDER BY contract_expiry ASC, overall_rating DESC, name""",
-                    (team_id,)
-                )
-                players = await cursor.fetchall()
+    async def build_contract_status_embed(self, team_id, team_name):
+        """
+        Render a team's players by contract expiry year.
 
-                if not players:
-                    await interaction.followup.send(f"❌ No players found for {team_name}!")
-                    return
+        Returns:
+            discord.Embed: The contract status, or None if the team has no players
+        """
+        async with aiosqlite.connect(DB_PATH) as db:
+            # Get all players grouped by contract expiry year
+            cursor = await db.execute(
+                """SELECT contract_expiry, name, position, age, overall_rating
+                   FROM players
+                   WHERE team_id = ?
+                   ORDER BY contract_expiry ASC, overall_rating DESC, name""",
+                (team_id,)
+            )
+            players = await cursor.fetchall()
 
-                # Group players by contract expiry year
-                players_by_year = {}
-                for contract_expiry, name, pos, age, ovr in players:
-                    if contract_expiry not in players_by_year:
-                        players_by_year[contract_expiry] = []
-                    players_by_year[contract_expiry].append(f"{name} ({pos}, {age}, {ovr})")
+        if not players:
+            return None
 
-                # Build response
-                embed = discord.Embed(
-                    title=f"📋 Contract Status - {team_name}",
-                    description=f"Players grouped by contract expiry year",
-                    color=discord.Color.blue()
-                )
+        # Group players by contract expiry year
+        players_by_year = {}
+        for contract_expiry, name, pos, age, ovr in players:
+            if contract_expiry not in players_by_year:
+                players_by_year[contract_expiry] = []
+            players_by_year[contract_expiry].append(f"{name} ({pos}, {age}, {ovr})")
 
-                for year in sorted(players_by_year.keys()):
-                    player_list = players_by_year[year]
-                    # Add field for each year
-                    field_value = "\n".join(player_list)
-                    # Discord has a 1024 character limit per field
-                    if len(field_value) > 1024:
-                        # Split into multiple fields if needed
-                        chunks = []
-                        current_chunk = []
-                        current_length = 0
-                        for player in player_list:
-                            if current_length + len(player) + 1 > 1024:
-                                chunks.append("\n".join(current_chunk))
-                                current_chunk = [player]
-                                current_length = len(player)
-                            else:
-                                current_chunk.append(player)
-                                current_length += len(player) + 1
-                        if current_chunk:
-                            chunks.append("\n".join(current_chunk))
-
-                        for i, chunk in enumerate(chunks):
-                            field_name = f"Season {year}" if i == 0 else f"Season {year} (cont.)"
-                            embed.add_field(name=field_name, value=chunk, inline=False)
-                    else:
-                        embed.add_field(name=f"Season {year}", value=field_value, inline=False)
+        # Build response
+        embed = discord.Embed(
+            title=f"📋 Contract Status - {team_name}",
+            description=f"Players grouped by contract expiry year",
+            color=discord.Color.blue()
+        )
 
-                await interaction.followup.send(embed=embed)
+        for year in sorted(players_by_year.keys()):
+            player_list = players_by_year[year]
+            # Add field for each year
+            field_value = "\n".join(player_list)
+            # Discord has a 1024 character limit per field
+            if len(field_value) > 1024:
+                # Split into multiple fields if needed
+                chunks = []
+                current_chunk = []
+                current_length = 0
+                for player in player_list:
+                    if current_length + len(player) + 1 > 1024:
+                        chunks.append("\n".join(current_chunk))
+                        current_chunk = [player]
+                        current_length = len(player)
+                    else:
+                        current_chunk.append(player)
+                        current_length += len(player) + 1
+                if current_chunk:
+                    chunks.append("\n".join(current_chunk))
+
+                for i, chunk in enumerate(chunks):
+                    field_name = f"Season {year}" if i == 0 else f"Season {year} (cont.)"
+                    embed.add_field(name=field_name, value=chunk, inline=False)
+            else:
+                embed.add_field(name=f"Season {year}", value=field_value, inline=False)
 
-        except Exception as e:
-            await interaction.followup.send(f"❌ Error: {e}")
+        return embed
 
     @app_commands.command(name="compensationtable", description="View the compensation chart for free agency")
     async def compensation_table(self, interaction: discord.Interaction):
@@ -2574,15 +2487,7 @@ class FreeAgentsView(discord.ui.View):
             team_data = self.teams_dict[team_name]
             players = team_data['players']
 
-            # Get emoji
-            emoji_str = ""
-            if team_data['emoji_id']:
-                try:
-                    emoji = self.bot.get_emoji(int(team_data['emoji_id']))
-                    if emoji:
-                        emoji_str = f"{emoji} "
-                except:
-                    pass
+            emoji_str = team_emojis.prefix(team_data['team_id'])
 
             # Add all players from this team with team emoji and RFA status
             for name, pos, age, ovr in players:
@@ -2669,7 +2574,7 @@ class MatchingNotificationView(discord.ui.View):
                 # Get winning bids on this team's players
                 cursor = await db.execute(
                     """SELECT r.player_id, p.name, p.position, p.age, p.overall_rating,
-                              r.winning_team_id, t.team_name, t.emoji_id, r.winning_bid
+                              r.winning_team_id, t.team_name, r.winning_bid
                        FROM free_agency_results r
                        JOIN players p ON r.player_id = p.player_id
                        JOIN teams t ON r.winning_team_id = t.team_id
@@ -2686,15 +2591,7 @@ class MatchingNotificationView(discord.ui.View):
                     return
 
                 # Calculate remaining points
-                cursor = await db.execute(
-                    """SELECT COALESCE(SUM(b.bid_amount), 0)
-                       FROM free_agency_bids b
-                       JOIN players p ON b.player_id = p.player_id
-                       WHERE b.period_id = ? AND b.team_id = ? AND b.status = 'winning'
-                       AND p.team_id != ?""",
-                    (self.period_id, self.team_id, self.team_id)
-                )
-                winning_bid_total = (await cursor.fetchone())[0]
+                _, winning_bid_total = await get_team_auction_balance(db, self.period_id, self.team_id)
                 remaining_points = 300 - winning_bid_total
 
                 # Create matching view
@@ -2722,16 +2619,8 @@ class MatchingNotificationView(discord.ui.View):
 
         # List each player with bid info (no status or compensation)
         player_lines = []
-        for player_id, name, pos, age, ovr, winning_team_id, bidding_team, emoji_id, bid in player_bids:
-            # Get emoji
-            emoji_str = ""
-            if emoji_id:
-                try:
-                    emoji = bot.get_emoji(int(emoji_id))
-                    if emoji:
-                        emoji_str = f"{emoji} "
-                except:
-                    pass
+        for player_id, name, pos, age, ovr, winning_team_id, bidding_team, bid in player_bids:
+            emoji_str = team_emojis.prefix(winning_team_id)
 
             # Check if RFA (age <= 25) and calculate match cost
             is_rfa = age <= 25
@@ -2767,7 +2656,7 @@ class MatchingView(discord.ui.View):
         self.period_id = period_id
         self.team_id = team_id
         self.team_name = team_name
-        self.player_bids = player_bids  # List of (player_id, name, pos, age, ovr, winning_team_id, team_name, emoji_id, bid)
+        self.player_bids = player_bids  # List of (player_id, name, pos, age, ovr, winning_team_id, team_name, bid)
         self.season_number = season_number
         self.matches = {}  # player_id -> bool (True = match, False = don't match)
         self.confirmed = False  # Track if matches have been confirmed
@@ -2776,7 +2665,7 @@ class MatchingView(discord.ui.View):
         self.max_points = max_points
 
         # Add toggle buttons for each player
-        for player_id, name, pos, age, ovr, winning_team_id, bidding_team, emoji_id, bid in player_bids:
+        for player_id, name, pos, age, ovr, winning_team_id, bidding_team, bid in player_bids:
             self.matches[player_id] = False  # Default to not matching
 
         self.update_buttons()
@@ -2788,7 +2677,7 @@ class MatchingView(discord.ui.View):
         # Add dropdown to select players to match (limit to 25)
         if self.player_bids:
             options = []
-            for player_id, name, pos, age, ovr, _, bidding_team, _, bid in self.player_bids[:25]:
+            for player_id, name, pos, age, ovr, _, bidding_team, bid in self.player_bids[:25]:
                 # Check if RFA and calculate cost
                 is_rfa = age <= 25
                 if is_rfa:
@@ -2838,7 +2727,7 @@ class MatchingView(discord.ui.View):
 
         # Calculate points needed if all current matches go through (with RFA discount)
         total_cost = 0
-        for player_id, _, _, age, _, _, _, _, bid in self.player_bids:
+        for player_id, _, _, age, _, _, _, bid in self.player_bids:
             if self.matches.get(player_id, False):
                 # Apply 20% discount for RFAs (age <= 25)
                 if age <= 25:
@@ -2858,7 +2747,7 @@ class MatchingView(discord.ui.View):
         # Get compensation bands for all players
         async with aiosqlite.connect(DB_PATH) as db:
             compensation_bands = {}
-            for player_id, name, pos, age, ovr, winning_team_id, bidding_team, emoji_id, bid in self.player_bids:
+            for player_id, name, pos, age, ovr, winning_team_id, bidding_team, bid in self.player_bids:
                 cursor = await db.execute(
                     """SELECT compensation_band FROM compensation_chart
                        WHERE min_age <= ? AND COALESCE(max_age, min_age) >= ?
@@ -2872,16 +2761,8 @@ class MatchingView(discord.ui.View):
 
         # List each player with current match status
         player_lines = []
-        for player_id, name, pos, age, ovr, winning_team_id, bidding_team, emoji_id, bid in self.player_bids:
-            # Get emoji
-            emoji_str = ""
-            if emoji_id:
-                try:
-                    emoji = self.bot.get_emoji(int(emoji_id))
-                    if emoji:
-                        emoji_str = f"{emoji} "
-                except:
-                    pass
+        for player_id, name, pos, age, ovr, winning_team_id, bidding_team, bid in self.player_bids:
+            emoji_str = team_emojis.prefix(winning_team_id)
 
             is_matched = self.matches.get(player_id, False)
             status = "✅ MATCH" if is_matched else "❌ LET GO"
@@ -2938,7 +2819,7 @@ class MatchingView(discord.ui.View):
         selected_ids = {int(value) for value in interaction.data['values']}
 
         # Update matches dict - selected = match, not selected = let go
-        for player_id, _, _, _, _, _, _, _, _ in self.player_bids:
+        for player_id, _, _, _, _, _, _, _ in self.player_bids:
             self.matches[player_id] = player_id in selected_ids
 
         # Update the view
@@ -2965,7 +2846,7 @@ class MatchingView(discord.ui.View):
 
             # Calculate total cost (with RFA discount)
             total_cost = 0
-            for player_id, _, _, age, _, _, _, _, bid in self.player_bids:
+            for player_id, _, _, age, _, _, _, bid in self.player_bids:
                 if self.matches.get(player_id, False):
                     # Apply 20% discount for RFAs (age <= 25)
                     if age <= 25:
@@ -2995,22 +2876,13 @@ class MatchingView(discord.ui.View):
                 await db.commit()
 
                 # Log to bot logs channel
-                log_channel = await self.bot.get_cog('FreeAgencyCommands').get_bot_logs_channel(db)
+                log_channel = await settings.channel(self.bot, 'bot_logs_channel_id')
                 if log_channel:
                     # Get team info
-                    cursor = await db.execute("SELECT team_name, emoji_id FROM teams WHERE team_id = ?", (self.team_id,))
+                    cursor = await db.execute("SELECT team_name FROM teams WHERE team_id = ?", (self.team_id,))
                     team_data = await cursor.fetchone()
                     team_name = team_data[0] if team_data else "Unknown Team"
-                    emoji_id = team_data[1] if team_data and team_data[1] else None
-
-                    emoji_str = ""
-                    if emoji_id:
-                        try:
-                            emoji = self.bot.get_emoji(int(emoji_id))
-                            if emoji:
-                                emoji_str = f"{emoji} "
-                        except:
-                            pass
+                    emoji_str = team_emojis.prefix(self.team_id)
 
                     matched_count = sum(1 for m in self.matches.values() if m)
                     let_go_count = len(self.matches) - matched_count
@@ -3101,7 +2973,7 @@ class AuctionsMenuView(discord.ui.View):
         # Add dropdown to withdraw bids (only during bidding period and if there are bids)
         if self.period_status == 'bidding' and self.bids:
             options = []
-            for bid_id, player_id, amount, player_name, pos, age, ovr, team_name_player, emoji_id in self.bids[:25]:
+            for bid_id, player_id, amount, player_name, pos, age, ovr, team_name_player, player_team_id in self.bids[:25]:
                 options.append(
                     discord.SelectOption(
                         label=f"{player_name} ({pos}, {age}, {ovr})",
@@ -3203,16 +3075,8 @@ class AuctionsMenuView(discord.ui.View):
 
         if self.bids:
             bid_lines = []
-            for bid_id, player_id, amount, player_name, pos, age, ovr, team_name_player, emoji_id in self.bids:
-                # Get emoji
-                emoji_str = ""
-                if emoji_id:
-                    try:
-                        emoji = self.bot.get_emoji(int(emoji_id))
-                        if emoji:
-                            emoji_str = f"{emoji} "
-                    except:
-                        pass
+            for bid_id, player_id, amount, player_name, pos, age, ovr, team_name_player, player_team_id in self.bids:
+                emoji_str = team_emojis.prefix(player_team_id)
 
                 bid_lines.append(f"• {emoji_str}**{player_name}** ({pos}, {age}, {ovr}) - {team_name_player} - **{amount} pts**")
 
@@ -3260,30 +3124,20 @@ class AuctionsMenuView(discord.ui.View):
 
             async with aiosqlite.connect(DB_PATH) as db:
                 # Delete the selected bids
-                for bid_id in selected_bid_ids:
-                    await db.execute(
-                        "DELETE FROM free_agency_bids WHERE bid_id = ?",
-                        (bid_id,)
-                    )
+                await db.executemany(
+                    "DELETE FROM free_agency_bids WHERE bid_id = ? AND team_id = ?",
+                    [(bid_id, self.team_id) for bid_id in selected_bid_ids]
+                )
                 await db.commit()
 
                 # Log to bot logs channel
-                log_channel = await self.bot.get_cog('FreeAgencyCommands').get_bot_logs_channel(db)
+                log_channel = await settings.channel(self.bot, 'bot_logs_channel_id')
                 if log_channel:
                     # Get team info
-                    cursor = await db.execute("SELECT team_name, emoji_id FROM teams WHERE team_id = ?", (self.team_id,))
+                    cursor = await db.execute("SELECT team_name FROM teams WHERE team_id = ?", (self.team_id,))
                     team_data = await cursor.fetchone()
                     team_name = team_data[0] if team_data else "Unknown Team"
-                    emoji_id = team_data[1] if team_data and team_data[1] else None
-
-                    emoji_str = ""
-                    if emoji_id:
-                        try:
-                            emoji = self.bot.get_emoji(int(emoji_id))
-                            if emoji:
-                                emoji_str = f"{emoji} "
-                        except:
-                            pass
+                    emoji_str = team_emojis.prefix(self.team_id)
 
                     # Get withdrawn bids for logging
                     withdrawn_bids_temp = [b for b in self.bids if b[0] in selected_bid_ids]
@@ -3378,7 +3232,7 @@ class AuctionsMenuView(discord.ui.View):
                 # Get winning bids on this team's players
                 cursor = await db.execute(
                     """SELECT p.player_id, p.name, p.position, p.age, p.overall_rating,
-                              t.team_id, t.team_name, t.emoji_id, b.bid_amount
+                              t.team_id, t.team_name, b.bid_amount
                        FROM players p
                        JOIN free_agency_bids b ON p.player_id = b.player_id
                        JOIN teams t ON b.team_id = t.team_id
@@ -3396,15 +3250,7 @@ class AuctionsMenuView(discord.ui.View):
                     return
 
                 # Calculate remaining points for this team (300 - winning bids on other teams' players)
-                cursor = await db.execute(
-                    """SELECT COALESCE(SUM(b.bid_amount), 0)
-                       FROM free_agency_bids b
-                       JOIN players p ON b.player_id = p.player_id
-                       WHERE b.period_id = ? AND b.team_id = ? AND b.status = 'winning'
-                       AND p.team_id != ?""",
-                    (self.period_id, self.team_id, self.team_id)
-                )
-                winning_bid_total = (await cursor.fetchone())[0]
+                _, winning_bid_total = await get_team_auction_balance(db, self.period_id, self.team_id)
                 remaining_points = 300 - winning_bid_total
 
                 # Create matching view
@@ -3421,7 +3267,7 @@ class AuctionsMenuView(discord.ui.View):
                 # Re-fetch bids
                 cursor = await db.execute(
                     """SELECT b.bid_id, b.player_id, b.bid_amount, p.name, p.position, p.age, p.overall_rating,
-                              t.team_name, t.emoji_id
+                              t.team_name, t.team_id
                        FROM free_agency_bids b
                        JOIN players p ON b.player_id = p.player_id
                        JOIN teams t ON p.team_id = t.team_id
@@ -3432,7 +3278,7 @@ class AuctionsMenuView(discord.ui.View):
                 self.bids = await cursor.fetchall()
 
                 # Recalculate points
-                total_spent = sum(bid[2] for bid in self.bids)
+                total_spent, _ = await get_team_auction_balance(db, self.period_id, self.team_id)
                 self.remaining_points = self.max_points - total_spent
 
                 # Re-fetch period status
@@ -3640,22 +3486,13 @@ class FreeResignSelectionView(discord.ui.View):
                 await db.commit()
 
                 # Log to bot logs channel
-                log_channel = await self.bot.get_cog('FreeAgencyCommands').get_bot_logs_channel(db)
+                log_channel = await settings.channel(self.bot, 'bot_logs_channel_id')
                 if log_channel:
                     # Get team and player names
-                    cursor = await db.execute("SELECT team_name, emoji_id FROM teams WHERE team_id = ?", (self.team_id,))
+                    cursor = await db.execute("SELECT team_name FROM teams WHERE team_id = ?", (self.team_id,))
                     team_data = await cursor.fetchone()
                     team_name = team_data[0] if team_data else "Unknown Team"
-                    emoji_id = team_data[1] if team_data and team_data[1] else None
-
-                    emoji_str = ""
-                    if emoji_id:
-                        try:
-                            emoji = self.bot.get_emoji(int(emoji_id))
-                            if emoji:
-                                emoji_str = f"{emoji} "
-                        except:
-                            pass
+                    emoji_str = team_emojis.prefix(self.team_id)
 
                     if self.selected_players:
                         player_names = []
@@ -3,6 +3,9 @@ from discord.ext import commands
 from discord import app_commands
 import aiosqlite
 from config import DB_PATH, ADMIN_ROLE_ID
+from deferral import auto_defer
+from render_cache import render_cache
+from team_emojis import team_emojis
 from commands.season_commands import get_round_name
 
 class InjuryCommands(commands.Cog):
@@ -227,7 +230,48 @@ class InjuryCommands(commands.Cog):
 
     @app_commands.command(name="injurylist", description="View current injuries and suspensions")
     @app_commands.describe(team_name="Team name (leave empty for your team, use 'all' for all teams)")
+    @auto_defer(ephemeral=False)
     async def injury_list(self, interaction: discord.Interaction, team_name: str = None):
+        # Determine which team to show
+        if team_name and team_name.lower() == 'all':
+            # Show all teams
+            team = None
+        elif team_name:
+            # Show specific team (exact match due to autocomplete)
+            team = await render_cache.team_named(team_name)
+            if not team:
+                await interaction.response.send_message(
+                    f"❌ Team '{team_name}' not found. Please select from the autocomplete suggestions.",
+                    ephemeral=True
+                )
+                return
+        else:
+            # Default to user's team - a user with no team sees all
+            team = await render_cache.team_for_member(interaction.user)
+
+        filter_team_id, filter_team_name = team if team else (None, None)
+        embed = await render_cache.get(
+            'injuries', filter_team_id, None, lambda: self.build_injury_list_embed(filter_team_id, filter_team_name)
+        )
+        if embed is None:
+            await interaction.response.send_message("No active injuries or suspensions!")
+            return
+
+        await interaction.response.send_message(embed=embed)
+
+    async def build_injury_list_embed(self, filter_team_id, filter_team_name):
+        """
+        Render the current injuries and suspensions.
+
+        Args:
+            filter_team_id: Only this team's players (None for every team)
+            filter_team_name: The team's name, for the title
+
+        Returns:
+            discord.Embed: The injury list, or None if nobody is injured or suspended
+        """
+        title_suffix = f" - {filter_team_name}" if filter_team_id else ""
+
         async with aiosqlite.connect(DB_PATH) as db:
             # Get current round, total rounds, and regular_rounds
             cursor = await db.execute(
@@ -238,76 +282,21 @@ class InjuryCommands(commands.Cog):
             total_rounds = season_info[1] if season_info else 0
             regular_rounds = season_info[2] if season_info else 24
 
-            # Determine which team to show
-            filter_team_id = None
-            title_suffix = ""
-
-            if team_name and team_name.lower() == 'all':
-                # Show all teams - no suffix
-                filter_team_id = None
-                title_suffix = ""
-            elif team_name:
-                # Show specific team (exact match due to autocomplete)
-                cursor = await db.execute(
-                    "SELECT team_id, team_name FROM teams WHERE team_name = ?",
-                    (team_name,)
-                )
-                team = await cursor.fetchone()
-                if not team:
-                    await interaction.response.send_message(
-                        f"❌ Team '{team_name}' not found. Please select from the autocomplete suggestions.",
-                        ephemeral=True
-                    )
-                    return
-                filter_team_id = team[0]
-                title_suffix = f" - {team[1]}"
-            else:
-                # Default to user's team
-                cursor = await db.execute(
-                    "SELECT team_name, role_id FROM teams WHERE role_id IS NOT NULL"
-                )
-                teams = await cursor.fetchall()
-
-                user_team_id = None
-                user_team_name = None
-                for t_name, role_id in teams:
-                    role = interaction.guild.get_role(int(role_id))
-                    if role and role in interaction.user.roles:
-                        cursor = await db.execute(
-                            "SELECT team_id FROM teams WHERE team_name = ?",
-                            (t_name,)
-                        )
-                        result = await cursor.fetchone()
-                        if result:
-                            user_team_id = result[0]
-                            user_team_name = t_name
-                            break
-
-                if user_team_id:
-                    filter_team_id = user_team_id
-                    title_suffix = f" - {user_team_name}"
-                else:
-                    # User has no team, show all
-                    filter_team_id = None
-                    title_suffix = ""
-
             # Get active injuries (filtered by team if specified)
             if filter_team_id:
                 cursor = await db.execute(
-                    """SELECT p.name, i.injury_type, i.return_round, t.team_name, t.emoji_id
+                    """SELECT p.name, i.injury_type, i.return_round, p.team_id
                        FROM injuries i
                        JOIN players p ON i.player_id = p.player_id
-                       LEFT JOIN teams t ON p.team_id = t.team_id
                        WHERE i.status = 'injured' AND p.team_id = ?
                        ORDER BY i.return_round ASC, p.name ASC""",
                     (filter_team_id,)
                 )
             else:
                 cursor = await db.execute(
-                    """SELECT p.name, i.injury_type, i.return_round, t.team_name, t.emoji_id
+                    """SELECT p.name, i.injury_type, i.return_round, p.team_id
                        FROM injuries i
                        JOIN players p ON i.player_id = p.player_id
-                       LEFT JOIN teams t ON p.team_id = t.team_id
                        WHERE i.status = 'injured'
                        ORDER BY i.return_round ASC, p.name ASC"""
                 )
@@ -316,104 +305,85 @@ class InjuryCommands(commands.Cog):
             # Get active suspensions (filtered by team if specified)
             if filter_team_id:
                 cursor = await db.execute(
-                    """SELECT p.name, s.suspension_reason, s.return_round, t.team_name, t.emoji_id
+                    """SELECT p.name, s.suspension_reason, s.return_round, p.team_id
                        FROM suspensions s
                        JOIN players p ON s.player_id = p.player_id
-                       LEFT JOIN teams t ON p.team_id = t.team_id
                        WHERE s.status = 'suspended' AND p.team_id = ?
                        ORDER BY s.return_round ASC, p.name ASC""",
                     (filter_team_id,)
                 )
             else:
                 cursor = await db.execute(
-                    """SELECT p.name, s.suspension_reason, s.return_round, t.team_name, t.emoji_id
+                    """SELECT p.name, s.suspension_reason, s.return_round, p.team_id
                        FROM suspensions s
                        JOIN players p ON s.player_id = p.player_id
-                       LEFT JOIN teams t ON p.team_id = t.team_id
                        WHERE s.status = 'suspended'
                        ORDER BY s.return_round ASC, p.name ASC"""
                 )
             suspensions = await cursor.fetchall()
 
-            if not injuries and not suspensions:
-                await interaction.response.send_message("No active injuries or suspensions!")
-                return
+        if not injuries and not suspensions:
+            return None
+
+        # Build combined list
+        combined_list = []
 
-            # Build combined list
-            combined_list = []
+        # Add injuries
+        if injuries:
+            combined_list.append("**🚑 Injuries:**")
+            for name, injury_type, return_round, team_id in injuries:
+                # Calculate weeks remaining
+                weeks_left = return_round - current_round
 
-            # Add injuries
+                # Get team emoji
+                team_display = team_emojis.prefix(team_id)
+
+                if weeks_left <= 0:
+                    status = "✅ Ready to return"
+                else:
+                    week_text = "week" if weeks_left == 1 else "weeks"
+                    # Check if injury extends beyond season
+                    season_indicator = " (SEASON)" if return_round > total_rounds else ""
+                    status = f"- {weeks_left} {week_text}{season_indicator}"
+
+                combined_list.append(
+                    f"{team_display}**{name}** - {injury_type} {status}"
+                )
+
+        # Add suspensions
+        if suspensions:
             if injuries:
-                combined_list.append("**🚑 Injuries:**")
-                for name, injury_type, return_round, team_name, emoji_id in injuries:
-                    # Calculate weeks remaining
-                    weeks_left = return_round - current_round
-
-                    # Get team emoji
-                    team_display = ""
-                    if team_name:
-                        try:
-                            if emoji_id:
-                                emoji = self.bot.get_emoji(int(emoji_id))
-                                if emoji:
-                                    team_display = f"{emoji} "
-                        except:
-                            pass
-
-                    if weeks_left <= 0:
-                        status = "✅ Ready to return"
-                    else:
-                        week_text = "week" if weeks_left == 1 else "weeks"
-                        # Check if injury extends beyond season
-                        season_indicator = " (SEASON)" if return_round > total_rounds else ""
-                        status = f"- {weeks_left} {week_text}{season_indicator}"
-
-                    combined_list.append(
-                        f"{team_display}**{name}** - {injury_type} {status}"
-                    )
-
-            # Add suspensions
-            if suspensions:
-                if injuries:
-                    combined_list.append("")  # Empty line separator
-                combined_list.append("**🚫 Suspensions:**")
-                for name, suspension_reason, return_round, team_name, emoji_id in suspensions:
-                    # Calculate games remaining
-                    games_left = return_round - current_round
-
-                    # Get team emoji
-                    team_display = ""
-                    if team_name:
-                        try:
-                            if emoji_id:
-                                emoji = self.bot.get_emoji(int(emoji_id))
-                                if emoji:
-                                    team_display = f"{emoji} "
-                        except:
-                            pass
-
-                    if games_left <= 0:
-                        status = "✅ Ready to return"
-                    else:
-                        game_text = "game" if games_left == 1 else "games"
-                        # Check if suspension extends beyond season
-                        season_indicator = " (SEASON)" if return_round > total_rounds else ""
-                        status = f"- {games_left} {game_text}{season_indicator}"
-
-                    combined_list.append(
-                        f"{team_display}**{name}** - {suspension_reason} {status}"
-                    )
-
-            # Get the round name
-            round_display = get_round_name(current_round, regular_rounds) if current_round > 0 else "Offseason"
-
-            embed = discord.Embed(
-                title=f"Injury & Suspension List - {round_display}{title_suffix}",
-                description="\n".join(combined_list),
-                color=discord.Color.red()
-            )
+                combined_list.append("")  # Empty line separator
+            combined_list.append("**🚫 Suspensions:**")
+            for name, suspension_reason, return_round, team_id in suspensions:
+                # Calculate games remaining
+                games_left = return_round - current_round
+
+                # Get team emoji
+                team_display = team_emojis.prefix(team_id)
+
+                if games_left <= 0:
+                    status = "✅ Ready to return"
+                else:
+                    game_text = "game" if games_left == 1 else "games"
+                    # Check if suspension extends beyond season
+                    season_indicator = " (SEASON)" if return_round > total_rounds else ""
+                    status = f"- {games_left} {game_text}{season_indicator}"
+
+                combined_list.append(
+                    f"{team_display}**{name}** - {suspension_reason} {status}"
+                )
+
+        # Get the round name
+        round_display = get_round_name(current_round, regular_rounds) if current_round > 0 else "Offseason"
+
+        embed = discord.Embed(
+            title=f"Injury & Suspension List - {round_display}{title_suffix}",
+            description="\n".join(combined_list),
+            color=discord.Color.red()
+        )
 
-            await interaction.response.send_message(embed=embed)
+        return embed
 
     @app_commands.command(name="editinjury", description="[ADMIN] Edit a player's injury")
     @app_commands.describe(
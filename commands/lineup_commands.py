@@ -4,7 +4,9 @@ from discord import app_commands
 import aiosqlite
 import json
 from config import DB_PATH
+from settings_store import settings
 from commands.season_commands import get_round_name
+from lineup_solver import SLOT_ELIGIBILITY, INTERCHANGE_SLOTS, best_lineup
 
 # AFL lineup structure with 18 positions + 5 interchange
 AFL_POSITIONS = [
@@ -22,6 +24,181 @@ AFL_POSITIONS = [
     "INT1", "INT2", "INT3", "INT4", "INT5"
 ]
 
+
+class LineupState:
+    """
+    In-memory copy of a team's lineup for the lineup editor.
+
+    Loaded once when the editor opens, along with the injury/suspension
+    return rounds of everyone who could be picked, so warnings never need
+    the database. Edits are applied here first and only the slots they
+    touched are written back, in one transaction per edit.
+    """
+
+    def __init__(self, team_id, roster):
+        self.team_id = team_id
+        self.roster = roster
+        self.players = {player_id: (name, pos, rating) for player_id, name, pos, rating in roster}
+        self.lineup = {}  # position_name -> {'name', 'pos', 'rating', 'player_id'}
+        self.current_round = 0
+        self.injured = {}  # player_id -> return_round
+        self.suspended = {}  # player_id -> return_round
+        self.dirty = set()  # positions changed since the last flush
+
+    @classmethod
+    async def load(cls, team_id, roster):
+        """Load a team's lineup and the injury/suspension state of its players"""
+        state = cls(team_id, roster)
+
+        async with aiosqlite.connect(DB_PATH) as db:
+            cursor = await db.execute(
+                """SELECT l.position_name, p.player_id, p.name, p.position, p.overall_rating
+                   FROM lineups l
+                   JOIN players p ON l.player_id = p.player_id
+                   WHERE l.team_id = ?
+                   ORDER BY l.slot_number""",
+                (team_id,)
+            )
+            for pos_name, player_id, name, pos, rating in await cursor.fetchall():
+                state.lineup[pos_name] = {'name': name, 'pos': pos, 'rating': rating, 'player_id': player_id}
+                # Lineup players who have since left the roster still need names
+                state.players.setdefault(player_id, (name, pos, rating))
+
+            cursor = await db.execute(
+                "SELECT current_round FROM seasons WHERE status = 'active' LIMIT 1"
+            )
+            season_info = await cursor.fetchone()
+            state.current_round = season_info[0] if season_info else 0
+
+            # Injuries and suspensions for the roster and anyone still in the lineup
+            cursor = await db.execute(
+                """SELECT 'injured', player_id, MAX(return_round) FROM injuries
+                   WHERE status = 'injured'
+                     AND player_id IN (SELECT player_id FROM players WHERE team_id = ?
+                                       UNION SELECT player_id FROM lineups WHERE team_id = ?)
+                   GROUP BY player_id
+                   UNION ALL
+                   SELECT 'suspended', player_id, MAX(return_round) FROM suspensions
+                   WHERE status = 'suspended'
+                     AND player_id IN (SELECT player_id FROM players WHERE team_id = ?
+                                       UNION SELECT player_id FROM lineups WHERE team_id = ?)
+                   GROUP BY player_id""",
+                (team_id, team_id, team_id, team_id)
+            )
+            for kind, player_id, return_round in await cursor.fetchall():
+                if kind == 'injured':
+                    state.injured[player_id] = return_round
+                else:
+                    state.suspended[player_id] = return_round
+
+        return state
+
+    def assign(self, position_name, player_id):
+        """Put a player in a position, moving them out of any other position"""
+        for pos_name, player_info in list(self.lineup.items()):
+            if player_info['player_id'] == player_id and pos_name != position_name:
+                # Delete the old position entry so it shows as "Empty"
+                del self.lineup[pos_name]
+                self.dirty.add(pos_name)
+
+        name, pos, rating = self.players[player_id]
+        self.lineup[position_name] = {'name': name, 'pos': pos, 'rating': rating, 'player_id': player_id}
+        self.dirty.add(position_name)
+
+    def clear(self, position_name):
+        """Empty a position"""
+        if position_name in self.lineup:
+            del self.lineup[position_name]
+        self.dirty.add(position_name)
+
+    def unavailable(self):
+        """Ids of players who are injured or suspended for the current round"""
+        return {player_id for returns in (self.injured, self.suspended)
+                for player_id, return_round in returns.items() if return_round > self.current_round}
+
+    def auto_fill(self):
+        """
+        Replace the whole lineup with the best one from the fit roster players.
+
+        Returns:
+            int: Number of positions filled
+        """
+        unavailable = self.unavailable()
+        available = [(player_id, pos, rating) for player_id, name, pos, rating in self.roster
+                     if player_id not in unavailable]
+        best = best_lineup(AFL_POSITIONS, available)
+
+        self.lineup.clear()
+        for pos_name in AFL_POSITIONS:
+            if pos_name in best:
+                name, pos, rating = self.players[best[pos_name]]
+                self.lineup[pos_name] = {'name': name, 'pos': pos, 'rating': rating, 'player_id': best[pos_name]}
+        self.dirty.update(AFL_POSITIONS)
+        return len(best)
+
+    async def flush(self):
+        """Write every position changed since the last flush in a single transaction"""
+        if not self.dirty:
+            return
+
+        positions = sorted(self.dirty, key=AFL_POSITIONS.index)
+        rows = [
+            (self.team_id, self.lineup[pos_name]['player_id'], AFL_POSITIONS.index(pos_name) + 1, pos_name)
+            for pos_name in positions if pos_name in self.lineup
+        ]
+        placeholders = ','.join('?' * len(positions))
+        player_placeholders = ','.join('?' * len(rows))
+
+        async with aiosqlite.connect(DB_PATH) as db:
+            # Clear the touched slots, and the new players' old slots in case the table moved on without us
+            await db.execute(
+                f"""DELETE FROM lineups
+                    WHERE team_id = ? AND (position_name IN ({placeholders}) OR player_id IN ({player_placeholders}))""",
+                [self.team_id, *positions, *(row[1] for row in rows)]
+            )
+            await db.executemany(
+                "INSERT OR REPLACE INTO lineups (team_id, player_id, slot_number, position_name) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            await db.commit()
+
+        self.dirty.clear()
+
+    def get_warnings(self):
+        """Duplicate, injured and suspended player warnings for the current lineup"""
+        warnings = []
+        ordered = [self.lineup[pos_name] for pos_name in AFL_POSITIONS if pos_name in self.lineup]
+
+        # Check for duplicates
+        player_ids = [p['player_id'] for p in ordered]
+        duplicates = []
+        for p in ordered:
+            if player_ids.count(p['player_id']) > 1 and p['name'] not in duplicates:
+                duplicates.append(p['name'])
+        if duplicates:
+            warnings.append(f"⚠️ **Duplicate players:** {', '.join(duplicates)}")
+
+        # Check for injured players
+        injured = []
+        for p in ordered:
+            weeks_left = self.injured.get(p['player_id'], self.current_round) - self.current_round
+            if weeks_left > 0:
+                injured.append(f"{p['name']} ({weeks_left}w)")
+        if injured:
+            warnings.append(f"🚑 **Injured players:** {', '.join(injured)}")
+
+        # Check for suspended players
+        suspended = []
+        for p in ordered:
+            games_left = self.suspended.get(p['player_id'], self.current_round) - self.current_round
+            if games_left > 0:
+                suspended.append(f"{p['name']} ({games_left}g)")
+        if suspended:
+            warnings.append(f"🚫 **Suspended players:** {', '.join(suspended)}")
+
+        return warnings
+
+
 class LineupCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -438,12 +615,6 @@ class LineupCommands(commands.Cog):
 
             await db.commit()
 
-            # Get delist log channel
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = 'delist_log_channel_id'"
-            )
-            result = await cursor.fetchone()
-
         # Build response message
         response = ""
         if delisted_players:
@@ -461,9 +632,10 @@ class LineupCommands(commands.Cog):
         await interaction.response.send_message(response)
 
         # Log to delist channel if configured
-        if result and result[0] and delisted_players:
+        delist_channel_id = await settings.get_int('delist_log_channel_id')
+        if delist_channel_id and delisted_players:
             try:
-                log_channel = interaction.guild.get_channel(int(result[0]))
+                log_channel = interaction.guild.get_channel(delist_channel_id)
                 if log_channel:
                     if len(delisted_players) == 1:
                         full_name, position, rating, age = delisted_players[0]
@@ -621,6 +793,10 @@ class TeamLineupMenu(discord.ui.View):
         submit_btn.callback = self.submit_lineup_callback
         self.add_item(submit_btn)
 
+        auto_fill_btn = discord.ui.Button(label="⚡ Auto-fill Best Lineup", style=discord.ButtonStyle.primary, custom_id="auto_fill_lineup")
+        auto_fill_btn.callback = self.auto_fill_lineup_callback
+        self.add_item(auto_fill_btn)
+
         # Row 2: Starting lineup management
         save_btn = discord.ui.Button(label="💾 Save as Starting Lineup", style=discord.ButtonStyle.secondary, custom_id="save_starting")
         save_btn.callback = self.save_starting_lineup_callback
@@ -651,18 +827,45 @@ class TeamLineupMenu(discord.ui.View):
 
     async def edit_lineup_callback(self, interaction: discord.Interaction):
         """Open the lineup editor"""
-        # Create LineupView with current data
-        view = LineupView(self.team_id, self.team_name, [], self.roster, self.bot, self.emoji_id)
-
-        # Convert lineup dict to format expected by LineupView
-        view.lineup = self.lineup.copy()
-
-        await view.initialize()
-        view.add_position_buttons()
+        # Load the team's lineup once - the editor works from this copy
+        state = await LineupState.load(self.team_id, self.roster)
+        view = LineupView(self.team_id, self.team_name, state, self.bot, self.emoji_id)
         embed = view.create_embed()
 
         await interaction.response.edit_message(embed=embed, view=view)
 
+    async def auto_fill_lineup_callback(self, interaction: discord.Interaction):
+        """Fill the lineup with the best available players - confirm first if it would replace one"""
+        if not self.lineup:
+            await interaction.response.defer()
+            await self.do_auto_fill_lineup(interaction)
+            return
+
+        confirmation_view = ConfirmAutoFillLineupView(self)
+        message = ("⚡ **Auto-fill Lineup?**\n\nYour current lineup will be replaced with the highest rated "
+                   "players who are fit to play, each in a position they can play.")
+
+        await interaction.response.send_message(message, view=confirmation_view, ephemeral=True)
+
+    async def do_auto_fill_lineup(self, interaction: discord.Interaction):
+        """Actually auto-fill the lineup (interaction has already been responded to)"""
+        state = await LineupState.load(self.team_id, self.roster)
+        filled = state.auto_fill()
+        await state.flush()
+
+        self.lineup = {pos_name: dict(state.lineup[pos_name]) for pos_name in AFL_POSITIONS if pos_name in state.lineup}
+
+        embed = await self.create_menu_embed()
+        await self.message.edit(embed=embed, view=self)
+
+        if filled < len(AFL_POSITIONS):
+            await interaction.followup.send(
+                f"⚠️ Only {filled} fit players available - {len(AFL_POSITIONS) - filled} position(s) left empty.",
+                ephemeral=True
+            )
+        else:
+            await interaction.followup.send("✅ Lineup auto-filled!", ephemeral=True)
+
     async def submit_lineup_callback(self, interaction: discord.Interaction):
         """Submit the lineup for the current round"""
         await interaction.response.defer(ephemeral=True)
@@ -746,16 +949,12 @@ class TeamLineupMenu(discord.ui.View):
                 return
 
             # Get lineup channel
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = ?",
-                ("lineups_channel_id",)
-            )
-            result = await cursor.fetchone()
-            if not result or not result[0]:
+            lineup_channel_id = await settings.get_int('lineups_channel_id')
+            if not lineup_channel_id:
                 await interaction.followup.send("❌ Lineups channel not set! Ask an admin to use `/setlineupschannel`", ephemeral=True)
                 return
 
-            lineup_channel = self.bot.get_channel(int(result[0]))
+            lineup_channel = self.bot.get_channel(lineup_channel_id)
             if not lineup_channel:
                 await interaction.followup.send("❌ Lineup channel not found!", ephemeral=True)
                 return
@@ -1245,46 +1444,48 @@ class ConfirmClearLineupView(discord.ui.View):
         await interaction.response.edit_message(content="❌ Cancelled.", view=self)
 
 
+class ConfirmAutoFillLineupView(discord.ui.View):
+    """Confirmation view for auto-filling the lineup"""
+    def __init__(self, parent_menu):
+        super().__init__(timeout=60)
+        self.parent_menu = parent_menu
+
+    @discord.ui.button(label="✅ Confirm", style=discord.ButtonStyle.success)
+    async def confirm_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        # Disable all buttons and respond to interaction
+        for item in self.children:
+            item.disabled = True
+        await interaction.response.edit_message(view=self)
+
+        # Call the parent's do_auto_fill method
+        await self.parent_menu.do_auto_fill_lineup(interaction)
+
+    @discord.ui.button(label="❌ Cancel", style=discord.ButtonStyle.secondary)
+    async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        # Disable all buttons
+        for item in self.children:
+            item.disabled = True
+        await interaction.response.edit_message(content="❌ Cancelled.", view=self)
+
+
 class LineupView(discord.ui.View):
-    def __init__(self, team_id, team_name, current_lineup, roster, bot, emoji_id=None):
+    def __init__(self, team_id, team_name, state, bot, emoji_id=None):
         super().__init__(timeout=300)  # 5 minute timeout
         self.team_id = team_id
         self.team_name = team_name
-        self.roster = roster
+        self.state = state
+        self.lineup = state.lineup  # position_name -> player info, edited in place by state
+        self.roster = state.roster
         self.bot = bot
         self.emoji_id = emoji_id
         self.selected_position = None  # Track which position is being edited
         self.player_page = 0  # Current page of players in dropdown
-        self.warnings = []  # Store lineup warnings
-
-        # Build lineup dict (position_name -> player info)
-        self.lineup = {}
-        for pos_name, name, pos, rating in current_lineup:
-            self.lineup[pos_name] = {'name': name, 'pos': pos, 'rating': rating, 'player_id': None}
+        self.warnings = state.get_warnings()  # Store lineup warnings
 
         # Add position buttons
         self.current_group = 0  # 0=backs, 1=mids, 2=forwards, 3=interchange
         self.add_position_buttons()
 
-    async def initialize(self):
-        """Initialize player IDs and warnings (call this after creating the view)"""
-        await self.refresh_lineup_ids()
-        await self.update_warnings()
-    
-    async def refresh_lineup_ids(self):
-        """Get player IDs for current lineup players"""
-        async with aiosqlite.connect(DB_PATH) as db:
-            for pos_name in self.lineup:
-                cursor = await db.execute(
-                    """SELECT p.player_id FROM lineups l
-                       JOIN players p ON l.player_id = p.player_id
-                       WHERE l.team_id = ? AND l.position_name = ?""",
-                    (self.team_id, pos_name)
-                )
-                result = await cursor.fetchone()
-                if result:
-                    self.lineup[pos_name]['player_id'] = result[0]
-    
     def add_position_buttons(self):
         """Add buttons for current position group"""
         self.clear_items()
@@ -1329,26 +1530,11 @@ class LineupView(discord.ui.View):
         if not self.selected_position:
             return self.roster
         
-        # Define position priorities
-        defensive_positions = ["LBP", "FB", "RBP", "LHB", "CHB", "RHB"]
-        midfield_positions = ["LW", "C", "RW", "R", "RR", "RO"]
-        forward_positions = ["LHF", "CHF", "RHF", "LFP", "FF", "RFP"]
-
-        # Define preferred player positions for each field position type
-        if self.selected_position in defensive_positions:
-            priority_positions = ["GEN DEF", "KEY DEF", "DEF-MID", "RUCK-DEF", "UTILITY", "SWINGMAN"]
-        elif self.selected_position in midfield_positions:
-            # Prioritize ruck positions for R only
-            if self.selected_position == "R":
-                priority_positions = ["RUCK", "RUCK-DEF", "RUCK-FWD"]
-            else:
-                # LW, C, RW, RR, RO prioritize midfield positions
-                priority_positions = ["MID", "MID-FWD", "DEF-MID", "UTILITY"]
-        elif self.selected_position in forward_positions:
-            priority_positions = ["GEN FWD", "KEY FWD", "MID-FWD", "RUCK-FWD", "UTILITY", "SWINGMAN"]
-        else:  # Interchange
+        # Players eligible for the position come first
+        if self.selected_position in INTERCHANGE_SLOTS:
             return self.roster  # No sorting for interchange
-        
+        priority_positions = SLOT_ELIGIBILITY[self.selected_position]
+
         # Get players already in lineup
         used_ids = {p.get('player_id') for p in self.lineup.values() if p.get('player_id')}
         
@@ -1367,107 +1553,6 @@ class LineupView(discord.ui.View):
         """Get count of all players (no filtering - all players can be moved)"""
         return len(self.roster)
 
-    def get_duplicate_players(self):
-        """Check for duplicate players in lineup - returns list of player names that appear more than once"""
-        player_ids = [p.get('player_id') for p in self.lineup.values() if p.get('player_id')]
-        duplicates = []
-        seen = set()
-        for pos_name, player_info in self.lineup.items():
-            player_id = player_info.get('player_id')
-            if player_id and player_ids.count(player_id) > 1 and player_id not in seen:
-                duplicates.append(player_info['name'])
-                seen.add(player_id)
-        return duplicates
-
-    async def get_injured_players(self):
-        """Check for injured players in lineup - returns list of (player_name, weeks_left) tuples"""
-        injured = []
-        player_ids = [p.get('player_id') for p in self.lineup.values() if p.get('player_id')]
-
-        if not player_ids:
-            return injured
-
-        async with aiosqlite.connect(DB_PATH) as db:
-            # Get current round
-            cursor = await db.execute(
-                "SELECT current_round FROM seasons WHERE status = 'active' LIMIT 1"
-            )
-            season_info = await cursor.fetchone()
-            current_round = season_info[0] if season_info else 0
-
-            # Check for injuries
-            placeholders = ','.join('?' * len(player_ids))
-            cursor = await db.execute(
-                f"""SELECT p.name, i.return_round
-                   FROM injuries i
-                   JOIN players p ON i.player_id = p.player_id
-                   WHERE i.player_id IN ({placeholders}) AND i.status = 'injured'""",
-                player_ids
-            )
-            injuries = await cursor.fetchall()
-
-            for name, return_round in injuries:
-                weeks_left = return_round - current_round
-                if weeks_left > 0:
-                    injured.append((name, weeks_left))
-
-        return injured
-
-    async def get_suspended_players(self):
-        """Check for suspended players in lineup - returns list of (player_name, games_left) tuples"""
-        suspended = []
-        player_ids = [p.get('player_id') for p in self.lineup.values() if p.get('player_id')]
-
-        if not player_ids:
-            return suspended
-
-        async with aiosqlite.connect(DB_PATH) as db:
-            # Get current round
-            cursor = await db.execute(
-                "SELECT current_round FROM seasons WHERE status = 'active' LIMIT 1"
-            )
-            season_info = await cursor.fetchone()
-            current_round = season_info[0] if season_info else 0
-
-            # Check for suspensions
-            placeholders = ','.join('?' * len(player_ids))
-            cursor = await db.execute(
-                f"""SELECT p.name, s.return_round
-                   FROM suspensions s
-                   JOIN players p ON s.player_id = p.player_id
-                   WHERE s.player_id IN ({placeholders}) AND s.status = 'suspended'""",
-                player_ids
-            )
-            suspensions = await cursor.fetchall()
-
-            for name, return_round in suspensions:
-                games_left = return_round - current_round
-                if games_left > 0:
-                    suspended.append((name, games_left))
-
-        return suspended
-
-    async def update_warnings(self):
-        """Update the warnings list based on current lineup"""
-        self.warnings = []
-
-        # Check for duplicates
-        duplicates = self.get_duplicate_players()
-        if duplicates:
-            self.warnings.append(f"⚠️ **Duplicate players:** {', '.join(duplicates)}")
-
-        # Check for injured players
-        injured = await self.get_injured_players()
-        if injured:
-            injured_str = ', '.join([f"{name} ({weeks}w)" for name, weeks in injured])
-            self.warnings.append(f"🚑 **Injured players:** {injured_str}")
-
-        # Check for suspended players
-        suspended = await self.get_suspended_players()
-        if suspended:
-            suspended_str = ', '.join([f"{name} ({games}g)" for name, games in suspended])
-            self.warnings.append(f"🚫 **Suspended players:** {suspended_str}")
-
     def create_embed(self):
         """Create the lineup display embed"""
         rows = [
@@ -1594,21 +1679,14 @@ class ClearPositionButton(discord.ui.Button):
     
     async def callback(self, interaction: discord.Interaction):
         pos_name = self.parent_view.selected_position
-        
-        # Remove from database
-        async with aiosqlite.connect(DB_PATH) as db:
-            await db.execute(
-                "DELETE FROM lineups WHERE team_id = ? AND position_name = ?",
-                (self.parent_view.team_id, pos_name)
-            )
-            await db.commit()
-        
-        # Remove from lineup
-        if pos_name in self.parent_view.lineup:
-            del self.parent_view.lineup[pos_name]
+
+        # Remove from lineup and database
+        state = self.parent_view.state
+        state.clear(pos_name)
+        await state.flush()
 
         # Update warnings and refresh view
-        await self.parent_view.update_warnings()
+        self.parent_view.warnings = state.get_warnings()
         self.parent_view.add_position_buttons()
         embed = self.parent_view.create_embed()
 
@@ -1717,49 +1795,15 @@ class PlayerSelect(discord.ui.Select):
             return
         
         player_id = int(self.values[0])
-        
-        # Get slot number for this position
-        slot_number = AFL_POSITIONS.index(self.position_name) + 1
-        
-        # Update lineup in database
-        async with aiosqlite.connect(DB_PATH) as db:
-            # Remove player from any existing position
-            await db.execute(
-                "DELETE FROM lineups WHERE team_id = ? AND player_id = ?",
-                (self.parent_view.team_id, player_id)
-            )
-            
-            # Add to new position
-            await db.execute(
-                "INSERT OR REPLACE INTO lineups (team_id, player_id, slot_number, position_name) VALUES (?, ?, ?, ?)",
-                (self.parent_view.team_id, player_id, slot_number, self.position_name)
-            )
-            await db.commit()
-            
-            # Get player info
-            cursor = await db.execute(
-                "SELECT name, position, overall_rating FROM players WHERE player_id = ?",
-                (player_id,)
-            )
-            name, pos, rating = await cursor.fetchone()
 
-        # Remove player from old position in lineup dict (if they were in a different position)
-        for pos_name, player_info in list(self.parent_view.lineup.items()):
-            if player_info.get('player_id') == player_id and pos_name != self.position_name:
-                # Delete the old position entry so it shows as "Empty"
-                del self.parent_view.lineup[pos_name]
-
-        # Update parent view with new position
-        self.parent_view.lineup[self.position_name] = {
-            'name': name,
-            'pos': pos,
-            'rating': rating,
-            'player_id': player_id
-        }
+        # Move the player into this position (and out of any other) and save
+        state = self.parent_view.state
+        state.assign(self.position_name, player_id)
+        await state.flush()
 
         # Reset to first page, update warnings, and refresh view
         self.parent_view.player_page = 0
-        await self.parent_view.update_warnings()
+        self.parent_view.warnings = state.get_warnings()
         self.parent_view.add_position_buttons()
         embed = self.parent_view.create_embed()
 
@@ -1772,19 +1816,8 @@ class MainMenuButton(discord.ui.Button):
         self.parent_view = parent_view
 
     async def callback(self, interaction: discord.Interaction):
-        # Return to TeamLineupMenu
+        # Return to TeamLineupMenu (the editor's state already matches the database)
         async with aiosqlite.connect(DB_PATH) as db:
-            # Get updated lineup
-            cursor = await db.execute(
-                """SELECT l.position_name, p.name, p.position, p.overall_rating, p.player_id
-                   FROM lineups l
-                   JOIN players p ON l.player_id = p.player_id
-                   WHERE l.team_id = ?
-                   ORDER BY l.slot_number""",
-                (self.parent_view.team_id,)
-            )
-            lineup_data = await cursor.fetchall()
-
             # Check if starting lineup exists
             cursor = await db.execute(
                 "SELECT 1 FROM starting_lineups WHERE team_id = ?",
@@ -1792,10 +1825,9 @@ class MainMenuButton(discord.ui.Button):
             )
             has_starting_lineup = await cursor.fetchone() is not None
 
-        # Build lineup dict
-        lineup = {}
-        for pos_name, name, pos, rating, player_id in lineup_data:
-            lineup[pos_name] = {'name': name, 'pos': pos, 'rating': rating, 'player_id': player_id}
+        # Build lineup dict in slot order
+        lineup = {pos_name: dict(self.parent_view.lineup[pos_name])
+                  for pos_name in AFL_POSITIONS if pos_name in self.parent_view.lineup}
 
         # Create TeamLineupMenu
         menu_view = TeamLineupMenu(
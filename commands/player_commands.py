@@ -3,22 +3,14 @@ from discord.ext import commands
 from discord import app_commands
 import aiosqlite
 from config import DB_PATH
+from team_emojis import team_emojis
+from render_cache import render_cache
+from deferral import auto_defer
 
 class PlayerCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-    def get_team_emoji(self, emoji_id: str) -> str:
-        """Get server emoji by ID, return empty string if not found."""
-        if not emoji_id:
-            return ""
-        try:
-            # Server emojis are accessed via bot.get_emoji(id)
-            emoji = self.bot.get_emoji(int(emoji_id))
-            return str(emoji) if emoji else ""
-        except:
-            return ""
-
     async def player_name_autocomplete(
         self,
         interaction: discord.Interaction,
@@ -75,7 +67,7 @@ class PlayerCommands(commands.Cog):
             # Search for each term
             for search_term in search_terms:
                 cursor = await db.execute(
-                    """SELECT p.player_id, p.name, p.position, p.overall_rating, p.age, t.team_name, t.emoji_id
+                    """SELECT p.player_id, p.name, p.position, p.overall_rating, p.age, t.team_name, p.team_id
                        FROM players p
                        LEFT JOIN teams t ON p.team_id = t.team_id
                        WHERE p.name LIKE ?
@@ -104,13 +96,9 @@ class PlayerCommands(commands.Cog):
 
             # Show list view for all results (single or multiple)
             player_list = []
-            for player_id, p_name, pos, rating, age, team, emoji_id in unique_players:
+            for player_id, p_name, pos, rating, age, team, team_id in unique_players:
                 # Build team display
-                if team:
-                    emoji = self.get_team_emoji(emoji_id)
-                    team_prefix = f"{emoji} " if emoji else ""
-                else:
-                    team_prefix = ""
+                team_prefix = team_emojis.prefix(team_id) if team else ""
 
                 # Hide OVR for draft pool players
                 if team == "Draft Pool":
@@ -178,61 +166,50 @@ class PlayerCommands(commands.Cog):
         app_commands.Choice(name="Age (Youngest to Oldest)", value="age_asc"),
         app_commands.Choice(name="Position", value="position"),
     ])
+    @auto_defer(ephemeral=True)
     async def roster(self, interaction: discord.Interaction, team_name: str = None, sort_by: str = "position"):
-        async with aiosqlite.connect(DB_PATH) as db:
-            # If no team specified, get user's team
-            if not team_name:
-                # Get all teams with their roles
-                cursor = await db.execute("SELECT team_name, role_id, emoji_id FROM teams WHERE role_id IS NOT NULL")
-                teams = await cursor.fetchall()
-
-                # Check which team role the user has
-                user_team = None
-                user_emoji_id = None
-                for t_name, role_id, e_id in teams:
-                    role = interaction.guild.get_role(int(role_id))
-                    if role and role in interaction.user.roles:
-                        user_team = t_name
-                        user_emoji_id = e_id
-                        break
-
-                if not user_team:
-                    await interaction.response.send_message(
-                        "❌ You don't have a team role! Specify a team name to view their roster.",
-                        ephemeral=True
-                    )
-                    return
-
-                # Get team ID for user's team
-                cursor = await db.execute(
-                    "SELECT team_id FROM teams WHERE team_name = ?",
-                    (user_team,)
+        # If no team specified, get user's team
+        if not team_name:
+            team = await render_cache.team_for_member(interaction.user)
+            if team is None:
+                await interaction.response.send_message(
+                    "❌ You don't have a team role! Specify a team name to view their roster.",
+                    ephemeral=True
                 )
-                result = await cursor.fetchone()
-                team_id = result[0]
-                t_name = user_team
-                emoji_id = user_emoji_id
-            else:
-                # Get team info by name (exact match due to autocomplete)
-                cursor = await db.execute(
-                    """SELECT team_id, team_name, emoji_id FROM teams WHERE team_name = ?""",
-                    (team_name,)
+                return
+        else:
+            # Get team info by name (exact match due to autocomplete)
+            team = await render_cache.team_named(team_name)
+            if not team:
+                await interaction.response.send_message(
+                    f"❌ Team '{team_name}' not found. Please select from the autocomplete suggestions.",
+                    ephemeral=True
                 )
-                team = await cursor.fetchone()
+                return
+
+        team_id, t_name = team
+        # Everyone viewing this roster in this order gets the same embed until the roster changes
+        embed = await render_cache.get(
+            'roster', team_id, sort_by, lambda: self.build_roster_embed(team_id, t_name, sort_by)
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
-                if not team:
-                    await interaction.response.send_message(
-                        f"❌ Team '{team_name}' not found. Please select from the autocomplete suggestions.",
-                        ephemeral=True
-                    )
-                    return
+    async def build_roster_embed(self, team_id, t_name, sort_by):
+        """
+        Render a team's roster.
 
-                team_id, t_name, emoji_id = team
-            
-            # Build team title
-            emoji = self.get_team_emoji(emoji_id)
-            team_title = f"{emoji} {t_name}" if emoji else t_name
-            
+        Args:
+            team_id: Team to show
+            t_name: The team's name
+            sort_by: One of the /roster sort_by choices
+
+        Returns:
+            discord.Embed: The roster
+        """
+        # Build team title
+        team_title = f"{team_emojis.prefix(team_id)}{t_name}"
+
+        async with aiosqlite.connect(DB_PATH) as db:
             # Build ORDER BY clause
             if sort_by == "ovr_desc":
                 order_clause = "overall_rating DESC, age ASC"
@@ -315,7 +292,7 @@ class PlayerCommands(commands.Cog):
                 embed.description = "No players on this team"
                 embed.set_footer(text="0 players")
 
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        return embed
 
     @app_commands.command(name="filterplayers", description="Search for players with filters")
     @app_commands.describe(
@@ -344,6 +321,7 @@ class PlayerCommands(commands.Cog):
         app_commands.Choice(name="Age (Youngest to Oldest)", value="age_asc"),
         app_commands.Choice(name="Position", value="position"),
     ])
+    @auto_defer(ephemeral=True)
     async def search_players(
         self,
         interaction: discord.Interaction,
@@ -361,7 +339,7 @@ class PlayerCommands(commands.Cog):
     ):
         async with aiosqlite.connect(DB_PATH) as db:
             # Build the query dynamically based on filters
-            query = """SELECT p.name, p.position, p.overall_rating, p.age, t.team_name, t.emoji_id
+            query = """SELECT p.name, p.position, p.overall_rating, p.age, t.team_name, p.team_id
                        FROM players p
                        LEFT JOIN teams t ON p.team_id = t.team_id
                        WHERE 1=1"""
@@ -522,12 +500,8 @@ class SearchPlayersView(discord.ui.View):
         
         # Build player list with emojis
         player_lines = []
-        for name, pos, rating, age, team, emoji_id in page_players:
-            if team:
-                emoji = self.cog.get_team_emoji(emoji_id)
-                team_prefix = f"{emoji} " if emoji else ""
-            else:
-                team_prefix = ""
+        for name, pos, rating, age, team, team_id in page_players:
+            team_prefix = team_emojis.prefix(team_id) if team else ""
 
             # Hide OVR for Draft Pool players
             if team == "Draft Pool":
@@ -2,7 +2,15 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import aiosqlite
+import asyncio
+import random
 from config import DB_PATH, ADMIN_ROLE_ID
+from deferral import auto_defer
+from settings_store import settings
+from excel_io import run_in_worker
+import match_engine
+import fixture_generator
+import metrics
 
 # Finals structure - added after regular season
 FINALS_ROUNDS = [
@@ -99,14 +107,93 @@ async def ensure_future_seasons_exist(db, current_season_number, num_future=2, d
     await db.commit()
     return created_seasons
 
+async def get_ladder(db, season_id):
+    """
+    Get a season's ladder from the ladder_standings table.
+
+    Costs one row per team however many matches have been played - the
+    standings are kept up to date by triggers on matches.
+
+    Returns:
+        list: (team_id, team_name, emoji_id, played, wins, losses, draws, points_for,
+               points_against, percentage, premiership_points) in ladder order
+    """
+    cursor = await db.execute(
+        """SELECT t.team_id, t.team_name, t.emoji_id,
+                  IFNULL(ls.played, 0), IFNULL(ls.wins, 0), IFNULL(ls.losses, 0), IFNULL(ls.draws, 0),
+                  IFNULL(ls.points_for, 0), IFNULL(ls.points_against, 0)
+           FROM teams t
+           LEFT JOIN ladder_standings ls ON ls.team_id = t.team_id AND ls.season_id = ?
+           WHERE t.team_name != 'Draft Pool'""",
+        (season_id,)
+    )
+    ladder = []
+    for row in await cursor.fetchall():
+        wins, draws, points_for, points_against = row[4], row[6], row[7], row[8]
+        percentage = 100.0 * points_for / points_against if points_against else (float('inf') if points_for else 0.0)
+        ladder.append((*row, percentage, 4 * wins + 2 * draws))
+
+    # Premiership points, then percentage, then points for
+    ladder.sort(key=lambda row: (-row[10], -row[9], -row[7], row[1]))
+    return ladder
+
+
+async def reconcile_ladder(db):
+    """
+    Check ladder_standings against the matches table and fix any drift.
+
+    The standings are maintained by triggers on matches, so this should find
+    nothing - apart from backfilling results entered before the table existed.
+    The caller commits.
+
+    Returns:
+        list: (season_id, team_id) for each corrected row
+    """
+    cursor = await db.execute(
+        f"""SELECT season_id, team_id, COUNT(*),
+                   SUM(points_for > points_against), SUM(points_for < points_against), SUM(points_for = points_against),
+                   SUM(points_for), SUM(points_against)
+            FROM (SELECT season_id, home_team_id AS team_id,
+                         IFNULL(home_score, 0) AS points_for, IFNULL(away_score, 0) AS points_against
+                  FROM matches WHERE {match_engine.MATCH_HAS_RESULT_SQL} AND home_team_id <> away_team_id
+                  UNION ALL
+                  SELECT season_id, away_team_id,
+                         IFNULL(away_score, 0), IFNULL(home_score, 0)
+                  FROM matches WHERE {match_engine.MATCH_HAS_RESULT_SQL} AND home_team_id <> away_team_id)
+            WHERE season_id IS NOT NULL AND team_id IS NOT NULL
+            GROUP BY season_id, team_id"""
+    )
+    actual = {(row[0], row[1]): tuple(row[2:]) for row in await cursor.fetchall()}
+
+    cursor = await db.execute(
+        """SELECT season_id, team_id, played, wins, losses, draws, points_for, points_against
+           FROM ladder_standings"""
+    )
+    standings = {(row[0], row[1]): tuple(row[2:]) for row in await cursor.fetchall()}
+
+    empty = (0,) * 6
+    drift = [key for key in actual.keys() | standings.keys() if standings.get(key, empty) != actual.get(key, empty)]
+
+    await db.executemany(
+        """INSERT OR REPLACE INTO ladder_standings
+           (season_id, team_id, played, wins, losses, draws, points_for, points_against)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        [(*key, *actual.get(key, empty)) for key in drift]
+    )
+    return drift
+
+
 class SeasonCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        # season_id -> (cache key, projections) for /projections
+        self.projections_cache = {}
+        self.projections_lock = asyncio.Lock()
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Check if user has admin permissions for admin commands"""
         # Check if command is a public command
-        if interaction.command.name in ['currentseason']:
+        if interaction.command.name in ['currentseason', 'ladder', 'projections']:
             return True
 
         # Admin check for other commands
@@ -528,6 +615,8 @@ class SeasonCommands(commands.Cog):
                     await db.execute("ALTER TABLE draft_picks ADD COLUMN picked_at TIMESTAMP")
 
                 await db.commit()
+                # The migration may have created the settings table or added season_1_year
+                settings.invalidate()
 
                 await interaction.followup.send(
                     "✅ Database migrated successfully!\n"
@@ -719,12 +808,8 @@ class SeasonCommands(commands.Cog):
 
             # Update player ages at START of new season
             # The new season (season_number + 1) is starting, so age players for that year
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = 'season_1_year'"
-            )
-            setting_result = await cursor.fetchone()
-            if setting_result:
-                season_1_year = int(setting_result[0])
+            season_1_year = await settings.get_int('season_1_year')
+            if season_1_year is not None:
                 # Calculate the year for the NEW season that's about to start
                 new_season_year = season_1_year + season_number  # season_number is the offseason, +1 is the new season
                 await db.execute(
@@ -805,6 +890,7 @@ class SeasonCommands(commands.Cog):
             await interaction.followup.send(message, ephemeral=True)
 
     @app_commands.command(name="nextround", description="[ADMIN] Advance to the next round")
+    @auto_defer(ephemeral=False)
     async def next_round(self, interaction: discord.Interaction):
         async with aiosqlite.connect(DB_PATH) as db:
             # Get active season
@@ -842,6 +928,7 @@ class SeasonCommands(commands.Cog):
                 (next_round_num, next_round_name, season_id)
             )
             await db.commit()
+            self.projections_cache.clear()
 
             # Check for players who have recovered from injuries
             cursor = await db.execute(
@@ -1000,10 +1087,182 @@ class SeasonCommands(commands.Cog):
                 f"✅ Skipped to **{round_name}** of Season {season_number}"
             )
 
+    @app_commands.command(name="simulateround", description="[ADMIN] Simulate a round's fixtures from submitted lineups")
+    @app_commands.describe(
+        round_number="Round to simulate (default: current round)",
+        seed="RNG seed to replay a simulation (default: random)",
+        resimulate="Also redo matches that were already simulated"
+    )
+    async def simulate_round(self, interaction: discord.Interaction, round_number: int = None,
+                             seed: int = None, resimulate: bool = False):
+        await interaction.response.defer()
+
+        async with aiosqlite.connect(DB_PATH) as db:
+            # Get active season
+            cursor = await db.execute(
+                """SELECT season_id, season_number, current_round, regular_rounds
+                   FROM seasons WHERE status = 'active' LIMIT 1"""
+            )
+            season = await cursor.fetchone()
+
+            if not season:
+                await interaction.followup.send("❌ No active season! Start a season first with `/startseason`.")
+                return
+
+            season_id, season_number, current_round, regular_rounds = season
+            if round_number is None:
+                round_number = current_round
+            round_name = get_round_name(round_number, regular_rounds)
+
+            seed, results, missing = await match_engine.simulate_round(db, season_id, round_number, seed, resimulate)
+            await db.commit()
+
+            if not results:
+                await interaction.followup.send(f"❌ No unplayed fixtures in **{round_name}** of Season {season_number}!")
+                return
+
+            cursor = await db.execute("SELECT team_id, team_name FROM teams")
+            team_names = dict(await cursor.fetchall())
+
+        lines = []
+        for _, home_id, away_id, home_score, away_score in results:
+            home_name = team_names.get(home_id, "Unknown Team")
+            away_name = team_names.get(away_id, "Unknown Team")
+            if home_score > away_score:
+                lines.append(f"**{home_name}** {home_score} def. {away_name} {away_score}")
+            elif away_score > home_score:
+                lines.append(f"**{away_name}** {away_score} def. {home_name} {home_score}")
+            else:
+                lines.append(f"{home_name} {home_score} drew with {away_name} {away_score}")
+
+        message = f"🏉 **{round_name} Results** (Season {season_number})\n\n" + "\n".join(lines)
+        if missing:
+            message += "\n\n⚠️ No lineup submitted: " + ", ".join(team_names.get(team_id, "Unknown Team") for team_id in missing)
+        message += f"\n\nSeed: `{seed}`"
+
+        await interaction.followup.send(message)
+
+    @app_commands.command(name="generatefixtures", description="[ADMIN] Generate a season's home/away fixtures")
+    @app_commands.describe(
+        season_number="Season to draw (default: active season, otherwise the next future season)",
+        seed="RNG seed to reproduce a draw (default: random)",
+        replace="Replace existing fixtures (only if none have been played)",
+        shared_grounds="Teams sharing a home ground, e.g. 'Team A/Team B, Team C/Team D'",
+        max_streak="Most consecutive home or away games for any team"
+    )
+    async def generate_fixtures(self, interaction: discord.Interaction, season_number: int = None,
+                                seed: int = None, replace: bool = False, shared_grounds: str = None,
+                                max_streak: int = None):
+        await interaction.response.defer(ephemeral=True)
+
+        async with aiosqlite.connect(DB_PATH) as db:
+            if season_number is None:
+                cursor = await db.execute(
+                    """SELECT season_id, season_number, regular_rounds FROM seasons
+                       WHERE status IN ('active', 'future')
+                       ORDER BY CASE status WHEN 'active' THEN 1 ELSE 2 END, season_number
+                       LIMIT 1"""
+                )
+            else:
+                cursor = await db.execute(
+                    "SELECT season_id, season_number, regular_rounds FROM seasons WHERE season_number = ?",
+                    (season_number,)
+                )
+            season = await cursor.fetchone()
+
+            if not season:
+                await interaction.followup.send("❌ Season not found!", ephemeral=True)
+                return
+
+            season_id, season_number, regular_rounds = season
+
+            cursor = await db.execute(
+                f"""SELECT COUNT(*), COUNT(*) FILTER (WHERE {match_engine.MATCH_HAS_RESULT_SQL})
+                    FROM matches WHERE season_id = ?""",
+                (season_id,)
+            )
+            existing, played = await cursor.fetchone()
+
+            if played:
+                await interaction.followup.send(
+                    f"❌ Season {season_number} already has {played} played match(es) - its fixtures can't be regenerated.",
+                    ephemeral=True
+                )
+                return
+            if existing and not replace:
+                await interaction.followup.send(
+                    f"❌ Season {season_number} already has {existing} fixtures. Use `replace: True` to redraw them.",
+                    ephemeral=True
+                )
+                return
+
+            cursor = await db.execute(
+                "SELECT team_id, team_name FROM teams WHERE team_name != 'Draft Pool' ORDER BY team_id"
+            )
+            teams = await cursor.fetchall()
+
+            if len(teams) < 2:
+                await interaction.followup.send("❌ Need at least 2 teams to generate fixtures!", ephemeral=True)
+                return
+
+            # Resolve "Team A/Team B" pairs by name
+            team_ids_by_name = {team_name.lower(): team_id for team_id, team_name in teams}
+            ground_pairs = []
+            for pair in (shared_grounds or "").split(','):
+                if not pair.strip():
+                    continue
+                names = [name.strip() for name in pair.split('/')]
+                pair_ids = [team_ids_by_name.get(name.lower()) for name in names]
+                if len(names) != 2 or None in pair_ids:
+                    await interaction.followup.send(
+                        f"❌ Couldn't read shared ground `{pair.strip()}` - use two team names separated by `/`.",
+                        ephemeral=True
+                    )
+                    return
+                ground_pairs.append(tuple(pair_ids))
+
+            if seed is None:
+                seed = random.randrange(2 ** 31)
+            team_ids = [team_id for team_id, _ in teams]
+            fixtures, violations = fixture_generator.generate_fixtures(team_ids, regular_rounds, seed, ground_pairs, max_streak)
+
+            problems = fixture_generator.check_balance(fixtures, team_ids, regular_rounds)
+            if problems:
+                print(f"Fixture draw for season {season_number} (seed {seed}) is unbalanced: {problems}")
+                await interaction.followup.send(
+                    f"❌ Generated draw failed its balance check - try another seed.\n" + "\n".join(problems[:5]),
+                    ephemeral=True
+                )
+                return
+
+            # Whole season in one transaction
+            await db.execute("DELETE FROM matches WHERE season_id = ?", (season_id,))
+            await db.executemany(
+                """INSERT INTO matches (season_id, round_number, home_team_id, away_team_id)
+                   VALUES (?, ?, ?, ?)""",
+                [(season_id, round_number, home_id, away_id) for round_number, home_id, away_id in fixtures]
+            )
+            await db.commit()
+
+        self.projections_cache.pop(season_id, None)
+
+        message = (
+            f"✅ Generated **{len(fixtures)} fixtures** for Season {season_number} "
+            f"({len(teams)} teams, {regular_rounds} rounds)"
+        )
+        if existing:
+            message += f"\nReplaced {existing} existing fixtures."
+        if violations:
+            message += f"\n\n⚠️ Best draw found still breaks the shared ground/streak constraints {violations} time(s)."
+        message += f"\n\nSeed: `{seed}`"
+
+        await interaction.followup.send(message, ephemeral=True)
+
     @app_commands.command(name="endseason", description="[ADMIN] End the current season and create offseason")
     @app_commands.describe(
         next_season_rounds="Number of rounds for next season (default: same as current season)"
     )
+    @auto_defer(ephemeral=True)
     async def end_season(self, interaction: discord.Interaction, next_season_rounds: int = None):
         async with aiosqlite.connect(DB_PATH) as db:
             # Get active season
@@ -1124,5 +1383,132 @@ class SeasonCommands(commands.Cog):
 
             await interaction.response.send_message(embed=embed)
 
+    @app_commands.command(name="ladder", description="View the season ladder")
+    @app_commands.describe(season_number="Season to view (default: current season)")
+    async def ladder(self, interaction: discord.Interaction, season_number: int = None):
+        async with aiosqlite.connect(DB_PATH) as db:
+            if season_number is None:
+                cursor = await db.execute(
+                    """SELECT season_id, season_number FROM seasons
+                       ORDER BY
+                           CASE status
+                               WHEN 'active' THEN 1
+                               WHEN 'offseason' THEN 2
+                               ELSE 3
+                           END,
+                           season_number DESC
+                       LIMIT 1"""
+                )
+            else:
+                cursor = await db.execute(
+                    "SELECT season_id, season_number FROM seasons WHERE season_number = ?",
+                    (season_number,)
+                )
+            season = await cursor.fetchone()
+
+            if not season:
+                await interaction.response.send_message("❌ Season not found!", ephemeral=True)
+                return
+
+            season_id, season_number = season
+            ladder = await get_ladder(db, season_id)
+
+        if not ladder:
+            await interaction.response.send_message("❌ No teams found!", ephemeral=True)
+            return
+
+        name_width = max(len(row[1]) for row in ladder)
+        lines = [f"{'#':>2} {'Team':<{name_width}} {'P':>2} {'W':>2} {'L':>2} {'D':>2} {'PF':>5} {'PA':>5} {'%':>6} {'Pts':>3}"]
+        for position, (_, team_name, _, played, wins, losses, draws, points_for, points_against, percentage, points) in enumerate(ladder, 1):
+            percentage_text = f"{percentage:.1f}" if percentage != float('inf') else "-"
+            lines.append(
+                f"{position:>2} {team_name:<{name_width}} {played:>2} {wins:>2} {losses:>2} {draws:>2} "
+                f"{points_for:>5} {points_against:>5} {percentage_text:>6} {points:>3}"
+            )
+
+        embed = discord.Embed(
+            title=f"🏆 Season {season_number} Ladder",
+            description="```\n" + "\n".join(lines) + "\n```",
+            color=discord.Color.gold()
+        )
+        await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="projections", description="Projected finals odds, ladder finish and draft pick for every team")
+    async def projections(self, interaction: discord.Interaction):
+        await interaction.response.defer()
+
+        async with aiosqlite.connect(DB_PATH) as db:
+            cursor = await db.execute(
+                """SELECT season_id, season_number, current_round, regular_rounds
+                   FROM seasons WHERE status = 'active' LIMIT 1"""
+            )
+            season = await cursor.fetchone()
+
+            if not season:
+                await interaction.followup.send("❌ No active season!")
+                return
+
+            season_id, season_number, current_round, regular_rounds = season
+
+            ladder = await get_ladder(db, season_id)
+            if not ladder:
+                await interaction.followup.send("❌ No teams found!")
+                return
+
+            # Projections are cached per round and per team standings - a new or corrected
+            # result changes some team's wins, draws or scores even when the season totals don't
+            standings = [(team_id, wins, draws, points_for, points_against)
+                         for team_id, _, _, _, wins, _, draws, points_for, points_against, _, _ in ladder]
+            cache_key = (current_round, tuple(sorted(standings)))
+
+            cached = self.projections_cache.get(season_id)
+            stale = not cached or cached[0] != cache_key
+            metrics.cache_lookup('projections', not stale)
+            if stale:
+                cursor = await db.execute(
+                    f"""SELECT home_team_id, away_team_id FROM matches
+                        WHERE season_id = ? AND round_number <= ? AND NOT {match_engine.MATCH_HAS_RESULT_SQL}""",
+                    (season_id, regular_rounds)
+                )
+                fixtures = await cursor.fetchall()
+
+                team_ids = [row[0] for row in ladder]
+                strengths, _ = await match_engine.load_team_strengths(db, season_id, current_round, team_ids)
+
+        if stale:
+            # One simulation at a time - anyone waiting picks up the fresh result
+            async with self.projections_lock:
+                cached = self.projections_cache.get(season_id)
+                if not cached or cached[0] != cache_key:
+                    projections = await run_in_worker(
+                        match_engine.project_season, standings, fixtures, strengths,
+                        match_engine.PROJECTION_SIMULATIONS, season_id * 1000 + current_round
+                    )
+                    cached = self.projections_cache[season_id] = (cache_key, projections)
+
+        projections = cached[1]
+        rows = sorted(
+            ((team_name, *projections[team_id]) for team_id, team_name, *_ in ladder if team_id in projections),
+            key=lambda row: row[2]
+        )
+
+        name_width = max(len(row[0]) for row in rows)
+        lines = [f"{'Team':<{name_width}} {'Finals':>6} {'Pos':>4} {'Pick':>4}"]
+        for team_name, finals_probability, expected_position, expected_pick in rows:
+            lines.append(
+                f"{team_name:<{name_width}} {finals_probability * 100:>5.1f}% {expected_position:>4.1f} {expected_pick:>4.1f}"
+            )
+
+        embed = discord.Embed(
+            title=f"🔮 Season {season_number} Projections",
+            description="```\n" + "\n".join(lines) + "\n```",
+            color=discord.Color.purple()
+        )
+        embed.set_footer(
+            text=f"{match_engine.PROJECTION_SIMULATIONS:,} simulated seasons from Round {current_round} · "
+                 f"Finals = top {match_engine.FINALS_TEAMS} · Pick = expected first round pick"
+        )
+        await interaction.followup.send(embed=embed)
+
 async def setup(bot):
     await bot.add_cog(SeasonCommands(bot))
@@ -4,6 +4,8 @@ from discord import app_commands
 import aiosqlite
 import json
 from config import DB_PATH, ADMIN_ROLE_ID
+from settings_store import settings
+from team_emojis import team_emojis
 
 class TradeCommands(commands.Cog):
     def __init__(self, bot):
@@ -60,20 +62,7 @@ class TradeCommands(commands.Cog):
 
         return False
 
-    async def get_bot_logs_channel(self, db):
-        """Get the bot logs channel from settings"""
-        cursor = await db.execute(
-            "SELECT setting_value FROM settings WHERE setting_key = 'bot_logs_channel_id'"
-        )
-        result = await cursor.fetchone()
-        if result and result[0]:
-            try:
-                return self.bot.get_channel(int(result[0]))
-            except:
-                return None
-        return None
-
-    def format_pick_display(self, pick_number, season_number, round_number, emoji_id, current_season):
+    def format_pick_display(self, pick_number, season_number, round_number, original_team_id, current_season):
         """
         Format pick display based on whether it's a current or future pick.
 
@@ -81,7 +70,7 @@ class TradeCommands(commands.Cog):
             pick_number: The pick number (NULL for future picks)
             season_number: The season this pick belongs to
             round_number: The round number (1-4)
-            emoji_id: The emoji ID for the original team
+            original_team_id: The team the pick originally belonged to (shown as its emoji)
             current_season: The current active season number
 
         Returns:
@@ -94,15 +83,7 @@ class TradeCommands(commands.Cog):
             # Future draft - format as "Future 1st ([emoji] S10)"
             # Draft for Season N is named "Season N-1 National Draft", so use season_number - 1
             round_suffix = {1: "1st", 2: "2nd", 3: "3rd", 4: "4th"}.get(round_number, f"{round_number}th")
-            emoji_str = ""
-            if emoji_id:
-                try:
-                    emoji = self.bot.get_emoji(int(emoji_id))
-                    if emoji:
-                        emoji_str = f"{emoji} "
-                except (ValueError, AttributeError):
-                    # If emoji_id can't be converted or bot isn't available, skip emoji
-                    pass
+            emoji_str = team_emojis.prefix(original_team_id)
             return f"Future {round_suffix} ({emoji_str}S{season_number - 1})"
 
     async def format_picks_for_display(self, db, pick_ids_json):
@@ -133,17 +114,16 @@ class TradeCommands(commands.Cog):
         formatted_picks = []
         for pick_id in pick_ids:
             cursor = await db.execute(
-                """SELECT dp.pick_number, dp.season_number, dp.round_number, t.emoji_id
+                """SELECT dp.pick_number, dp.season_number, dp.round_number, dp.original_team_id
                    FROM draft_picks dp
-                   JOIN teams t ON dp.original_team_id = t.team_id
                    WHERE dp.pick_id = ?""",
                 (pick_id,)
             )
             result = await cursor.fetchone()
             if result:
-                pick_number, season_number, round_number, emoji_id = result
+                pick_number, season_number, round_number, original_team_id = result
                 pick_display = self.format_pick_display(
-                    pick_number, season_number, round_number, emoji_id, current_season
+                    pick_number, season_number, round_number, original_team_id, current_season
                 )
                 formatted_picks.append(f"**{pick_display}**")
 
@@ -186,25 +166,19 @@ class TradeCommands(commands.Cog):
 
         async with aiosqlite.connect(DB_PATH) as db:
             if action == "start":
-                await db.execute(
-                    "INSERT OR REPLACE INTO settings (setting_key, setting_value) VALUES (?, ?)",
-                    ("trade_period_active", "1")
-                )
-                await db.commit()
+                await settings.set(db, "trade_period_active", "1")
+                await settings.commit(db)
                 await interaction.response.send_message("✅ **Trade period has been opened!** Coaches can now submit trade offers.")
 
             elif action == "end":
-                await db.execute(
-                    "INSERT OR REPLACE INTO settings (setting_key, setting_value) VALUES (?, ?)",
-                    ("trade_period_active", "0")
-                )
+                await settings.set(db, "trade_period_active", "0")
 
                 # Mark all active trade offers as expired
                 await db.execute(
                     "UPDATE trades SET status = 'expired' WHERE status = 'pending'"
                 )
 
-                await db.commit()
+                await settings.commit(db)
                 await interaction.response.send_message("✅ **Trade period has been closed!** Coaches can no longer submit trade offers. All pending trade offers have been marked as expired.")
 
             elif action == "resend":
@@ -280,17 +254,16 @@ class TradeCommands(commands.Cog):
                             for pick_id in init_picks:
                                 cursor = await db.execute(
                                     """SELECT pick_id, draft_name, pick_number, pick_origin, season_number, round_number,
-                                              t.emoji_id
+                                              dp.original_team_id
                                        FROM draft_picks dp
-                                       LEFT JOIN teams t ON dp.original_team_id = t.team_id
                                        WHERE dp.pick_id = ?""",
                                     (pick_id,)
                                 )
                                 pick = await cursor.fetchone()
                                 if pick:
-                                    _, draft_name, pick_number, pick_origin, season_number, round_number, emoji_id = pick
+                                    _, draft_name, pick_number, pick_origin, season_number, round_number, original_team_id = pick
                                     pick_display = self.format_pick_display(
-                                        pick_number, season_number, round_number, emoji_id, current_season
+                                        pick_number, season_number, round_number, original_team_id, current_season
                                     )
                                     offering_items.append(f"**{pick_display}**")
 
@@ -311,17 +284,16 @@ class TradeCommands(commands.Cog):
                             for pick_id in recv_picks:
                                 cursor = await db.execute(
                                     """SELECT pick_id, draft_name, pick_number, pick_origin, season_number, round_number,
-                                              t.emoji_id
+                                              dp.original_team_id
                                        FROM draft_picks dp
-                                       LEFT JOIN teams t ON dp.original_team_id = t.team_id
                                        WHERE dp.pick_id = ?""",
                                     (pick_id,)
                                 )
                                 pick = await cursor.fetchone()
                                 if pick:
-                                    _, draft_name, pick_number, pick_origin, season_number, round_number, emoji_id = pick
+                                    _, draft_name, pick_number, pick_origin, season_number, round_number, original_team_id = pick
                                     pick_display = self.format_pick_display(
-                                        pick_number, season_number, round_number, emoji_id, current_season
+                                        pick_number, season_number, round_number, original_team_id, current_season
                                     )
                                     receiving_items.append(f"**{pick_display}**")
 
@@ -395,13 +367,7 @@ class TradeCommands(commands.Cog):
     @app_commands.autocomplete(team=team_autocomplete)
     async def trade_offer(self, interaction: discord.Interaction, team: str):
         # Check if trade period is active
-        async with aiosqlite.connect(DB_PATH) as db:
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = 'trade_period_active'"
-            )
-            result = await cursor.fetchone()
-
-        if not result or result[0] != "1":
+        if not await settings.get_bool('trade_period_active'):
             await interaction.response.send_message(
                 "❌ The trade period is not currently active!",
                 ephemeral=True
@@ -1117,7 +1083,7 @@ class TradeMenuView(discord.ui.View):
             await db.commit()
 
             # Log to bot logs channel
-            log_channel = await self.bot.get_cog('TradeCommands').get_bot_logs_channel(db)
+            log_channel = await settings.channel(self.bot, 'bot_logs_channel_id')
             if log_channel:
                 init_emoji = self.bot.get_emoji(int(init_emoji_id)) if init_emoji_id else None
                 recv_emoji = self.bot.get_emoji(int(recv_emoji_id)) if recv_emoji_id else None
@@ -1242,7 +1208,7 @@ class TradeMenuView(discord.ui.View):
             await db.commit()
 
             # Log to bot logs channel
-            log_channel = await self.bot.get_cog('TradeCommands').get_bot_logs_channel(db)
+            log_channel = await settings.channel(self.bot, 'bot_logs_channel_id')
             if log_channel:
                 init_emoji = self.bot.get_emoji(int(init_emoji_id)) if init_emoji_id else None
                 recv_emoji = self.bot.get_emoji(int(recv_emoji_id)) if recv_emoji_id else None
@@ -1381,7 +1347,7 @@ class TradeMenuView(discord.ui.View):
             if trade_info:
                 initiating_team_id, init_team_name, recv_channel_id, init_emoji_id, recv_emoji_id, init_players_json, recv_players_json, init_picks_json, recv_picks_json = trade_info
 
-                log_channel = await self.bot.get_cog('TradeCommands').get_bot_logs_channel(db)
+                log_channel = await settings.channel(self.bot, 'bot_logs_channel_id')
                 if log_channel:
                     init_emoji = self.bot.get_emoji(int(init_emoji_id)) if init_emoji_id else None
                     recv_emoji = self.bot.get_emoji(int(recv_emoji_id)) if recv_emoji_id else None
@@ -1738,7 +1704,7 @@ class PendingTradesView(discord.ui.View):
 
             # Log to bot logs channel
             if result:
-                log_channel = await parent_cog.get_bot_logs_channel(db)
+                log_channel = await settings.channel(parent_cog.bot, 'bot_logs_channel_id')
                 if log_channel:
                     init_emoji = self.bot.get_emoji(int(init_emoji_id)) if init_emoji_id else None
                     recv_emoji = self.bot.get_emoji(int(recv_emoji_id)) if recv_emoji_id else None
@@ -1838,35 +1804,12 @@ class TradeOfferView(discord.ui.View):
         self.receiving_page = 0   # Current page for receiving team roster
         self.current_season = None  # Will be set in initialize()
 
-    def get_emoji(self, emoji_id, as_string=False):
-        """Get emoji from ID
-
-        Args:
-            emoji_id: The emoji ID to fetch
-            as_string: If True, returns emoji as string (for embeds). If False, returns emoji object (for select menus)
-        """
-        if not emoji_id:
-            return None
-        try:
-            emoji = self.bot.get_emoji(int(emoji_id))
-            if emoji:
-                return str(emoji) if as_string else emoji
-            return None
-        except:
-            return None
-
     async def initialize(self):
         """Load initial data"""
         async with aiosqlite.connect(DB_PATH) as db:
-            # Get initiating team info (with emoji)
-            cursor = await db.execute(
-                "SELECT emoji_id FROM teams WHERE team_id = ?",
-                (self.initiating_team_id,)
-            )
-            result = await cursor.fetchone()
-            if result:
-                self.initiating_emoji = self.get_emoji(result[0], as_string=True)
-                self.initiating_emoji_obj = self.get_emoji(result[0], as_string=False)
+            # Team emojis - strings for embeds, objects for select menus
+            self.initiating_emoji = team_emojis.text(self.initiating_team_id) or None
+            self.initiating_emoji_obj = team_emojis.emoji(self.initiating_team_id)
 
             # Get initiating team roster (include age, order by OVR desc)
             cursor = await db.execute(
@@ -1887,9 +1830,8 @@ class TradeOfferView(discord.ui.View):
             # Filter to current season + 2 years max
             cursor = await db.execute(
                 """SELECT dp.pick_id, dp.draft_name, dp.pick_number, dp.pick_origin,
-                          dp.season_number, dp.round_number, t.emoji_id
+                          dp.season_number, dp.round_number, dp.original_team_id
                    FROM draft_picks dp
-                   JOIN teams t ON dp.original_team_id = t.team_id
                    LEFT JOIN seasons s ON dp.season_number = s.season_number
                    WHERE dp.current_team_id = ?
                      AND dp.player_selected_id IS NULL
@@ -1904,14 +1846,14 @@ class TradeOfferView(discord.ui.View):
             # If receiving team is set, get their roster and name
             if self.receiving_team_id:
                 cursor = await db.execute(
-                    "SELECT team_name, emoji_id FROM teams WHERE team_id = ?",
+                    "SELECT team_name FROM teams WHERE team_id = ?",
                     (self.receiving_team_id,)
                 )
                 result = await cursor.fetchone()
                 if result:
                     self.receiving_team_name = result[0]
-                    self.receiving_emoji = self.get_emoji(result[1], as_string=True)
-                    self.receiving_emoji_obj = self.get_emoji(result[1], as_string=False)
+                    self.receiving_emoji = team_emojis.text(self.receiving_team_id) or None
+                    self.receiving_emoji_obj = team_emojis.emoji(self.receiving_team_id)
 
                 cursor = await db.execute(
                     "SELECT player_id, name, position, overall_rating, age FROM players WHERE team_id = ? ORDER BY overall_rating DESC",
@@ -1922,9 +1864,8 @@ class TradeOfferView(discord.ui.View):
                 # Get receiving team's draft picks (only available picks - no player selected)
                 cursor = await db.execute(
                     """SELECT dp.pick_id, dp.draft_name, dp.pick_number, dp.pick_origin,
-                              dp.season_number, dp.round_number, t.emoji_id
+                              dp.season_number, dp.round_number, dp.original_team_id
                        FROM draft_picks dp
-                       JOIN teams t ON dp.original_team_id = t.team_id
                        LEFT JOIN seasons s ON dp.season_number = s.season_number
                        WHERE dp.current_team_id = ?
                          AND dp.player_selected_id IS NULL
@@ -2016,9 +1957,9 @@ class TradeOfferView(discord.ui.View):
             for pick_id in self.initiating_picks:
                 pick = next((p for p in self.initiating_draft_picks if p[0] == pick_id), None)
                 if pick:
-                    _, draft_name, pick_number, pick_origin, season_number, round_number, emoji_id = pick
+                    _, draft_name, pick_number, pick_origin, season_number, round_number, original_team_id = pick
                     pick_display = self.parent_cog.format_pick_display(
-                        pick_number, season_number, round_number, emoji_id, self.current_season
+                        pick_number, season_number, round_number, original_team_id, self.current_season
                     )
                     offering_items.append(f"**{pick_display}**")
 
@@ -2035,9 +1976,9 @@ class TradeOfferView(discord.ui.View):
             for pick_id in self.receiving_picks:
                 pick = next((p for p in self.receiving_draft_picks if p[0] == pick_id), None)
                 if pick:
-                    _, draft_name, pick_number, pick_origin, season_number, round_number, emoji_id = pick
+                    _, draft_name, pick_number, pick_origin, season_number, round_number, original_team_id = pick
                     pick_display = self.parent_cog.format_pick_display(
-                        pick_number, season_number, round_number, emoji_id, self.current_season
+                        pick_number, season_number, round_number, original_team_id, self.current_season
                     )
                     receiving_items.append(f"**{pick_display}**")
 
@@ -2175,9 +2116,9 @@ class TradeOfferView(discord.ui.View):
                     for pick_id in self.initiating_picks:
                         pick = next((p for p in self.initiating_draft_picks if p[0] == pick_id), None)
                         if pick:
-                            _, draft_name, pick_number, pick_origin, season_number, round_number, emoji_id = pick
+                            _, draft_name, pick_number, pick_origin, season_number, round_number, original_team_id = pick
                             pick_display = self.parent_cog.format_pick_display(
-                                pick_number, season_number, round_number, emoji_id, self.current_season
+                                pick_number, season_number, round_number, original_team_id, self.current_season
                             )
                             offering_items.append(f"**{pick_display}**")
 
@@ -2194,9 +2135,9 @@ class TradeOfferView(discord.ui.View):
                     for pick_id in self.receiving_picks:
                         pick = next((p for p in self.receiving_draft_picks if p[0] == pick_id), None)
                         if pick:
-                            _, draft_name, pick_number, pick_origin, season_number, round_number, emoji_id = pick
+                            _, draft_name, pick_number, pick_origin, season_number, round_number, original_team_id = pick
                             pick_display = self.parent_cog.format_pick_display(
-                                pick_number, season_number, round_number, emoji_id, self.current_season
+                                pick_number, season_number, round_number, original_team_id, self.current_season
                             )
                             receiving_items.append(f"**{pick_display}**")
 
@@ -2241,7 +2182,7 @@ class TradeOfferView(discord.ui.View):
 
         # Log to bot logs channel
         async with aiosqlite.connect(DB_PATH) as db:
-            log_channel = await self.parent_cog.get_bot_logs_channel(db)
+            log_channel = await settings.channel(self.parent_cog.bot, 'bot_logs_channel_id')
             if log_channel:
                 initiating_emoji_str = f"{self.initiating_emoji} " if self.initiating_emoji else ""
                 receiving_emoji_str = f"{self.receiving_emoji} " if self.receiving_emoji else ""
@@ -2274,7 +2215,7 @@ class OfferingPlayerSelect(discord.ui.Select):
         pick_end = min(total_picks, page_end)
 
         for idx in range(pick_start, pick_end):
-            pick_id, draft_name, pick_number, pick_origin, season_number, round_number, emoji_id = parent_view.initiating_draft_picks[idx]
+            pick_id, draft_name, pick_number, pick_origin, season_number, round_number, original_team_id = parent_view.initiating_draft_picks[idx]
             # Format pick display and get emoji for SelectOption
             if pick_number is not None:
                 # Current draft with ladder set
@@ -2287,12 +2228,7 @@ class OfferingPlayerSelect(discord.ui.Select):
                 round_suffix = {1: "1st", 2: "2nd", 3: "3rd", 4: "4th"}.get(round_number, f"{round_number}th")
                 pick_label = f"Future {round_suffix} (S{season_number - 1})"
                 pick_description = None  # No description for picks
-                pick_emoji = None
-                if emoji_id:
-                    try:
-                        pick_emoji = parent_view.bot.get_emoji(int(emoji_id))
-                    except (ValueError, AttributeError):
-                        pass
+                pick_emoji = team_emojis.emoji(original_team_id)
 
             options.append(
                 discord.SelectOption(
@@ -2387,7 +2323,7 @@ class ReceivingPlayerSelect(discord.ui.Select):
         pick_end = min(total_picks, page_end)
 
         for idx in range(pick_start, pick_end):
-            pick_id, draft_name, pick_number, pick_origin, season_number, round_number, emoji_id = parent_view.receiving_draft_picks[idx]
+            pick_id, draft_name, pick_number, pick_origin, season_number, round_number, original_team_id = parent_view.receiving_draft_picks[idx]
             # Format pick display and get emoji for SelectOption
             if pick_number is not None:
                 # Current draft with ladder set
@@ -2400,12 +2336,7 @@ class ReceivingPlayerSelect(discord.ui.Select):
                 round_suffix = {1: "1st", 2: "2nd", 3: "3rd", 4: "4th"}.get(round_number, f"{round_number}th")
                 pick_label = f"Future {round_suffix} (S{season_number - 1})"
                 pick_description = None  # No description for picks
-                pick_emoji = None
-                if emoji_id:
-                    try:
-                        pick_emoji = parent_view.bot.get_emoji(int(emoji_id))
-                    except (ValueError, AttributeError):
-                        pass
+                pick_emoji = team_emojis.emoji(original_team_id)
 
             options.append(
                 discord.SelectOption(
@@ -2557,18 +2488,12 @@ class TradeResponseView(discord.ui.View):
         # Get parent_cog for helper methods
         parent_cog = self.bot.get_cog('TradeCommands')
 
-        async with aiosqlite.connect(DB_PATH) as db:
-            # Get trade approval channel
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = 'trade_approval_channel_id'"
-            )
-            result = await cursor.fetchone()
-
-            if not result or not result[0]:
-                return  # No approval channel set
-
-            approval_channel_id = int(result[0])
+        # Get trade approval channel
+        approval_channel_id = await settings.get_int('trade_approval_channel_id')
+        if not approval_channel_id:
+            return  # No approval channel set
 
+        async with aiosqlite.connect(DB_PATH) as db:
             # Get trade details
             cursor = await db.execute(
                 """SELECT t.initiating_team_id, t.receiving_team_id, t.initiating_players, t.receiving_players,
@@ -2807,7 +2732,7 @@ class ModeratorApprovalView(discord.ui.View):
 
             # Log to bot logs channel
             if result:
-                log_channel = await parent_cog.get_bot_logs_channel(db)
+                log_channel = await settings.channel(parent_cog.bot, 'bot_logs_channel_id')
                 if log_channel:
                     init_emoji = self.bot.get_emoji(int(init_emoji_id)) if init_emoji_id else None
                     recv_emoji = self.bot.get_emoji(int(recv_emoji_id)) if recv_emoji_id else None
@@ -3045,17 +2970,11 @@ class ModeratorApprovalView(discord.ui.View):
                 )
                 recv_receiving.extend([f"**{name}** ({pos}, {age}, {ovr})" for name, pos, ovr, age in await cursor.fetchall()])
 
-            # Get trade log channel
-            cursor = await db.execute(
-                "SELECT setting_value FROM settings WHERE setting_key = 'trade_log_channel_id'"
-            )
-            log_result = await cursor.fetchone()
-
             await db.commit()
 
             # Log to bot logs channel
             if team_info:
-                bot_log_channel = await parent_cog.get_bot_logs_channel(db)
+                bot_log_channel = await settings.channel(parent_cog.bot, 'bot_logs_channel_id')
                 if bot_log_channel:
                     log_init_team_name, log_init_channel_id, log_init_emoji_id, log_recv_team_name, log_recv_channel_id, log_recv_emoji_id = team_info
                     init_emoji = self.bot.get_emoji(int(log_init_emoji_id)) if log_init_emoji_id else None
@@ -3099,10 +3018,9 @@ class ModeratorApprovalView(discord.ui.View):
         embed.set_footer(text=f"Trade ID: {self.trade_id}")
 
         # Send to trade log channel
-        if log_result and log_result[0]:
-            log_channel = self.bot.get_channel(int(log_result[0]))
-            if log_channel:
-                await log_channel.send(embed=embed)
+        log_channel = await settings.channel(self.bot, 'trade_log_channel_id')
+        if log_channel:
+            await log_channel.send(embed=embed)
 
         # Send to both team channels
         for channel_id in [init_channel_id, recv_channel_id]:
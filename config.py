@@ -18,4 +18,19 @@ GUILD_ID = int(os.getenv("GUILD_ID", 0)) if os.getenv("GUILD_ID") else None
 ADMIN_ROLE_ID = int(os.getenv("ADMIN_ROLE_ID")) if os.getenv("ADMIN_ROLE_ID") else None
 
 # Database Configuration
-DB_PATH = os.getenv("DB_PATH", "affl_bot.db")
\ No newline at end of file
+DB_PATH = os.getenv("DB_PATH", "affl_bot.db")
+
+# Performance Diagnostics
+# Statements slower than this are logged as they finish
+SLOW_QUERY_MS = int(os.getenv("SLOW_QUERY_MS", 100))
+# Interactions running more statements than this get a per-statement report
+QUERY_REPORT_STATEMENTS = int(os.getenv("QUERY_REPORT_STATEMENTS", 200))
+# Serve Prometheus metrics on this port (off when unset); bind 0.0.0.0 for an external scraper
+METRICS_PORT = int(os.getenv("METRICS_PORT")) if os.getenv("METRICS_PORT") else None
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+# Event loop blocked this long is a stall - its stack goes to the bot logs channel
+LOOP_STALL_MS = int(os.getenv("LOOP_STALL_MS", 500))
+# At most one stall report per this many seconds (the rest are counted and logged)
+LOOP_STALL_REPORT_INTERVAL = int(os.getenv("LOOP_STALL_REPORT_INTERVAL", 300))
+# Handlers wrapped in deferral.auto_defer are deferred if they haven't responded within this long
+AUTO_DEFER_MS = int(os.getenv("AUTO_DEFER_MS", 2000))
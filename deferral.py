@@ -0,0 +1,143 @@
+"""Automatic deferral for handlers that may not answer within Discord's 3 seconds.
+
+Discord fails an interaction that hasn't been responded to within 3 seconds.
+Handlers that do their DB work (and channel sends) before their first
+interaction.response.send_message can run past that on a busy night, and
+deferring every one of them up front costs a "thinking..." message on the
+quick paths too.
+
+@auto_defer wraps a slash command or component callback so it can keep its
+plain response code:
+
+    @app_commands.command(name="nextround", ...)
+    @auto_defer(ephemeral=False)
+    async def next_round(self, interaction):
+
+If the handler hasn't responded when the budget (AUTO_DEFER_MS) runs out, the
+interaction is deferred for it. After that, interaction.response.send_message
+goes to followup.send and edit_message to edit_original_response, so the
+handler never needs to know. Each deferral is counted against the interaction
+in metrics (the "dfr" column of /perfstats), which shows which commands need
+an explicit defer or a faster path.
+"""
+
+import asyncio
+import functools
+
+import discord
+
+from config import AUTO_DEFER_MS
+import metrics
+
+
+class DeferringResponse(discord.InteractionResponse):
+    """
+    interaction.response for a guarded interaction - routes responses to
+    followups once the guard has deferred.
+
+    Args:
+        interaction: The interaction being handled
+        ephemeral: Whether an automatic deferral should be ephemeral
+    """
+
+    def __init__(self, interaction, ephemeral):
+        super().__init__(interaction)
+        self.ephemeral = ephemeral
+        self.responding = False  # the handler's own response is on its way
+        self.deferring = None  # the automatic defer, once started
+        self.followups = 0
+
+    def auto_defer(self):
+        """Budget ran out - defer unless the handler has responded (or is responding)"""
+        if self.responding or self.deferring is not None or self.is_done():
+            return
+        # Slash commands show "thinking..."; components just acknowledge and edit later
+        thinking = self._parent.type == discord.InteractionType.application_command
+        self.deferring = asyncio.create_task(
+            discord.InteractionResponse.defer(self, ephemeral=self.ephemeral, thinking=thinking)
+        )
+        timing = metrics.current.get()
+        if timing is not None:
+            timing.auto_deferred = True
+
+    async def deferred(self):
+        """Wait out an automatic defer in flight; True if there was one"""
+        if self.deferring is None:
+            return False
+        await self.deferring
+        return True
+
+    async def send_message(self, content=None, **kwargs):
+        if await self.deferred():
+            return await self.send_followup(content, **kwargs)
+        self.responding = True
+        return await super().send_message(content, **kwargs)
+
+    async def send_followup(self, content=None, **kwargs):
+        interaction = self._parent
+        ephemeral = kwargs.get('ephemeral', False)
+        # The first followup takes over the "thinking..." message, whose visibility was fixed
+        # by the deferral - replace it when this reply wanted the other one
+        if (not self.followups and ephemeral != self.ephemeral
+                and interaction.type == discord.InteractionType.application_command):
+            await interaction.delete_original_response()
+        self.followups += 1
+        # Webhook messages can't delete themselves
+        kwargs.pop('delete_after', None)
+        if kwargs.get('view', discord.utils.MISSING) is None:
+            del kwargs['view']
+        return await interaction.followup.send(content if content is not None else discord.utils.MISSING, **kwargs)
+
+    async def edit_message(self, **kwargs):
+        if await self.deferred():
+            kwargs.pop('delete_after', None)
+            return await self._parent.edit_original_response(**kwargs)
+        self.responding = True
+        return await super().edit_message(**kwargs)
+
+    async def defer(self, **kwargs):
+        # The handler deferring itself after the guard did is a no-op
+        if await self.deferred():
+            return None
+        self.responding = True
+        return await super().defer(**kwargs)
+
+    async def send_modal(self, modal):
+        self.responding = True
+        return await super().send_modal(modal)
+
+
+def auto_defer(ephemeral=False, budget_ms=AUTO_DEFER_MS):
+    """
+    Defer the decorated callback's interaction if it hasn't responded within the budget.
+
+    Goes below @app_commands.command / @discord.ui.button, directly on the callback.
+
+    Args:
+        ephemeral: Visibility of the automatic deferral - match the handler's main reply
+        budget_ms: Milliseconds to wait for the handler's own response
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(callback):
+        @functools.wraps(callback)
+        async def wrapper(self, interaction, *args, **kwargs):
+            # Stand-ins (bench.fakes) have no real response to swap out
+            if not isinstance(interaction, discord.Interaction):
+                return await callback(self, interaction, *args, **kwargs)
+            response = DeferringResponse(interaction, ephemeral)
+            # Interaction.response is a cached slot - swap in the deferring one
+            interaction._cs_response = response
+            timer = asyncio.get_running_loop().call_later(budget_ms / 1000, response.auto_defer)
+            try:
+                return await callback(self, interaction, *args, **kwargs)
+            finally:
+                timer.cancel()
+                if response.deferring is not None and not response.deferring.done():
+                    await asyncio.wait([response.deferring])
+
+        return wrapper
+
+    return decorator
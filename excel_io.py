@@ -0,0 +1,96 @@
+"""Excel workbook engine for /exportdata and /importdata.
+
+pandas (and NumPy/openpyxl with it) is only imported inside these functions,
+so the bot doesn't pay for it at startup - only the first time an admin
+exports or imports a workbook. Everything going in and out is plain Python
+(bytes, lists, dicts) so callers never need pandas themselves, and the work
+can be handed to a worker process with run_in_worker.
+"""
+
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Worker process for parsing/serialising workbooks, created on first use
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        # spawn rather than fork - the bot process has aiosqlite threads running
+        _executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+    return _executor
+
+
+async def run_in_worker(func, *args):
+    """
+    Run one of this module's functions in the Excel worker process.
+
+    Spreadsheet parsing and writing is pure CPU work that would otherwise
+    block the event loop (and every other command) for the whole import.
+    Other CPU-bound jobs (match_engine.project_season) share the same worker.
+
+    Args:
+        func: Module-level function to call (must be picklable)
+        *args: Picklable arguments for func
+
+    Returns:
+        Whatever func returns
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), func, *args)
+
+
+def shutdown_worker():
+    """Stop the worker process if it was started"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def write_workbook(sheets):
+    """
+    Build an .xlsx workbook in memory.
+
+    Args:
+        sheets: List of (sheet_name, columns, rows) tuples, written in order.
+                rows is a list of tuples/lists matching columns; None is written as a blank cell.
+
+    Returns:
+        bytes: The workbook file contents
+    """
+    import pandas as pd
+
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        for sheet_name, columns, rows in sheets:
+            pd.DataFrame(rows, columns=columns).to_excel(writer, sheet_name=sheet_name, index=False)
+    return output.getvalue()
+
+
+def read_workbook(data, dtypes=None):
+    """
+    Parse every sheet of an Excel workbook.
+
+    Args:
+        data: Raw .xlsx/.xls file contents
+        dtypes: Optional {sheet_name: {column: dtype}} for columns that must not be
+                parsed as numbers (e.g. Discord IDs)
+
+    Returns:
+        dict: {sheet_name: list of row dicts}, with blank cells as None
+    """
+    import pandas as pd
+
+    dtypes = dtypes or {}
+    sheets = {}
+    with pd.ExcelFile(io.BytesIO(data)) as workbook:
+        for sheet_name in workbook.sheet_names:
+            df = workbook.parse(sheet_name, dtype=dtypes.get(sheet_name))
+            df = df.astype(object).where(df.notna(), None)
+            sheets[sheet_name] = df.to_dict('records')
+    return sheets
+
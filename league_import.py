@@ -0,0 +1,886 @@
+"""Diff-based league import for /importdata.
+
+Each workbook sheet is turned into the rows its table should contain, diffed
+against the live database, and only the resulting inserts, updates and
+deletes are written. Reimporting an unchanged workbook writes nothing, and
+rows that survive an import keep their ids, so foreign keys and persistent
+views pointing at them stay valid.
+
+LeagueImport.run works inside a transaction that the caller finishes:
+/importdata runs it once and rolls back to build the change preview, then
+runs it again and commits when the admin confirms.
+"""
+
+import json
+from positions import validate_position
+
+# Lineup positions in slot order (slot_number = index + 1)
+LINEUP_POSITIONS = [
+    "LBP", "FB", "RBP", "LHB", "CHB", "RHB",
+    "LW", "C", "RW", "LHF", "CHF", "RHF",
+    "LFP", "FF", "RFP", "R", "RR", "RO",
+    "INT1", "INT2", "INT3", "INT4", "INT5"
+]
+
+
+class TableDiff:
+    """Row-level changes to one table from one sheet"""
+
+    def __init__(self, label, table, key_columns, value_columns):
+        self.label = label
+        self.table = table
+        self.key_columns = list(key_columns)
+        self.value_columns = list(value_columns)
+        self.inserts = []  # full rows: key columns then value columns
+        self.updates = []  # full rows: key columns then value columns
+        self.deletes = []  # keys
+
+    @property
+    def changed(self):
+        return bool(self.inserts or self.updates or self.deletes)
+
+    def summary(self):
+        parts = []
+        if self.inserts:
+            parts.append(f"{len(self.inserts)} added")
+        if self.updates:
+            parts.append(f"{len(self.updates)} updated")
+        if self.deletes:
+            parts.append(f"{len(self.deletes)} removed")
+        return f"**{self.label}:** {', '.join(parts)}"
+
+
+async def diff_table(db, label, table, key_columns, value_columns, desired, *,
+                     live=None, insert_missing=True, delete_missing=True, keep=()):
+    """
+    Compare the rows a table should contain with what it contains now.
+
+    Tables without a usable key pass every column as key_columns and no
+    value_columns, so rows are only ever added or removed.
+
+    Args:
+        db: Active aiosqlite database connection
+        label: Name shown in the import summary
+        table: Table name
+        key_columns: Columns identifying a row
+        value_columns: Columns compared between the sheet and the database
+        desired: {key tuple: value tuple} built from the sheet
+        live: Optional {key tuple: value tuple} to compare against instead of
+              reading the table (for columns that need normalising first)
+        insert_missing: Insert desired rows that aren't in the table
+        delete_missing: Delete table rows that aren't in desired
+        keep: Keys never to delete (e.g. sheet rows that failed to parse)
+
+    Returns:
+        TableDiff: The changes needed
+    """
+    diff = TableDiff(label, table, key_columns, value_columns)
+
+    if live is None:
+        key_count = len(key_columns)
+        cursor = await db.execute(f"SELECT {', '.join(diff.key_columns + diff.value_columns)} FROM {table}")
+        live = {tuple(row[:key_count]): tuple(row[key_count:]) for row in await cursor.fetchall()}
+
+    for key, values in desired.items():
+        if key not in live:
+            if insert_missing:
+                diff.inserts.append(key + values)
+        elif live[key] != values:
+            diff.updates.append(key + values)
+
+    if delete_missing:
+        diff.deletes = [key for key in live if key not in desired and key not in keep]
+
+    return diff
+
+
+async def apply_diff(db, diff, *, replace_updates=False, touch=()):
+    """
+    Write a TableDiff to the database with one executemany per statement kind.
+
+    Args:
+        db: Active aiosqlite database connection
+        diff: Changes from diff_table
+        replace_updates: Apply updates as delete + reinsert (same key), for tables
+                         where rows can swap values under a UNIQUE constraint
+        touch: Columns set to CURRENT_TIMESTAMP on updated rows
+    """
+    key_count = len(diff.key_columns)
+    key_where = " AND ".join(f"{column} IS ?" for column in diff.key_columns)
+    columns = diff.key_columns + diff.value_columns
+
+    deletes = list(diff.deletes)
+    if replace_updates:
+        deletes += [row[:key_count] for row in diff.updates]
+    if deletes:
+        await db.executemany(f"DELETE FROM {diff.table} WHERE {key_where}", deletes)
+
+    if diff.updates and not replace_updates:
+        assignments = [f"{column} = ?" for column in diff.value_columns]
+        assignments += [f"{column} = CURRENT_TIMESTAMP" for column in touch]
+        await db.executemany(
+            f"UPDATE {diff.table} SET {', '.join(assignments)} WHERE {key_where}",
+            [row[key_count:] + row[:key_count] for row in diff.updates]
+        )
+
+    inserts = diff.inserts + (diff.updates if replace_updates else [])
+    if inserts:
+        await db.executemany(
+            f"INSERT INTO {diff.table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            inserts
+        )
+
+
+def _text(value):
+    """Sheet cell as a string, or None when blank"""
+    return str(value) if value else None
+
+
+def _int(value, default=None):
+    """Sheet cell as an int, or default when blank"""
+    return int(value) if value is not None else default
+
+
+class LeagueImport:
+    """Imports every sheet of a workbook parsed by excel_io.read_workbook"""
+
+    def __init__(self, db, sheets):
+        self.db = db
+        self.sheets = sheets
+        self.diffs = []
+        self.errors = []
+
+        # Lookups, refreshed as sheets that change them are applied
+        self.team_ids = {}
+        self.player_ids = set()
+        self.season_ids = {}
+
+    @property
+    def changed(self):
+        return any(diff.changed for diff in self.diffs)
+
+    def summary_lines(self):
+        return [diff.summary() for diff in self.diffs if diff.changed]
+
+    async def run(self, progress=None):
+        """
+        Diff and apply every sheet inside a new transaction.
+
+        The caller must commit or roll back afterwards. A sheet that fails is
+        rolled back on its own and reported in errors; the others still apply.
+
+        Args:
+            progress: Optional async callable taking a status string
+        """
+        await self.db.execute("BEGIN")
+
+        stages = [
+            ("teams and players", [
+                ('Teams', self.import_teams),
+                ('Players', self.import_players),
+                ('Add_Players', self.import_add_players),
+            ]),
+            ("lineups and seasons", [
+                ('Lineups', self.import_lineups),
+                ('Seasons', self.import_seasons),
+            ]),
+            ("injuries, suspensions, trades and settings", [
+                ('Injuries', self.import_injuries),
+                ('Suspensions', self.import_suspensions),
+                ('Trades', self.import_trades),
+                ('Settings', self.import_settings),
+            ]),
+            ("matches and drafts", [
+                ('Matches', self.import_matches),
+                ('Drafts', self.import_drafts),
+                ('Draft_Picks', self.import_draft_picks),
+                ('Ladder_Positions', self.import_ladder_positions),
+                ('Lineups', self.import_submitted_lineups),
+            ]),
+            ("league configuration", [
+                ('Compensation_Chart', self.import_compensation_chart),
+                ('Contract_Config', self.import_contract_config),
+                ('Draft_Value_Index', self.import_draft_value_index),
+            ]),
+            ("free agency", [
+                ('Free_Agency_Periods', self.import_free_agency_periods),
+                ('Free_Agency_Bids', self.import_free_agency_bids),
+                ('Free_Agency_Re-Signs', self.import_free_agency_resigns),
+                ('Free_Agency_Results', self.import_free_agency_results),
+            ]),
+        ]
+
+        await self.load_lookups()
+        for stage_number, (description, steps) in enumerate(stages, 1):
+            if progress:
+                await progress(f"{description}... ({stage_number}/{len(stages)})")
+            for sheet_name, step in steps:
+                if sheet_name not in self.sheets:
+                    # Teams and Players are required, everything else is optional
+                    if sheet_name in ('Teams', 'Players'):
+                        self.errors.append(f"{sheet_name} sheet error: Worksheet {sheet_name} not found")
+                    continue
+                await self.run_step(sheet_name, step)
+
+    async def run_step(self, sheet_name, step):
+        """Run one sheet's import in a savepoint so a failure only discards that sheet"""
+        diff_count = len(self.diffs)
+        await self.db.execute("SAVEPOINT import_sheet")
+        try:
+            await step(self.sheets[sheet_name])
+            await self.db.execute("RELEASE import_sheet")
+        except Exception as e:
+            await self.db.execute("ROLLBACK TO import_sheet")
+            await self.db.execute("RELEASE import_sheet")
+            del self.diffs[diff_count:]
+            self.errors.append(f"{sheet_name.replace('_', ' ')} sheet error: {e}")
+            await self.load_lookups()
+
+    async def apply(self, diff, **kwargs):
+        await apply_diff(self.db, diff, **kwargs)
+        self.diffs.append(diff)
+
+    async def load_lookups(self):
+        cursor = await self.db.execute("SELECT team_id, team_name FROM teams")
+        self.team_ids = {team_name: team_id for team_id, team_name in await cursor.fetchall()}
+
+        cursor = await self.db.execute("SELECT player_id FROM players")
+        self.player_ids = {player_id for (player_id,) in await cursor.fetchall()}
+
+        cursor = await self.db.execute("SELECT season_id, season_number FROM seasons")
+        self.season_ids = {season_number: season_id for season_id, season_number in await cursor.fetchall()}
+
+    async def current_year(self):
+        """Calendar year used to turn an Age column into birth_year"""
+        cursor = await self.db.execute(
+            """SELECT season_number FROM seasons
+               ORDER BY
+                   CASE status
+                       WHEN 'active' THEN 1
+                       WHEN 'offseason' THEN 2
+                       ELSE 3
+                   END,
+                   season_number DESC
+               LIMIT 1"""
+        )
+        season_result = await cursor.fetchone()
+        current_season = season_result[0] if season_result else 1
+
+        cursor = await self.db.execute(
+            "SELECT setting_value FROM settings WHERE setting_key = 'season_1_year'"
+        )
+        setting_result = await cursor.fetchone()
+        season_1_year = int(setting_result[0]) if setting_result else current_season
+        return season_1_year + (current_season - 1)
+
+    def player_row_values(self, row, current_year, team_map):
+        """Values for the players table from a Players/Add_Players row, or raise ValueError"""
+        name = str(row['Name']).strip()
+        position = str(row['Pos']).strip()
+        rating = int(row['OVR'])
+        age = int(row['Age'])
+
+        # Get birth_year if present, otherwise calculate from age
+        birth_year = int(row['Birth_Year']) if row.get('Birth_Year') else current_year - age
+
+        contract_expiry = int(row['Contract_Expiry']) if row.get('Contract_Expiry') else None
+
+        is_valid, normalized_pos = validate_position(position)
+        if not is_valid:
+            raise ValueError(f"Invalid position '{position}'")
+
+        team_id = team_map.get(str(row['Team']).strip().lower()) if row.get('Team') else None
+        father_son_club_id = team_map.get(str(row['Father_Son_Club']).strip().lower()) if row.get('Father_Son_Club') else None
+        plays_like = str(row['Plays_Like']).strip() if row.get('Plays_Like') else None
+
+        return (name, normalized_pos, rating, age, birth_year, team_id, contract_expiry, father_son_club_id, plays_like)
+
+    # --- Core data ---
+
+    async def import_teams(self, rows):
+        desired = {}
+        for row in rows:
+            try:
+                team_name = str(row['Team_Name']).strip()
+                role_id = str(row['Role_ID']).strip() if row['Role_ID'] else None
+                emoji_id = str(row['Emoji_ID']).strip() if row['Emoji_ID'] else None
+                channel_id = str(row['Channel_ID']).strip() if row.get('Channel_ID') else None
+                desired[(team_name,)] = (role_id, emoji_id, channel_id)
+            except Exception as e:
+                self.errors.append(f"Team '{row.get('Team_Name')}': {str(e)}")
+
+        diff = await diff_table(self.db, "Teams", 'teams', ['team_name'], ['role_id', 'emoji_id', 'channel_id'],
+                                desired, delete_missing=False)
+        await self.apply(diff)
+        await self.load_lookups()
+
+    async def import_players(self, rows):
+        """Update existing players (matched by Player_ID, then name) and delete players missing from the sheet"""
+        current_year = await self.current_year()
+        team_map = {team_name.lower(): team_id for team_name, team_id in self.team_ids.items()}
+
+        cursor = await self.db.execute("SELECT player_id, name FROM players ORDER BY player_id")
+        ids_by_name = {}
+        for player_id, name in await cursor.fetchall():
+            ids_by_name.setdefault(name, player_id)
+
+        desired = {}
+        keep = set()
+        for row in rows:
+            name = row.get('Name')
+            try:
+                existing_id = None
+                if row.get('Player_ID') is not None and int(row['Player_ID']) in self.player_ids:
+                    existing_id = int(row['Player_ID'])
+                if existing_id is None:
+                    existing_id = ids_by_name.get(str(name).strip())
+
+                if existing_id is None:
+                    self.errors.append(f"Player '{name}' not found - use Add_Players sheet to add new players")
+                    continue
+
+                # A row that fails to parse leaves that player untouched rather than deleting them
+                keep.add((existing_id,))
+                desired[(existing_id,)] = self.player_row_values(row, current_year, team_map)
+            except Exception as e:
+                self.errors.append(f"Player '{name}': {str(e)}")
+
+        diff = await diff_table(
+            self.db, "Players", 'players', ['player_id'],
+            ['name', 'position', 'overall_rating', 'age', 'birth_year', 'team_id', 'contract_expiry',
+             'father_son_club_id', 'plays_like'],
+            desired, insert_missing=False, keep=keep
+        )
+        await self.apply(diff)
+        if diff.deletes:
+            print(f"Import deleted {len(diff.deletes)} player(s) not in Excel")
+        await self.load_lookups()
+
+    async def import_add_players(self, rows):
+        """Bulk add new players (duplicate names are allowed since players are matched by Player_ID)"""
+        current_year = await self.current_year()
+        team_map = {team_name.lower(): team_id for team_name, team_id in self.team_ids.items()}
+
+        diff = TableDiff("Players (Add_Players)", 'players', [],
+                         ['name', 'position', 'overall_rating', 'age', 'birth_year', 'team_id', 'contract_expiry',
+                          'father_son_club_id', 'plays_like'])
+        for row in rows:
+            # Skip empty rows
+            if row['Name'] is None or not str(row['Name']).strip():
+                continue
+            try:
+                diff.inserts.append(self.player_row_values(row, current_year, team_map))
+            except Exception as e:
+                self.errors.append(f"Add_Players - '{row['Name']}': {str(e)}")
+
+        await self.apply(diff)
+        await self.load_lookups()
+
+    async def import_seasons(self, rows):
+        desired = {}
+        for row in rows:
+            try:
+                desired[(int(row['Season']),)] = (
+                    int(row['Current_Round']), int(row['Regular_Rounds']), int(row['Total_Rounds']),
+                    str(row['Round_Name']), str(row['Status'])
+                )
+            except Exception as e:
+                self.errors.append(f"Season {row.get('Season')}: {str(e)}")
+
+        # Seasons are updated in place (never deleted) so season_id references stay valid
+        diff = await diff_table(self.db, "Seasons", 'seasons', ['season_number'],
+                                ['current_round', 'regular_rounds', 'total_rounds', 'round_name', 'status'],
+                                desired, delete_missing=False)
+        await self.apply(diff)
+        await self.load_lookups()
+
+    async def import_settings(self, rows):
+        desired = {}
+        for row in rows:
+            try:
+                desired[(str(row['Setting_Key']),)] = (_text(row['Setting_Value']),)
+            except Exception as e:
+                self.errors.append(f"Setting {row.get('Setting_Key')}: {str(e)}")
+
+        diff = await diff_table(self.db, "Settings", 'settings', ['setting_key'], ['setting_value'],
+                                desired, delete_missing=False)
+        await self.apply(diff)
+
+    # --- Relationships/state ---
+
+    async def import_lineups(self, rows):
+        """Current lineups (by team and slot) and starting lineup presets; submitted lineups are handled later"""
+        current = {}
+        starting = {}
+        for row in rows:
+            try:
+                lineup_type = str(row['Type']).strip().lower()
+                team_name = str(row['Team_Name'])
+                position = str(row['Position']).strip()
+                player_id = int(row['Player_ID'])
+
+                team_id = self.team_ids.get(team_name)
+                if player_id not in self.player_ids or not team_id:
+                    continue
+
+                if lineup_type == 'current':
+                    position_upper = position.upper()
+                    if position_upper in LINEUP_POSITIONS:
+                        slot_number = LINEUP_POSITIONS.index(position_upper) + 1
+                        current[(team_id, slot_number)] = (player_id, position_upper)
+                    else:
+                        self.errors.append(f"Current lineup: Invalid position '{position}' for Player_ID {player_id}")
+
+                elif lineup_type == 'starting':
+                    starting.setdefault(team_id, {})[position] = player_id
+
+                # Note: 'submitted' lineups are historical records, imported by import_submitted_lineups
+
+            except Exception as e:
+                self.errors.append(f"Lineup row error: {str(e)}")
+
+        diff = await diff_table(self.db, "Current Lineups", 'lineups', ['team_id', 'slot_number'],
+                                ['player_id', 'position_name'], current, delete_missing=False)
+        await self.apply(diff)
+
+        # Compare presets by content - key order and id types in stored JSON vary
+        cursor = await self.db.execute("SELECT team_id, lineup_data FROM starting_lineups")
+        live = {}
+        for team_id, lineup_json in await cursor.fetchall():
+            lineup_data = json.loads(lineup_json) if lineup_json else {}
+            live[(team_id,)] = (json.dumps({pos: int(pid) for pos, pid in lineup_data.items()}, sort_keys=True),)
+
+        desired = {(team_id,): (json.dumps(lineup, sort_keys=True),) for team_id, lineup in starting.items()}
+        diff = await diff_table(self.db, "Starting Lineups", 'starting_lineups', ['team_id'], ['lineup_data'],
+                                desired, live=live, delete_missing=False)
+        await self.apply(diff, touch=['last_updated'])
+
+    async def import_injuries(self, rows):
+        """Injuries (recovery_rounds calculated from injury_round and return_round)"""
+        desired = {}
+        for row in rows:
+            try:
+                player_id = int(row['Player_ID'])
+                if player_id in self.player_ids:
+                    injury_round = int(row['Injury_Round'])
+                    return_round = int(row['Return_Round'])
+                    desired[(player_id, str(row['Injury_Type']), injury_round, return_round - injury_round,
+                             return_round, str(row['Status']))] = ()
+            except Exception as e:
+                self.errors.append(f"Injury for Player_ID {row.get('Player_ID', 'unknown')}: {str(e)}")
+
+        diff = await diff_table(self.db, "Injuries", 'injuries',
+                                ['player_id', 'injury_type', 'injury_round', 'recovery_rounds', 'return_round', 'status'],
+                                [], desired)
+        await self.apply(diff)
+
+    async def import_suspensions(self, rows):
+        """Suspensions (games_missed calculated from suspension_round and return_round)"""
+        desired = {}
+        for row in rows:
+            try:
+                player_id = int(row['Player_ID'])
+                if player_id in self.player_ids:
+                    suspension_round = int(row['Suspension_Round'])
+                    return_round = int(row['Return_Round'])
+                    desired[(player_id, suspension_round, return_round - suspension_round, return_round,
+                             str(row['Reason']), str(row['Status']))] = ()
+            except Exception as e:
+                self.errors.append(f"Suspension for Player_ID {row.get('Player_ID', 'unknown')}: {str(e)}")
+
+        diff = await diff_table(self.db, "Suspensions", 'suspensions',
+                                ['player_id', 'suspension_round', 'games_missed', 'return_round', 'suspension_reason', 'status'],
+                                [], desired)
+        await self.apply(diff)
+
+    async def import_trades(self, rows):
+        value_columns = ['initiating_team_id', 'receiving_team_id', 'initiating_players', 'receiving_players',
+                         'status', 'created_at', 'responded_at', 'approved_at', 'created_by_user_id',
+                         'responded_by_user_id', 'approved_by_user_id', 'original_trade_id']
+        # Pick columns aren't exported - only touch them if the sheet has them
+        pick_columns = [column for column in ('Initiating_Picks', 'Receiving_Picks') if rows and column in rows[0]]
+        value_columns += [column.lower() for column in pick_columns]
+
+        desired = {}
+        for row in rows:
+            try:
+                init_team_id = self.team_ids.get(str(row['Initiating_Team']))
+                recv_team_id = self.team_ids.get(str(row['Receiving_Team']))
+                if init_team_id and recv_team_id:
+                    desired[(int(row['Trade_ID']),)] = (
+                        init_team_id, recv_team_id,
+                        _text(row['Initiating_Players']), _text(row['Receiving_Players']),
+                        str(row['Status']),
+                        _text(row['Created_At']), _text(row['Responded_At']), _text(row['Approved_At']),
+                        _text(row['Created_By_User_ID']), _text(row['Responded_By_User_ID']), _text(row['Approved_By_User_ID']),
+                        int(row['Original_Trade_ID']) if row['Original_Trade_ID'] else None,
+                    ) + tuple(str(row[column]) if row[column] is not None else '' for column in pick_columns)
+            except Exception as e:
+                self.errors.append(f"Trade {row.get('Trade_ID')}: {str(e)}")
+
+        diff = await diff_table(self.db, "Trades", 'trades', ['trade_id'], value_columns, desired)
+        await self.apply(diff)
+
+    async def import_matches(self, rows):
+        desired = {}
+        for row in rows:
+            try:
+                season_id = self.season_ids.get(int(row['Season']))
+                home_team_id = self.team_ids.get(str(row['Home_Team']))
+                away_team_id = self.team_ids.get(str(row['Away_Team']))
+                if season_id and home_team_id and away_team_id:
+                    desired[(int(row['Match_ID']),)] = (
+                        season_id, int(row['Round']), home_team_id, away_team_id,
+                        int(row['Home_Score']), int(row['Away_Score']), int(row['Simulated'])
+                    )
+            except Exception as e:
+                self.errors.append(f"Match {row.get('Match_ID')}: {str(e)}")
+
+        diff = await diff_table(self.db, "Matches", 'matches', ['match_id'],
+                                ['season_id', 'round_number', 'home_team_id', 'away_team_id',
+                                 'home_score', 'away_score', 'simulated'],
+                                desired)
+        await self.apply(diff)
+
+    async def import_drafts(self, rows):
+        """Update live draft fields on existing drafts (drafts are created from Draft_Picks)"""
+        cursor = await self.db.execute(
+            "SELECT draft_id, started_at, completed_at, current_pick_number, status FROM drafts"
+        )
+        live = {(draft_id,): values for draft_id, *values in await cursor.fetchall()}
+        live = {key: tuple(values) for key, values in live.items()}
+
+        desired = {}
+        for row in rows:
+            try:
+                draft_id = int(row['Draft_ID']) if row['Draft_ID'] is not None else None
+                if not draft_id or (draft_id,) not in live:
+                    continue
+
+                # No Status in the sheet keeps the draft's current status
+                status = str(row['Status']) if row.get('Status') is not None else live[(draft_id,)][3]
+                desired[(draft_id,)] = (
+                    _text(row.get('Started_At')), _text(row.get('Completed_At')),
+                    _int(row.get('Current_Pick_Number'), 0), status
+                )
+            except Exception as e:
+                self.errors.append(f"Draft {row.get('Draft_ID', 'Unknown')}: {str(e)}")
+
+        diff = await diff_table(self.db, "Drafts", 'drafts', ['draft_id'],
+                                ['started_at', 'completed_at', 'current_pick_number', 'status'],
+                                desired, live=live, insert_missing=False, delete_missing=False)
+        await self.apply(diff)
+
+    async def import_draft_picks(self, rows):
+        cursor = await self.db.execute("SELECT draft_id, draft_name FROM drafts")
+        draft_ids = {draft_name: draft_id for draft_id, draft_name in await cursor.fetchall()}
+
+        def draft_season(draft_name):
+            # Draft names look like "Season 9 National Draft", which is for season 10
+            if 'Season' in draft_name:
+                try:
+                    return int(draft_name.split('Season')[1].split()[0]) + 1
+                except (IndexError, ValueError):
+                    pass
+            return None
+
+        # Create drafts that only exist in the sheet so their picks have a draft_id
+        new_drafts = TableDiff("Drafts (created)", 'drafts', [], ['draft_name', 'season_number', 'status', 'rounds'])
+        seen = set()
+        for row in rows:
+            draft_name = str(row['Draft_Name']) if row['Draft_Name'] is not None else ''
+            if draft_name and draft_name not in draft_ids and draft_name not in seen:
+                seen.add(draft_name)
+                # Determine status based on whether pick_number is set
+                draft_status = 'current' if row['Pick'] is not None else 'future'
+                new_drafts.inserts.append((draft_name, draft_season(draft_name), draft_status, 4))
+        if new_drafts.inserts:
+            await self.apply(new_drafts)
+            cursor = await self.db.execute("SELECT draft_id, draft_name FROM drafts")
+            draft_ids = {draft_name: draft_id for draft_id, draft_name in await cursor.fetchall()}
+
+        desired = {}
+        for row in rows:
+            try:
+                current_team_id = self.team_ids.get(str(row['Current_Team']))
+
+                # Parse original_team_id from pick_origin format: "Team Name R1" or "Team Name F/S Match"
+                original_team_id = None
+                pick_origin = str(row['Pick_Origin']) if row['Pick_Origin'] else ''
+                if ' R' in pick_origin:
+                    original_team_id = self.team_ids.get(pick_origin.split(' R')[0])
+                elif ' F/S' in pick_origin:
+                    original_team_id = self.team_ids.get(pick_origin.split(' F/S')[0])
+
+                # Fallback to current team if pick_origin parsing failed
+                if not original_team_id:
+                    original_team_id = current_team_id
+
+                player_id = int(row['Player_ID']) if row['Player_ID'] else None
+                if player_id not in self.player_ids:
+                    player_id = None
+
+                pick_id = _int(row['Pick_ID'])
+                draft_name = str(row['Draft_Name']) if row['Draft_Name'] is not None else ''
+                draft_id = draft_ids.get(draft_name)
+
+                if current_team_id and pick_id and draft_id:
+                    desired[(pick_id,)] = (
+                        draft_id, draft_name, draft_season(draft_name), _int(row['Round']), _int(row['Pick']),
+                        pick_origin, original_team_id, current_team_id, player_id,
+                        _int(row.get('Passed'), 0), _text(row.get('Picked_At'))
+                    )
+            except Exception as e:
+                self.errors.append(f"Draft Pick {row.get('Pick_ID')}: {str(e)}")
+
+        diff = await diff_table(self.db, "Draft Picks", 'draft_picks', ['pick_id'],
+                                ['draft_id', 'draft_name', 'season_number', 'round_number', 'pick_number',
+                                 'pick_origin', 'original_team_id', 'current_team_id', 'player_selected_id',
+                                 'passed', 'picked_at'],
+                                desired)
+        await self.apply(diff)
+
+    async def import_ladder_positions(self, rows):
+        desired = {}
+        for row in rows:
+            try:
+                season_id = self.season_ids.get(int(row['Season']))
+                team_id = self.team_ids.get(str(row['Team']))
+                if season_id and team_id:
+                    desired[(int(row['Ladder_ID']),)] = (season_id, team_id, int(row['Position']))
+            except Exception as e:
+                self.errors.append(f"Ladder Position {row.get('Ladder_ID')}: {str(e)}")
+
+        diff = await diff_table(self.db, "Ladder Positions", 'ladder_positions', ['ladder_id'],
+                                ['season_id', 'team_id', 'position'], desired)
+        # Teams swapping places would trip UNIQUE(season_id, position) mid-update
+        await self.apply(diff, replace_updates=True)
+
+    async def import_submitted_lineups(self, rows):
+        """Submitted lineups from the merged Lineups sheet (Type = 'submitted')"""
+        submitted_rows = [row for row in rows if row['Type'] == 'submitted']
+        if not submitted_rows:
+            return
+
+        # Group by team, season, and round to rebuild each submission (rows stay in position order)
+        grouped = {}
+        for row in submitted_rows:
+            key = (row['Team_Name'], row['Season'], row['Round'])
+            if None not in key:
+                grouped.setdefault(key, []).append(row['Player_ID'])
+
+        desired = {}
+        for (team_name, season_num, round_num), player_ids in grouped.items():
+            try:
+                team_id = self.team_ids.get(str(team_name))
+                season_id = self.season_ids.get(int(season_num))
+                if team_id and season_id:
+                    desired[(team_id, season_id, int(round_num))] = (json.dumps([int(player_id) for player_id in player_ids]),)
+            except Exception as e:
+                self.errors.append(f"Submitted Lineup for {team_name} S{season_num} R{round_num}: {str(e)}")
+
+        cursor = await self.db.execute("SELECT team_id, season_id, round_number, player_ids FROM submitted_lineups")
+        live = {}
+        for team_id, season_id, round_number, player_ids_json in await cursor.fetchall():
+            player_ids = json.loads(player_ids_json) if player_ids_json else []
+            live[(team_id, season_id, round_number)] = (json.dumps([int(player_id) for player_id in player_ids]),)
+
+        diff = await diff_table(self.db, "Submitted Lineups", 'submitted_lineups',
+                                ['team_id', 'season_id', 'round_number'], ['player_ids'], desired, live=live)
+        await self.apply(diff)
+
+    # --- League configuration ---
+
+    async def import_compensation_chart(self, rows):
+        """Compensation chart from its 2D export table (rows = ages, columns = individual OVRs)"""
+        # Build a map of (age, ovr) -> band
+        cell_map = {}
+        for row in rows:
+            # First column is ages, other columns are individual OVRs
+            age_col, *ovr_cols = row.keys()  # age_col should be "Age \ OVR" or similar
+            if row[age_col] is None:
+                continue
+            try:
+                age = int(float(str(row[age_col]).strip()))  # Convert through float first to handle "19.0" format
+            except ValueError:
+                continue
+
+            for ovr_col in ovr_cols:
+                band_value = row[ovr_col]
+                if band_value is None or band_value == '':
+                    continue
+                try:
+                    band = int(float(band_value))
+                    ovr = int(float(str(ovr_col)))  # Column name might be int or string
+                    cell_map[(age, ovr)] = band
+                except Exception as e:
+                    self.errors.append(f"Compensation Chart cell parsing error at age {age}, OVR {ovr_col}: {str(e)}")
+
+        if not cell_map:
+            self.errors.append("Compensation Chart: No valid data found in sheet. Check that cells contain numeric values for bands.")
+            return
+
+        # Group consecutive OVRs with the same band at each age into ranges
+        desired = {}
+        for age in sorted({age for age, _ in cell_map}):
+            ovrs = sorted(ovr for cell_age, ovr in cell_map if cell_age == age)
+            start = prev = ovrs[0]
+            for ovr in ovrs[1:] + [None]:
+                if ovr is not None and ovr == prev + 1 and cell_map[(age, ovr)] == cell_map[(age, start)]:
+                    prev = ovr
+                    continue
+                desired[(age, age, start, prev if prev != start else None, cell_map[(age, start)])] = ()
+                start = prev = ovr
+
+        diff = await diff_table(self.db, "Compensation Chart", 'compensation_chart',
+                                ['min_age', 'max_age', 'min_ovr', 'max_ovr', 'compensation_band'], [], desired)
+        await self.apply(diff)
+
+    async def import_contract_config(self, rows):
+        desired = {}
+        for row in rows:
+            try:
+                # Skip empty rows
+                if row['Min_Age'] is None or row['Min_Age'] == '':
+                    continue
+                max_age = int(row['Max_Age']) if row['Max_Age'] is not None and row['Max_Age'] != '' else None
+                desired[(int(row['Min_Age']), max_age, int(row['Contract_Years']))] = ()
+            except Exception as e:
+                self.errors.append(f"Contract Config row: {str(e)}")
+
+        diff = await diff_table(self.db, "Contract Config", 'contract_config',
+                                ['min_age', 'max_age', 'contract_years'], [], desired)
+        await self.apply(diff)
+
+    async def import_draft_value_index(self, rows):
+        desired = {}
+        for row in rows:
+            try:
+                # Skip empty rows
+                if row['Pick_Number'] is None or row['Pick_Number'] == '':
+                    continue
+                desired[(int(row['Pick_Number']),)] = (int(row['Points_Value']),)
+            except Exception as e:
+                self.errors.append(f"Draft Value Index row: {str(e)}")
+
+        diff = await diff_table(self.db, "Draft Value Index", 'draft_value_index', ['pick_number'],
+                                ['points_value'], desired)
+        await self.apply(diff)
+
+    # --- Free agency ---
+
+    async def import_free_agency_periods(self, rows):
+        desired = {}
+        new_periods = []
+        for row in rows:
+            try:
+                values = (
+                    int(row['Season_Number']), str(row['Status']), _int(row['Auction_Points'], 300),
+                    _text(row['Started_At']), _text(row['Resign_Started_At']), _text(row['Bidding_Started_At']),
+                    _text(row['Bidding_Ended_At']), _text(row['Matching_Ended_At'])
+                )
+                if row['Period_ID']:
+                    desired[(int(row['Period_ID']),)] = values
+                else:
+                    new_periods.append((None,) + values)
+            except Exception as e:
+                self.errors.append(f"Free Agency Periods row: {str(e)}")
+
+        diff = await diff_table(self.db, "Free Agency Periods", 'free_agency_periods', ['period_id'],
+                                ['season_number', 'status', 'auction_points', 'started_at', 'resign_started_at',
+                                 'bidding_started_at', 'bidding_ended_at', 'matching_ended_at'],
+                                desired)
+        diff.inserts += new_periods
+        await self.apply(diff)
+
+    async def import_free_agency_bids(self, rows):
+        desired = {}
+        for row in rows:
+            try:
+                if not row['Bid_ID']:
+                    continue
+
+                team_id = self.team_ids.get(str(row['Team']))
+                if not team_id:
+                    self.errors.append(f"Free Agency Bids: Team '{row['Team']}' not found")
+                    continue
+
+                player_id = int(row['Player_ID'])
+                if player_id not in self.player_ids:
+                    self.errors.append(f"Free Agency Bids: Player_ID '{player_id}' not found")
+                    continue
+
+                desired[(int(row['Bid_ID']),)] = (
+                    int(row['Period_ID']), team_id, player_id, int(row['Bid_Amount']),
+                    str(row['Status']), _text(row['Placed_At'])
+                )
+            except Exception as e:
+                self.errors.append(f"Free Agency Bids row: {str(e)}")
+
+        diff = await diff_table(self.db, "Free Agency Bids", 'free_agency_bids', ['bid_id'],
+                                ['period_id', 'team_id', 'player_id', 'bid_amount', 'status', 'placed_at'],
+                                desired)
+        await self.apply(diff)
+
+    async def import_free_agency_resigns(self, rows):
+        desired = {}
+        for row in rows:
+            try:
+                if not row['Resign_ID']:
+                    continue
+
+                team_id = self.team_ids.get(str(row['Team']))
+                if not team_id:
+                    self.errors.append(f"Free Agency Re-Sign: Team '{row['Team']}' not found")
+                    continue
+
+                player_id = int(row['Player_ID'])
+                if player_id not in self.player_ids:
+                    self.errors.append(f"Free Agency Re-Sign: Player_ID '{player_id}' not found")
+                    continue
+
+                desired[(int(row['Resign_ID']),)] = (
+                    int(row['Period_ID']), team_id, player_id, _int(row['Confirmed'], 0), _text(row['Confirmed_At'])
+                )
+            except Exception as e:
+                self.errors.append(f"Free Agency Re-Signs row: {str(e)}")
+
+        diff = await diff_table(self.db, "Free Agency Re-Signs", 'free_agency_resigns', ['resign_id'],
+                                ['period_id', 'team_id', 'player_id', 'confirmed', 'confirmed_at'],
+                                desired)
+        await self.apply(diff)
+
+    async def import_free_agency_results(self, rows):
+        desired = {}
+        for row in rows:
+            try:
+                if not row['Result_ID']:
+                    continue
+
+                player_id = int(row['Player_ID'])
+                if player_id not in self.player_ids:
+                    self.errors.append(f"Free Agency Results: Player_ID '{player_id}' not found")
+                    continue
+
+                original_team_id = self.team_ids.get(str(row['Original_Team']))
+                if not original_team_id:
+                    self.errors.append(f"Free Agency Results: Original team '{row['Original_Team']}' not found")
+                    continue
+
+                winning_team_id = self.team_ids.get(str(row['Winning_Team'])) if row['Winning_Team'] else None
+
+                desired[(int(row['Result_ID']),)] = (
+                    int(row['Period_ID']), player_id, original_team_id, winning_team_id,
+                    int(row['Winning_Bid']) if row['Winning_Bid'] else None,
+                    _int(row['Matched'], 0),
+                    int(row['Compensation_Band']) if row['Compensation_Band'] else None,
+                    _text(row['Confirmed_At'])
+                )
+            except Exception as e:
+                self.errors.append(f"Free Agency Results row: {str(e)}")
+
+        diff = await diff_table(self.db, "Free Agency Results", 'free_agency_results', ['result_id'],
+                                ['period_id', 'player_id', 'original_team_id', 'winning_team_id', 'winning_bid',
+                                 'matched', 'compensation_band', 'confirmed_at'],
+                                desired)
+        await self.apply(diff)
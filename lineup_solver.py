@@ -0,0 +1,146 @@
+"""Best-lineup solver for the lineup menu's auto-fill.
+
+Every player position in positions.VALID_POSITIONS is eligible for some of the
+field slots (backs, midfield, ruck, forwards) and for any interchange slot.
+Filling the 23 slots is then an assignment problem: each slot gets one player,
+each player at most one slot, and the total value - OVR, counted at
+match_engine.INTERCHANGE_WEIGHT on the bench so the best players take the field,
+less a large penalty for any player out of position - is as high as possible.
+It's solved exactly with the Hungarian algorithm, which for a 23 slot lineup and
+a 40 or so player list takes a few milliseconds in plain Python.
+"""
+
+from positions import VALID_POSITIONS
+from match_engine import INTERCHANGE_WEIGHT
+
+BACK_SLOTS = ["LBP", "FB", "RBP", "LHB", "CHB", "RHB"]
+MIDFIELD_SLOTS = ["LW", "C", "RW", "RR", "RO"]
+RUCK_SLOTS = ["R"]
+FORWARD_SLOTS = ["LHF", "CHF", "RHF", "LFP", "FF", "RFP"]
+INTERCHANGE_SLOTS = ["INT1", "INT2", "INT3", "INT4", "INT5"]
+
+# Player positions that can play in each group of field slots
+SLOT_ELIGIBILITY = {}
+for slots, positions in [
+    (BACK_SLOTS, ["GEN DEF", "KEY DEF", "DEF-MID", "RUCK-DEF", "UTILITY", "SWINGMAN"]),
+    (MIDFIELD_SLOTS, ["MID", "MID-FWD", "DEF-MID", "UTILITY"]),
+    (RUCK_SLOTS, ["RUCK", "RUCK-DEF", "RUCK-FWD"]),
+    (FORWARD_SLOTS, ["GEN FWD", "KEY FWD", "MID-FWD", "RUCK-FWD", "UTILITY", "SWINGMAN"]),
+    (INTERCHANGE_SLOTS, VALID_POSITIONS),
+]:
+    assert set(positions) <= set(VALID_POSITIONS)
+    for slot in slots:
+        SLOT_ELIGIBILITY[slot] = positions
+
+# Taken off a player's value in a slot they aren't eligible for - more than any
+# OVR, so out-of-position players are only used when nobody eligible is left
+OUT_OF_POSITION_PENALTY = 1000
+
+
+def solve_assignment(value):
+    """
+    Maximum-value assignment of rows to distinct columns (Hungarian algorithm).
+
+    Args:
+        value: n x m list of lists with n <= m
+
+    Returns:
+        list: The column assigned to each row
+    """
+    n, m = len(value), len(value[0]) if value else 0
+    infinity = float('inf')
+    # 1-indexed potentials and matching, column 0 is the unmatched sentinel
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    match = [0] * (m + 1)  # column -> row
+    way = [0] * (m + 1)
+
+    for row in range(1, n + 1):
+        match[0] = row
+        column = 0
+        min_slack = [infinity] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[column] = True
+            current_row = match[column]
+            delta = infinity
+            next_column = 0
+            costs = value[current_row - 1]
+            for j in range(1, m + 1):
+                if not used[j]:
+                    slack = -costs[j - 1] - u[current_row] - v[j]
+                    if slack < min_slack[j]:
+                        min_slack[j] = slack
+                        way[j] = column
+                    if min_slack[j] < delta:
+                        delta = min_slack[j]
+                        next_column = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_slack[j] -= delta
+            column = next_column
+            if match[column] == 0:
+                break
+        # Flip the augmenting path
+        while column:
+            previous = way[column]
+            match[column] = match[previous]
+            column = previous
+
+    assignment = [0] * n
+    for j in range(1, m + 1):
+        if match[j]:
+            assignment[match[j] - 1] = j - 1
+    return assignment
+
+
+def best_lineup(slots, players):
+    """
+    Pick the highest-value lineup from a list of available players.
+
+    Args:
+        slots: Slot names to fill, in lineup order (on-field, then INT1-INT5)
+        players: List of (player_id, position, overall_rating) - already without
+                 injured or suspended players
+
+    Returns:
+        dict: slot name -> player_id. Slots are left out when there aren't enough players.
+    """
+    # Best first, so ties always resolve the same way
+    players = sorted(players, key=lambda player: (-(player[2] or 0), player[0]))
+    if not slots or not players:
+        return {}
+
+    value = []
+    for slot in slots:
+        eligible = SLOT_ELIGIBILITY.get(slot, VALID_POSITIONS)
+        weight = INTERCHANGE_WEIGHT if slot in INTERCHANGE_SLOTS else 1.0
+        value.append([
+            weight * (rating or 0) - (0 if position in eligible else OUT_OF_POSITION_PENALTY)
+            for _, position, rating in players
+        ])
+
+    # Short of players - pad with empty picks, penalised on the field so any gaps are on the bench
+    if len(players) < len(slots):
+        empty = len(slots) - len(players)
+        for slot, row in zip(slots, value):
+            row.extend([-OUT_OF_POSITION_PENALTY if slot not in INTERCHANGE_SLOTS else 0.0] * empty)
+
+    assignment = solve_assignment(value)
+    return {slot: players[column][0] for slot, column in zip(slots, assignment) if column < len(players)}
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    rng = random.Random(0)
+    slots = list(SLOT_ELIGIBILITY)
+    players = [(i, rng.choice(VALID_POSITIONS), rng.randint(50, 95)) for i in range(44)]
+    start = time.perf_counter()
+    for _ in range(100):
+        lineup = best_lineup(slots, players)
+    print(f"{len(players)} players: {(time.perf_counter() - start) * 10:.2f}ms per lineup")
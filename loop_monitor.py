@@ -0,0 +1,180 @@
+"""Event loop stall watchdog.
+
+Synchronous work on the event loop - building a workbook, formatting a long
+embed, sorting a big roster - holds up every other interaction and the gateway
+heartbeat until it finishes. A blocked loop can't notice that about itself, so
+the watch is split in two:
+
+- a heartbeat task on the loop wakes every HEARTBEAT_INTERVAL and records how
+  late it woke (the loop lag metrics and /metrics report)
+- a watchdog thread checks the heartbeat; once it is more than the stall
+  threshold overdue, the thread snapshots the loop thread's stack - which is
+  exactly the code doing the blocking - and the task that was running, with
+  the interaction it belongs to when query_log knows it
+
+When the loop gets going again the heartbeat reports the stall with its full
+length: always a line in the log, and the stack to the bot logs channel at most
+once per report interval (stalls in between are counted into the next report).
+
+This is the same attribution asyncio's debug mode gives with
+loop.slow_callback_duration, without debug mode's overhead on every callback.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+
+from config import LOOP_STALL_MS, LOOP_STALL_REPORT_INTERVAL
+import metrics
+import query_log
+from settings_store import settings
+
+# Seconds between heartbeats
+HEARTBEAT_INTERVAL = 0.1
+# Innermost stack frames kept in a report
+STACK_FRAMES = 12
+
+
+class Stall:
+    """What the watchdog thread saw while the loop was blocked"""
+
+    def __init__(self, stack, task_name, interaction_name):
+        self.stack = stack
+        self.task_name = task_name
+        self.interaction_name = interaction_name
+        self.seconds = None
+
+    def summary(self):
+        where = self.interaction_name or self.task_name or "unknown task"
+        return f"Event loop blocked for {self.seconds * 1000:.0f}ms in {where}"
+
+
+def running_task_names(loop):
+    """
+    The task running on a (blocked) loop and its interaction, read from another thread.
+
+    Returns:
+        tuple: (task name, interaction name) - either may be None
+    """
+    try:
+        task = asyncio.current_task(loop)
+    except RuntimeError:
+        return None, None
+    if task is None:
+        return None, None
+    coro = task.get_coro()
+    task_name = f"{task.get_name()} ({getattr(coro, '__qualname__', coro)})"
+    queries = query_log.interaction_tasks.get(task)
+    if queries is None and hasattr(task, 'get_context'):
+        # A task the interaction started - its context carries the interaction (3.12+)
+        queries = task.get_context().get(query_log.current)
+    return task_name, queries.name if queries is not None else None
+
+
+class LoopMonitor:
+    """
+    Heartbeat task plus watchdog thread.
+
+    Args:
+        bot: The AFFLBot, for the bot logs channel
+        stall_ms: Milliseconds the loop may be blocked before it's reported
+        report_interval: Minimum seconds between stall reports to the bot logs channel
+    """
+
+    def __init__(self, bot, stall_ms=LOOP_STALL_MS, report_interval=LOOP_STALL_REPORT_INTERVAL):
+        self.bot = bot
+        self.stall_seconds = stall_ms / 1000
+        self.report_interval = report_interval
+        self.loop = None
+        self.loop_thread_id = None
+        self.last_beat = time.monotonic()
+        self.stall = None  # set by the watchdog thread, taken by the heartbeat
+        self.last_report = None
+        self.unreported = 0
+        self.heartbeat_task = None
+        self.thread = None
+        self.stopped = threading.Event()
+
+    def start(self):
+        """Start watching the running loop (call from the loop thread)"""
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread_id = threading.get_ident()
+        # Only used in asyncio debug mode - keep its warnings in line with ours
+        self.loop.slow_callback_duration = self.stall_seconds
+        self.last_beat = time.monotonic()
+        self.heartbeat_task = asyncio.create_task(self.heartbeat())
+        self.thread = threading.Thread(target=self.watch, name="loop-monitor", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.heartbeat_task is not None:
+            self.heartbeat_task.cancel()
+
+    async def heartbeat(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            lag = max(0.0, time.perf_counter() - start - HEARTBEAT_INTERVAL)
+            self.last_beat = time.monotonic()
+            metrics.record_loop_lag(lag * 1000)
+
+            stall = self.stall
+            if stall is not None:
+                self.stall = None
+                stall.seconds = lag
+                metrics.record_loop_stall()
+                self.report(stall)
+
+    def watch(self):
+        """Watchdog thread - snapshot the loop thread once per stall"""
+        while not self.stopped.wait(HEARTBEAT_INTERVAL / 2):
+            overdue = time.monotonic() - self.last_beat - HEARTBEAT_INTERVAL
+            if overdue < self.stall_seconds or self.stall is not None:
+                continue
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is None:
+                continue
+            # The event loop's own frames are the same in every stall
+            entries = [entry for entry in traceback.extract_stack(frame) if '/asyncio/' not in entry.filename.replace('\\', '/')]
+            del frame
+            stack = traceback.format_list(entries[-STACK_FRAMES:])
+            task_name, interaction_name = running_task_names(self.loop)
+            self.stall = Stall(stack, task_name, interaction_name)
+            # Wait for this stall to be picked up before looking for another
+            while self.stall is not None and not self.stopped.wait(HEARTBEAT_INTERVAL / 2):
+                pass
+
+    def report(self, stall):
+        now = time.monotonic()
+        if self.last_report is not None and now - self.last_report < self.report_interval:
+            self.unreported += 1
+            print(f"[loop monitor] {stall.summary()} (report suppressed)")
+            return
+        self.last_report = now
+        suppressed, self.unreported = self.unreported, 0
+        print(f"[loop monitor] {stall.summary()}\n{''.join(stall.stack).rstrip()}")
+        asyncio.create_task(self.post(stall, suppressed))
+
+    async def post(self, stall, suppressed):
+        """Send a stall report to the bot logs channel, if one is configured"""
+        try:
+            channel = await settings.channel(self.bot, 'bot_logs_channel_id')
+            if channel is None:
+                return
+
+            message = f"⚠️ **{stall.summary()}**\n"
+            if stall.task_name and stall.interaction_name:
+                message += f"Task: `{stall.task_name}`\n"
+            if suppressed:
+                message += f"{suppressed} more stall(s) since the last report - see the logs\n"
+            # Keep the innermost frames that fit in one message
+            frames = list(stall.stack)
+            while frames and len(message) + sum(len(f) for f in frames) + 10 > 2000:
+                frames.pop(0)
+            message += "```\n" + "".join(frames) + "```"
+            await channel.send(message)
+        except Exception as e:
+            print(f"[loop monitor] Could not post stall report: {e}")
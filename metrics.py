@@ -0,0 +1,301 @@
+"""In-memory latency and counter metrics, read by /perfstats and the /metrics exporter.
+
+Every slash command, autocomplete, view and modal callback gets its wall time,
+SQL time (from query_log) and Discord API time recorded under its name -
+"/roster", "/searchplayers autocomplete", "DraftPickView.pick_button" - along
+with whether its first response reached Discord within the 3 second window.
+
+Latencies go into HDR-style histograms: values are bucketed on a log scale with
+SUB_BUCKETS buckets per doubling, so every percentile is within about 9% of the
+true value while a histogram is just a small dict of counts. Each series keeps
+one bucket set per minute in a ring covering the last day, so any window up to
+a day is a merge of the minutes it spans, and nothing is ever written to disk.
+"""
+
+import asyncio
+import contextvars
+import functools
+import math
+import time
+
+import discord
+import discord.http
+import discord.webhook.async_
+
+import query_log
+
+SUB_BUCKETS = 8
+# Minutes of history kept for every series
+WINDOW_MINUTES = 24 * 60
+# Discord fails an interaction that hasn't been responded to (or deferred) in this long
+RESPONSE_DEADLINE = 3.0
+
+
+class Histogram:
+    """Log-bucketed latency histogram, in milliseconds"""
+
+    def __init__(self):
+        self.buckets = {}  # bucket index -> count
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def bucket(value):
+        if value <= 0:
+            return -SUB_BUCKETS * 10
+        return math.floor(math.log2(value) * SUB_BUCKETS)
+
+    @staticmethod
+    def bucket_upper(index):
+        return 2 ** ((index + 1) / SUB_BUCKETS)
+
+    def record(self, value):
+        index = self.bucket(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, fraction):
+        """
+        Upper edge of the bucket holding the given fraction of values (capped at the max seen).
+
+        Returns:
+            float: Milliseconds, or None if nothing was recorded
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.bucket_upper(index), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+
+class InteractionStats:
+    """One minute (or a merged window) of a series: latency plus where the time went"""
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.db_ms = 0.0
+        self.discord_ms = 0.0
+        self.late_responses = 0
+        self.errors = 0
+        self.auto_deferrals = 0
+
+    def merge(self, other):
+        self.latency.merge(other.latency)
+        self.db_ms += other.db_ms
+        self.discord_ms += other.discord_ms
+        self.late_responses += other.late_responses
+        self.errors += other.errors
+        self.auto_deferrals += other.auto_deferrals
+
+
+class Ring:
+    """
+    Per-minute slots for the last WINDOW_MINUTES, plus a running total since startup.
+
+    Args:
+        factory: Makes an empty slot - anything with merge()
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.slots = {}  # minute number -> slot
+        self.lifetime = factory()
+
+    def current(self, now=None):
+        minute = int((now if now is not None else time.monotonic()) // 60)
+        slot = self.slots.get(minute)
+        if slot is None:
+            slot = self.slots[minute] = self.factory()
+            # Drop anything that has aged out of the window
+            oldest = minute - WINDOW_MINUTES
+            for stale in [m for m in self.slots if m <= oldest]:
+                del self.slots[stale]
+        return slot
+
+    def window(self, minutes, now=None):
+        """Everything recorded in the last `minutes` minutes, merged into one slot"""
+        minute = int((now if now is not None else time.monotonic()) // 60)
+        merged = self.factory()
+        for slot_minute, slot in self.slots.items():
+            if slot_minute > minute - minutes:
+                merged.merge(slot)
+        return merged
+
+
+class Counter:
+    def __init__(self):
+        self.value = 0
+
+    def merge(self, other):
+        self.value += other.value
+
+
+current = contextvars.ContextVar('metrics_current', default=None)
+
+# Series name -> Ring of InteractionStats
+interactions = {}
+# Cache name -> (Ring of hit Counters, Ring of miss Counters)
+caches = {}
+# Every SQL statement's duration since startup, in milliseconds
+sql_statements = Histogram()
+# Event loop lag samples since startup (from loop_monitor), in milliseconds, and the latest one
+loop_lag = Histogram()
+last_loop_lag = 0.0
+# Stalls loop_monitor caught past its threshold
+loop_stalls = 0
+# Discord API requests sent but not yet answered (includes any waiting on a rate limit)
+discord_requests_in_flight = 0
+
+
+def record_interaction(name, seconds, db_seconds=0.0, discord_seconds=0.0, late=False, failed=False,
+                       deferred=False):
+    ring = interactions.get(name)
+    if ring is None:
+        ring = interactions[name] = Ring(InteractionStats)
+    for stats in (ring.current(), ring.lifetime):
+        stats.latency.record(seconds * 1000)
+        stats.db_ms += db_seconds * 1000
+        stats.discord_ms += discord_seconds * 1000
+        stats.late_responses += late
+        stats.errors += failed
+        stats.auto_deferrals += deferred
+
+
+def record_statement(seconds):
+    """query_log hook - one SQL statement finished"""
+    sql_statements.record(seconds * 1000)
+
+
+def record_loop_lag(milliseconds):
+    """How late the event loop woke a sleeping task - time every other task also waited"""
+    global last_loop_lag
+    last_loop_lag = milliseconds
+    loop_lag.record(milliseconds)
+
+
+def record_loop_stall():
+    global loop_stalls
+    loop_stalls += 1
+
+
+def cache_lookup(name, hit):
+    """Count a cache hit or miss for /perfstats"""
+    rings = caches.get(name)
+    if rings is None:
+        rings = caches[name] = (Ring(Counter), Ring(Counter))
+    ring = rings[0] if hit else rings[1]
+    ring.current().value += 1
+    ring.lifetime.value += 1
+
+
+def interaction_window(minutes):
+    """
+    Returns:
+        dict: Series name -> merged InteractionStats, for series with anything in the window
+    """
+    merged = {name: ring.window(minutes) for name, ring in interactions.items()}
+    return {name: stats for name, stats in merged.items() if stats.latency.count}
+
+
+def cache_window(minutes):
+    """
+    Returns:
+        dict: Cache name -> (hits, misses), for caches used in the window
+    """
+    totals = {}
+    for name, (hits, misses) in caches.items():
+        hit_count, miss_count = hits.window(minutes).value, misses.window(minutes).value
+        if hit_count or miss_count:
+            totals[name] = (hit_count, miss_count)
+    return totals
+
+
+class InteractionTiming:
+    """What one running interaction has spent so far"""
+
+    def __init__(self, name, interaction, queries):
+        self.name = name
+        self.interaction = interaction
+        self.queries = queries
+        self.started = time.perf_counter()
+        self.responded_after = None
+        self.discord_seconds = 0.0
+        self.auto_deferred = False  # set by deferral when the handler ran out of time
+
+
+def finish_interaction(timing, task):
+    seconds = time.perf_counter() - timing.started
+    responded_after = timing.responded_after
+    # No response at all past the deadline fails the interaction just the same
+    late = (responded_after if responded_after is not None else seconds) > RESPONSE_DEADLINE
+    # Errors in commands are handled inside the task, which marks the interaction instead
+    failed = (task.cancelled() or task.exception() is not None
+              or getattr(timing.interaction, 'command_failed', False))
+    record_interaction(timing.name, seconds, timing.queries.seconds, timing.discord_seconds, late, failed,
+                       timing.auto_deferred)
+
+
+def begin_interaction(name, interaction, queries):
+    """query_log hook - start timing the interaction running in the current task"""
+    if interaction is not None and interaction.type == discord.InteractionType.autocomplete:
+        name = f"{name} autocomplete"
+    timing = InteractionTiming(name, interaction, queries)
+    current.set(timing)
+    task = asyncio.current_task()
+    if task is not None:
+        task.add_done_callback(functools.partial(finish_interaction, timing))
+
+
+def timed_request(original):
+    """Wrap a Discord HTTP request method so its time is charged to the running interaction"""
+
+    @functools.wraps(original)
+    async def request(self, route, *args, **kwargs):
+        global discord_requests_in_flight
+        timing = current.get()
+        start = time.perf_counter()
+        if (timing is not None and timing.responded_after is None
+                and route.path.startswith('/interactions/') and route.path.endswith('/callback')):
+            timing.responded_after = start - timing.started
+        discord_requests_in_flight += 1
+        try:
+            return await original(self, route, *args, **kwargs)
+        finally:
+            discord_requests_in_flight -= 1
+            if timing is not None:
+                timing.discord_seconds += time.perf_counter() - start
+
+    request.metrics = True
+    return request
+
+
+def install(bot):
+    """Record every interaction the bot handles (and its SQL, through query_log). Call from setup_hook."""
+    query_log.instrument_interactions(bot)
+    if begin_interaction not in query_log.interaction_hooks:
+        query_log.interaction_hooks.append(begin_interaction)
+        query_log.statement_hooks.append(record_statement)
+    # Bot API calls (channel messages, roles) and interaction responses/followups,
+    # which discord.py sends through its webhook adapter
+    for owner in (discord.http.HTTPClient, discord.webhook.async_.AsyncWebhookAdapter):
+        if not getattr(owner.request, 'metrics', False):
+            owner.request = timed_request(owner.request)
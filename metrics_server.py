@@ -0,0 +1,224 @@
+"""Optional Prometheus /metrics endpoint.
+
+Off unless METRICS_PORT is set. Serves the metrics module's numbers in the
+Prometheus text format with aiohttp's web server (aiohttp ships with
+discord.py), so nothing is added to requirements.txt. Everything is already
+counted in memory as the bot runs, so a scrape only formats a few hundred lines -
+cheap enough to leave on in production.
+
+Interaction latencies are kept as log-bucketed histograms; they are reported
+here against the fixed LATENCY_BUCKETS bounds, each of metrics' buckets counted
+under the first bound at or above its upper edge, so a value can land at most
+one bound high. _sum and _count are exact.
+
+Run this file to scrape a server started on a free local port (the same
+round trip tests/test_metrics_server.py checks):
+
+    python metrics_server.py
+"""
+
+import asyncio
+import math
+import os
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from aiohttp import web
+
+import metrics
+
+# Histogram bucket bounds, in seconds
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 3.0, 5.0, 10.0, 30.0]
+SQL_BUCKETS = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0]
+LOOP_LAG_BUCKETS = [0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0]
+
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+def histogram_lines(name, histogram, bounds, labels=None):
+    """
+    Prometheus histogram samples for a metrics.Histogram (recorded in milliseconds).
+
+    Returns:
+        list: _bucket lines (cumulative, ending at +Inf), then _sum and _count
+    """
+    labels = labels or {}
+    counts = [0] * len(bounds)
+    for index, count in histogram.buckets.items():
+        upper = histogram.bucket_upper(index) / 1000
+        for position, bound in enumerate(bounds):
+            if upper <= bound:
+                counts[position] += count
+                break
+
+    lines = []
+    cumulative = 0
+    for bound, count in zip(bounds, counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{format_labels({**labels, 'le': bound})} {cumulative}")
+    lines.append(f"{name}_bucket{format_labels({**labels, 'le': '+Inf'})} {histogram.count}")
+    lines.append(f"{name}_sum{format_labels(labels)} {histogram.total / 1000}")
+    lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+    return lines
+
+
+def process_rss_bytes():
+    """
+    Resident set size of this process.
+
+    Returns:
+        int: Bytes - current RSS from /proc on Linux, otherwise the peak from getrusage
+             (None where neither is available)
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        if resource is None:
+            return None
+        # ru_maxrss is kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def render(bot=None):
+    """
+    The current metrics in the Prometheus text exposition format.
+
+    Args:
+        bot: The running AFFLBot, for gateway latency and the bid queue (optional)
+
+    Returns:
+        str: Response body for /metrics
+    """
+    lines = []
+
+    def metric(name, kind, help_text):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    series = sorted(metrics.interactions.items())
+    metric("affl_interaction_duration_seconds", "histogram",
+           "Wall time of slash commands, autocompletes, view and modal callbacks")
+    for name, ring in series:
+        lines.extend(histogram_lines("affl_interaction_duration_seconds", ring.lifetime.latency,
+                                     LATENCY_BUCKETS, {'interaction': name}))
+
+    # scale converts milliseconds to seconds; counts have none
+    for metric_name, attribute, scale, help_text in [
+        ("affl_interaction_sql_seconds_total", 'db_ms', 1000, "Time interactions spent in SQL"),
+        ("affl_interaction_discord_seconds_total", 'discord_ms', 1000, "Time interactions spent in Discord API requests"),
+        ("affl_interaction_late_responses_total", 'late_responses', None,
+         f"Interactions first responded to after {metrics.RESPONSE_DEADLINE:.0f}s"),
+        ("affl_interaction_errors_total", 'errors', None, "Interactions that failed"),
+        ("affl_interaction_auto_deferrals_total", 'auto_deferrals', None,
+         "Interactions deferred for the handler because it hadn't responded in time"),
+    ]:
+        metric(metric_name, "counter", help_text)
+        for name, ring in series:
+            value = getattr(ring.lifetime, attribute)
+            lines.append(f"{metric_name}{format_labels({'interaction': name})} {value / scale if scale else value}")
+
+    metric("affl_cache_lookups_total", "counter", "Cache lookups by result")
+    for name, (hits, misses) in sorted(metrics.caches.items()):
+        lines.append(f"affl_cache_lookups_total{format_labels({'cache': name, 'result': 'hit'})} {hits.lifetime.value}")
+        lines.append(f"affl_cache_lookups_total{format_labels({'cache': name, 'result': 'miss'})} {misses.lifetime.value}")
+
+    metric("affl_sql_statement_duration_seconds", "histogram", "Duration of every SQL statement")
+    lines.extend(histogram_lines("affl_sql_statement_duration_seconds", metrics.sql_statements, SQL_BUCKETS))
+
+    metric("affl_event_loop_lag_seconds", "histogram", "How late the event loop ran a task due to wake up")
+    lines.extend(histogram_lines("affl_event_loop_lag_seconds", metrics.loop_lag, LOOP_LAG_BUCKETS))
+    metric("affl_event_loop_lag_last_seconds", "gauge", "Latest event loop lag sample")
+    lines.append(f"affl_event_loop_lag_last_seconds {metrics.last_loop_lag / 1000}")
+    metric("affl_event_loop_stalls_total", "counter", "Times the event loop was blocked past the stall threshold")
+    lines.append(f"affl_event_loop_stalls_total {metrics.loop_stalls}")
+
+    metric("affl_discord_requests_in_flight", "gauge",
+           "Discord API requests sent and not yet answered, including any held by a rate limit")
+    lines.append(f"affl_discord_requests_in_flight {metrics.discord_requests_in_flight}")
+
+    if bot is not None:
+        free_agency = bot.get_cog('FreeAgencyCommands')
+        bid_queue = getattr(getattr(free_agency, 'bid_intake', None), 'queue', None)
+        metric("affl_bid_queue_depth", "gauge", "Free agency bids waiting to be written")
+        lines.append(f"affl_bid_queue_depth {bid_queue.qsize() if bid_queue is not None else 0}")
+
+        # bot.latency is inf/nan until the first heartbeat
+        if math.isfinite(bot.latency):
+            metric("affl_gateway_latency_seconds", "gauge", "Discord gateway heartbeat latency")
+            lines.append(f"affl_gateway_latency_seconds {bot.latency}")
+
+    rss = process_rss_bytes()
+    if rss is not None:
+        metric("affl_process_resident_memory_bytes", "gauge", "Resident set size of the bot process")
+        lines.append(f"affl_process_resident_memory_bytes {rss}")
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    aiohttp server for GET /metrics.
+
+    Args:
+        bot: The AFFLBot (or None)
+        host: Interface to bind - 127.0.0.1 keeps it local, 0.0.0.0 for an external scraper
+        port: Port to listen on (0 picks a free one)
+    """
+
+    def __init__(self, bot, host, port):
+        self.bot = bot
+        self.host = host
+        self.port = port
+        self.runner = None
+
+    async def handle_metrics(self, request):
+        return web.Response(text=render(self.bot), content_type='text/plain', charset='utf-8',
+                            headers={'X-Content-Type-Options': 'nosniff'})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/metrics', self.handle_metrics)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+        # Report the real port when 0 asked for any free one
+        self.port = self.runner.addresses[0][1]
+
+    async def stop(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+
+if __name__ == "__main__":
+    import aiohttp
+
+    async def main():
+        server = MetricsServer(None, '127.0.0.1', 0)
+        await server.start()
+        metrics.record_interaction('/roster', 0.12, db_seconds=0.03, discord_seconds=0.05)
+        metrics.record_interaction('/roster', 3.4, late=True)
+        metrics.cache_lookup('free_agent_pool', True)
+        metrics.record_statement(0.002)
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(f'http://127.0.0.1:{server.port}/metrics') as response:
+                    print(f"HTTP {response.status} {response.headers['Content-Type']}")
+                    print(await response.text())
+        finally:
+            await server.stop()
+
+    asyncio.run(main())
@@ -0,0 +1,248 @@
+"""On-demand profiling for /profile.
+
+One capture at a time, over the next N interactions or N seconds (whichever
+comes first), in one of two modes:
+
+- cprofile: deterministic profile of everything the event loop runs, saved as
+  a pstats file (open with python -m pstats, snakeviz, etc.) plus a text
+  summary of the top functions by cumulative time
+- sampling: a thread samples the event loop thread's stack every
+  SAMPLE_INTERVAL and counts identical stacks, saved as collapsed stacks
+  ("frame;frame;frame count" lines) for flamegraph.pl or speedscope. Much
+  lower overhead than cProfile, so safer mid-draft
+
+Either can also take tracemalloc snapshots at the start and end and attach the
+top allocation differences.
+"""
+
+import asyncio
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+import query_log
+
+# Seconds between stack samples in sampling mode
+SAMPLE_INTERVAL = 0.005
+# Frames tracemalloc keeps per allocation
+TRACEMALLOC_FRAMES = 25
+# Lines in the text summaries
+SUMMARY_LINES = 40
+
+
+class ProfileResult:
+    """A finished capture, ready to upload"""
+
+    def __init__(self, mode, seconds, interactions, files, summary):
+        self.mode = mode
+        self.seconds = seconds
+        self.interactions = interactions
+        self.files = files  # list of (filename, bytes)
+        self.summary = summary
+
+
+class ProfileSession:
+    """
+    One running capture.
+
+    Args:
+        mode: "cprofile" or "sampling"
+        max_interactions: Stop after this many interactions finish (None for no limit)
+        seconds: Stop after this long (None for no limit)
+        memory: Also diff tracemalloc snapshots
+        on_finish: Called as on_finish(result, reached_limit) when the capture stops
+    """
+
+    def __init__(self, mode, max_interactions=None, seconds=None, memory=False, on_finish=None):
+        self.mode = mode
+        self.max_interactions = max_interactions
+        self.seconds = seconds
+        self.memory = memory
+        self.on_finish = on_finish
+        self.interactions = 0
+        self.started = None
+        self.profile = None
+        self.samples = {}  # collapsed stack -> count
+        self.sampler = None
+        self.stopped = threading.Event()
+        self.timer = None
+        self.snapshot = None
+        self.started_tracemalloc = False
+        self.result = None
+
+    def start(self):
+        self.started = time.perf_counter()
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+                self.started_tracemalloc = True
+            self.snapshot = tracemalloc.take_snapshot()
+
+        if self.mode == 'cprofile':
+            # cProfile follows the thread that enables it - the event loop thread
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        else:
+            self.sampler = threading.Thread(target=self.sample, args=(threading.get_ident(),),
+                                            name="profile-sampler", daemon=True)
+            self.sampler.start()
+
+        if self.seconds:
+            self.timer = asyncio.get_running_loop().call_later(self.seconds, self.finish, True)
+        query_log.interaction_hooks.append(self.interaction_started)
+
+    def interaction_started(self, name, interaction, queries):
+        """query_log hook - count interactions as they finish"""
+        if name.startswith('/profile'):
+            return
+        task = asyncio.current_task()
+        if task is not None:
+            task.add_done_callback(self.interaction_finished)
+
+    def interaction_finished(self, task):
+        self.interactions += 1
+        if self.max_interactions and self.interactions >= self.max_interactions:
+            self.finish(reached_limit=True)
+
+    def sample(self, thread_id):
+        """Sampler thread - count the event loop thread's stacks"""
+        while not self.stopped.wait(SAMPLE_INTERVAL):
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            # The loop waiting for events - nothing is running
+            if names[0].startswith("select (selectors.py"):
+                stack = "(idle)"
+            else:
+                stack = ";".join(reversed(names))
+            self.samples[stack] = self.samples.get(stack, 0) + 1
+
+    def finish(self, reached_limit=False):
+        """Stop capturing (once) and hand the result to on_finish"""
+        if self.result is not None:
+            return self.result
+        seconds = time.perf_counter() - self.started
+        if self.timer is not None:
+            self.timer.cancel()
+        if self.interaction_started in query_log.interaction_hooks:
+            query_log.interaction_hooks.remove(self.interaction_started)
+
+        files = []
+        if self.profile is not None:
+            self.profile.disable()
+            files.append(("profile.pstats", self.pstats_bytes()))
+            summary = self.pstats_summary()
+        else:
+            self.stopped.set()
+            self.sampler.join()
+            collapsed = "".join(f"{stack} {count}\n" for stack, count in
+                                sorted(self.samples.items(), key=lambda item: item[1], reverse=True))
+            files.append(("profile.folded", collapsed.encode()))
+            summary = self.sampling_summary()
+        files.append(("profile-summary.txt", summary.encode()))
+
+        if self.snapshot is not None:
+            diff = tracemalloc.take_snapshot().compare_to(self.snapshot, 'lineno')
+            if self.started_tracemalloc:
+                tracemalloc.stop()
+            text = "\n".join(str(stat) for stat in diff[:SUMMARY_LINES])
+            files.append(("tracemalloc-diff.txt", text.encode()))
+
+        self.result = ProfileResult(self.mode, seconds, self.interactions, files, summary)
+        if self.on_finish is not None:
+            self.on_finish(self.result, reached_limit)
+        return self.result
+
+    def pstats_bytes(self):
+        """The profile in the format pstats.Stats(filename) loads - what Profile.dump_stats writes"""
+        self.profile.create_stats()
+        return marshal.dumps(self.profile.stats)
+
+    def pstats_summary(self):
+        output = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=output)
+        stats.strip_dirs().sort_stats('cumulative').print_stats(SUMMARY_LINES)
+        return output.getvalue()
+
+    def sampling_summary(self):
+        """Functions by share of samples they were on the stack for (inclusive time)"""
+        total = sum(self.samples.values())
+        if not total:
+            return "No samples taken."
+        inclusive = {}
+        for stack, count in self.samples.items():
+            for name in set(stack.split(";")):
+                inclusive[name] = inclusive.get(name, 0) + count
+        lines = [f"{total} samples every {SAMPLE_INTERVAL * 1000:.0f}ms", ""]
+        for name, count in sorted(inclusive.items(), key=lambda item: item[1], reverse=True)[:SUMMARY_LINES]:
+            lines.append(f"{count / total:>6.1%}  {name}")
+        return "\n".join(lines)
+
+
+# The running capture, or the last one that finished and hasn't been collected
+active = None
+finished = None
+
+
+def start(mode, max_interactions=None, seconds=None, memory=False, on_finish=None):
+    """
+    Start a capture.
+
+    Args:
+        on_finish: Called with the ProfileResult if a limit ends the capture (not on stop())
+
+    Returns:
+        ProfileSession
+
+    Raises:
+        RuntimeError: A capture is already running
+    """
+    global active, finished
+    if active is not None:
+        raise RuntimeError("A profile is already running - use /profile stop first")
+
+    def done(result, reached_limit):
+        global active, finished
+        active = None
+        # Stopped by hand, stop() returns it; stopped by a limit, it waits to be collected
+        if reached_limit:
+            finished = result
+            if on_finish is not None:
+                on_finish(result)
+
+    finished = None
+    active = ProfileSession(mode, max_interactions, seconds, memory, on_finish=done)
+    active.start()
+    return active
+
+
+def stop():
+    """
+    Stop the running capture, or collect the one a limit already stopped.
+
+    Returns:
+        ProfileResult, or None if there is nothing to collect
+    """
+    global finished
+    if active is not None:
+        return active.finish()
+    result, finished = finished, None
+    return result
+
+
+def discard(result):
+    """Forget a finished capture that has been delivered another way"""
+    global finished
+    if finished is result:
+        finished = None
@@ -0,0 +1,438 @@
+"""SQL statement accounting per interaction.
+
+install() wraps aiosqlite's Connection._execute - the one call every execute,
+fetch and commit on every connection goes through - so all the
+aiosqlite.connect(DB_PATH) blocks in the cogs are covered without touching them.
+Each statement, and the time spent fetching its rows, is added to the
+InteractionQueries for whatever is running in the current task. That is a
+contextvar set by instrument_interactions() when discord.py starts a slash
+command, autocomplete, view or modal callback, so the counts follow the
+interaction through every await and into any tasks it spawns.
+
+Statements slower than SLOW_QUERY_MS are logged as they finish, and when an
+interaction ends having run more than QUERY_REPORT_STATEMENTS statements (the
+tell-tale of a query inside a loop) its busiest statements are logged:
+
+    [queries] /exportdata: 33074 statements, 5830ms in SQL
+      33012x  5210ms  SELECT name FROM players WHERE player_id = ?  (int)
+
+Writes are collected per connection too, and once committed the tables they
+touched go to commit_hooks (render_cache bumps its version counters there).
+
+The bench suite counts each operation's statements with track(), or with
+query_budget() for operations that have a statement budget.
+
+aiosqlite's Connection._execute and discord.py's View/Modal._scheduled_task are
+private, so each is checked before it's wrapped. If a library upgrade removes
+one, that part of the instrumentation is switched off with a warning at startup
+instead of breaking the bot - install() returns False then, and render_cache
+stops keeping renderings it could no longer invalidate.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
+import re
+import sqlite3
+import time
+import weakref
+
+import aiosqlite.core
+import discord
+
+from config import SLOW_QUERY_MS, QUERY_REPORT_STATEMENTS
+
+# Busiest statements listed in an end-of-interaction report
+REPORT_TOP_STATEMENTS = 5
+
+# sqlite3 methods aiosqlite runs on its worker thread that execute SQL
+STATEMENT_METHODS = {'execute', 'executemany', 'executescript', '_execute_insert', '_execute_fetchall'}
+FETCH_METHODS = {'fetchone', 'fetchmany', 'fetchall'}
+TRANSACTION_METHODS = {'commit': 'COMMIT', 'rollback': 'ROLLBACK'}
+
+current = contextvars.ContextVar('query_log_current', default=None)
+
+# Called as hook(name, interaction, queries) whenever begin_interaction starts
+# one, in the interaction's task - how metrics times the same interactions
+interaction_hooks = []
+# Called as hook(seconds) after every statement (not fetches), in any task
+statement_hooks = []
+# Called as hook(tables) after a connection commits, with the tables it wrote
+# since its last commit, in any task - how render_cache follows writes
+commit_hooks = []
+
+# Task -> InteractionQueries for tasks begin_interaction started, so other
+# threads (loop_monitor) can tell which interaction a task belongs to
+interaction_tasks = weakref.WeakKeyDictionary()
+
+_original_execute = None
+_warned = set()  # private attributes already reported missing
+_cursor_statements = weakref.WeakKeyDictionary()  # sqlite3.Cursor -> StatementStats, for fetch timing
+_uncommitted_writes = weakref.WeakKeyDictionary()  # Connection -> tables written since its last commit
+
+# The table an INSERT, REPLACE, UPDATE or DELETE writes (not the SET of an upsert's DO UPDATE)
+WRITE_TABLE = re.compile(
+    r"\b(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|DELETE\s+FROM|UPDATE(?:\s+OR\s+\w+)?)\s+(?!SET\b)(\w+)",
+    re.IGNORECASE
+)
+
+
+class StatementStats:
+    """Totals for one SQL statement within an interaction"""
+
+    def __init__(self, sql, shape=None):
+        self.sql = sql
+        self.shape = shape
+        self.count = 0
+        self.seconds = 0.0
+
+
+class InteractionQueries:
+    """
+    Every statement one interaction (or track() block) ran.
+
+    Args:
+        name: What's running - "/command", "ViewClass.callback" or a track() label
+        parent: Enclosing InteractionQueries, which gets these totals too when this one ends
+    """
+
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+        self.statements = {}  # normalised sql -> StatementStats
+        self.count = 0
+        self.seconds = 0.0
+
+    def record(self, sql, seconds):
+        stats = self.statements.get(sql)
+        if stats is None:
+            stats = self.statements[sql] = StatementStats(sql)
+        stats.count += 1
+        stats.seconds += seconds
+        self.count += 1
+        self.seconds += seconds
+        return stats
+
+    def add_time(self, stats, seconds):
+        """Fetch time for a statement that was already counted"""
+        stats.seconds += seconds
+        self.seconds += seconds
+
+    def merge_into_parent(self):
+        if self.parent is None:
+            return
+        for sql, stats in self.statements.items():
+            merged = self.parent.statements.get(sql)
+            if merged is None:
+                merged = self.parent.statements[sql] = StatementStats(sql, stats.shape)
+            merged.count += stats.count
+            merged.seconds += stats.seconds
+        self.parent.count += self.count
+        self.parent.seconds += self.seconds
+
+    def top(self, limit=REPORT_TOP_STATEMENTS):
+        """The statements that took the most time, busiest first"""
+        return sorted(self.statements.values(), key=lambda stats: stats.seconds, reverse=True)[:limit]
+
+    def report(self):
+        lines = [f"[queries] {self.name}: {self.count} statements, {self.seconds * 1000:.0f}ms in SQL"]
+        for stats in self.top():
+            lines.append(f"  {stats.count:>5}x {stats.seconds * 1000:>6.0f}ms  {truncate(stats.sql)}  {stats.shape}")
+        return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=2048)
+def normalise_sql(sql):
+    """Collapse whitespace so the same statement from different call sites groups together"""
+    return re.sub(r"\s+", " ", sql).strip()
+
+
+@functools.lru_cache(maxsize=2048)
+def written_tables(sql):
+    """Tables a statement (or script) writes, lowercased"""
+    return frozenset(table.lower() for table in WRITE_TABLE.findall(sql))
+
+
+def record_writes(connection, name, args):
+    """Collect a connection's writes, and hand them to commit_hooks once they're committed"""
+    if name == 'rollback':
+        _uncommitted_writes.pop(connection, None)
+        return
+    if name == 'commit':
+        tables = _uncommitted_writes.pop(connection, None)
+    else:
+        tables = written_tables(args[0]) if args and isinstance(args[0], str) else frozenset()
+        if name != 'executescript':
+            if tables:
+                _uncommitted_writes.setdefault(connection, set()).update(tables)
+            return
+        # executescript commits what was pending, then runs the script outside a transaction
+        tables = _uncommitted_writes.pop(connection, set()) | tables
+    if tables:
+        for hook in commit_hooks:
+            hook(tables)
+
+
+def truncate(sql, length=160):
+    return sql if len(sql) <= length else sql[:length - 3] + "..."
+
+
+def value_shape(value):
+    return "None" if value is None else type(value).__name__
+
+
+def parameter_shape(parameters, many=False):
+    """
+    Describe parameters by type only, so reports never log player names or other values.
+
+    Returns:
+        str: e.g. "(int, str)", "{team_id: int}" or "120 rows of (int, int)"
+    """
+    if many:
+        if not isinstance(parameters, (list, tuple)):
+            return "rows from an iterator"
+        first = parameter_shape(parameters[0]) if parameters else "()"
+        return f"{len(parameters)} rows of {first}"
+    if not parameters:
+        return "()"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {value_shape(value)}" for key, value in parameters.items()) + "}"
+    return "(" + ", ".join(value_shape(value) for value in parameters) + ")"
+
+
+async def _instrumented_execute(self, fn, *args, **kwargs):
+    """Connection._execute with timing - runs for every call aiosqlite sends to its worker thread"""
+    name = getattr(fn, '__name__', None)
+    if name not in STATEMENT_METHODS and name not in FETCH_METHODS and name not in TRANSACTION_METHODS:
+        return await _original_execute(self, fn, *args, **kwargs)
+
+    start = time.perf_counter()
+    result = await _original_execute(self, fn, *args, **kwargs)
+    seconds = time.perf_counter() - start
+
+    queries = current.get()
+    if name in FETCH_METHODS:
+        stats = _cursor_statements.get(getattr(fn, '__self__', None))
+        if stats is not None and queries is not None:
+            queries.add_time(stats, seconds)
+        if seconds * 1000 >= SLOW_QUERY_MS:
+            sql = stats.sql if stats is not None else "(unknown statement)"
+            print(f"[slow query] {queries.name if queries else '(no interaction)'} "
+                  f"{seconds * 1000:.0f}ms fetching: {truncate(sql)}")
+        return result
+
+    if name in TRANSACTION_METHODS:
+        sql = TRANSACTION_METHODS[name]
+    else:
+        sql = normalise_sql(args[0]) if args else ""
+
+    if commit_hooks:
+        record_writes(self, name, args)
+    for hook in statement_hooks:
+        hook(seconds)
+    slow = seconds * 1000 >= SLOW_QUERY_MS
+    stats = queries.record(sql, seconds) if queries is not None else None
+    # Shapes are only worked out for a statement's first run, or when it's logged
+    if slow or (stats is not None and stats.shape is None):
+        shape = statement_shape(name, args)
+        if stats is not None and stats.shape is None:
+            stats.shape = shape
+        if slow:
+            print(f"[slow query] {queries.name if queries else '(no interaction)'} "
+                  f"{seconds * 1000:.0f}ms: {truncate(sql)}  {shape}")
+    if stats is not None and isinstance(result, sqlite3.Cursor):
+        _cursor_statements[result] = stats
+    return result
+
+
+def statement_shape(name, args):
+    if name in TRANSACTION_METHODS:
+        return "()"
+    if name == 'executescript':
+        return "(script)"
+    return parameter_shape(args[1] if len(args) > 1 else None, many=(name == 'executemany'))
+
+
+def private_method(owner, name, leading, effect):
+    """
+    A private library coroutine method, checked before it's wrapped.
+
+    Args:
+        owner: Class the method is looked up on
+        name: Method name
+        leading: Names of the parameters after self the wrapper relies on
+        effect: What stops working without it, for the warning
+
+    Returns:
+        The method, or None (after warning once) if it's missing or its signature changed
+    """
+    method = getattr(owner, name, None)
+    if method is not None and inspect.iscoroutinefunction(method):
+        try:
+            parameters = list(inspect.signature(method).parameters)[1:1 + len(leading)]
+        except (TypeError, ValueError):
+            parameters = None
+        if parameters == list(leading):
+            return method
+
+    label = f"{owner.__module__}.{owner.__qualname__}.{name}"
+    if label not in _warned:
+        _warned.add(label)
+        print(f"[query_log] WARNING: {label} is missing or has changed in this library version - {effect}")
+    return None
+
+
+def install():
+    """
+    Start timing aiosqlite statements, for the whole process. Safe to call more than once.
+
+    Returns:
+        bool: True if statements (and so commits) are being followed
+    """
+    global _original_execute
+    if _original_execute is not None:
+        return True
+    execute = private_method(aiosqlite.core.Connection, '_execute', ('fn',),
+                             "SQL statements won't be counted or timed and commit hooks won't run")
+    if execute is None:
+        return False
+    _original_execute = execute
+    aiosqlite.core.Connection._execute = _instrumented_execute
+    return True
+
+
+def uninstall():
+    global _original_execute
+    if _original_execute is None:
+        return
+    aiosqlite.core.Connection._execute = _original_execute
+    _original_execute = None
+
+
+@contextlib.contextmanager
+def track(name):
+    """
+    Attribute the statements run inside the block (including in tasks it starts) to a new InteractionQueries.
+
+    Args:
+        name: Label for reports
+
+    Returns:
+        InteractionQueries: Live totals - read .count and .seconds after the block
+    """
+    install()
+    queries = InteractionQueries(name, parent=current.get())
+    token = current.set(queries)
+    try:
+        yield queries
+    finally:
+        current.reset(token)
+        queries.merge_into_parent()
+
+
+@contextlib.contextmanager
+def query_budget(max_statements, name="query budget"):
+    """
+    Fail if the block runs more than max_statements SQL statements.
+
+    Use in tests to pin a handler's query count, so one that starts querying
+    inside a loop fails instead of slowing down as the league grows:
+
+        with query_budget(5):
+            await cog.roster.callback(cog, interaction, "Team 001")
+
+    Raises:
+        AssertionError: Listing the busiest statements, when the budget is exceeded
+    """
+    with track(name) as queries:
+        yield queries
+    if queries.count > max_statements:
+        raise AssertionError(f"{name}: {queries.count} statements, budget is {max_statements}\n{queries.report()}")
+
+
+def finish_interaction(queries, task):
+    """Task done callback - report an interaction that ran too many statements"""
+    queries.merge_into_parent()
+    if queries.count > QUERY_REPORT_STATEMENTS:
+        print(queries.report())
+
+
+def begin_interaction(name, interaction=None):
+    """
+    Attribute the rest of the current task's statements to an interaction.
+
+    discord.py runs every command, autocomplete and component callback in a task
+    of its own, so the contextvar is set for exactly that interaction and the
+    report goes out when the task finishes.
+    """
+    install()
+    queries = InteractionQueries(name, parent=current.get())
+    current.set(queries)
+    task = asyncio.current_task()
+    if task is not None:
+        interaction_tasks[task] = queries
+        task.add_done_callback(functools.partial(finish_interaction, queries))
+    for hook in interaction_hooks:
+        hook(name, interaction, queries)
+    return queries
+
+
+def interaction_name(interaction, view=None, item=None):
+    """
+    Label for an interaction in reports.
+
+    Returns:
+        str: "/command subcommand" for app commands and autocompletes,
+             "ViewClass.callback" for components and modals
+    """
+    if view is not None:
+        callback = getattr(item, 'callback', None)
+        callback_name = getattr(getattr(callback, 'callback', callback), '__name__', None)
+        return f"{type(view).__name__}.{callback_name}" if callback_name else type(view).__name__
+    command = interaction.command
+    if command is not None:
+        return f"/{command.qualified_name}"
+    return f"interaction {interaction.type.name if interaction.type else 'unknown'}"
+
+
+def instrument_interactions(bot):
+    """
+    Start an InteractionQueries for every interaction the bot handles.
+
+    Commands and autocompletes go through the tree's interaction_check, which
+    discord.py awaits at the start of the command's task. Views and modals have
+    no bot-wide hook, so their per-callback task method is wrapped instead.
+    """
+    install()
+
+    tree_check = bot.tree.interaction_check
+    if not getattr(tree_check, 'query_log', False):
+        async def interaction_check(interaction):
+            begin_interaction(interaction_name(interaction), interaction)
+            return await tree_check(interaction)
+
+        interaction_check.query_log = True
+        bot.tree.interaction_check = interaction_check
+
+    view_task = private_method(discord.ui.View, '_scheduled_task', ('item', 'interaction'),
+                               "view callbacks won't be counted as interactions")
+    if view_task is not None and not getattr(view_task, 'query_log', False):
+        async def scheduled_view_task(self, item, interaction):
+            begin_interaction(interaction_name(interaction, self, item), interaction)
+            return await view_task(self, item, interaction)
+
+        scheduled_view_task.query_log = True
+        discord.ui.View._scheduled_task = scheduled_view_task
+
+    modal_task = private_method(discord.ui.Modal, '_scheduled_task', ('interaction',),
+                                "modal submits won't be counted as interactions")
+    if modal_task is not None and not getattr(modal_task, 'query_log', False):
+        async def scheduled_modal_task(self, interaction, *args, **kwargs):
+            begin_interaction(f"{type(self).__name__}.on_submit", interaction)
+            return await modal_task(self, interaction, *args, **kwargs)
+
+        scheduled_modal_task.query_log = True
+        discord.ui.Modal._scheduled_task = scheduled_modal_task
+
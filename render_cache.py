@@ -0,0 +1,122 @@
+"""Rendered embeds for the read-mostly views.
+
+/roster, /drafthand, /contractstatus, /draftorder and /injurylist show everyone
+who asks the same embeds until a trade, pick, free agency move, round or admin
+edit changes the data under them. Each rendering is kept under (kind, team,
+option) together with the data version it was built from:
+
+- the data version is a counter per table, bumped after every commit that
+  wrote the table (through query_log's commit hook, so every write path is
+  covered without calling anything), plus team_emojis' generation
+- get() hands back the kept rendering while none of its kind's tables have
+  been written since, and builds it again otherwise
+- teams() keeps the teams table the same way, so working out which team a view
+  is for doesn't need a query either
+
+The version is read before building, so a write that commits mid-build leaves
+the new rendering filed under the old version, where nothing will look it up.
+Renderings are shared between viewers - never modify one after get().
+"""
+
+import aiosqlite
+
+from config import DB_PATH
+import metrics
+import query_log
+from team_emojis import team_emojis
+
+# The tables each kind of rendering reads
+KIND_TABLES = {
+    'teams': ('teams',),
+    'roster': ('players', 'teams'),
+    'contracts': ('players', 'teams'),
+    'drafthand': ('draft_picks', 'teams'),
+    'draftorder': ('draft_picks', 'drafts', 'players'),
+    'injuries': ('injuries', 'suspensions', 'players', 'teams', 'seasons'),
+}
+
+
+class RenderCache:
+    def __init__(self):
+        self.versions = {}  # table -> commits that wrote it
+        self.entries = {}  # (kind, team, option) -> (version, rendering)
+
+    def install(self):
+        """
+        Follow committed writes. get() calls this, so nothing is kept before it's in place.
+
+        Returns:
+            bool: False if query_log can't follow commits - then nothing is kept at all
+        """
+        if not query_log.install():
+            return False
+        if self.tables_written not in query_log.commit_hooks:
+            query_log.commit_hooks.append(self.tables_written)
+        return True
+
+    def tables_written(self, tables):
+        for table in tables:
+            self.versions[table] = self.versions.get(table, 0) + 1
+
+    def version(self, kind):
+        return (team_emojis.generation,) + tuple(self.versions.get(table, 0) for table in KIND_TABLES[kind])
+
+    def invalidate(self):
+        """Drop everything, for when the database was replaced under the bot"""
+        self.entries = {}
+
+    async def get(self, kind, team, option, build):
+        """
+        A rendering, built if the kept one is missing or out of date.
+
+        Args:
+            kind: Key of KIND_TABLES
+            team: team_id the rendering is for (None if it isn't for one team)
+            option: Anything else the rendering depends on - sort order, draft name
+            build: Coroutine function returning the rendering
+
+        Returns:
+            What build returned, now or for an earlier viewer
+        """
+        if not self.install():
+            return await build()
+        key = (kind, team, option)
+        version = self.version(kind)
+        entry = self.entries.get(key)
+        hit = entry is not None and entry[0] == version
+        metrics.cache_lookup(f'render_{kind}', hit)
+        if hit:
+            return entry[1]
+        rendering = await build()
+        self.entries[key] = (version, rendering)
+        return rendering
+
+    async def teams(self):
+        """
+        Returns:
+            list: (team_id, team_name, role_id) for every team, in team_id order
+        """
+        return await self.get('teams', None, None, load_teams)
+
+    async def team_named(self, team_name, ignore_case=False):
+        """(team_id, team_name) for a team name, or None"""
+        if ignore_case:
+            team_name = team_name.lower()
+        for team_id, name, _ in await self.teams():
+            if (name.lower() if ignore_case else name) == team_name:
+                return team_id, name
+        return None
+
+    async def team_for_member(self, member):
+        """(team_id, team_name) of the first team whose role member has, or None"""
+        role_ids = {str(role.id) for role in member.roles}
+        return next(((team_id, name) for team_id, name, role_id in await self.teams() if str(role_id) in role_ids), None)
+
+
+async def load_teams():
+    async with aiosqlite.connect(DB_PATH) as db:
+        cursor = await db.execute("SELECT team_id, team_name, role_id FROM teams ORDER BY team_id")
+        return await cursor.fetchall()
+
+
+render_cache = RenderCache()
@@ -0,0 +1,117 @@
+"""In-memory copy of the settings table.
+
+Channel ids, the trade period flag and season_1_year are read all through a
+draft or a round of bids - several times per pick - but only change through
+/config, /tradeperiod, /startseason and /importdata. The whole table is a few
+rows, so it is read once and kept:
+
+- reads (get, get_int, get_bool, channel) load the table on first use and
+  never touch the DB again
+- set() writes the row on the caller's connection, and commit() commits that
+  connection and then updates the copy - so a write that is rolled back (or
+  never committed) never shows up in reads
+- invalidate() drops the copy after something rewrote the table wholesale
+  (/importdata), and the next read loads it again
+"""
+
+import asyncio
+import weakref
+
+import aiosqlite
+
+from config import DB_PATH
+
+
+class SettingsStore:
+    def __init__(self):
+        self.values = None  # setting_key -> setting_value, once loaded
+        self.lock = asyncio.Lock()
+        self.pending = weakref.WeakKeyDictionary()  # connection -> {setting_key: value} awaiting commit()
+
+    async def load(self):
+        async with aiosqlite.connect(DB_PATH) as db:
+            cursor = await db.execute("SELECT setting_key, setting_value FROM settings")
+            self.values = dict(await cursor.fetchall())
+
+    async def loaded(self):
+        """The settings, loading them if needed"""
+        if self.values is None:
+            async with self.lock:
+                if self.values is None:
+                    await self.load()
+        return self.values
+
+    def invalidate(self):
+        self.values = None
+
+    async def get(self, key, default=None):
+        """
+        Args:
+            key: setting_key
+            default: Returned when the setting is missing or empty
+
+        Returns:
+            str: The stored value, or default
+        """
+        value = (await self.loaded()).get(key)
+        return value if value else default
+
+    async def get_int(self, key, default=None):
+        """Integer setting (default when missing or not a number)"""
+        value = await self.get(key)
+        try:
+            return int(value) if value is not None else default
+        except ValueError:
+            return default
+
+    async def get_bool(self, key):
+        """Flag stored as '1' or '0'"""
+        return await self.get(key) == "1"
+
+    async def channel(self, client, key):
+        """
+        Resolve a channel id setting.
+
+        Args:
+            client: The bot, for its channel cache
+            key: setting_key holding the channel id
+
+        Returns:
+            The channel, or None if unset or no longer visible to the bot
+        """
+        channel_id = await self.get_int(key)
+        return client.get_channel(channel_id) if channel_id else None
+
+    async def set(self, db, key, value):
+        """
+        Write a setting on the caller's connection. Reads see it once the caller calls commit().
+
+        Args:
+            db: Active aiosqlite database connection
+            key: setting_key
+            value: New value (stored as text)
+        """
+        value = str(value)
+        await db.execute(
+            "INSERT OR REPLACE INTO settings (setting_key, setting_value) VALUES (?, ?)",
+            (key, value)
+        )
+        self.pending.setdefault(db, {})[key] = value
+
+    async def commit(self, db):
+        """
+        Commit the caller's connection, then apply the settings it set().
+
+        Args:
+            db: Active aiosqlite database connection
+        """
+        await db.commit()
+        pending = self.pending.pop(db, None)
+        if pending:
+            # Under the lock, so a load that read the table before the commit can't land afterwards
+            async with self.lock:
+                if self.values is not None:
+                    self.values.update(pending)
+
+
+settings = SettingsStore()
@@ -0,0 +1,84 @@
+"""Team emojis by team_id.
+
+Rosters, search results, draft boards, trade screens and auction summaries put
+a team's emoji beside every row. Each team's emoji_id is read from the teams
+table once and each emoji is resolved through the bot's emoji cache once, so a
+row only costs a dict lookup - and queries only need a team_id, not a join on
+teams for emoji_id.
+
+- install() refreshes on emoji changes in the guild (and on ready, when the
+  guild's emojis first arrive)
+- reload() at startup and after anything writes teams.emoji_id (/addteam,
+  /updateteam, /removeteam, /importdata)
+- generation counts reloads and refreshes, for anything that keeps text built
+  from these emojis (render_cache)
+
+Lookups are synchronous so views can use them while building embeds. A team
+with no emoji (or one the bot can't see) gets None / "".
+"""
+
+import aiosqlite
+
+from config import DB_PATH
+
+
+class TeamEmojiCache:
+    def __init__(self):
+        self.client = None
+        self.emoji_ids = {}  # team_id -> emoji id
+        self.resolved = {}  # team_id -> discord.Emoji or None
+        self.generation = 0
+
+    def install(self, client):
+        """Resolve emojis through the client and follow its emoji updates. Call from setup_hook."""
+        self.client = client
+        client.add_listener(self.on_guild_emojis_update)
+        client.add_listener(self.refresh, 'on_ready')
+
+    async def reload(self):
+        """Read every team's emoji_id again"""
+        async with aiosqlite.connect(DB_PATH) as db:
+            cursor = await db.execute("SELECT team_id, emoji_id FROM teams WHERE emoji_id IS NOT NULL AND emoji_id != ''")
+            rows = await cursor.fetchall()
+        emoji_ids = {}
+        for team_id, emoji_id in rows:
+            try:
+                emoji_ids[team_id] = int(emoji_id)
+            except ValueError:
+                print(f"[team emojis] Ignoring invalid emoji_id {emoji_id!r} for team {team_id}")
+        self.emoji_ids = emoji_ids
+        self.resolved = {}
+        self.generation += 1
+
+    async def refresh(self):
+        """Resolve the emojis again on next use"""
+        self.resolved = {}
+        self.generation += 1
+
+    async def on_guild_emojis_update(self, guild, before, after):
+        await self.refresh()
+
+    def emoji(self, team_id):
+        """
+        Returns:
+            discord.Emoji: The team's emoji (for select options and buttons), or None
+        """
+        if team_id in self.resolved:
+            return self.resolved[team_id]
+        emoji_id = self.emoji_ids.get(team_id)
+        emoji = self.client.get_emoji(emoji_id) if emoji_id and self.client else None
+        self.resolved[team_id] = emoji
+        return emoji
+
+    def text(self, team_id):
+        """The team's emoji as message text, or "" """
+        emoji = self.emoji(team_id)
+        return str(emoji) if emoji else ""
+
+    def prefix(self, team_id):
+        """The team's emoji and a space, for putting in front of a name - or "" """
+        emoji = self.emoji(team_id)
+        return f"{emoji} " if emoji else ""
+
+
+team_emojis = TeamEmojiCache()
@@ -0,0 +1,95 @@
+"""Pins the final draft order place_compensation_picks gives end_matching_period."""
+
+from commands.free_agency_commands import place_compensation_picks, sort_compensation_results
+
+TEAMS = 18
+ROUNDS = 5
+
+# (result_id, team_id, compensation_band) as free_agency_results holds them, in no particular order
+RESULTS = [
+    (1, 3, 1), (2, 10, 1),
+    (3, 4, 2), (4, 12, 2), (5, 7, 2), (6, 15, 2),
+    (7, 2, 3), (8, 9, 3), (9, 16, 3), (10, 5, 3),
+    (11, 1, 4), (12, 18, 4), (13, 11, 4), (14, 11, 4),
+    (15, 6, 5), (16, 13, 5), (17, 17, 5), (18, 8, 5),
+    (19, 14, 6),  # no such band - skipped
+    (20, 99, 1),  # no such team - skipped
+]
+
+# "TT.R" is team TT's natural round R pick, "Bn:TT" team TT's band n compensation pick
+EXPECTED_ORDER = [
+    # Round 1 - band 1 after the team's natural pick, band 2 at the end in reverse
+    # ladder order with team 15 (not on the ladder) last
+    '18.1', '17.1', '16.1', '15.1', '14.1', '13.1', '12.1', '11.1', '10.1', 'B1:10',
+    '09.1', '08.1', '07.1', '06.1', '05.1', '04.1', '03.1', 'B1:03', '02.1', '01.1',
+    'B2:12', 'B2:07', 'B2:04', 'B2:15',
+    # Round 2 - band 3 after the natural pick (team 05 was renamed, so its pick can't
+    # be found and goes at the end of the round), then band 4 in reverse ladder
+    # order, team 11's two picks in result order
+    '18.2', '17.2', '16.2', 'B3:16', '15.2', '14.2', '13.2', '12.2', '11.2', '10.2',
+    '09.2', 'B3:09', '08.2', '07.2', '06.2', '05.2', '04.2', '03.2', '02.2', 'B3:02',
+    '01.2', 'B3:05', 'B4:18', 'B4:11', 'B4:11', 'B4:01',
+    # Round 3 - band 5 after the natural pick
+    '18.3', '17.3', 'B5:17', '16.3', '15.3', '14.3', '13.3', 'B5:13', '12.3', '11.3',
+    '10.3', '09.3', '08.3', 'B5:08', '07.3', '06.3', 'B5:06', '05.3', '04.3', '03.3',
+    '02.3', '01.3',
+    # Rounds 4 and 5 - untouched
+    *[f"{team:02d}.4" for team in range(TEAMS, 0, -1)],
+    *[f"{team:02d}.5" for team in range(TEAMS, 0, -1)],
+]
+
+
+def build_draft():
+    """A 90-pick draft in reverse ladder order (team 18 finished last), pick_id = pick_number"""
+    draft_order = []
+    for round_number in range(1, ROUNDS + 1):
+        for team_id in range(TEAMS, 0, -1):
+            pick_number = len(draft_order) + 1
+            draft_order.append((pick_number, round_number, pick_number, f"Team {team_id:02d} R{round_number}"))
+    return draft_order
+
+
+def final_order(draft_order, renumbered, new_picks):
+    """The draft as labels in pick order, after applying what place_compensation_picks returned"""
+    moved = {pick_id: pick_number for pick_number, pick_id in renumbered}
+    labels = {}
+    for pick_id, round_number, pick_number, pick_origin in draft_order:
+        team_id = int(pick_origin.split()[1])
+        labels[moved.get(pick_id, pick_number)] = f"{team_id:02d}.{round_number}"
+    for _, team_id, comp_band, _, pick_number in new_picks:
+        assert pick_number not in labels, f"Pick {pick_number} given out twice"
+        labels[pick_number] = f"B{comp_band}:{team_id:02d}"
+    assert sorted(labels) == list(range(1, len(labels) + 1)), "Pick numbers have gaps"
+    return [labels[pick_number] for pick_number in sorted(labels)]
+
+
+def test_final_draft_order():
+    draft_order = build_draft()
+    team_names = {team_id: f"Team {team_id:02d}" for team_id in range(1, TEAMS + 1)}
+    team_names[5] = "Team 05 Renamed"
+    ladder = {team_id: team_id for team_id in range(1, TEAMS + 1) if team_id != 15}
+
+    rows = [(result_id, team_id, band, ladder.get(team_id)) for result_id, team_id, band in reversed(RESULTS)]
+    renumbered, new_picks = place_compensation_picks(draft_order, sort_compensation_results(rows), team_names)
+
+    assert final_order(draft_order, renumbered, new_picks) == EXPECTED_ORDER
+    assert len(new_picks) == 18
+    # Each pick keeps the round its band goes in
+    assert {band: {round_number for _, _, b, round_number, _ in new_picks if b == band} for band in range(1, 6)} == \
+        {1: {1}, 2: {1}, 3: {2}, 4: {2}, 5: {3}}
+
+
+def test_band_ties_fall_back_to_the_ladder():
+    # Bands 2 and 4 follow the ladder, worst team first, whatever order the results come in
+    rows = [(1, 7, 2, 3), (2, 8, 2, 10), (3, 9, 2, 6), (4, 7, 4, 3), (5, 8, 4, None), (6, 9, 4, 6)]
+    assert sort_compensation_results(rows) == [
+        (2, 8, 2), (3, 9, 2), (1, 7, 2),
+        (6, 9, 4), (4, 7, 4), (5, 8, 4),
+    ]
+    assert sort_compensation_results(rows[::-1]) == sort_compensation_results(rows)
+
+
+def test_untouched_draft_keeps_its_numbers():
+    draft_order = build_draft()
+    team_names = {team_id: f"Team {team_id:02d}" for team_id in range(1, TEAMS + 1)}
+    assert place_compensation_picks(draft_order, [], team_names) == ([], [])
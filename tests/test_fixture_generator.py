@@ -0,0 +1,73 @@
+"""Balance properties of fixture_generator's draws."""
+
+from collections import Counter
+
+import pytest
+
+from fixture_generator import check_balance, constraint_violations, generate_fixtures
+
+SEEDS = range(20)
+SHARED_GROUNDS = [(1, 2), (3, 4), (5, 6)]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_18_teams_24_rounds_balanced(seed):
+    teams = list(range(1, 19))
+    fixtures, violations = generate_fixtures(teams, 24, seed)
+    assert check_balance(fixtures, teams, 24) == []
+    assert violations == 0
+    assert len(fixtures) == 9 * 24
+    assert generate_fixtures(teams, 24, seed)[0] == fixtures
+
+
+@pytest.mark.parametrize("team_count, rounds", [(17, 24), (7, 10), (9, 22)])
+@pytest.mark.parametrize("seed", range(5))
+def test_odd_team_counts_get_one_bye_per_round(team_count, rounds, seed):
+    teams = list(range(1, team_count + 1))
+    fixtures, _ = generate_fixtures(teams, rounds, seed)
+    assert check_balance(fixtures, teams, rounds) == []
+
+    playing = Counter()
+    for round_number, home_id, away_id in fixtures:
+        playing[round_number] += 2
+    assert all(playing[round_number] == team_count - 1 for round_number in range(1, rounds + 1))
+
+    byes = Counter({team_id: rounds for team_id in teams})
+    for _, home_id, away_id in fixtures:
+        byes[home_id] -= 1
+        byes[away_id] -= 1
+    assert max(byes.values()) - min(byes.values()) <= 1
+
+
+@pytest.mark.parametrize("team_count", [18, 17])
+@pytest.mark.parametrize("seed", range(5))
+def test_shared_home_grounds(team_count, seed):
+    teams = list(range(1, team_count + 1))
+    fixtures, violations = generate_fixtures(teams, 24, seed, shared_grounds=SHARED_GROUNDS)
+    assert violations == 0
+    assert check_balance(fixtures, teams, 24) == []
+
+    home_teams = {}
+    for round_number, home_id, _ in fixtures:
+        home_teams.setdefault(round_number, set()).add(home_id)
+    for home_ids in home_teams.values():
+        assert not any(a in home_ids and b in home_ids for a, b in SHARED_GROUNDS)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_shared_grounds_with_a_streak_cap(seed):
+    teams = list(range(1, 19))
+    fixtures, violations = generate_fixtures(teams, 24, seed, shared_grounds=SHARED_GROUNDS, max_streak=3)
+    assert violations == 0
+    assert constraint_violations(fixtures, SHARED_GROUNDS, max_streak=3) == 0
+    assert check_balance(fixtures, teams, 24) == []
+
+
+def test_check_balance_reports_an_unbalanced_draw():
+    teams = [1, 2, 3, 4]
+    # Team 1 at home every week, team 4 never
+    fixtures = [(1, 1, 2), (1, 3, 4), (2, 1, 3), (2, 2, 4), (3, 1, 4), (3, 2, 3)]
+    assert check_balance(fixtures, teams, 3) == [
+        "Team 1 has 3 home games out of 3",
+        "Team 4 has 0 home games out of 3",
+    ]
@@ -0,0 +1,35 @@
+"""Scrapes a local MetricsServer over HTTP."""
+
+import asyncio
+
+import aiohttp
+
+import metrics
+from metrics_server import MetricsServer
+
+
+async def scrape():
+    server = MetricsServer(None, '127.0.0.1', 0)
+    await server.start()
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f'http://127.0.0.1:{server.port}/metrics') as response:
+                return response.status, response.headers['Content-Type'], await response.text()
+    finally:
+        await server.stop()
+
+
+def test_scrape_metrics():
+    metrics.record_interaction('/scrapetest', 0.12, db_seconds=0.03, discord_seconds=0.05)
+    metrics.record_interaction('/scrapetest', 3.4, late=True)
+
+    status, content_type, body = asyncio.run(scrape())
+
+    assert status == 200
+    assert content_type.startswith('text/plain')
+    lines = body.splitlines()
+    buckets = [line for line in lines
+               if line.startswith('affl_interaction_duration_seconds_bucket{interaction="/scrapetest",')]
+    assert 'affl_interaction_duration_seconds_bucket{interaction="/scrapetest",le="0.25"} 1' in buckets
+    assert buckets[-1] == 'affl_interaction_duration_seconds_bucket{interaction="/scrapetest",le="+Inf"} 2'
+    assert 'affl_interaction_duration_seconds_count{interaction="/scrapetest"} 2' in lines
@@ -1,7 +1,7 @@
 """Utility functions for the AFFL Discord Bot"""
 
-import aiosqlite
-from config import DB_PATH
+import time
+from settings_store import settings
 
 
 async def get_current_year(db):
@@ -32,15 +32,11 @@ async def get_current_year(db):
     current_season = season_result[0]
 
     # Get season_1_year setting
-    cursor = await db.execute(
-        "SELECT setting_value FROM settings WHERE setting_key = 'season_1_year'"
-    )
-    setting_result = await cursor.fetchone()
-    if not setting_result:
+    season_1_year = await settings.get_int('season_1_year')
+    if season_1_year is None:
         # Fallback: assume year equals season number
         return current_season
 
-    season_1_year = int(setting_result[0])
     current_year = season_1_year + (current_season - 1)
     return current_year
 
@@ -59,3 +55,38 @@ def age_calculation_sql(current_year):
         return f"{current_year} - p.birth_year"
     else:
         return "? - p.birth_year"
+
+
+class ProgressMessage:
+    """
+    Followup message that is edited in place to report progress on a long-running command.
+
+    Edits are throttled so a command reporting many small steps doesn't hit
+    Discord's rate limits; the final update should pass force=True.
+    """
+
+    def __init__(self, interaction, min_interval=1.5):
+        self.interaction = interaction
+        self.min_interval = min_interval
+        self.message = None
+        self._last_edit = 0.0
+
+    async def update(self, content, force=False, **kwargs):
+        """
+        Show content in the progress message, sending it on first use.
+
+        Args:
+            content: New message text
+            force: Edit even if the last edit was less than min_interval ago
+            **kwargs: Extra arguments for the edit (e.g. attachments)
+        """
+        now = time.monotonic()
+        if self.message is None:
+            if 'attachments' in kwargs:
+                kwargs['files'] = kwargs.pop('attachments')
+            self.message = await self.interaction.followup.send(content, ephemeral=True, wait=True, **kwargs)
+        elif force or now - self._last_edit >= self.min_interval:
+            await self.message.edit(content=content, **kwargs)
+        else:
+            return
+        self._last_edit = now